@@ -0,0 +1,7 @@
+"""
+Benchmark da camada de serviços
+===============================
+
+Gerador de dados sintéticos (gerador) e suíte de medição de tempo dos
+serviços (suite), executados contra um PostgreSQL local.
+"""
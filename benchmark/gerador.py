@@ -0,0 +1,189 @@
+"""
+Gerador de dados sintéticos para o benchmark
+
+Preenche aluno, disciplina, matricula e notas com volumes configuráveis usando
+COPY, o carregamento em massa do PostgreSQL. Os dados existentes nas quatro
+tabelas são APAGADOS; por isso a execução exige --confirmar:
+
+    python -m benchmark.gerador --alunos 50000 --disciplinas 2000 --notas 1000000 --confirmar
+
+A conexão usa as mesmas variáveis DB_* do sistema (.env).
+"""
+
+import argparse
+import io
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from registro_notas_alunos.backend.lib.database import DatabaseConnection
+
+# Quantidade de linhas enviadas por comando COPY
+_LINHAS_POR_COPY = 100_000
+
+# Fração das notas geradas com AV pendente e com AVS preenchida
+_FRACAO_PENDENTES = 0.05
+_FRACAO_COM_AVS = 0.3
+
+
+@dataclass
+class Volumes:
+    """
+    Quantidade de registros gerados por tabela
+
+    Cada nota pertence a uma matrícula distinta, então o número de matrículas
+    é igual ao de notas e não pode exceder alunos x disciplinas.
+    """
+
+    alunos: int = 50_000
+    disciplinas: int = 2_000
+    notas: int = 1_000_000
+
+    def __post_init__(self):
+        """Validações após inicialização"""
+        if self.alunos <= 0 or self.disciplinas <= 0 or self.notas < 0:
+            raise ValueError("Volumes devem ser positivos")
+        if self.notas > self.alunos * self.disciplinas:
+            raise ValueError("Notas não podem exceder alunos x disciplinas")
+
+
+def _par_matricula(k: int, volumes: Volumes) -> tuple:
+    """
+    Retorna o par (id_aluno, id_disciplina) da k-ésima matrícula
+
+    Os pares são únicos para k < alunos x disciplinas e distribuem as
+    matrículas de cada aluno entre disciplinas espalhadas.
+    """
+    aluno = k % volumes.alunos
+    rodada = k // volumes.alunos
+    passo = 7919 % volumes.disciplinas or 1
+    disciplina = (rodada + aluno * passo) % volumes.disciplinas
+    return aluno + 1, disciplina + 1
+
+
+def _linhas_aluno(volumes: Volumes) -> Iterator[str]:
+    for i in range(1, volumes.alunos + 1):
+        yield f"{i}\tAluno Sintético {i:06d}\tB{i:09d}\n"
+
+
+def _linhas_disciplina(volumes: Volumes) -> Iterator[str]:
+    for i in range(1, volumes.disciplinas + 1):
+        ano = 2020 + (i % 6)
+        semestre = 1 + (i // 6) % 2
+        yield f"{i}\tDisciplina {i:05d}\t{ano}\t{semestre}\n"
+
+
+def _linhas_matricula(volumes: Volumes) -> Iterator[str]:
+    for k in range(volumes.notas):
+        id_aluno, id_disciplina = _par_matricula(k, volumes)
+        yield f"{k + 1}\t{id_aluno}\t{id_disciplina}\n"
+
+
+def _linhas_notas(volumes: Volumes, semente: int) -> Iterator[str]:
+    aleatorio = random.Random(semente)
+    for k in range(1, volumes.notas + 1):
+        sm1 = round(aleatorio.uniform(0, 1), 1)
+        sm2 = round(aleatorio.uniform(0, 1), 1)
+        av = "\\N" if aleatorio.random() < _FRACAO_PENDENTES else round(aleatorio.uniform(0, 10), 1)
+        avs = round(aleatorio.uniform(0, 10), 1) if aleatorio.random() < _FRACAO_COM_AVS else "\\N"
+        # nf e situacao são preenchidas pelo trigger da migração 0004 durante o COPY
+        yield f"{k}\t{k}\t{sm1}\t{sm2}\t{av}\t{avs}\n"
+
+
+def _copiar(cur, tabela: str, colunas: str, linhas: Iterator[str]) -> None:
+    """Envia as linhas com COPY em blocos de _LINHAS_POR_COPY"""
+    comando = f"COPY {tabela} ({colunas}) FROM STDIN"
+    bloco = io.StringIO()
+    quantidade = 0
+    for linha in linhas:
+        bloco.write(linha)
+        quantidade += 1
+        if quantidade == _LINHAS_POR_COPY:
+            bloco.seek(0)
+            cur.copy_expert(comando, bloco)
+            bloco = io.StringIO()
+            quantidade = 0
+    if quantidade:
+        bloco.seek(0)
+        cur.copy_expert(comando, bloco)
+
+
+def gerar(
+    volumes: Volumes,
+    db_connection: Optional[DatabaseConnection] = None,
+    semente: int = 42,
+    progresso: Optional[Callable[[str], None]] = None,
+) -> None:
+    """
+    Apaga as tabelas do sistema e as preenche com dados sintéticos
+
+    Toda a carga é feita em uma única transação: em caso de erro o banco volta
+    ao estado anterior.
+
+    Args:
+        volumes: Quantidade de registros por tabela
+        db_connection: Conexão com banco de dados (opcional)
+        semente: Semente do gerador de números aleatórios das notas
+        progresso: Função chamada com mensagens de andamento (opcional)
+    """
+    db = db_connection or DatabaseConnection()
+    avisar = progresso or (lambda mensagem: None)
+
+    with db.transaction() as conn:
+        with conn.cursor() as cur:
+            cur.execute("TRUNCATE notas, matricula, disciplina, aluno RESTART IDENTITY CASCADE")
+
+            etapas = [
+                ("aluno", "id, nome, matricula", _linhas_aluno(volumes)),
+                ("disciplina", "id, nome, ano, semestre", _linhas_disciplina(volumes)),
+                ("matricula", "id, id_aluno, id_disciplina", _linhas_matricula(volumes)),
+                ("notas", "id, id_matricula, sm1, sm2, av, avs", _linhas_notas(volumes, semente)),
+            ]
+            for tabela, colunas, linhas in etapas:
+                inicio = time.perf_counter()
+                _copiar(cur, tabela, colunas, linhas)
+                # Os IDs foram informados explicitamente: ajusta as sequences
+                cur.execute(
+                    f"SELECT setval(pg_get_serial_sequence('{tabela}', 'id'), "
+                    f"COALESCE(max(id), 0) + 1, false) FROM {tabela}"
+                )
+                avisar(f"{tabela}: {time.perf_counter() - inicio:.1f}s")
+
+    # Estatísticas atualizadas para o planejador antes das medições
+    with db.connection() as conn:
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("ANALYZE aluno, disciplina, matricula, notas")
+        finally:
+            conn.autocommit = False
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Gera dados sintéticos para o benchmark")
+    parser.add_argument("--alunos", type=int, default=Volumes.alunos)
+    parser.add_argument("--disciplinas", type=int, default=Volumes.disciplinas)
+    parser.add_argument("--notas", type=int, default=Volumes.notas)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument(
+        "--confirmar", action="store_true", help="confirma que os dados atuais serão apagados"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.confirmar:
+        print("Os dados de aluno, disciplina, matricula e notas serão APAGADOS.")
+        print("Execute novamente com --confirmar para continuar.")
+        return 1
+
+    volumes = Volumes(alunos=args.alunos, disciplinas=args.disciplinas, notas=args.notas)
+    inicio = time.perf_counter()
+    gerar(volumes, semente=args.semente, progresso=print)
+    print(f"Dados gerados em {time.perf_counter() - inicio:.1f}s: {volumes}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,419 @@
+"""
+Suíte de benchmark dos serviços
+
+Mede o tempo de cada método de AlunoService, DisciplinaService,
+MatriculaService e NotasService contra o banco configurado nas variáveis DB_*
+(tipicamente preenchido por benchmark.gerador) e grava o resultado em JSON:
+
+    python -m benchmark.suite --saida benchmark/resultados/atual.json
+    python -m benchmark.suite --comparar benchmark/resultados/base.json
+
+Os métodos de escrita rodam dentro de uma transação desfeita ao final de cada
+repetição, de forma que o banco não muda entre execuções.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from registro_notas_alunos.backend import (
+    AlunoService,
+    DisciplinaService,
+    MatriculaService,
+    NotasService,
+)
+from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.backend.matricula.model import Matricula
+from registro_notas_alunos.backend.notas.model import Notas
+from registro_notas_alunos.backend.notas.vo import FiltroNotasVO
+
+DIRETORIO_RESULTADOS = Path(__file__).resolve().parent / "resultados"
+
+
+@dataclass
+class Caso:
+    """
+    Um método de serviço medido pela suíte
+    """
+
+    nome: str
+    executar: Callable[[], Any]
+    escrita: bool = False
+
+
+@dataclass
+class Medicao:
+    """
+    Tempos de um caso, em milissegundos
+    """
+
+    repeticoes: int
+    linhas: Optional[int]
+    minimo_ms: float
+    mediana_ms: float
+    media_ms: float
+    maximo_ms: float
+
+
+class _Amostra:
+    """IDs existentes no banco usados como parâmetros dos casos"""
+
+    def __init__(self, db: DatabaseConnection):
+        def primeira(query):
+            result = db.execute_query(query)
+            if not result or result[0][0] is None:
+                raise Exception("Banco sem dados: execute benchmark.gerador antes da suíte")
+            return result[0]
+
+        self.id_aluno, self.matricula_aluno = primeira(
+            "SELECT id, matricula FROM aluno ORDER BY id LIMIT 1 OFFSET "
+            "(SELECT count(*) / 2 FROM aluno)"
+        )
+        (
+            self.id_disciplina,
+            self.nome_disciplina,
+            self.ano,
+            self.semestre,
+        ) = primeira(
+            "SELECT id, nome, ano, semestre FROM disciplina ORDER BY id LIMIT 1 OFFSET "
+            "(SELECT count(*) / 2 FROM disciplina)"
+        )
+        self.id_matricula, self.id_aluno_matricula, self.id_disciplina_matricula = primeira(
+            "SELECT id, id_aluno, id_disciplina FROM matricula "
+            "WHERE id IN (SELECT id_matricula FROM notas) ORDER BY id LIMIT 1"
+        )
+        (self.id_notas,) = primeira(
+            f"SELECT id FROM notas WHERE id_matricula = {int(self.id_matricula)}"
+        )
+        # Par aluno/disciplina ainda sem matrícula, para os casos de criação
+        self.id_aluno_livre, self.id_disciplina_livre = primeira(
+            "SELECT a.id, d.id FROM aluno a CROSS JOIN LATERAL ("
+            "  SELECT d.id FROM disciplina d WHERE NOT EXISTS ("
+            "    SELECT 1 FROM matricula m WHERE m.id_aluno = a.id AND m.id_disciplina = d.id"
+            "  ) LIMIT 1"
+            ") d LIMIT 1"
+        )
+
+
+def contar_registros(db: DatabaseConnection) -> Dict[str, int]:
+    """Quantidade de registros de cada tabela do sistema"""
+    return {
+        tabela: db.execute_query(f"SELECT count(*) FROM {tabela}")[0][0]
+        for tabela in ("aluno", "disciplina", "matricula", "notas")
+    }
+
+
+def montar_casos(db: DatabaseConnection) -> List[Caso]:
+    """
+    Monta a lista de casos da suíte com parâmetros existentes no banco
+
+    Args:
+        db: Conexão com banco de dados
+
+    Returns:
+        Lista de Caso, um por método de serviço
+    """
+    amostra = _Amostra(db)
+    alunos = AlunoService(db)
+    disciplinas = DisciplinaService(db)
+    matriculas = MatriculaService(db)
+    notas = NotasService(db)
+
+    def nova_matricula_com_notas():
+        id_matricula = matriculas.criar(
+            Matricula(None, amostra.id_aluno_livre, amostra.id_disciplina_livre)
+        )
+        return notas.criar(Notas(None, id_matricula, sm1=1.0, sm2=0.5, av=7.0))
+
+    return [
+        # AlunoService
+        Caso("AlunoService.criar", lambda: alunos.criar("Aluno Benchmark", "BENCH-0001"), True),
+        Caso("AlunoService.buscar_por_id", lambda: alunos.buscar_por_id(amostra.id_aluno)),
+        Caso(
+            "AlunoService.buscar_por_matricula",
+            lambda: alunos.buscar_por_matricula(amostra.matricula_aluno),
+        ),
+        # A consulta ao banco; a leitura repetida vem de cache_leitura
+        Caso("AlunoService.listar_todos", lambda: alunos.listar_todos(recarregar=True)),
+        Caso("AlunoService.listar_todos (cache)", alunos.listar_todos),
+        Caso(
+            "AlunoService.atualizar",
+            lambda: alunos.atualizar(amostra.id_aluno, "Aluno Renomeado", amostra.matricula_aluno),
+            True,
+        ),
+        Caso("AlunoService.excluir", lambda: alunos.excluir(amostra.id_aluno), True),
+        # DisciplinaService
+        Caso(
+            "DisciplinaService.criar",
+            lambda: disciplinas.criar("Disciplina Benchmark", 2030, 1),
+            True,
+        ),
+        Caso(
+            "DisciplinaService.buscar_por_id",
+            lambda: disciplinas.buscar_por_id(amostra.id_disciplina),
+        ),
+        Caso(
+            "DisciplinaService.buscar_por_nome_ano_semestre",
+            lambda: disciplinas.buscar_por_nome_ano_semestre(
+                amostra.nome_disciplina, amostra.ano, amostra.semestre
+            ),
+        ),
+        Caso("DisciplinaService.listar_todas", lambda: disciplinas.listar_todas(recarregar=True)),
+        Caso("DisciplinaService.listar_todas (cache)", disciplinas.listar_todas),
+        Caso(
+            "DisciplinaService.listar_por_periodo",
+            lambda: disciplinas.listar_por_periodo(amostra.ano, amostra.semestre),
+        ),
+        Caso(
+            "DisciplinaService.atualizar",
+            lambda: disciplinas.atualizar(
+                amostra.id_disciplina, "Disciplina Renomeada", amostra.ano, amostra.semestre
+            ),
+            True,
+        ),
+        Caso("DisciplinaService.excluir", lambda: disciplinas.excluir(amostra.id_disciplina), True),
+        # MatriculaService
+        Caso(
+            "MatriculaService.criar",
+            lambda: matriculas.criar(
+                Matricula(None, amostra.id_aluno_livre, amostra.id_disciplina_livre)
+            ),
+            True,
+        ),
+        Caso(
+            "MatriculaService.buscar_por_id", lambda: matriculas.buscar_por_id(amostra.id_matricula)
+        ),
+        Caso(
+            "MatriculaService.buscar_por_aluno_disciplina",
+            lambda: matriculas.buscar_por_aluno_disciplina(
+                amostra.id_aluno_matricula, amostra.id_disciplina_matricula
+            ),
+        ),
+        Caso(
+            "MatriculaService.listar_por_disciplina",
+            lambda: matriculas.listar_por_disciplina(amostra.id_disciplina),
+        ),
+        Caso(
+            "MatriculaService.listar_por_aluno",
+            lambda: matriculas.listar_por_aluno(amostra.id_aluno),
+        ),
+        Caso("MatriculaService.listar_todas", matriculas.listar_todas),
+        Caso("MatriculaService.iterar_todas", lambda: sum(1 for _ in matriculas.iterar_todas())),
+        Caso("MatriculaService.excluir", lambda: matriculas.excluir(amostra.id_matricula), True),
+        # NotasService
+        Caso("NotasService.criar", nova_matricula_com_notas, True),
+        Caso("NotasService.buscar_por_id", lambda: notas.buscar_por_id(amostra.id_notas)),
+        Caso(
+            "NotasService.buscar_por_matricula",
+            lambda: notas.buscar_por_matricula(amostra.id_matricula),
+        ),
+        Caso(
+            "NotasService.atualizar",
+            lambda: notas.atualizar(
+                Notas(amostra.id_notas, amostra.id_matricula, sm1=1.0, sm2=1.0, av=8.0)
+            ),
+            True,
+        ),
+        Caso(
+            "NotasService.atualizar_por_matricula",
+            lambda: notas.atualizar_por_matricula(
+                Notas(None, amostra.id_matricula, sm1=0.5, sm2=0.5, av=6.0)
+            ),
+            True,
+        ),
+        Caso(
+            "NotasService.listar_por_disciplina",
+            lambda: notas.listar_por_disciplina(amostra.id_disciplina),
+        ),
+        Caso("NotasService.listar_por_aluno", lambda: notas.listar_por_aluno(amostra.id_aluno)),
+        Caso("NotasService.listar_notas_apuradas", notas.listar_notas_apuradas),
+        Caso(
+            "NotasService.iterar_notas_apuradas",
+            lambda: sum(1 for _ in notas.iterar_notas_apuradas()),
+        ),
+        Caso(
+            "NotasService.consultar_notas_apuradas",
+            lambda: notas.consultar_notas_apuradas(
+                FiltroNotasVO(ano=amostra.ano, semestre=amostra.semestre), limite=100
+            ),
+        ),
+        Caso(
+            "NotasService.estatisticas",
+            lambda: notas.estatisticas(FiltroNotasVO(ano=amostra.ano)),
+        ),
+        Caso("NotasService.calcular_todas_notas_finais", notas.calcular_todas_notas_finais, True),
+        Caso("NotasService.excluir", lambda: notas.excluir(amostra.id_notas), True),
+    ]
+
+
+def _contar_linhas(resultado: Any) -> Optional[int]:
+    """Quantidade de linhas retornadas, quando o resultado é uma lista"""
+    if isinstance(resultado, list):
+        return len(resultado)
+    return None
+
+
+def medir(caso: Caso, db: DatabaseConnection, repeticoes: int = 5, aquecimento: int = 1) -> Medicao:
+    """
+    Executa um caso várias vezes e calcula as estatísticas de tempo
+
+    Casos de escrita rodam em uma transação desfeita ao fim de cada repetição.
+
+    Args:
+        caso: Caso a ser medido
+        db: Conexão com banco de dados
+        repeticoes: Quantidade de execuções medidas
+        aquecimento: Quantidade de execuções descartadas antes da medição
+
+    Returns:
+        Medicao com os tempos em milissegundos
+    """
+    tempos = []
+    linhas = None
+
+    for indice in range(aquecimento + repeticoes):
+        if caso.escrita:
+            with db.transaction() as conn:
+                inicio = time.perf_counter()
+                resultado = caso.executar()
+                decorrido = time.perf_counter() - inicio
+                conn.rollback()
+        else:
+            inicio = time.perf_counter()
+            resultado = caso.executar()
+            decorrido = time.perf_counter() - inicio
+
+        if indice >= aquecimento:
+            tempos.append(decorrido * 1000)
+            linhas = _contar_linhas(resultado)
+
+    return Medicao(
+        repeticoes=repeticoes,
+        linhas=linhas,
+        minimo_ms=round(min(tempos), 3),
+        mediana_ms=round(statistics.median(tempos), 3),
+        media_ms=round(statistics.fmean(tempos), 3),
+        maximo_ms=round(max(tempos), 3),
+    )
+
+
+def executar(
+    db_connection: Optional[DatabaseConnection] = None,
+    repeticoes: int = 5,
+    filtro: Optional[str] = None,
+    progresso: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Executa a suíte e retorna o resultado no formato gravado em JSON
+
+    Args:
+        db_connection: Conexão com banco de dados (opcional)
+        repeticoes: Quantidade de execuções medidas por caso
+        filtro: Executa apenas os casos cujo nome contém este texto (opcional)
+        progresso: Função chamada com cada linha de resultado (opcional)
+
+    Returns:
+        Dicionário com "metadados" e "resultados" (nome do caso -> Medicao)
+    """
+    db = db_connection or DatabaseConnection()
+    avisar = progresso or (lambda mensagem: None)
+
+    casos = montar_casos(db)
+    resultados = {}
+    for caso in casos:
+        if filtro and filtro not in caso.nome:
+            continue
+        medicao = medir(caso, db, repeticoes=repeticoes)
+        resultados[caso.nome] = asdict(medicao)
+        avisar(f"{caso.nome:50} {medicao.mediana_ms:10.2f} ms  linhas={medicao.linhas}")
+
+    return {
+        "metadados": {
+            "data": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "postgres": db.execute_query("SHOW server_version")[0][0],
+            "volumes": contar_registros(db),
+            "repeticoes": repeticoes,
+        },
+        "resultados": resultados,
+    }
+
+
+def comparar(
+    base: Dict[str, Any], atual: Dict[str, Any], tolerancia: float = 0.2
+) -> List[Dict[str, Any]]:
+    """
+    Compara duas execuções pela mediana de cada caso
+
+    Args:
+        base: Resultado de referência (conteúdo de um JSON da suíte)
+        atual: Resultado a ser comparado
+        tolerancia: Aumento relativo da mediana tolerado (0.2 = 20%)
+
+    Returns:
+        Lista, por caso presente nas duas execuções, com as medianas, a razão
+        atual/base e se houve regressão além da tolerância
+    """
+    comparacao = []
+    for nome, medicao_atual in atual["resultados"].items():
+        medicao_base = base["resultados"].get(nome)
+        if medicao_base is None:
+            continue
+
+        mediana_base = medicao_base["mediana_ms"]
+        mediana_atual = medicao_atual["mediana_ms"]
+        razao = mediana_atual / mediana_base if mediana_base > 0 else float("inf")
+        comparacao.append(
+            {
+                "caso": nome,
+                "base_ms": mediana_base,
+                "atual_ms": mediana_atual,
+                "razao": round(razao, 3),
+                "regressao": razao > 1 + tolerancia,
+            }
+        )
+    return comparacao
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Benchmark da camada de serviços")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--filtro", help="executa apenas casos cujo nome contém o texto")
+    parser.add_argument("--saida", type=Path, help="arquivo JSON de saída")
+    parser.add_argument("--comparar", type=Path, help="JSON de referência para comparação")
+    parser.add_argument("--tolerancia", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    resultado = executar(repeticoes=args.repeticoes, filtro=args.filtro, progresso=print)
+
+    saida = args.saida
+    if saida is None:
+        DIRETORIO_RESULTADOS.mkdir(exist_ok=True)
+        saida = DIRETORIO_RESULTADOS / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    saida.write_text(json.dumps(resultado, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"Resultado gravado em {saida}")
+
+    if args.comparar:
+        base = json.loads(args.comparar.read_text(encoding="utf-8"))
+        comparacao = comparar(base, resultado, args.tolerancia)
+        for item in comparacao:
+            marcador = "REGRESSÃO" if item["regressao"] else "ok"
+            print(
+                f"{marcador:10} {item['caso']:50} "
+                f"{item['base_ms']:10.2f} -> {item['atual_ms']:10.2f} ms (x{item['razao']})"
+            )
+        return 1 if any(item["regressao"] for item in comparacao) else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Aluno:
     """
     Representa um aluno no sistema
@@ -27,3 +27,21 @@ class Aluno:
         # Normaliza os dados
         self.nome = self.nome.strip()
         self.matricula = self.matricula.strip()
+
+    @classmethod
+    def de_linha(cls, linha: tuple) -> "Aluno":
+        """
+        Cria um Aluno a partir de uma linha lida do banco, sem validar nem normalizar
+
+        Nome e matrícula já foram validados e normalizados ao serem gravados;
+        buscas e listagens evitam assim repetir __post_init__ a cada linha.
+
+        Args:
+            linha: Tupla (id, nome, matricula)
+
+        Returns:
+            Aluno com os valores da linha
+        """
+        aluno = object.__new__(cls)
+        aluno.id, aluno.nome, aluno.matricula = linha
+        return aluno
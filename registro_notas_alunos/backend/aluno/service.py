@@ -5,7 +5,13 @@ Serviço para operações com Aluno
 from typing import List, Optional
 
 from registro_notas_alunos.backend.aluno.model import Aluno
+from registro_notas_alunos.backend.lib.cache import cache_leitura
 from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.backend.lib.paginacao import LIMITE_MAXIMO, Pagina, consultar_pagina
+
+# Termo da busca sem acentos e em minúsculas, como a coluna aluno.nome_busca
+# (migração 0005); o argumento é constante e o banco o calcula antes do plano
+_TERMO = "normalizar_busca(%s)"
 
 
 class AlunoService:
@@ -24,6 +30,7 @@ class AlunoService:
             db_connection: Conexão com banco de dados (opcional)
         """
         self.db = db_connection or DatabaseConnection()
+        self._trigramas: Optional[bool] = None
 
     def criar(self, nome: str, matricula: str) -> int:
         """
@@ -42,17 +49,19 @@ class AlunoService:
         """
         aluno = Aluno(id=None, nome=nome, matricula=matricula)
 
-        # Verifica se matrícula já existe
-        if self.buscar_por_matricula(aluno.matricula):
-            raise Exception("Aluno já existe")
-
         try:
-            query = "INSERT INTO aluno (nome, matricula) VALUES (%s, %s) " "RETURNING id"
+            # ON CONFLICT substitui a consulta prévia: sem linha retornada, a
+            # matrícula já existe
+            query = (
+                "INSERT INTO aluno (nome, matricula) VALUES (%s, %s) "
+                "ON CONFLICT DO NOTHING RETURNING id"
+            )
             result = self.db.execute_query(query, (aluno.nome, aluno.matricula))
 
             if not result:
-                raise Exception("Erro ao criar aluno")
+                raise Exception("Aluno já existe")
 
+            cache_leitura.invalidar("aluno")
             return result[0][0]
         except Exception as e:
             # Captura erros de constraint do banco
@@ -79,8 +88,25 @@ class AlunoService:
         if not result:
             return None
 
-        row = result[0]
-        return Aluno(id=row[0], nome=row[1], matricula=row[2])
+        return Aluno.de_linha(result[0])
+
+    def buscar_por_ids(self, ids: List[int]) -> List[Aluno]:
+        """
+        Busca vários alunos pelo ID em uma única consulta
+
+        Args:
+            ids: IDs dos alunos
+
+        Returns:
+            Alunos encontrados; IDs inexistentes são ignorados
+        """
+        if not ids:
+            return []
+
+        query = "SELECT id, nome, matricula FROM aluno WHERE id = ANY(%s)"
+        results = self.db.execute_query(query, (list(ids),))
+
+        return [Aluno.de_linha(row) for row in (results or [])]
 
     def buscar_por_matricula(self, matricula: str) -> Optional[Aluno]:
         """
@@ -101,23 +127,132 @@ class AlunoService:
         if not result:
             return None
 
-        row = result[0]
-        return Aluno(id=row[0], nome=row[1], matricula=row[2])
+        return Aluno.de_linha(result[0])
+
+    def buscar(self, termo: str, limite: int = 20) -> List[Aluno]:
+        """
+        Busca alunos por trecho do nome ou início da matrícula
+
+        A comparação ignora acentos e maiúsculas. Com a extensão pg_trgm no
+        banco, nomes parecidos com o termo também são encontrados (erros de
+        digitação, como "Joao Slva" para "João Silva"). Os resultados vêm na
+        ordem: nome ou matrícula começando pelo termo, nome com uma palavra
+        começando pelo termo, demais; dentro de cada grupo, os mais parecidos
+        com o termo primeiro.
+
+        Args:
+            termo: Texto digitado pelo usuário
+            limite: Quantidade máxima de alunos retornados
+
+        Returns:
+            Até limite alunos; lista vazia se o termo estiver em branco
+
+        Raises:
+            ValueError: Se o limite estiver fora da faixa
+        """
+        if not 1 <= limite <= LIMITE_MAXIMO:
+            raise ValueError(f"Limite deve estar entre 1 e {LIMITE_MAXIMO}")
+
+        termo = (termo or "").strip()
+        if not termo:
+            return []
 
-    def listar_todos(self) -> List[Aluno]:
+        # O termo é comparado literalmente: curingas do LIKE são escapados
+        literal = termo.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+        condicoes = [
+            f"nome_busca LIKE '%%' || {_TERMO} || '%%'",
+            "matricula LIKE %s || '%%'",
+        ]
+        params = [literal, literal]
+        ordem = [
+            f"CASE WHEN nome_busca LIKE {_TERMO} || '%%' OR matricula LIKE %s || '%%' THEN 0 "
+            f"WHEN nome_busca LIKE '%% ' || {_TERMO} || '%%' THEN 1 ELSE 2 END"
+        ]
+        params_ordem = [literal, literal, literal]
+
+        if self._tem_trigramas():
+            condicoes.append(f"{_TERMO} <%% nome_busca")
+            params.append(termo)
+            ordem.append(f"word_similarity({_TERMO}, nome_busca) DESC")
+            params_ordem.append(termo)
+
+        query = (
+            "SELECT id, nome, matricula FROM aluno "
+            f"WHERE {' OR '.join(condicoes)} "
+            f"ORDER BY {', '.join(ordem)}, nome, matricula LIMIT %s"
+        )
+        results = self.db.execute_query(query, tuple(params + params_ordem + [limite]))
+
+        return [Aluno.de_linha(row) for row in (results or [])]
+
+    def _tem_trigramas(self) -> bool:
+        """Verifica, uma vez por serviço, se a extensão pg_trgm está instalada"""
+        if self._trigramas is None:
+            result = self.db.execute_query(
+                "SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+            )
+            self._trigramas = bool(result and result[0][0])
+        return self._trigramas
+
+    def listar_todos(self, recarregar: bool = False) -> List[Aluno]:
         """
         Lista todos os alunos cadastrados
 
+        O resultado fica no cache compartilhado até expirar ou até uma escrita
+        em aluno.
+
+        Args:
+            recarregar: Consulta o banco mesmo que a lista esteja no cache
+
         Returns:
             Lista de alunos ordenada por nome
         """
+        alunos = cache_leitura.obter(("aluno", "listar_todos"), self._consultar_todos, recarregar)
+        return list(alunos)
+
+    def _consultar_todos(self) -> List[Aluno]:
+        """Consulta todos os alunos, ordenados por nome"""
         query = "SELECT id, nome, matricula FROM aluno ORDER BY nome, matricula"
         results = self.db.execute_query(query)
 
         if not results:
             return []
 
-        return [Aluno(id=row[0], nome=row[1], matricula=row[2]) for row in results]
+        return [Aluno.de_linha(row) for row in results]
+
+    def listar_todos_paginado(
+        self, limite: int = 100, token: Optional[str] = None
+    ) -> Pagina[Aluno]:
+        """
+        Lista os alunos em páginas, na ordem de listar_todos
+
+        Paginação por chave (nome, matrícula): cada página continua após o
+        último aluno da anterior, com custo independente da profundidade.
+
+        Args:
+            limite: Quantidade máxima de alunos na página
+            token: Pagina.proximo da página anterior; None para a primeira
+
+        Returns:
+            Pagina de alunos ordenados por nome e matrícula
+
+        Raises:
+            ValueError: Se o limite estiver fora da faixa ou o token for inválido
+        """
+        return consultar_pagina(
+            self.db,
+            escopo="aluno",
+            select="SELECT id, nome, matricula FROM aluno",
+            condicoes=[],
+            params=[],
+            # matrícula é única, o que torna a chave única
+            chave=("nome", "matricula"),
+            posicoes_chave=(1, 2),
+            limite=limite,
+            token=token,
+            montar=Aluno.de_linha,
+        )
 
     def atualizar(self, id: int, nome: str, matricula: str) -> None:
         """
@@ -148,6 +283,7 @@ class AlunoService:
             aluno = Aluno(id=id, nome=nome, matricula=matricula)
             query = "UPDATE aluno SET nome = %s, matricula = %s WHERE id = %s"
             self.db.execute_query(query, (aluno.nome, aluno.matricula, aluno.id))
+            cache_leitura.invalidar("aluno")
         except Exception as e:
             # Captura erros de constraint do banco
             if "duplicate key" in str(e) or "unique constraint" in str(e):
@@ -170,6 +306,7 @@ class AlunoService:
 
         query = "DELETE FROM aluno WHERE id = %s"
         self.db.execute_query(query, (id,))
+        cache_leitura.invalidar("aluno")
 
     def excluir(self, id: int) -> None:
         """
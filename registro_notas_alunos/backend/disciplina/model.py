@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Disciplina:
     """
     Representa uma disciplina no sistema
@@ -36,3 +36,20 @@ class Disciplina:
 
         # Normaliza os dados
         self.nome = self.nome.strip()
+
+    @classmethod
+    def de_linha(cls, linha: tuple) -> "Disciplina":
+        """
+        Cria uma Disciplina a partir de uma linha lida do banco, sem validar nem normalizar
+
+        O banco só recebe disciplinas validadas pelo construtor normal.
+
+        Args:
+            linha: Tupla (id, nome, ano, semestre)
+
+        Returns:
+            Disciplina com os valores da linha
+        """
+        disciplina = object.__new__(cls)
+        disciplina.id, disciplina.nome, disciplina.ano, disciplina.semestre = linha
+        return disciplina
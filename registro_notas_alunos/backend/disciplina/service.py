@@ -5,7 +5,9 @@ Serviço para operações com Disciplina
 from typing import List, Optional
 
 from registro_notas_alunos.backend.disciplina.model import Disciplina
+from registro_notas_alunos.backend.lib.cache import cache_leitura
 from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.backend.lib.paginacao import Pagina, consultar_pagina
 
 
 class DisciplinaService:
@@ -40,21 +42,21 @@ class DisciplinaService:
         """
         disciplina = Disciplina(id=None, nome=nome, ano=ano, semestre=semestre)
 
-        # Verifica se disciplina já existe
-        if self.buscar_por_nome_ano_semestre(disciplina.nome, disciplina.ano, disciplina.semestre):
-            raise Exception("Disciplina já existe")
-
         try:
+            # ON CONFLICT usa o índice único (nome, ano, semestre): sem linha
+            # retornada, a disciplina já existe
             query = (
-                "INSERT INTO disciplina (nome, ano, semestre) VALUES (%s, %s, %s) " "RETURNING id"
+                "INSERT INTO disciplina (nome, ano, semestre) VALUES (%s, %s, %s) "
+                "ON CONFLICT DO NOTHING RETURNING id"
             )
             result = self.db.execute_query(
                 query, (disciplina.nome, disciplina.ano, disciplina.semestre)
             )
 
             if not result:
-                raise Exception("Erro ao criar disciplina")
+                raise Exception("Disciplina já existe")
 
+            cache_leitura.invalidar("disciplina")
             return result[0][0]
         except Exception as e:
             # Captura erros de constraint do banco
@@ -81,8 +83,25 @@ class DisciplinaService:
         if not result:
             return None
 
-        row = result[0]
-        return Disciplina(id=row[0], nome=row[1], ano=row[2], semestre=row[3])
+        return Disciplina.de_linha(result[0])
+
+    def buscar_por_ids(self, ids: List[int]) -> List[Disciplina]:
+        """
+        Busca várias disciplinas pelo ID em uma única consulta
+
+        Args:
+            ids: IDs das disciplinas
+
+        Returns:
+            Disciplinas encontradas; IDs inexistentes são ignorados
+        """
+        if not ids:
+            return []
+
+        query = "SELECT id, nome, ano, semestre FROM disciplina WHERE id = ANY(%s)"
+        results = self.db.execute_query(query, (list(ids),))
+
+        return [Disciplina.de_linha(row) for row in (results or [])]
 
     def buscar_por_nome_ano_semestre(
         self, nome: str, ano: int, semestre: int
@@ -107,23 +126,62 @@ class DisciplinaService:
         if not result:
             return None
 
-        row = result[0]
-        return Disciplina(id=row[0], nome=row[1], ano=row[2], semestre=row[3])
+        return Disciplina.de_linha(result[0])
 
-    def listar_todas(self) -> List[Disciplina]:
+    def listar_todas(self, recarregar: bool = False) -> List[Disciplina]:
         """
         Lista todas as disciplinas cadastradas
 
+        O resultado fica no cache compartilhado até expirar ou até uma escrita
+        em disciplina.
+
+        Args:
+            recarregar: Consulta o banco mesmo que a lista esteja no cache
+
         Returns:
             Lista de disciplinas ordenada por nome
         """
+        disciplinas = cache_leitura.obter(
+            ("disciplina", "listar_todas"), self._consultar_todas, recarregar
+        )
+        return list(disciplinas)
+
+    def _consultar_todas(self) -> List[Disciplina]:
+        """Consulta todas as disciplinas, ordenadas por nome"""
         query = "SELECT id, nome, ano, semestre FROM disciplina ORDER BY nome"
         results = self.db.execute_query(query)
 
-        return [
-            Disciplina(id=row[0], nome=row[1], ano=row[2], semestre=row[3])
-            for row in (results or [])
-        ]
+        return [Disciplina.de_linha(row) for row in (results or [])]
+
+    def listar_todas_paginado(
+        self, limite: int = 100, token: Optional[str] = None
+    ) -> Pagina[Disciplina]:
+        """
+        Lista as disciplinas em páginas, na ordem de listar_todas
+
+        Args:
+            limite: Quantidade máxima de disciplinas na página
+            token: Pagina.proximo da página anterior; None para a primeira
+
+        Returns:
+            Pagina de disciplinas ordenadas por nome, ano e semestre
+
+        Raises:
+            ValueError: Se o limite estiver fora da faixa ou o token for inválido
+        """
+        return consultar_pagina(
+            self.db,
+            escopo="disciplina",
+            select="SELECT id, nome, ano, semestre FROM disciplina",
+            condicoes=[],
+            params=[],
+            # Única por uq_disciplina_nome_ano_semestre, que também atende a consulta
+            chave=("nome", "ano", "semestre"),
+            posicoes_chave=(1, 2, 3),
+            limite=limite,
+            token=token,
+            montar=Disciplina.de_linha,
+        )
 
     def listar_por_periodo(self, ano: int, semestre: int) -> List[Disciplina]:
         """
@@ -145,10 +203,7 @@ class DisciplinaService:
         )
         results = self.db.execute_query(query, (ano, semestre))
 
-        return [
-            Disciplina(id=row[0], nome=row[1], ano=row[2], semestre=row[3])
-            for row in (results or [])
-        ]
+        return [Disciplina.de_linha(row) for row in (results or [])]
 
     def atualizar(self, id: int, nome: str, ano: int, semestre: int) -> None:
         """
@@ -178,6 +233,7 @@ class DisciplinaService:
                 query,
                 (disciplina.nome, disciplina.ano, disciplina.semestre, disciplina.id),
             )
+            cache_leitura.invalidar("disciplina")
         except Exception as e:
             # Captura erros de constraint do banco
             if "duplicate key" in str(e) or "unique constraint" in str(e):
@@ -200,6 +256,7 @@ class DisciplinaService:
 
         query = "DELETE FROM disciplina WHERE id = %s"
         self.db.execute_query(query, (id,))
+        cache_leitura.invalidar("disciplina")
 
     def deletar(self, id: int) -> None:
         """
@@ -0,0 +1,144 @@
+"""
+Cache de leitura compartilhado pelos serviços
+
+Listas de referência (alunos, disciplinas) são lidas por várias telas a cada
+abertura. CacheLeitura guarda o resultado dessas consultas em memória, com
+validade (CACHE_TTL_SECONDS, padrão 300 s) e número máximo de entradas
+(CACHE_MAX_ITENS, padrão 128, descartando as menos usadas). Os métodos de
+escrita dos serviços invalidam o grupo da tabela alterada.
+
+Dentro de DatabaseConnection.transaction() as leituras vão direto ao banco, sem
+consultar nem guardar entradas, pois enxergam linhas ainda não confirmadas; as
+invalidações são repetidas após o commit, descartando o que outra thread tenha
+guardado antes dele.
+
+    from registro_notas_alunos.backend.lib.cache import cache_leitura
+
+    alunos = cache_leitura.obter(("aluno", "listar_todos"), consultar)
+    cache_leitura.invalidar("aluno")
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from registro_notas_alunos.backend.lib.database import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+_TTL_PADRAO_S = 300.0
+_MAX_ITENS_PADRAO = 128
+
+T = TypeVar("T")
+
+
+class CacheLeitura:
+    """
+    Cache thread-safe com validade e descarte das entradas menos usadas
+
+    As chaves são tuplas cujo primeiro elemento é o grupo (em geral o nome da
+    tabela), usado na invalidação.
+    """
+
+    def __init__(self, ttl_s: Optional[float] = None, max_itens: Optional[int] = None):
+        """
+        Inicializa o cache
+
+        Args:
+            ttl_s: Validade das entradas, em segundos; 0 desliga o cache.
+                Padrão: CACHE_TTL_SECONDS ou 300
+            max_itens: Número máximo de entradas. Padrão: CACHE_MAX_ITENS ou 128
+        """
+        if ttl_s is None:
+            valor = os.getenv("CACHE_TTL_SECONDS")
+            ttl_s = float(valor) if valor else _TTL_PADRAO_S
+        if max_itens is None:
+            valor = os.getenv("CACHE_MAX_ITENS")
+            max_itens = int(valor) if valor else _MAX_ITENS_PADRAO
+
+        self.ttl_s = ttl_s
+        self.max_itens = max_itens
+        self.acertos = 0
+        self.falhas = 0
+        self._lock = threading.Lock()
+        self._itens: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        # Incrementado a cada invalidação do grupo; evita guardar uma leitura
+        # iniciada antes de uma escrita concorrente
+        self._geracoes: Dict[Hashable, int] = {}
+
+    def obter(self, chave: Tuple, carregar: Callable[[], T], recarregar: bool = False) -> T:
+        """
+        Retorna o valor da chave, consultando-o com carregar se ausente ou vencido
+
+        A consulta roda fora do lock; duas threads podem carregar a mesma chave
+        ao mesmo tempo, e a última a terminar prevalece. Dentro de uma transação
+        a consulta sempre roda e o resultado não é guardado.
+
+        Args:
+            chave: Tupla (grupo, ...) que identifica a consulta
+            carregar: Executa a consulta
+            recarregar: Ignora o valor guardado e consulta de novo
+
+        Returns:
+            Valor guardado ou recém-consultado
+        """
+        if self.ttl_s <= 0 or DatabaseConnection.em_transacao():
+            return carregar()
+
+        agora = time.monotonic()
+        with self._lock:
+            item = None if recarregar else self._itens.get(chave)
+            if item is not None and item[0] > agora:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return item[1]
+            self.falhas += 1
+            geracao = self._geracoes.get(chave[0], 0)
+
+        valor = carregar()
+
+        with self._lock:
+            if self._geracoes.get(chave[0], 0) == geracao:
+                self._itens[chave] = (time.monotonic() + self.ttl_s, valor)
+                self._itens.move_to_end(chave)
+                while len(self._itens) > self.max_itens:
+                    self._itens.popitem(last=False)
+        return valor
+
+    def invalidar(self, grupo: Hashable) -> None:
+        """
+        Descarta as entradas do grupo
+
+        Dentro de uma transação o descarte é repetido após o commit: até lá
+        outras threads ainda leem e podem guardar os dados anteriores.
+
+        Args:
+            grupo: Primeiro elemento das chaves a descartar; ex.: "aluno"
+        """
+        if DatabaseConnection.em_transacao():
+            DatabaseConnection.ao_confirmar(lambda: self.invalidar(grupo))
+        with self._lock:
+            self._geracoes[grupo] = self._geracoes.get(grupo, 0) + 1
+            for chave in [chave for chave in self._itens if chave[0] == grupo]:
+                del self._itens[chave]
+        logger.debug(f"Cache invalidado: {grupo}")
+
+    def limpar(self) -> None:
+        """Descarta todas as entradas e zera os contadores"""
+        with self._lock:
+            for grupo in {chave[0] for chave in self._itens} | set(self._geracoes):
+                self._geracoes[grupo] = self._geracoes.get(grupo, 0) + 1
+            self._itens.clear()
+            self.acertos = 0
+            self.falhas = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._itens)
+
+
+# Cache compartilhado por todas as instâncias dos serviços
+cache_leitura = CacheLeitura()
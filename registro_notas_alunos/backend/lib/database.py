@@ -1,34 +1,60 @@
 import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
 
 from dotenv import load_dotenv
-from psycopg2 import pool
+from psycopg2 import extras, pool
+
+from registro_notas_alunos.backend.lib.instrumentacao import instrumentacao
 
 # Carrega as variáveis de ambiente do arquivo .env
 load_dotenv()
 
 
+def _env_int(nome, padrao):
+    """Lê uma variável de ambiente inteira, usando o padrão se ausente"""
+    valor = os.getenv(nome)
+    return int(valor) if valor else padrao
+
+
+def parametros_conexao():
+    """Parâmetros de conexão do .env, comuns ao pool e a conexões dedicadas"""
+    return {
+        "host": os.getenv("DB_HOST"),
+        "port": os.getenv("DB_PORT"),
+        "database": os.getenv("DB_NAME"),
+        "user": os.getenv("DB_USER"),
+        "password": os.getenv("DB_PASSWORD"),
+    }
+
+
 class DatabaseConnection:
     _instance = None
     _pool = None
+    _lock = threading.Lock()
+    # Conexão da transação corrente, isolada por thread
+    _local = threading.local()
+    # Coletor de latência, linhas e espera do pool por statement
+    instrumentacao = instrumentacao
 
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(DatabaseConnection, cls).__new__(cls)
-            cls._initialize_pool()
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(DatabaseConnection, cls).__new__(cls)
+                cls._initialize_pool()
         return cls._instance
 
     @classmethod
     def _initialize_pool(cls):
         if cls._pool is None:
             try:
-                cls._pool = pool.SimpleConnectionPool(
-                    minconn=1,
-                    maxconn=10,
-                    host=os.getenv("DB_HOST"),
-                    port=os.getenv("DB_PORT"),
-                    database=os.getenv("DB_NAME"),
-                    user=os.getenv("DB_USER"),
-                    password=os.getenv("DB_PASSWORD"),
+                # ThreadedConnectionPool pode ser compartilhado entre threads
+                cls._pool = pool.ThreadedConnectionPool(
+                    minconn=_env_int("DB_MIN_CONNECTIONS", 1),
+                    maxconn=_env_int("DB_MAX_CONNECTIONS", 10),
+                    **parametros_conexao(),
                 )
             except Exception as e:
                 print(f"Erro ao criar pool de conexões: {e}")
@@ -36,40 +62,271 @@ class DatabaseConnection:
 
     def get_connection(self):
         """Retorna uma conexão do pool"""
-        return self._pool.getconn()
+        inicio = time.perf_counter()
+        conn = self._pool.getconn()
+        # A espera é atribuída ao próximo statement executado pela thread
+        self._local.espera_pool = time.perf_counter() - inicio
+        return conn
 
     def release_connection(self, conn):
         """Libera uma conexão de volta para o pool"""
         self._pool.putconn(conn)
 
+    def _current_connection(self):
+        """Retorna a conexão da transação aberta na thread atual, se houver"""
+        return getattr(self._local, "conn", None)
+
+    @classmethod
+    def em_transacao(cls):
+        """Indica se a thread atual está dentro de transaction()"""
+        return getattr(cls._local, "conn", None) is not None
+
+    @classmethod
+    def ao_confirmar(cls, funcao):
+        """
+        Executa funcao após o commit da transação aberta na thread atual
+
+        Fora de transaction() a função é executada imediatamente. Se a transação
+        terminar em rollback, a função é descartada.
+
+        Args:
+            funcao: Chamada sem argumentos; ex.: invalidar um cache
+        """
+        if not cls.em_transacao():
+            funcao()
+            return
+        cls._local.ao_confirmar.append(funcao)
+
+    def _registrar(self, query, duracao, linhas, erro=False):
+        """Registra a execução de um statement na instrumentação"""
+        espera_pool = getattr(self._local, "espera_pool", 0.0)
+        self._local.espera_pool = 0.0
+        self.instrumentacao.registrar(query, duracao, linhas, espera_pool, erro=erro)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Abre uma transação compartilhada pelas queries executadas na thread atual
+
+        Todas as chamadas a execute_query dentro do bloco usam a mesma conexão e
+        o commit é feito uma única vez ao final. Em caso de exceção é feito
+        rollback. Transações aninhadas reaproveitam a transação externa. As funções
+        registradas com ao_confirmar() rodam depois do commit.
+
+        Yields:
+            Conexão psycopg2 da transação
+        """
+        conn = self._current_connection()
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self.get_connection()
+        self._local.conn = conn
+        self._local.ao_confirmar = []
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            confirmacoes, self._local.ao_confirmar = self._local.ao_confirmar, []
+            self.release_connection(conn)
+
+        # Fora da transação: uma função que chame ao_confirmar roda na hora
+        for funcao in confirmacoes:
+            funcao()
+
+    @contextmanager
+    def connection(self):
+        """
+        Fornece uma conexão para uso pontual
+
+        Dentro de transaction() retorna a conexão da transação, sem commit.
+        Fora dela obtém uma conexão do pool, faz commit ao final (ou rollback em
+        caso de erro) e a devolve ao pool.
+
+        Yields:
+            Conexão psycopg2
+        """
+        conn = self._current_connection()
+        if conn is not None:
+            yield conn
+            return
+
+        conn = self.get_connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.release_connection(conn)
+
     def execute_query(self, query, params=None):
         """Executa uma query e retorna os resultados"""
-        conn = None
         try:
-            conn = self.get_connection()
-            with conn.cursor() as cur:
-                cur.execute(query, params or ())
-                # Retorna dados para SELECT e comandos com RETURNING
-                query_upper = query.strip().upper()
-                if query_upper.startswith("SELECT") or "RETURNING" in query_upper:
-                    result = cur.fetchall()
-                    # Também faz commit para comandos com RETURNING (INSERT, UPDATE, DELETE)
-                    if not query_upper.startswith("SELECT"):
-                        conn.commit()
+            with self.connection() as conn:
+                with conn.cursor() as cur:
+                    inicio = time.perf_counter()
+                    try:
+                        cur.execute(query, params or ())
+                        # Retorna dados para comandos que produzem linhas (SELECT,
+                        # WITH ... SELECT e comandos com RETURNING)
+                        result = cur.fetchall() if cur.description is not None else None
+                    except Exception:
+                        self._registrar(query, time.perf_counter() - inicio, 0, erro=True)
+                        raise
+                    linhas = len(result) if result is not None else max(cur.rowcount, 0)
+                    self._registrar(query, time.perf_counter() - inicio, linhas)
                     return result
-                conn.commit()
-                return None
         except Exception as e:
-            if conn:
-                conn.rollback()
             print(f"Erro ao executar query: {e}")
             raise
-        finally:
-            if conn:
-                self.release_connection(conn)
+
+    def execute_values(self, query, params_list, template=None, page_size=1000, fetch=False):
+        """
+        Executa um comando com várias linhas de parâmetros em poucas idas ao banco
+
+        A query deve conter um único placeholder %s no lugar da lista VALUES,
+        por exemplo "INSERT INTO aluno (nome, matricula) VALUES %s RETURNING id".
+        As linhas são enviadas em páginas de page_size linhas por comando.
+
+        Args:
+            query: Comando SQL com o placeholder da lista de valores
+            params_list: Sequência de tuplas de parâmetros, uma por linha
+            template: Template de cada linha, ex.: "(%s, %s::real)" (opcional)
+            page_size: Quantidade de linhas enviadas por comando
+            fetch: Se True, retorna as linhas do RETURNING de todas as páginas
+
+        Returns:
+            Lista com as linhas retornadas se fetch=True, senão None
+        """
+        params_list = list(params_list)
+        if not params_list:
+            return [] if fetch else None
+
+        try:
+            with self.connection() as conn:
+                with conn.cursor() as cur:
+                    inicio = time.perf_counter()
+                    try:
+                        result = extras.execute_values(
+                            cur,
+                            query,
+                            params_list,
+                            template=template,
+                            page_size=page_size,
+                            fetch=fetch,
+                        )
+                    except Exception:
+                        self._registrar(query, time.perf_counter() - inicio, 0, erro=True)
+                        raise
+                    self._registrar(
+                        query,
+                        time.perf_counter() - inicio,
+                        len(result) if fetch else len(params_list),
+                    )
+                    return result
+        except Exception as e:
+            print(f"Erro ao executar query em lote: {e}")
+            raise
+
+    def execute_many(self, query, params_list, page_size=1000):
+        """
+        Executa o mesmo comando para várias tuplas de parâmetros em lotes
+
+        Usa psycopg2.extras.execute_batch, que agrupa page_size comandos por ida
+        ao banco. Indicado para comandos que não cabem em uma lista VALUES.
+
+        Args:
+            query: Comando SQL com placeholders %s
+            params_list: Sequência de tuplas de parâmetros
+            page_size: Quantidade de comandos enviados por ida ao banco
+        """
+        params_list = list(params_list)
+        if not params_list:
+            return None
+
+        try:
+            with self.connection() as conn:
+                with conn.cursor() as cur:
+                    inicio = time.perf_counter()
+                    try:
+                        extras.execute_batch(cur, query, params_list, page_size=page_size)
+                    except Exception:
+                        self._registrar(query, time.perf_counter() - inicio, 0, erro=True)
+                        raise
+                    self._registrar(query, time.perf_counter() - inicio, len(params_list))
+            return None
+        except Exception as e:
+            print(f"Erro ao executar query em lote: {e}")
+            raise
+
+    def stream_batches(self, query, params=None, batch_size=2000):
+        """
+        Executa um SELECT com cursor nomeado (server-side) e gera lotes de linhas
+
+        O resultado permanece no servidor e é trazido em lotes de batch_size
+        linhas conforme o consumo, sem materializar a consulta inteira em
+        memória. A conexão fica reservada até o gerador ser esgotado ou fechado.
+
+        Args:
+            query: Comando SELECT
+            params: Parâmetros da query (opcional)
+            batch_size: Quantidade de linhas por lote (itersize do cursor)
+
+        Yields:
+            Listas de tuplas com até batch_size linhas
+        """
+        try:
+            with self.connection() as conn:
+                with conn.cursor(name=f"stream_{uuid.uuid4().hex}") as cur:
+                    cur.itersize = batch_size
+                    # Mede apenas o tempo gasto no banco, sem o do consumidor
+                    decorrido = 0.0
+                    linhas = 0
+                    erro = False
+                    try:
+                        inicio = time.perf_counter()
+                        cur.execute(query, params or ())
+                        while True:
+                            rows = cur.fetchmany(batch_size)
+                            decorrido += time.perf_counter() - inicio
+                            if not rows:
+                                break
+                            linhas += len(rows)
+                            yield rows
+                            inicio = time.perf_counter()
+                    except Exception:
+                        erro = True
+                        raise
+                    finally:
+                        self._registrar(query, decorrido, linhas, erro)
+        except Exception as e:
+            print(f"Erro ao executar query em streaming: {e}")
+            raise
+
+    def stream_query(self, query, params=None, itersize=2000):
+        """
+        Executa um SELECT com cursor nomeado (server-side) e gera linha a linha
+
+        Args:
+            query: Comando SELECT
+            params: Parâmetros da query (opcional)
+            itersize: Quantidade de linhas trazidas do servidor por ida ao banco
+
+        Yields:
+            Tuplas com as linhas do resultado
+        """
+        for rows in self.stream_batches(query, params, batch_size=itersize):
+            yield from rows
 
     def close(self):
         """Fecha o pool de conexões"""
         if self._pool:
             self._pool.closeall()
-            self._pool = None
+            type(self)._pool = None
@@ -0,0 +1,232 @@
+"""
+Instrumentação das queries executadas por DatabaseConnection
+
+Registra, por statement, a latência, as linhas retornadas e a espera por uma
+conexão do pool, agregando os números por fingerprint (o SQL normalizado, sem
+literais nem listas de valores). Queries acima de DB_SLOW_QUERY_MS são
+registradas no log.
+
+Uso típico para localizar padrões N+1 (a captura vale só para a thread atual;
+chame o serviço diretamente, não a tela, que consulta pelo ExecutorTarefas):
+
+    from registro_notas_alunos.backend.lib.instrumentacao import instrumentacao
+
+    with instrumentacao.capturar() as captura:
+        notas_service.listar_notas_apuradas()
+    print(captura.total, captura.por_fingerprint().most_common(3))
+"""
+
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_LIMITE_LENTO_PADRAO_MS = 500.0
+
+_RE_STRING = re.compile(r"'(?:[^']|'')*'")
+_RE_NUMERO = re.compile(r"(?<![\w$])-?\d+(?:\.\d+)?\b")
+_RE_PLACEHOLDER = re.compile(r"%\(\w+\)s|%s")
+_RE_LISTA = re.compile(r"\(\s*\?(?:\s*(?:::\s*\w+)?\s*,\s*\?)*(?:\s*::\s*\w+)?\s*\)")
+_RE_LISTAS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_RE_ESPACOS = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalizar_sql(query: str) -> str:
+    """
+    Gera o fingerprint de uma query
+
+    Literais e placeholders viram "?", listas de valores viram "(?)" e
+    espaços são compactados, de forma que a mesma query com parâmetros
+    diferentes tenha o mesmo fingerprint.
+
+    Args:
+        query: Texto SQL
+
+    Returns:
+        SQL normalizado
+    """
+    sql = _RE_STRING.sub("?", query)
+    sql = _RE_PLACEHOLDER.sub("?", sql)
+    sql = _RE_NUMERO.sub("?", sql)
+    sql = _RE_ESPACOS.sub(" ", sql).strip()
+    sql = _RE_LISTA.sub("(?)", sql)
+    sql = _RE_LISTAS.sub("(?)", sql)
+    return sql
+
+
+@dataclass
+class EstatisticaConsulta:
+    """
+    Contadores agregados de um fingerprint
+    """
+
+    fingerprint: str
+    execucoes: int = 0
+    erros: int = 0
+    linhas: int = 0
+    tempo_total_ms: float = 0.0
+    tempo_maximo_ms: float = 0.0
+    espera_pool_ms: float = 0.0
+    lentas: int = 0
+
+    @property
+    def tempo_medio_ms(self) -> float:
+        """Tempo médio por execução"""
+        return self.tempo_total_ms / self.execucoes if self.execucoes else 0.0
+
+
+@dataclass
+class RegistroConsulta:
+    """
+    Uma execução de statement, como vista por capturar()
+    """
+
+    fingerprint: str
+    tempo_ms: float
+    linhas: int
+    espera_pool_ms: float
+    erro: bool = False
+
+
+class Captura:
+    """
+    Registros das queries executadas pela thread atual dentro de capturar()
+    """
+
+    def __init__(self):
+        self.registros: List[RegistroConsulta] = []
+
+    @property
+    def total(self) -> int:
+        """Quantidade de statements executados"""
+        return len(self.registros)
+
+    @property
+    def tempo_total_ms(self) -> float:
+        """Soma do tempo dos statements executados"""
+        return sum(registro.tempo_ms for registro in self.registros)
+
+    def por_fingerprint(self) -> Counter:
+        """Quantidade de execuções por fingerprint; repetições indicam N+1"""
+        return Counter(registro.fingerprint for registro in self.registros)
+
+
+class Instrumentacao:
+    """
+    Coletor thread-safe das estatísticas de execução de queries
+    """
+
+    def __init__(self, limite_lento_ms: Optional[float] = None):
+        """
+        Inicializa o coletor
+
+        Args:
+            limite_lento_ms: Tempo a partir do qual a query é registrada no log
+                como lenta; 0 desliga. Padrão: DB_SLOW_QUERY_MS ou 500 ms
+        """
+        if limite_lento_ms is None:
+            valor = os.getenv("DB_SLOW_QUERY_MS")
+            limite_lento_ms = float(valor) if valor else _LIMITE_LENTO_PADRAO_MS
+        self.limite_lento_ms = limite_lento_ms
+        self._lock = threading.Lock()
+        self._estatisticas: Dict[str, EstatisticaConsulta] = {}
+        self._local = threading.local()
+
+    def registrar(
+        self,
+        query: str,
+        duracao_s: float,
+        linhas: int = 0,
+        espera_pool_s: float = 0.0,
+        erro: bool = False,
+    ) -> None:
+        """
+        Registra a execução de um statement
+
+        Args:
+            query: Texto SQL executado
+            duracao_s: Tempo de execução, em segundos
+            linhas: Linhas retornadas ou afetadas
+            espera_pool_s: Tempo de espera por uma conexão do pool, em segundos
+            erro: Se a execução terminou em erro
+        """
+        fingerprint = normalizar_sql(query)
+        tempo_ms = duracao_s * 1000
+        espera_ms = espera_pool_s * 1000
+        lenta = 0 < self.limite_lento_ms <= tempo_ms
+
+        with self._lock:
+            estatistica = self._estatisticas.get(fingerprint)
+            if estatistica is None:
+                estatistica = EstatisticaConsulta(fingerprint)
+                self._estatisticas[fingerprint] = estatistica
+            estatistica.execucoes += 1
+            estatistica.erros += int(erro)
+            estatistica.linhas += linhas
+            estatistica.tempo_total_ms += tempo_ms
+            estatistica.tempo_maximo_ms = max(estatistica.tempo_maximo_ms, tempo_ms)
+            estatistica.espera_pool_ms += espera_ms
+            estatistica.lentas += int(lenta)
+
+        for captura in getattr(self._local, "capturas", ()):
+            captura.registros.append(
+                RegistroConsulta(fingerprint, tempo_ms, linhas, espera_ms, erro)
+            )
+
+        if lenta:
+            logger.warning(
+                f"Query lenta ({tempo_ms:.1f} ms, {linhas} linhas, "
+                f"espera do pool {espera_ms:.1f} ms): {fingerprint}"
+            )
+
+    def snapshot(self) -> List[EstatisticaConsulta]:
+        """
+        Retorna uma cópia dos contadores agregados por fingerprint
+
+        Returns:
+            Lista de EstatisticaConsulta ordenada pelo tempo total, decrescente
+        """
+        with self._lock:
+            copias = [
+                EstatisticaConsulta(**vars(estatistica))
+                for estatistica in self._estatisticas.values()
+            ]
+        return sorted(copias, key=lambda estatistica: estatistica.tempo_total_ms, reverse=True)
+
+    def resetar(self) -> None:
+        """Zera os contadores agregados"""
+        with self._lock:
+            self._estatisticas.clear()
+
+    @contextmanager
+    def capturar(self):
+        """
+        Captura as queries executadas pela thread atual dentro do bloco
+
+        Capturas podem ser aninhadas; cada uma recebe todos os registros do
+        seu bloco.
+
+        Yields:
+            Captura com os registros do bloco
+        """
+        captura = Captura()
+        capturas = getattr(self._local, "capturas", None)
+        if capturas is None:
+            capturas = self._local.capturas = []
+        capturas.append(captura)
+        try:
+            yield captura
+        finally:
+            capturas.remove(captura)
+
+
+# Coletor compartilhado por todas as instâncias de DatabaseConnection
+instrumentacao = Instrumentacao()
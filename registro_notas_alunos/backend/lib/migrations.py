@@ -0,0 +1,355 @@
+"""
+Migrações versionadas do esquema do banco de dados
+
+As migrações são arquivos SQL em registro_notas_alunos/sql/migrations com nome
+no formato NNNN_descricao.sql. As versões aplicadas ficam registradas na tabela
+schema_migrations. Uso pela linha de comando:
+
+    python -m registro_notas_alunos.backend.lib.migrations            # aplica pendentes
+    python -m registro_notas_alunos.backend.lib.migrations --status   # lista versões
+    python -m registro_notas_alunos.backend.lib.migrations --explain  # verifica índices
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Set, Tuple
+
+from registro_notas_alunos.backend.lib.database import DatabaseConnection
+
+DIRETORIO_MIGRACOES = Path(__file__).resolve().parents[2] / "sql" / "migrations"
+
+# Chave do advisory lock que impede duas aplicações simultâneas das migrações
+_CHAVE_LOCK = 7_400_101
+
+_PADRAO_ARQUIVO = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+_SQL_CRIAR_TABELA_CONTROLE = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        versao INTEGER PRIMARY KEY,
+        nome VARCHAR(200) NOT NULL,
+        aplicada_em TIMESTAMP NOT NULL DEFAULT now()
+    )
+"""
+
+
+@dataclass
+class Migracao:
+    """
+    Representa um arquivo de migração
+    """
+
+    versao: int
+    nome: str
+    caminho: Path
+
+    def sql(self) -> str:
+        """Retorna o conteúdo SQL da migração"""
+        return self.caminho.read_text(encoding="utf-8")
+
+
+@dataclass
+class VerificacaoIndice:
+    """
+    Resultado da verificação de uso de índice por uma consulta de serviço
+    """
+
+    consulta: str
+    indice_esperado: str
+    indices_usados: List[str]
+
+    @property
+    def ok(self) -> bool:
+        """Indica se o plano usa o índice esperado"""
+        return self.indice_esperado in self.indices_usados
+
+
+class Migrador:
+    """
+    Aplica as migrações pendentes e verifica o uso dos índices
+    """
+
+    def __init__(
+        self,
+        db_connection: Optional[DatabaseConnection] = None,
+        diretorio: Optional[Path] = None,
+    ):
+        """
+        Inicializa o migrador
+
+        Args:
+            db_connection: Conexão com banco de dados (opcional)
+            diretorio: Diretório dos arquivos de migração (opcional)
+        """
+        self.db = db_connection or DatabaseConnection()
+        self.diretorio = diretorio or DIRETORIO_MIGRACOES
+
+    def listar_disponiveis(self) -> List[Migracao]:
+        """
+        Lista os arquivos de migração do diretório, em ordem de versão
+
+        Returns:
+            Lista de Migracao ordenada por versão
+
+        Raises:
+            ValueError: Se houver duas migrações com a mesma versão
+        """
+        migracoes = {}
+        for caminho in sorted(self.diretorio.glob("*.sql")):
+            match = _PADRAO_ARQUIVO.match(caminho.name)
+            if not match:
+                continue
+
+            versao = int(match.group(1))
+            if versao in migracoes:
+                raise ValueError(f"Versão de migração duplicada: {versao}")
+            migracoes[versao] = Migracao(versao=versao, nome=match.group(2), caminho=caminho)
+
+        return [migracoes[versao] for versao in sorted(migracoes)]
+
+    def versoes_aplicadas(self) -> Set[int]:
+        """
+        Retorna as versões já registradas em schema_migrations
+
+        Returns:
+            Conjunto de versões aplicadas
+        """
+        self.db.execute_query(_SQL_CRIAR_TABELA_CONTROLE)
+        result = self.db.execute_query("SELECT versao FROM schema_migrations")
+        return {row[0] for row in (result or [])}
+
+    def pendentes(self) -> List[Migracao]:
+        """
+        Lista as migrações ainda não aplicadas
+
+        Returns:
+            Lista de Migracao pendentes, em ordem de versão
+        """
+        aplicadas = self.versoes_aplicadas()
+        return [m for m in self.listar_disponiveis() if m.versao not in aplicadas]
+
+    def versao_atual(self) -> int:
+        """
+        Retorna a maior versão aplicada, sem alterar o banco
+
+        Ao contrário de versoes_aplicadas, não cria schema_migrations: pode ser
+        usado com as credenciais dos usuários da interface, sem permissão de DDL.
+
+        Returns:
+            Maior versão registrada; 0 se nenhuma migração foi aplicada
+        """
+        result = self.db.execute_query("SELECT to_regclass('schema_migrations') IS NOT NULL")
+        if not result or not result[0][0]:
+            return 0
+
+        result = self.db.execute_query("SELECT COALESCE(MAX(versao), 0) FROM schema_migrations")
+        return result[0][0] if result else 0
+
+    def versao_mais_recente(self) -> int:
+        """
+        Retorna a maior versão entre os arquivos de migração
+
+        Returns:
+            Versão da última migração disponível; 0 se não houver nenhuma
+        """
+        disponiveis = self.listar_disponiveis()
+        return disponiveis[-1].versao if disponiveis else 0
+
+    def aplicar(self) -> List[Migracao]:
+        """
+        Aplica todas as migrações pendentes em uma única transação
+
+        Um advisory lock garante que apenas um processo aplique migrações por
+        vez; as versões pendentes são relidas depois de obtido o lock. Se
+        alguma migração falhar, nenhuma é registrada.
+
+        Returns:
+            Lista das migrações aplicadas
+        """
+        disponiveis = self.listar_disponiveis()
+
+        with self.db.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT pg_advisory_xact_lock(%s)", (_CHAVE_LOCK,))
+                cur.execute(_SQL_CRIAR_TABELA_CONTROLE)
+                cur.execute("SELECT versao FROM schema_migrations")
+                aplicadas = {row[0] for row in cur.fetchall()}
+
+                executadas = []
+                for migracao in disponiveis:
+                    if migracao.versao in aplicadas:
+                        continue
+
+                    # Sem parâmetros, para que '%' no arquivo não seja interpretado
+                    cur.execute(migracao.sql())
+                    cur.execute(
+                        "INSERT INTO schema_migrations (versao, nome) VALUES (%s, %s)",
+                        (migracao.versao, migracao.nome),
+                    )
+                    executadas.append(migracao)
+
+        return executadas
+
+    def verificar_indices(self) -> List[VerificacaoIndice]:
+        """
+        Executa EXPLAIN nas consultas dos serviços e informa os índices usados
+
+        As consultas são capturadas chamando os próprios métodos dos serviços,
+        de forma que a verificação acompanha o SQL real. O EXPLAIN roda com
+        enable_seqscan desligado para mostrar se o índice é utilizável mesmo em
+        tabelas pequenas, onde o planejador preferiria uma leitura sequencial.
+
+        Returns:
+            Lista de VerificacaoIndice, uma por consulta
+        """
+        verificacoes = []
+
+        with self.db.transaction() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SET LOCAL enable_seqscan = off")
+
+                for descricao, indice, chamada in _consultas_verificadas():
+                    query, params = _capturar_consulta(chamada)
+                    cur.execute("EXPLAIN (FORMAT JSON) " + query, params)
+                    plano = cur.fetchone()[0]
+                    if isinstance(plano, str):
+                        plano = json.loads(plano)
+                    verificacoes.append(
+                        VerificacaoIndice(
+                            consulta=descricao,
+                            indice_esperado=indice,
+                            indices_usados=_indices_do_plano(plano[0]["Plan"]),
+                        )
+                    )
+
+            # Apenas leitura: desfaz o SET LOCAL sem depender do commit
+            conn.rollback()
+
+        return verificacoes
+
+
+class _GravadorConsultas:
+    """Substituto de DatabaseConnection que apenas registra a query executada"""
+
+    def __init__(self):
+        self.consultas: List[Tuple[str, tuple]] = []
+
+    def execute_query(self, query, params=None):
+        self.consultas.append((query, params or ()))
+        return []
+
+
+def _capturar_consulta(chamada: Callable) -> Tuple[str, tuple]:
+    """Executa a chamada de serviço com o gravador e retorna a query gerada"""
+    gravador = _GravadorConsultas()
+    chamada(gravador)
+    return gravador.consultas[-1]
+
+
+def _consultas_verificadas() -> List[Tuple[str, str, Callable]]:
+    """Consultas de serviço verificadas por verificar_indices e o índice esperado"""
+    from registro_notas_alunos.backend.aluno.service import AlunoService
+    from registro_notas_alunos.backend.disciplina.service import DisciplinaService
+    from registro_notas_alunos.backend.lib.paginacao import codificar_token
+    from registro_notas_alunos.backend.matricula.service import MatriculaService
+    from registro_notas_alunos.backend.notas.service import NotasService
+
+    return [
+        (
+            "NotasService.buscar_por_matricula",
+            "uq_notas_id_matricula",
+            lambda db: NotasService(db).buscar_por_matricula(1),
+        ),
+        (
+            "MatriculaService.listar_por_disciplina",
+            "idx_matricula_id_disciplina",
+            lambda db: MatriculaService(db).listar_por_disciplina(1),
+        ),
+        (
+            "DisciplinaService.listar_por_periodo",
+            "idx_disciplina_ano_semestre",
+            lambda db: DisciplinaService(db).listar_por_periodo(2025, 1),
+        ),
+        (
+            "DisciplinaService.buscar_por_nome_ano_semestre",
+            "uq_disciplina_nome_ano_semestre",
+            lambda db: DisciplinaService(db).buscar_por_nome_ano_semestre("RAD em Python", 2025, 1),
+        ),
+        (
+            "AlunoService.listar_todos_paginado (página seguinte)",
+            "idx_aluno_nome",
+            lambda db: AlunoService(db).listar_todos_paginado(
+                token=codificar_token("aluno", ["Ana", "2025001"])
+            ),
+        ),
+        (
+            "DisciplinaService.listar_todas_paginado (página seguinte)",
+            "uq_disciplina_nome_ano_semestre",
+            lambda db: DisciplinaService(db).listar_todas_paginado(
+                token=codificar_token("disciplina", ["RAD em Python", 2025, 1])
+            ),
+        ),
+        (
+            "NotasService.consultar_notas_apuradas (primeira página)",
+            "idx_aluno_nome",
+            lambda db: NotasService(db).consultar_notas_apuradas(limite=100),
+        ),
+    ]
+
+
+def _indices_do_plano(no: dict) -> List[str]:
+    """Percorre o plano do EXPLAIN e retorna os índices usados em varreduras"""
+    indices = []
+    if "Index Name" in no:
+        indices.append(no["Index Name"])
+    for filho in no.get("Plans", []):
+        indices.extend(_indices_do_plano(filho))
+    return indices
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Ponto de entrada da linha de comando"""
+    parser = argparse.ArgumentParser(description="Migrações do banco de dados")
+    grupo = parser.add_mutually_exclusive_group()
+    grupo.add_argument("--status", action="store_true", help="lista as migrações e seu estado")
+    grupo.add_argument(
+        "--explain", action="store_true", help="verifica o uso de índices pelas consultas"
+    )
+    args = parser.parse_args(argv)
+
+    migrador = Migrador()
+
+    if args.status:
+        aplicadas = migrador.versoes_aplicadas()
+        for migracao in migrador.listar_disponiveis():
+            estado = "aplicada" if migracao.versao in aplicadas else "pendente"
+            print(f"{migracao.versao:04d} {migracao.nome}: {estado}")
+        return 0
+
+    if args.explain:
+        verificacoes = migrador.verificar_indices()
+        for verificacao in verificacoes:
+            marcador = "OK  " if verificacao.ok else "FALHA"
+            usados = ", ".join(verificacao.indices_usados) or "nenhum índice"
+            print(f"{marcador} {verificacao.consulta}: {usados}")
+        return 0 if all(v.ok for v in verificacoes) else 1
+
+    try:
+        executadas = migrador.aplicar()
+    except Exception as e:
+        # Nenhuma migração é registrada quando uma delas falha
+        print(f"Migrações não aplicadas: {e}", file=sys.stderr)
+        return 1
+
+    if not executadas:
+        print("Nenhuma migração pendente")
+    for migracao in executadas:
+        print(f"Migração aplicada: {migracao.versao:04d} {migracao.nome}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,270 @@
+"""
+Notificações de alteração publicadas pelo banco (LISTEN/NOTIFY)
+
+Os gatilhos da migração 0003 publicam, a cada comando de escrita em aluno,
+disciplina, matricula e notas, um evento no canal registro_notas_alteracoes
+com a tabela, a operação e os IDs afetados. OuvinteAlteracoes mantém uma
+conexão dedicada (fora do pool) escutando o canal em uma thread própria e
+repassa os eventos aos inscritos: o cache de leitura e as telas abertas, que
+atualizam apenas as linhas afetadas. Assim, alterações feitas por outros
+clientes chegam sem recargas periódicas.
+
+    from registro_notas_alunos.backend.lib.notificacoes import ouvinte_alteracoes
+
+    ouvinte_alteracoes.iniciar()
+    cancelar = ouvinte_alteracoes.inscrever(print, tabelas=("aluno",))
+
+Os callbacks rodam na thread do ouvinte; telas Tk devem usar
+registro_notas_alunos.gui.alteracoes.ReceptorAlteracoes.
+"""
+
+import json
+import logging
+import os
+import select
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import psycopg2
+
+from registro_notas_alunos.backend.lib.cache import cache_leitura
+from registro_notas_alunos.backend.lib.database import parametros_conexao
+
+logger = logging.getLogger(__name__)
+
+CANAL = "registro_notas_alteracoes"
+TABELAS = ("aluno", "disciplina", "matricula", "notas")
+
+# Operação dos eventos gerados após uma reconexão, quando notificações podem
+# ter sido perdidas
+RECONEXAO = "RECONEXAO"
+
+# Intervalo máximo entre verificações do pedido de parada
+_INTERVALO_S = 1.0
+_ESPERA_MAXIMA_RECONEXAO_S = 60.0
+
+
+@dataclass(frozen=True)
+class Alteracao:
+    """
+    Evento de alteração de uma tabela
+    """
+
+    tabela: str
+    operacao: str
+    # IDs afetados; None quando desconhecidos (muitas linhas ou reconexão)
+    ids: Optional[Tuple[int, ...]] = None
+
+    @property
+    def completa(self) -> bool:
+        """Indica que qualquer linha da tabela pode ter mudado"""
+        return self.ids is None
+
+
+def interpretar_payload(payload: str) -> Optional[Alteracao]:
+    """
+    Converte o payload JSON publicado pelos gatilhos em Alteracao
+
+    Args:
+        payload: Texto do NOTIFY
+
+    Returns:
+        Alteracao ou None se o payload for inválido
+    """
+    try:
+        dados = json.loads(payload)
+        ids = dados.get("ids")
+        return Alteracao(
+            tabela=dados["tabela"],
+            operacao=dados["operacao"],
+            ids=tuple(int(id) for id in ids) if ids is not None else None,
+        )
+    except (ValueError, TypeError, KeyError) as e:
+        logger.warning(f"Notificação inválida ignorada ({e}): {payload!r}")
+        return None
+
+
+def agrupar(alteracoes: Iterable[Alteracao]) -> List[Alteracao]:
+    """
+    Combina os eventos de cada tabela em um só, preservando a ordem das tabelas
+
+    Os IDs são unidos; se algum evento for completo, o resultado também é. A
+    operação é mantida quando todos os eventos da tabela têm a mesma, e vira
+    "MULTIPLA" caso contrário.
+
+    Args:
+        alteracoes: Eventos recebidos
+
+    Returns:
+        Um evento por tabela
+    """
+    agrupadas: Dict[str, Alteracao] = {}
+    for alteracao in alteracoes:
+        anterior = agrupadas.get(alteracao.tabela)
+        if anterior is None:
+            agrupadas[alteracao.tabela] = alteracao
+            continue
+
+        operacao = anterior.operacao if anterior.operacao == alteracao.operacao else "MULTIPLA"
+        if anterior.completa or alteracao.completa:
+            ids = None
+        else:
+            ids = tuple(dict.fromkeys(anterior.ids + alteracao.ids))
+        agrupadas[alteracao.tabela] = Alteracao(alteracao.tabela, operacao, ids)
+    return list(agrupadas.values())
+
+
+class OuvinteAlteracoes:
+    """
+    Thread que escuta o canal de alterações e repassa os eventos aos inscritos
+    """
+
+    def __init__(self, canal: str = CANAL, conectar: Optional[Callable] = None):
+        """
+        Inicializa o ouvinte, sem conectar
+
+        Args:
+            canal: Canal do LISTEN
+            conectar: Cria a conexão dedicada (opcional, padrão: parâmetros do .env)
+        """
+        self.canal = canal
+        self._conectar = conectar or (lambda: psycopg2.connect(**parametros_conexao()))
+        self._inscritos: List[Tuple[Callable[[Alteracao], None], Optional[frozenset]]] = []
+        self._lock = threading.Lock()
+        self._parar = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def ativo(self) -> bool:
+        """Indica se a thread do ouvinte está rodando"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def inscrever(
+        self, callback: Callable[[Alteracao], None], tabelas: Optional[Iterable[str]] = None
+    ) -> Callable[[], None]:
+        """
+        Registra um callback para os eventos de alteração
+
+        Args:
+            callback: Recebe cada Alteracao, na thread do ouvinte
+            tabelas: Tabelas de interesse (opcional, padrão: todas)
+
+        Returns:
+            Função que cancela a inscrição
+        """
+        inscricao = (callback, frozenset(tabelas) if tabelas is not None else None)
+        with self._lock:
+            self._inscritos.append(inscricao)
+
+        def cancelar():
+            with self._lock:
+                if inscricao in self._inscritos:
+                    self._inscritos.remove(inscricao)
+
+        return cancelar
+
+    def iniciar(self) -> bool:
+        """
+        Inicia a thread do ouvinte, se habilitado
+
+        DB_NOTIFICACOES=0 desliga as notificações; nesse caso o cache depende
+        apenas da validade e das escritas do próprio processo.
+
+        Returns:
+            True se o ouvinte está rodando
+        """
+        if os.getenv("DB_NOTIFICACOES", "1") == "0":
+            logger.info("Notificações de alteração desligadas (DB_NOTIFICACOES=0)")
+            return False
+        if self.ativo:
+            return True
+
+        self._parar.clear()
+        self._thread = threading.Thread(
+            target=self._executar, name="ouvinte-alteracoes", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def parar(self, timeout: float = 2.0) -> None:
+        """
+        Encerra a thread do ouvinte
+
+        Args:
+            timeout: Tempo máximo de espera pela thread, em segundos
+        """
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def despachar(self, alteracao: Alteracao) -> None:
+        """
+        Entrega um evento aos inscritos interessados na tabela
+
+        Args:
+            alteracao: Evento recebido
+        """
+        with self._lock:
+            inscritos = list(self._inscritos)
+
+        for callback, tabelas in inscritos:
+            if tabelas is not None and alteracao.tabela not in tabelas:
+                continue
+            try:
+                callback(alteracao)
+            except Exception as e:
+                logger.exception(f"Erro ao tratar alteração {alteracao}: {e}")
+
+    def _executar(self) -> None:
+        """Laço da thread: conecta, escuta e reconecta em caso de falha"""
+        espera = 1.0
+        conectado_antes = False
+
+        while not self._parar.is_set():
+            conn = None
+            try:
+                conn = self._conectar()
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self.canal}")
+                logger.info(f"Escutando alterações no canal {self.canal}")
+                espera = 1.0
+
+                # Eventos publicados enquanto a conexão estava fora foram perdidos
+                if conectado_antes:
+                    for tabela in TABELAS:
+                        self.despachar(Alteracao(tabela, RECONEXAO))
+                conectado_antes = True
+
+                self._escutar(conn)
+            except psycopg2.Error as e:
+                logger.warning(f"Ouvinte de alterações sem conexão: {e}")
+            finally:
+                if conn is not None:
+                    conn.close()
+
+            if self._parar.wait(espera):
+                break
+            espera = min(espera * 2, _ESPERA_MAXIMA_RECONEXAO_S)
+
+    def _escutar(self, conn) -> None:
+        """Repassa as notificações da conexão até o pedido de parada"""
+        while not self._parar.is_set():
+            if select.select([conn], [], [], _INTERVALO_S) == ([], [], []):
+                continue
+            conn.poll()
+            while conn.notifies:
+                alteracao = interpretar_payload(conn.notifies.pop(0).payload)
+                if alteracao is not None:
+                    self.despachar(alteracao)
+
+
+# Ouvinte compartilhado pelo processo
+ouvinte_alteracoes = OuvinteAlteracoes()
+
+# Escritas de outros clientes também invalidam as listas em cache
+ouvinte_alteracoes.inscrever(
+    lambda alteracao: cache_leitura.invalidar(alteracao.tabela), tabelas=("aluno", "disciplina")
+)
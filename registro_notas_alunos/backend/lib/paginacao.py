@@ -0,0 +1,229 @@
+"""
+Paginação por chave (keyset) das listagens dos serviços
+
+Em vez de LIMIT/OFFSET, que lê e descarta todas as linhas anteriores à página,
+cada página continua a partir dos valores da chave de ordenação da última
+linha entregue:
+
+    SELECT ... WHERE (a.nome, a.matricula) > (%s, %s) ORDER BY a.nome, a.matricula LIMIT 101
+
+Com um índice na chave o custo de cada página não depende da profundidade.
+A chave precisa ser única (por isso termina em uma coluna única, em geral o
+ID) e todas as colunas são ordenadas de forma crescente.
+
+O token de continuação é opaco para quem chama: a chave da última linha em
+JSON, codificada em base64 e marcada com o escopo da listagem, de forma que
+um token de uma listagem não é aceito por outra.
+
+    pagina = AlunoService().listar_todos_paginado(limite=50)
+    while pagina.proximo:
+        pagina = AlunoService().listar_todos_paginado(limite=50, token=pagina.proximo)
+
+Listagens ordenáveis pelo usuário (colunas que aceitam NULL, ordem decrescente)
+usam condicao_apos, que monta a mesma continuação sem a comparação de tuplas.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+LIMITE_MAXIMO = 1000
+
+
+@dataclass
+class Pagina(Generic[T]):
+    """
+    Página de uma listagem com o token da página seguinte
+
+    Attributes:
+        itens: Registros da página, na ordem da listagem
+        proximo: Token da página seguinte; None na última página
+    """
+
+    itens: List[T] = field(default_factory=list)
+    proximo: Optional[str] = None
+
+
+def codificar_token(escopo: str, chave: Sequence) -> str:
+    """
+    Gera o token de continuação a partir da chave da última linha
+
+    Args:
+        escopo: Identificação da listagem (ex.: "aluno")
+        chave: Valores das colunas da chave de ordenação
+
+    Returns:
+        Token opaco, seguro para URLs
+    """
+    dados = json.dumps([escopo, list(chave)], ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(dados.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decodificar_token(token: str, escopo: str, tamanho: int) -> list:
+    """
+    Recupera a chave da última linha a partir do token de continuação
+
+    Args:
+        token: Token gerado por codificar_token
+        escopo: Identificação da listagem que está sendo paginada
+        tamanho: Quantidade de colunas da chave
+
+    Returns:
+        Valores das colunas da chave
+
+    Raises:
+        ValueError: Se o token estiver corrompido ou for de outra listagem
+    """
+    try:
+        dados = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        escopo_token, chave = json.loads(dados.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError("Token de paginação inválido")
+
+    if escopo_token != escopo or not isinstance(chave, list) or len(chave) != tamanho:
+        raise ValueError("Token de paginação inválido")
+
+    return chave
+
+
+def consultar_pagina(
+    db,
+    escopo: str,
+    select: str,
+    condicoes: Sequence[str],
+    params: Sequence,
+    chave: Sequence[str],
+    posicoes_chave: Sequence[int],
+    limite: int,
+    token: Optional[str] = None,
+    montar: Optional[Callable[[tuple], T]] = None,
+) -> Pagina[T]:
+    """
+    Executa uma consulta paginada por chave
+
+    Args:
+        db: DatabaseConnection usada na consulta
+        escopo: Identificação da listagem, gravada no token
+        select: SELECT ... FROM ... JOIN ..., sem WHERE, ORDER BY nem LIMIT
+        condicoes: Condições do WHERE da listagem (unidas com AND)
+        params: Parâmetros das condições
+        chave: Colunas da chave de ordenação, todas crescentes; o conjunto
+            precisa ser único
+        posicoes_chave: Posição de cada coluna da chave nas linhas retornadas
+        limite: Quantidade máxima de registros na página (1 a LIMITE_MAXIMO)
+        token: Token da página anterior; None para a primeira página
+        montar: Converte cada linha no item da página (opcional)
+
+    Returns:
+        Pagina com os itens e o token da página seguinte
+
+    Raises:
+        ValueError: Se o limite estiver fora da faixa ou o token for inválido
+    """
+    if not 1 <= limite <= LIMITE_MAXIMO:
+        raise ValueError(f"Limite deve estar entre 1 e {LIMITE_MAXIMO}")
+
+    condicoes = list(condicoes)
+    params = list(params)
+    if token is not None:
+        valores = decodificar_token(token, escopo, len(chave))
+        marcadores = ", ".join(["%s"] * len(chave))
+        condicoes.append(f"({', '.join(chave)}) > ({marcadores})")
+        params.extend(valores)
+
+    query = select
+    if condicoes:
+        query += " WHERE " + " AND ".join(condicoes)
+    # Uma linha a mais indica se há página seguinte
+    query += " ORDER BY " + ", ".join(chave) + " LIMIT %s"
+    params.append(limite + 1)
+
+    rows = db.execute_query(query, tuple(params)) or []
+
+    proximo = None
+    if len(rows) > limite:
+        rows = rows[:limite]
+        ultima = rows[-1]
+        proximo = codificar_token(escopo, [ultima[posicao] for posicao in posicoes_chave])
+
+    itens = [montar(row) for row in rows] if montar else list(rows)
+    return Pagina(itens=itens, proximo=proximo)
+
+
+def condicao_apos(
+    colunas: Sequence[str],
+    valores: Sequence,
+    decrescente: bool = False,
+    marcadores: Optional[Sequence[str]] = None,
+) -> Tuple[str, list]:
+    """
+    Monta a condição das linhas posteriores a uma linha na ordem ORDER BY colunas
+
+    Variante de consultar_pagina para ordenações com colunas que aceitam NULL e
+    para a ordem decrescente, em que a comparação de tuplas não serve. Segue a
+    ordem padrão do PostgreSQL: NULLs por último na ordem crescente e primeiro
+    na decrescente. A condição começa por um limite simples na primeira coluna,
+    que permite ao banco usar o índice dela em vez de ler e ordenar todas as
+    linhas anteriores.
+
+    Args:
+        colunas: Colunas do ORDER BY, todas na mesma direção; o conjunto
+            precisa ser único
+        valores: Valores das colunas na última linha entregue (None para NULL)
+        decrescente: Se a ordem é decrescente
+        marcadores: Marcador de cada valor no SQL (opcional, padrão "%s"); ex.:
+            "%s::real" para que um float seja comparado a uma coluna REAL com a
+            precisão dela
+
+    Returns:
+        tuple: (condição SQL, lista de parâmetros)
+    """
+    if len(colunas) != len(valores) or not colunas:
+        raise ValueError("Informe um valor para cada coluna da ordenação")
+    marcadores = marcadores or ["%s"] * len(colunas)
+
+    alternativas = []
+    params: list = []
+    iguais: List[str] = []
+    params_iguais: list = []
+
+    for coluna, valor, marcador in zip(colunas, valores, marcadores):
+        if valor is None:
+            # NULL é o último valor na ordem crescente e o primeiro na decrescente
+            posterior = f"{coluna} IS NOT NULL" if decrescente else None
+        elif decrescente:
+            posterior = f"{coluna} < {marcador}"
+        else:
+            posterior = f"({coluna} > {marcador} OR {coluna} IS NULL)"
+
+        if posterior is not None:
+            alternativas.append("(" + " AND ".join(iguais + [posterior]) + ")")
+            params.extend(params_iguais)
+            if valor is not None:
+                params.append(valor)
+
+        if valor is None:
+            iguais.append(f"{coluna} IS NULL")
+        else:
+            iguais.append(f"{coluna} = {marcador}")
+            params_iguais.append(valor)
+
+    if not alternativas:
+        return "FALSE", []
+
+    primeira, valor, marcador = colunas[0], valores[0], marcadores[0]
+    if valor is None:
+        limite = None if decrescente else f"{primeira} IS NULL"
+    elif decrescente:
+        limite = f"{primeira} <= {marcador}"
+    else:
+        limite = f"({primeira} >= {marcador} OR {primeira} IS NULL)"
+
+    condicao = "(" + " OR ".join(alternativas) + ")"
+    if limite is None:
+        return condicao, params
+    return limite + " AND " + condicao, ([valor] if valor is not None else []) + params
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Matricula:
     """
     Representa uma matrícula de aluno em disciplina
@@ -28,3 +28,18 @@ class Matricula:
 
         if self.id_disciplina <= 0:
             raise ValueError("ID da disciplina deve ser maior que zero")
+
+    @classmethod
+    def de_linha(cls, linha: tuple) -> "Matricula":
+        """
+        Cria uma Matricula a partir de uma linha lida do banco, sem validar os IDs
+
+        Args:
+            linha: Tupla (id, id_aluno, id_disciplina)
+
+        Returns:
+            Matricula com os valores da linha
+        """
+        matricula = object.__new__(cls)
+        matricula.id, matricula.id_aluno, matricula.id_disciplina = linha
+        return matricula
@@ -2,10 +2,66 @@
 Serviço para operações com Matrícula
 """
 
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.backend.lib.paginacao import Pagina, consultar_pagina
 from registro_notas_alunos.backend.matricula.model import Matricula
+from registro_notas_alunos.backend.matricula.vo import (
+    ALUNO_NAO_ENCONTRADO,
+    CRIADA,
+    JA_EXISTENTE,
+    ResultadoMatriculaVO,
+)
+
+
+_SQL_DETALHES = """
+    SELECT m.id, a.nome, a.matricula, d.nome as disciplina
+    FROM matricula m
+    JOIN aluno a ON m.id_aluno = a.id
+    JOIN disciplina d ON m.id_disciplina = d.id
+"""
+
+_SQL_LISTAR_TODAS = _SQL_DETALHES + "    ORDER BY d.nome, a.nome\n"
+
+# Alunos matriculados em uma disciplina (id_matricula, nome_aluno, matricula_aluno)
+_SQL_ALUNOS_MATRICULADOS = """
+    SELECT m.id, a.nome, a.matricula
+    FROM matricula m
+    JOIN aluno a ON m.id_aluno = a.id
+"""
+
+# Disciplinas de um aluno (id_matricula, nome_disciplina, ano, semestre)
+_SQL_DISCIPLINAS_MATRICULADAS = """
+    SELECT m.id, d.nome, d.ano, d.semestre
+    FROM matricula m
+    JOIN disciplina d ON m.id_disciplina = d.id
+"""
+
+# Matrícula em lote em um único comando. {pedido} é um SELECT com os alunos
+# (id_aluno, ordem); o INSERT pula alunos inexistentes (JOIN) e já matriculados
+# (ON CONFLICT). A consulta final enxerga a tabela matricula como estava antes
+# do INSERT, portanto encontra só as matrículas que já existiam.
+_SQL_MATRICULAR_LOTE = """
+    WITH pedido AS ({pedido}),
+    novas AS (
+        INSERT INTO matricula (id_aluno, id_disciplina)
+        SELECT p.id_aluno, d.id
+        FROM pedido p
+        JOIN aluno a ON a.id = p.id_aluno
+        JOIN disciplina d ON d.id = %s
+        ORDER BY p.ordem
+        ON CONFLICT (id_aluno, id_disciplina) DO NOTHING
+        RETURNING id, id_aluno
+    )
+    SELECT p.id_aluno, n.id, m.id, a.id IS NOT NULL,
+           EXISTS (SELECT 1 FROM disciplina WHERE id = %s)
+    FROM pedido p
+    LEFT JOIN aluno a ON a.id = p.id_aluno
+    LEFT JOIN novas n ON n.id_aluno = p.id_aluno
+    LEFT JOIN matricula m ON m.id_aluno = p.id_aluno AND m.id_disciplina = %s
+    ORDER BY p.ordem
+"""
 
 
 class MatriculaJaExisteException(Exception):
@@ -46,18 +102,17 @@ class MatriculaService:
         if matricula.id is not None:
             raise ValueError("Matrícula para criação não deve ter ID")
 
-        # Verifica se matrícula já existe
-        if self.buscar_por_aluno_disciplina(matricula.id_aluno, matricula.id_disciplina):
-            raise MatriculaJaExisteException("O aluno já está matriculado nesta disciplina")
-
         try:
+            # ON CONFLICT substitui a consulta prévia: sem linha retornada, o
+            # aluno já está matriculado na disciplina
             query = (
-                "INSERT INTO matricula (id_aluno, id_disciplina) VALUES (%s, %s) " "RETURNING id"
+                "INSERT INTO matricula (id_aluno, id_disciplina) VALUES (%s, %s) "
+                "ON CONFLICT DO NOTHING RETURNING id"
             )
             result = self.db.execute_query(query, (matricula.id_aluno, matricula.id_disciplina))
 
             if not result:
-                raise Exception("Erro ao criar matrícula")
+                raise MatriculaJaExisteException("O aluno já está matriculado nesta disciplina")
 
             return result[0][0]
         except Exception as e:
@@ -66,6 +121,143 @@ class MatriculaService:
                 raise MatriculaJaExisteException("Matrícula já existe")
             raise e
 
+    def criar_em_lote(self, matriculas: List[Matricula]) -> List[int]:
+        """
+        Cria várias matrículas com um único comando INSERT em lote
+
+        Args:
+            matriculas: Matrículas a serem criadas (sem ID)
+
+        Returns:
+            Lista com os IDs criados, na mesma ordem das matrículas recebidas
+
+        Raises:
+            ValueError: Se alguma matrícula já tiver ID
+            MatriculaJaExisteException: Se alguma matrícula já existe
+        """
+        if any(matricula.id is not None for matricula in matriculas):
+            raise ValueError("Matrícula para criação não deve ter ID")
+
+        try:
+            query = """
+                INSERT INTO matricula (id_aluno, id_disciplina)
+                VALUES %s
+                RETURNING id_aluno, id_disciplina, id
+            """
+            result = self.db.execute_values(
+                query,
+                [(matricula.id_aluno, matricula.id_disciplina) for matricula in matriculas],
+                fetch=True,
+            )
+        except Exception as e:
+            # Captura erros de constraint do banco
+            if "duplicate key" in str(e) or "unique constraint" in str(e):
+                raise MatriculaJaExisteException("Matrícula já existe")
+            raise e
+
+        # RETURNING não garante a ordem dos VALUES
+        ids = {(id_aluno, id_disciplina): id for id_aluno, id_disciplina, id in result}
+        return [ids[(matricula.id_aluno, matricula.id_disciplina)] for matricula in matriculas]
+
+    def matricular_em_lote(
+        self, id_disciplina: int, ids_alunos: List[int]
+    ) -> List[ResultadoMatriculaVO]:
+        """
+        Matricula vários alunos em uma disciplina com um único comando
+
+        Alunos já matriculados na disciplina e IDs de alunos inexistentes não
+        interrompem a operação: aparecem no resultado com a situação
+        JA_EXISTENTE ou ALUNO_NAO_ENCONTRADO.
+
+        Args:
+            id_disciplina: ID da disciplina
+            ids_alunos: IDs dos alunos; repetições são ignoradas
+
+        Returns:
+            Um ResultadoMatriculaVO por aluno, na ordem de ids_alunos
+
+        Raises:
+            ValueError: Se algum ID for inválido ou a disciplina não existir
+        """
+        ids = list(dict.fromkeys(ids_alunos))
+        if id_disciplina <= 0 or any(id_aluno <= 0 for id_aluno in ids):
+            raise ValueError("ID deve ser maior que zero")
+
+        if not ids:
+            return []
+
+        pedido = (
+            "SELECT id_aluno, ordem FROM unnest(%s::int[]) WITH ORDINALITY AS p (id_aluno, ordem)"
+        )
+        return self._matricular_lote(pedido, [ids], id_disciplina)
+
+    def copiar_matriculas(
+        self, id_disciplina_origem: int, id_disciplina_destino: int
+    ) -> List[ResultadoMatriculaVO]:
+        """
+        Matricula na disciplina de destino todos os alunos da disciplina de origem
+
+        Usado na abertura de um semestre, a partir da turma anterior. Alunos
+        que já estão na disciplina de destino são mantidos (JA_EXISTENTE).
+
+        Args:
+            id_disciplina_origem: ID da disciplina com os alunos a copiar
+            id_disciplina_destino: ID da disciplina que recebe as matrículas
+
+        Returns:
+            Um ResultadoMatriculaVO por aluno da origem, em ordem de nome;
+            lista vazia se a origem não tiver matrículas
+
+        Raises:
+            ValueError: Se algum ID for inválido, as disciplinas forem a mesma
+                ou a disciplina de destino não existir
+        """
+        if id_disciplina_origem <= 0 or id_disciplina_destino <= 0:
+            raise ValueError("ID deve ser maior que zero")
+        if id_disciplina_origem == id_disciplina_destino:
+            raise ValueError("Disciplinas de origem e destino devem ser diferentes")
+
+        pedido = (
+            "SELECT m.id_aluno, row_number() OVER (ORDER BY a.nome, a.matricula) AS ordem "
+            "FROM matricula m JOIN aluno a ON a.id = m.id_aluno WHERE m.id_disciplina = %s"
+        )
+        return self._matricular_lote(pedido, [id_disciplina_origem], id_disciplina_destino)
+
+    def _matricular_lote(
+        self, pedido: str, params: list, id_disciplina: int
+    ) -> List[ResultadoMatriculaVO]:
+        """
+        Executa _SQL_MATRICULAR_LOTE com o SELECT dos alunos informado
+
+        Args:
+            pedido: SELECT com as colunas (id_aluno, ordem)
+            params: Parâmetros do SELECT
+            id_disciplina: ID da disciplina que recebe as matrículas
+
+        Returns:
+            Um ResultadoMatriculaVO por linha de pedido, na ordem da coluna ordem
+
+        Raises:
+            ValueError: Se a disciplina não existir
+        """
+        query = _SQL_MATRICULAR_LOTE.format(pedido=pedido)
+        rows = self.db.execute_query(query, (*params, id_disciplina, id_disciplina, id_disciplina))
+        rows = rows or []
+
+        if rows and not rows[0][4]:
+            raise ValueError("Disciplina não encontrada")
+
+        resultados = []
+        for id_aluno, id_criada, id_existente, aluno_existe, _ in rows:
+            if id_criada is not None:
+                resultados.append(ResultadoMatriculaVO(id_aluno, CRIADA, id_criada))
+            elif not aluno_existe:
+                resultados.append(ResultadoMatriculaVO(id_aluno, ALUNO_NAO_ENCONTRADO))
+            else:
+                # id_existente é None se outro cliente criou a matrícula durante o comando
+                resultados.append(ResultadoMatriculaVO(id_aluno, JA_EXISTENTE, id_existente))
+        return resultados
+
     def buscar_por_id(self, id: int) -> Optional[Matricula]:
         """
         Busca uma matrícula pelo ID
@@ -85,8 +277,7 @@ class MatriculaService:
         if not result:
             return None
 
-        row = result[0]
-        return Matricula(id=row[0], id_aluno=row[1], id_disciplina=row[2])
+        return Matricula.de_linha(result[0])
 
     def buscar_por_aluno_disciplina(self, id_aluno: int, id_disciplina: int) -> Optional[Matricula]:
         """
@@ -113,8 +304,7 @@ class MatriculaService:
         if not result:
             return None
 
-        row = result[0]
-        return Matricula(id=row[0], id_aluno=row[1], id_disciplina=row[2])
+        return Matricula.de_linha(result[0])
 
     def listar_por_disciplina(self, id_disciplina: int) -> List[Tuple[int, str, str]]:
         """
@@ -129,15 +319,41 @@ class MatriculaService:
         if id_disciplina <= 0:
             raise ValueError("ID da disciplina deve ser maior que zero")
 
-        query = """
-            SELECT m.id, a.nome, a.matricula
-            FROM matricula m
-            JOIN aluno a ON m.id_aluno = a.id
-            WHERE m.id_disciplina = %s
-            ORDER BY a.nome
-        """
+        query = _SQL_ALUNOS_MATRICULADOS + "    WHERE m.id_disciplina = %s\n    ORDER BY a.nome\n"
         return self.db.execute_query(query, (id_disciplina,)) or []
 
+    def listar_por_disciplina_paginado(
+        self, id_disciplina: int, limite: int = 100, token: Optional[str] = None
+    ) -> Pagina[Tuple[int, str, str]]:
+        """
+        Lista matrículas de uma disciplina em páginas, na ordem de listar_por_disciplina
+
+        Args:
+            id_disciplina: ID da disciplina
+            limite: Quantidade máxima de matrículas na página
+            token: Pagina.proximo da página anterior; None para a primeira
+
+        Returns:
+            Pagina de tuplas (id_matricula, nome_aluno, matricula_aluno)
+
+        Raises:
+            ValueError: Se o ID ou o limite forem inválidos ou o token for inválido
+        """
+        if id_disciplina <= 0:
+            raise ValueError("ID da disciplina deve ser maior que zero")
+
+        return consultar_pagina(
+            self.db,
+            escopo=f"matricula:disciplina:{id_disciplina}",
+            select=_SQL_ALUNOS_MATRICULADOS,
+            condicoes=["m.id_disciplina = %s"],
+            params=[id_disciplina],
+            chave=("a.nome", "m.id"),
+            posicoes_chave=(1, 0),
+            limite=limite,
+            token=token,
+        )
+
     def listar_por_aluno(self, id_aluno: int) -> List[Tuple[int, str, int, int]]:
         """
         Lista matrículas de um aluno com dados da disciplina
@@ -151,15 +367,44 @@ class MatriculaService:
         if id_aluno <= 0:
             raise ValueError("ID do aluno deve ser maior que zero")
 
-        query = """
-            SELECT m.id, d.nome, d.ano, d.semestre
-            FROM matricula m
-            JOIN disciplina d ON m.id_disciplina = d.id
-            WHERE m.id_aluno = %s
-            ORDER BY d.ano, d.semestre, d.nome
-        """
+        query = (
+            _SQL_DISCIPLINAS_MATRICULADAS
+            + "    WHERE m.id_aluno = %s\n    ORDER BY d.ano, d.semestre, d.nome\n"
+        )
         return self.db.execute_query(query, (id_aluno,)) or []
 
+    def listar_por_aluno_paginado(
+        self, id_aluno: int, limite: int = 100, token: Optional[str] = None
+    ) -> Pagina[Tuple[int, str, int, int]]:
+        """
+        Lista matrículas de um aluno em páginas, na ordem de listar_por_aluno
+
+        Args:
+            id_aluno: ID do aluno
+            limite: Quantidade máxima de matrículas na página
+            token: Pagina.proximo da página anterior; None para a primeira
+
+        Returns:
+            Pagina de tuplas (id_matricula, nome_disciplina, ano, semestre)
+
+        Raises:
+            ValueError: Se o ID ou o limite forem inválidos ou o token for inválido
+        """
+        if id_aluno <= 0:
+            raise ValueError("ID do aluno deve ser maior que zero")
+
+        return consultar_pagina(
+            self.db,
+            escopo=f"matricula:aluno:{id_aluno}",
+            select=_SQL_DISCIPLINAS_MATRICULADAS,
+            condicoes=["m.id_aluno = %s"],
+            params=[id_aluno],
+            chave=("d.ano", "d.semestre", "d.nome", "m.id"),
+            posicoes_chave=(2, 3, 1, 0),
+            limite=limite,
+            token=token,
+        )
+
     def listar_todas(self) -> List[Tuple[int, str, str, str]]:
         """
         Lista todas as matrículas com dados do aluno e disciplina
@@ -167,14 +412,65 @@ class MatriculaService:
         Returns:
             Lista de tuplas (id_matricula, nome_aluno, matricula_aluno, nome_disciplina)
         """
-        query = """
-            SELECT m.id, a.nome, a.matricula, d.nome as disciplina
-            FROM matricula m
-            JOIN aluno a ON m.id_aluno = a.id
-            JOIN disciplina d ON m.id_disciplina = d.id
-            ORDER BY d.nome, a.nome
+        return self.db.execute_query(_SQL_LISTAR_TODAS) or []
+
+    def listar_todas_paginado(
+        self, limite: int = 100, token: Optional[str] = None
+    ) -> Pagina[Tuple[int, str, str, str]]:
+        """
+        Lista todas as matrículas em páginas, na ordem de listar_todas
+
+        Args:
+            limite: Quantidade máxima de matrículas na página
+            token: Pagina.proximo da página anterior; None para a primeira
+
+        Returns:
+            Pagina de tuplas (id_matricula, nome_aluno, matricula_aluno, nome_disciplina)
+
+        Raises:
+            ValueError: Se o limite estiver fora da faixa ou o token for inválido
+        """
+        return consultar_pagina(
+            self.db,
+            escopo="matricula",
+            select=_SQL_DETALHES,
+            condicoes=[],
+            params=[],
+            chave=("d.nome", "a.nome", "m.id"),
+            posicoes_chave=(3, 1, 0),
+            limite=limite,
+            token=token,
+        )
+
+    def listar_por_ids(self, ids: List[int]) -> List[Tuple[int, str, str, str]]:
+        """
+        Lista as matrículas informadas com dados do aluno e disciplina
+
+        Args:
+            ids: IDs das matrículas
+
+        Returns:
+            Lista de tuplas (id_matricula, nome_aluno, matricula_aluno, nome_disciplina);
+            IDs inexistentes são ignorados
+        """
+        if not ids:
+            return []
+        query = _SQL_DETALHES + "    WHERE m.id = ANY(%s)\n"
+        return self.db.execute_query(query, (list(ids),)) or []
+
+    def iterar_todas(self, itersize: int = 2000) -> Iterator[Tuple[int, str, str, str]]:
+        """
+        Percorre todas as matrículas sob demanda, com cursor no servidor
+
+        Variante de listar_todas que não carrega o resultado inteiro em memória.
+
+        Args:
+            itersize: Quantidade de linhas trazidas do banco por lote
+
+        Yields:
+            Tuplas (id_matricula, nome_aluno, matricula_aluno, nome_disciplina)
         """
-        return self.db.execute_query(query) or []
+        return self.db.stream_query(_SQL_LISTAR_TODAS, itersize=itersize)
 
     def excluir(self, id: int) -> None:
         """
@@ -0,0 +1,31 @@
+"""
+Value Objects para o módulo de Matrícula
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+# Resultado de cada aluno em uma matrícula em lote
+CRIADA = "CRIADA"
+JA_EXISTENTE = "JA_EXISTENTE"
+ALUNO_NAO_ENCONTRADO = "ALUNO_NAO_ENCONTRADO"
+
+
+@dataclass
+class ResultadoMatriculaVO:
+    """
+    Value Object com o resultado da matrícula de um aluno em uma operação em lote
+
+    id_matricula é a matrícula criada (CRIADA) ou a que já existia
+    (JA_EXISTENTE); fica None para ALUNO_NAO_ENCONTRADO e quando a matrícula
+    existente foi criada por outro cliente durante a operação.
+    """
+
+    id_aluno: int
+    situacao: str
+    id_matricula: Optional[int] = None
+
+    @property
+    def criada(self) -> bool:
+        """Indica se a matrícula foi criada pela operação"""
+        return self.situacao == CRIADA
@@ -0,0 +1,59 @@
+"""
+Cálculo da nota final e da situação
+
+A regra oficial fica no banco (migração 0004): um gatilho grava nf e situacao
+em toda escrita na tabela notas, e listagens, relatórios e o recálculo usam os
+valores gravados. calcular_nota_final reproduz a regra na aplicação apenas onde
+ainda não há registro gravado: a prévia da NF enquanto as notas são digitadas
+(NotasService.calcular_nota_final_e_situacao) e os atributos nf e situacao do
+modelo Notas antes da gravação.
+
+Regra:
+
+- NF = min(SM1, 1) + min(SM2, 1) + min(max(AV, AVS), 10)
+- AVS ausente não substitui a AV
+- sem SM1, SM2 ou AV a situação é PENDENTE e a NF é nula
+- NF >= 6.0 aprova
+
+O banco soma em numeric; aqui a soma é arredondada em 6 casas decimais para
+descartar os erros de representação binária (0.1 + 0.2 + 5.7 resulta 6.0 e
+aprova, como no banco).
+
+    nf, situacao = calcular_nota_final(sm1, sm2, av, avs)
+"""
+
+from typing import Optional, Tuple
+
+PENDENTE = "PENDENTE"
+APROVADO = "APROVADO"
+REPROVADO = "REPROVADO"
+SITUACOES = (APROVADO, REPROVADO, PENDENTE)
+
+NOTA_APROVACAO = 6.0
+
+# Casas decimais da soma; os valores gravados em REAL têm até 6 dígitos significativos
+_CASAS_DECIMAIS = 6
+
+
+def calcular_nota_final(
+    sm1: Optional[float], sm2: Optional[float], av: Optional[float], avs: Optional[float]
+) -> Tuple[Optional[float], str]:
+    """
+    Calcula a nota final e a situação de uma matrícula
+
+    Args:
+        sm1: Nota SM1 (pode ser None) - até 1 ponto
+        sm2: Nota SM2 (pode ser None) - até 1 ponto
+        av: Nota AV (pode ser None) - até 10 pontos
+        avs: Nota AVS (pode ser None) - até 10 pontos, substitui AV se maior
+
+    Returns:
+        tuple: (nota_final ou None se pendente, situacao)
+    """
+    if sm1 is None or sm2 is None or av is None:
+        return None, PENDENTE
+
+    prova = min(max(av, avs if avs is not None else 0.0), 10.0)
+    nf = round(min(sm1, 1.0) + min(sm2, 1.0) + prova, _CASAS_DECIMAIS)
+
+    return nf, APROVADO if nf >= NOTA_APROVACAO else REPROVADO
@@ -0,0 +1,253 @@
+"""
+Exportação das notas apuradas para CSV, JSON Lines ou Parquet
+
+As linhas são lidas do banco com cursor no servidor, em lotes, e gravadas no
+arquivo à medida que chegam: a memória usada depende do tamanho do lote, não
+da quantidade de notas exportadas. Os filtros são os mesmos do relatório
+(FiltroNotasVO). O arquivo é escrito com outro nome e só substitui o destino
+ao final, então uma exportação interrompida não deixa um arquivo incompleto.
+
+Colunas: matricula, aluno, disciplina, ano, semestre, sm1, sm2, av, avs, nf e
+situacao (nf vazia enquanto a situação estiver pendente).
+
+Uso pela linha de comando:
+
+    python -m registro_notas_alunos.backend.notas.exportacao notas-2025-1.csv \\
+        --ano 2025 --semestre 1
+    python -m registro_notas_alunos.backend.notas.exportacao notas.parquet
+
+Arquivos .parquet exigem o pacote opcional pyarrow.
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.backend.notas.service import COLUNAS_EXPORTACAO, NotasService
+from registro_notas_alunos.backend.notas.vo import FiltroNotasVO
+
+logger = logging.getLogger(__name__)
+
+# Formato por extensão do arquivo de destino
+FORMATOS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+
+
+def formato_do_arquivo(destino: Path) -> str:
+    """
+    Deduz o formato da exportação pela extensão do destino
+
+    Args:
+        destino: Arquivo de saída
+
+    Returns:
+        "csv", "jsonl" ou "parquet"
+
+    Raises:
+        ValueError: Se a extensão não for suportada
+    """
+    extensao = Path(destino).suffix.lower()
+    if extensao not in FORMATOS:
+        raise ValueError(
+            f"Formato não suportado: {extensao or destino} (use .csv, .jsonl ou .parquet)"
+        )
+    return FORMATOS[extensao]
+
+
+def escrever_csv(lotes: Iterable[List[tuple]], caminho: Path) -> int:
+    """
+    Grava os lotes em CSV com cabeçalho
+
+    Args:
+        lotes: Lotes de tuplas na ordem de COLUNAS_EXPORTACAO
+        caminho: Arquivo de saída
+
+    Returns:
+        Quantidade de linhas gravadas
+    """
+    total = 0
+    with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(COLUNAS_EXPORTACAO)
+        for lote in lotes:
+            escritor.writerows(lote)
+            total += len(lote)
+    return total
+
+
+def escrever_jsonl(lotes: Iterable[List[tuple]], caminho: Path) -> int:
+    """
+    Grava os lotes em JSON Lines, um objeto por linha
+
+    Args:
+        lotes: Lotes de tuplas na ordem de COLUNAS_EXPORTACAO
+        caminho: Arquivo de saída
+
+    Returns:
+        Quantidade de linhas gravadas
+    """
+    total = 0
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for lote in lotes:
+            arquivo.writelines(
+                json.dumps(dict(zip(COLUNAS_EXPORTACAO, linha)), ensure_ascii=False) + "\n"
+                for linha in lote
+            )
+            total += len(lote)
+    return total
+
+
+def escrever_parquet(lotes: Iterable[List[tuple]], caminho: Path) -> int:
+    """
+    Grava os lotes em Parquet, um row group por lote
+
+    Args:
+        lotes: Lotes de tuplas na ordem de COLUNAS_EXPORTACAO
+        caminho: Arquivo de saída
+
+    Returns:
+        Quantidade de linhas gravadas
+
+    Raises:
+        ImportError: Se o pacote pyarrow não estiver instalado
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Instale o pacote pyarrow para exportar arquivos .parquet")
+
+    esquema = pa.schema(
+        [
+            ("matricula", pa.string()),
+            ("aluno", pa.string()),
+            ("disciplina", pa.string()),
+            ("ano", pa.int32()),
+            ("semestre", pa.int16()),
+            ("sm1", pa.float32()),
+            ("sm2", pa.float32()),
+            ("av", pa.float32()),
+            ("avs", pa.float32()),
+            ("nf", pa.float64()),
+            ("situacao", pa.string()),
+        ]
+    )
+
+    total = 0
+    with pq.ParquetWriter(caminho, esquema) as escritor:
+        for lote in lotes:
+            colunas = [list(coluna) for coluna in zip(*lote)]
+            escritor.write_table(pa.Table.from_arrays(colunas, schema=esquema))
+            total += len(lote)
+    return total
+
+
+_ESCRITORES = {"csv": escrever_csv, "jsonl": escrever_jsonl, "parquet": escrever_parquet}
+
+
+class ExportadorNotas:
+    """
+    Exporta as notas apuradas filtradas direto do banco para um arquivo
+    """
+
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None):
+        """
+        Inicializa o exportador
+
+        Args:
+            db_connection: Conexão com banco de dados (opcional)
+        """
+        self.db = db_connection or DatabaseConnection()
+        self.notas_service = NotasService(self.db)
+
+    def exportar(
+        self,
+        destino: Path,
+        filtro: Optional[FiltroNotasVO] = None,
+        formato: Optional[str] = None,
+        tamanho_lote: int = 5000,
+    ) -> int:
+        """
+        Exporta as notas apuradas para um arquivo
+
+        Args:
+            destino: Arquivo de saída
+            filtro: Filtros por ano, semestre, disciplina e aluno (opcional)
+            formato: "csv", "jsonl" ou "parquet" (opcional, padrão: pela extensão)
+            tamanho_lote: Quantidade de linhas lidas do banco por vez
+
+        Returns:
+            Quantidade de linhas exportadas
+
+        Raises:
+            ValueError: Se o formato não for suportado
+        """
+        destino = Path(destino)
+        formato = formato or formato_do_arquivo(destino)
+        if formato not in _ESCRITORES:
+            raise ValueError(f"Formato não suportado: {formato}")
+
+        lotes = self.notas_service.iterar_lotes_exportacao(filtro, tamanho_lote=tamanho_lote)
+
+        # Grava ao lado do destino e substitui apenas se a exportação terminar
+        temporario = destino.with_name(f".{destino.name}.tmp")
+        try:
+            total = _ESCRITORES[formato](lotes, temporario)
+            os.replace(temporario, destino)
+        except BaseException:
+            temporario.unlink(missing_ok=True)
+            raise
+        finally:
+            # Devolve a conexão do cursor se o escritor parou antes do fim
+            lotes.close()
+
+        logger.info(f"Exportação de notas: {total} linhas em {destino} ({formato})")
+        return total
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ponto de entrada da linha de comando
+
+    Returns:
+        0 se a exportação terminou e 1 se falhou
+    """
+    parser = argparse.ArgumentParser(
+        description="Exporta as notas apuradas para CSV, JSON Lines ou Parquet"
+    )
+    parser.add_argument("destino", type=Path, help="arquivo .csv, .jsonl ou .parquet")
+    parser.add_argument("--formato", choices=sorted(_ESCRITORES), help="padrão: pela extensão")
+    parser.add_argument("--ano", type=int, help="apenas disciplinas deste ano")
+    parser.add_argument("--semestre", type=int, choices=(1, 2), help="apenas este semestre")
+    parser.add_argument("--disciplina", help="apenas a disciplina com este nome")
+    parser.add_argument("--id-aluno", type=int, help="apenas as notas deste aluno")
+    parser.add_argument(
+        "--lote", type=int, default=5000, help="linhas lidas do banco por vez (padrão: 5000)"
+    )
+    args = parser.parse_args(argv)
+
+    filtro = FiltroNotasVO(
+        ano=args.ano,
+        semestre=args.semestre,
+        nome_disciplina=args.disciplina,
+        id_aluno=args.id_aluno,
+    )
+    try:
+        total = ExportadorNotas().exportar(
+            args.destino, filtro, formato=args.formato, tamanho_lote=args.lote
+        )
+    except Exception as e:
+        print(f"Erro na exportação: {e}", file=sys.stderr)
+        return 1
+
+    print(f"{total} linhas exportadas para {args.destino}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
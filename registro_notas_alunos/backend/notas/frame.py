@@ -0,0 +1,364 @@
+"""
+Resultado colunar das notas apuradas
+
+NotasFrame guarda as notas apuradas em arrays numpy, uma coluna por campo,
+em vez de um AlunoNotaApuradoVO por linha:
+
+- id_nota e id_disciplina em arrays de inteiros
+- nome_aluno em array de strings internadas (o mesmo nome é um único objeto)
+- sm1, sm2, av, avs e nf em arrays float64, com NaN nas notas nulas
+- situacao em códigos uint8, índices de calculo.SITUACOES
+- disciplinas em um dicionário id -> Disciplina, um objeto por disciplina
+
+Filtros, ordenação e agrupamentos operam sobre as colunas e devolvem novos
+frames, sem criar objetos por linha:
+
+    frame = NotasService().frame_notas_apuradas(FiltroNotasVO(ano=2025))
+    reprovados = frame.filtrar(frame.mascara_situacao(REPROVADO))
+    for id_disciplina, grupo in reprovados.agrupar("id_disciplina").items():
+        print(frame.disciplinas[id_disciplina].nome, len(grupo), grupo.media_nf())
+
+Iterar o frame (ou indexá-lo com um inteiro) monta os AlunoNotaApuradoVO sob
+demanda, para as telas que exibem linha a linha.
+"""
+
+import sys
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from registro_notas_alunos.backend.disciplina.model import Disciplina
+from registro_notas_alunos.backend.notas.calculo import SITUACOES
+from registro_notas_alunos.backend.notas.vo import AlunoNotaApuradoVO
+
+# Colunas do frame, na ordem de _SQL_NOTAS_APURADAS (sem nome, ano e semestre
+# da disciplina, que ficam em NotasFrame.disciplinas)
+COLUNAS = (
+    "id_nota",
+    "nome_aluno",
+    "id_disciplina",
+    "sm1",
+    "sm2",
+    "av",
+    "avs",
+    "nf",
+    "situacao",
+)
+
+_COLUNAS_NOTAS = ("sm1", "sm2", "av", "avs", "nf")
+
+_CODIGOS_SITUACAO = {situacao: codigo for codigo, situacao in enumerate(SITUACOES)}
+
+
+class NotasFrame:
+    """
+    Notas apuradas em colunas numpy, com as disciplinas compartilhadas por id
+
+    Attributes:
+        id_nota: IDs dos registros de notas (int64)
+        nome_aluno: Nomes dos alunos (object, strings internadas)
+        id_disciplina: IDs das disciplinas (int64)
+        sm1, sm2, av, avs, nf: Notas (float64, NaN quando nulas)
+        situacao: Códigos das situações, índices de SITUACOES (uint8)
+        disciplinas: Disciplinas referenciadas pelas linhas, por ID
+    """
+
+    __slots__ = COLUNAS + ("disciplinas",)
+
+    def __init__(self, colunas: Mapping[str, np.ndarray], disciplinas: Dict[int, Disciplina]):
+        """
+        Cria um frame a partir de colunas já convertidas
+
+        Args:
+            colunas: Um array por nome de COLUNAS, todos do mesmo tamanho
+            disciplinas: Disciplinas por ID, incluindo todas as de id_disciplina
+
+        Raises:
+            ValueError: Se faltar uma coluna ou os tamanhos forem diferentes
+        """
+        tamanhos = {len(colunas[nome]) for nome in COLUNAS if nome in colunas}
+        if set(colunas) != set(COLUNAS) or len(tamanhos) > 1:
+            raise ValueError("O frame exige todas as colunas de notas, com o mesmo tamanho")
+
+        for nome in COLUNAS:
+            setattr(self, nome, colunas[nome])
+        self.disciplinas = disciplinas
+
+    @classmethod
+    def vazio(cls) -> "NotasFrame":
+        """Cria um frame sem linhas"""
+        return cls._de_colunas([_converter_lote([])], {})
+
+    @classmethod
+    def de_linhas(cls, rows: Sequence[tuple]) -> "NotasFrame":
+        """
+        Cria um frame a partir das linhas de _SQL_NOTAS_APURADAS
+
+        Args:
+            rows: Linhas retornadas pelo banco
+
+        Returns:
+            NotasFrame com as linhas na mesma ordem
+        """
+        return cls.de_lotes([rows])
+
+    @classmethod
+    def de_lotes(cls, lotes: Iterable[Sequence[tuple]]) -> "NotasFrame":
+        """
+        Cria um frame a partir de lotes de linhas de _SQL_NOTAS_APURADAS
+
+        Cada lote é convertido em colunas assim que chega, de forma que as
+        tuplas do banco podem ser descartadas antes do lote seguinte (use com
+        DatabaseConnection.stream_batches).
+
+        Args:
+            lotes: Listas de linhas retornadas pelo banco
+
+        Returns:
+            NotasFrame com as linhas de todos os lotes, na ordem recebida
+        """
+        disciplinas: Dict[int, Disciplina] = {}
+        partes = []
+
+        for rows in lotes:
+            if not rows:
+                continue
+            parte = _converter_lote(rows)
+            partes.append(parte)
+
+            # Uma Disciplina por ID, criada a partir da primeira linha em que aparece
+            ids, primeiras = np.unique(parte["id_disciplina"], return_index=True)
+            for id_disciplina, posicao in zip(ids.tolist(), primeiras.tolist()):
+                if id_disciplina not in disciplinas:
+                    disciplinas[id_disciplina] = Disciplina.de_linha(rows[posicao][2:6])
+
+        return cls._de_colunas(partes or [_converter_lote([])], disciplinas)
+
+    @classmethod
+    def _de_colunas(
+        cls, partes: List[Dict[str, np.ndarray]], disciplinas: Dict[int, Disciplina]
+    ) -> "NotasFrame":
+        """Concatena as colunas de cada lote em um frame"""
+        if len(partes) == 1:
+            return cls(partes[0], disciplinas)
+        colunas = {nome: np.concatenate([parte[nome] for parte in partes]) for nome in COLUNAS}
+        return cls(colunas, disciplinas)
+
+    def __len__(self) -> int:
+        return len(self.id_nota)
+
+    def __getitem__(self, posicao: int) -> AlunoNotaApuradoVO:
+        """
+        Monta o AlunoNotaApuradoVO de uma linha
+
+        Args:
+            posicao: Posição da linha (aceita negativos)
+
+        Returns:
+            AlunoNotaApuradoVO da linha, com a Disciplina compartilhada
+
+        Raises:
+            IndexError: Se a posição estiver fora do frame
+        """
+        nf = self.nf[posicao]
+        return AlunoNotaApuradoVO(
+            id_nota=int(self.id_nota[posicao]),
+            nome_aluno=self.nome_aluno[posicao],
+            disciplina=self.disciplinas[int(self.id_disciplina[posicao])],
+            sm1=_nota(self.sm1[posicao]),
+            sm2=_nota(self.sm2[posicao]),
+            av=_nota(self.av[posicao]),
+            avs=_nota(self.avs[posicao]),
+            # NF nula enquanto pendente, como em NotasService
+            nota_final=0.0 if np.isnan(nf) else float(nf),
+            situacao=SITUACOES[self.situacao[posicao]],
+        )
+
+    def __iter__(self) -> Iterator[AlunoNotaApuradoVO]:
+        """Percorre as linhas montando cada AlunoNotaApuradoVO somente quando consumido"""
+        for posicao in range(len(self)):
+            yield self[posicao]
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes ocupados pelos arrays das colunas (sem os textos dos nomes)"""
+        return sum(getattr(self, nome).nbytes for nome in COLUNAS)
+
+    def nulos(self, coluna: str) -> np.ndarray:
+        """
+        Máscara das linhas em que uma coluna de nota é nula
+
+        Args:
+            coluna: sm1, sm2, av, avs ou nf
+
+        Returns:
+            Array booleano, True nas linhas sem a nota
+
+        Raises:
+            ValueError: Se a coluna não for uma coluna de nota
+        """
+        if coluna not in _COLUNAS_NOTAS:
+            raise ValueError(f"Coluna de nota inválida: {coluna}")
+        return np.isnan(getattr(self, coluna))
+
+    def mascara_situacao(self, situacao: str) -> np.ndarray:
+        """
+        Máscara das linhas com uma situação
+
+        Args:
+            situacao: APROVADO, REPROVADO ou PENDENTE
+
+        Returns:
+            Array booleano, True nas linhas com a situação
+
+        Raises:
+            ValueError: Se a situação for desconhecida
+        """
+        if situacao not in _CODIGOS_SITUACAO:
+            raise ValueError(f"Situação deve ser uma de {', '.join(SITUACOES)}")
+        return self.situacao == _CODIGOS_SITUACAO[situacao]
+
+    def tomar(self, indices: np.ndarray) -> "NotasFrame":
+        """
+        Cria um frame com as linhas indicadas
+
+        Args:
+            indices: Posições das linhas ou máscara booleana do tamanho do frame
+
+        Returns:
+            NotasFrame com as linhas selecionadas, compartilhando as disciplinas
+        """
+        return NotasFrame(
+            {nome: getattr(self, nome)[indices] for nome in COLUNAS}, self.disciplinas
+        )
+
+    def filtrar(self, mascara: np.ndarray) -> "NotasFrame":
+        """
+        Cria um frame com as linhas em que a máscara é verdadeira
+
+        Args:
+            mascara: Array booleano do tamanho do frame, ex.: frame.nf >= 6
+
+        Returns:
+            NotasFrame filtrado, na mesma ordem
+
+        Raises:
+            ValueError: Se a máscara não tiver o tamanho do frame
+        """
+        mascara = np.asarray(mascara, dtype=bool)
+        if mascara.shape != (len(self),):
+            raise ValueError("A máscara deve ter uma posição por linha do frame")
+        return self.tomar(mascara)
+
+    def ordenar(self, *colunas: str, decrescente: bool = False) -> "NotasFrame":
+        """
+        Cria um frame ordenado por uma ou mais colunas
+
+        A ordenação é estável (empates mantêm a ordem atual) e as notas nulas
+        ficam no fim nas duas direções.
+
+        Args:
+            colunas: Nomes das colunas, da mais para a menos significativa
+            decrescente: Se a ordem é decrescente
+
+        Returns:
+            NotasFrame ordenado
+
+        Raises:
+            ValueError: Se nenhuma coluna ou uma coluna desconhecida for informada
+        """
+        if not colunas:
+            raise ValueError("Informe ao menos uma coluna para ordenar")
+
+        chaves = []
+        for coluna in colunas:
+            if coluna not in COLUNAS:
+                raise ValueError(f"Coluna desconhecida: {coluna}")
+            valores = getattr(self, coluna)
+            # Nomes viram códigos na ordem alfabética, para o lexsort numérico
+            if coluna == "nome_aluno":
+                valores = np.unique(valores, return_inverse=True)[1]
+            # Negar mantém a estabilidade e o NaN no fim na ordem decrescente
+            chaves.append(-valores.astype(np.float64) if decrescente else valores)
+
+        # lexsort usa a última chave como a mais significativa
+        return self.tomar(np.lexsort(tuple(reversed(chaves))))
+
+    def agrupar(self, coluna: str) -> Dict[object, "NotasFrame"]:
+        """
+        Separa o frame pelos valores de uma coluna
+
+        Args:
+            coluna: id_disciplina, nome_aluno ou situacao (a chave é o nome
+                da situação)
+
+        Returns:
+            Dicionário valor -> NotasFrame, em ordem crescente de valor e
+            mantendo a ordem das linhas em cada grupo
+
+        Raises:
+            ValueError: Se a coluna não puder ser agrupada
+        """
+        if coluna not in ("id_disciplina", "nome_aluno", "situacao"):
+            raise ValueError(f"Coluna não agrupável: {coluna}")
+
+        chaves, grupos = np.unique(getattr(self, coluna), return_inverse=True)
+        ordem = np.argsort(grupos, kind="stable")
+        limites = np.searchsorted(grupos[ordem], np.arange(len(chaves) + 1))
+
+        resultado: Dict[object, NotasFrame] = {}
+        for i, chave in enumerate(chaves.tolist()):
+            if coluna == "situacao":
+                chave = SITUACOES[chave]
+            resultado[chave] = self.tomar(ordem[limites[i] : limites[i + 1]])
+        return resultado
+
+    def contar_situacoes(self) -> Dict[str, int]:
+        """
+        Conta as linhas de cada situação
+
+        Returns:
+            Dicionário situação -> quantidade, com todas as situações
+        """
+        contagens = np.bincount(self.situacao, minlength=len(SITUACOES))
+        return dict(zip(SITUACOES, contagens.tolist()))
+
+    def media_nf(self) -> Optional[float]:
+        """
+        Média das notas finais apuradas (sem as pendentes)
+
+        Returns:
+            Média ou None se não houver nota final
+        """
+        apuradas = self.nf[~np.isnan(self.nf)]
+        return float(apuradas.mean()) if len(apuradas) else None
+
+
+def _converter_lote(rows: Sequence[tuple]) -> Dict[str, np.ndarray]:
+    """Converte um lote de linhas de _SQL_NOTAS_APURADAS em colunas"""
+    campos = list(zip(*rows)) if rows else [()] * 12
+    id_nota, nome_aluno, id_disciplina = campos[0], campos[1], campos[2]
+    sm1, sm2, av, avs, nf, situacao = campos[6:12]
+
+    nomes = np.empty(len(nome_aluno), dtype=object)
+    nomes[:] = [sys.intern(nome) for nome in nome_aluno]
+
+    return {
+        "id_nota": np.array(id_nota, dtype=np.int64),
+        "nome_aluno": nomes,
+        "id_disciplina": np.array(id_disciplina, dtype=np.int64),
+        # None vira NaN
+        "sm1": np.array(sm1, dtype=np.float64),
+        "sm2": np.array(sm2, dtype=np.float64),
+        "av": np.array(av, dtype=np.float64),
+        "avs": np.array(avs, dtype=np.float64),
+        "nf": np.array(nf, dtype=np.float64),
+        "situacao": np.fromiter(
+            (_CODIGOS_SITUACAO[s] for s in situacao), dtype=np.uint8, count=len(situacao)
+        ),
+    }
+
+
+def _nota(valor: float) -> Optional[float]:
+    """Converte um valor de coluna de nota para o VO (NaN vira None)"""
+    return None if np.isnan(valor) else float(valor)
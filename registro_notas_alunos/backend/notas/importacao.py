@@ -0,0 +1,427 @@
+"""
+Importação de notas a partir de planilhas CSV ou XLSX
+
+Cada linha da planilha traz a matrícula do aluno, a disciplina (nome, ano e
+semestre) e as notas SM1, SM2, AV e AVS. A importação resolve todas as
+matrículas em uma única consulta, valida as notas com as mesmas regras do
+modelo Notas e grava as linhas válidas com um único INSERT ... ON CONFLICT em
+lote, dentro de uma transação. Linhas inválidas não são gravadas e aparecem no
+relatório de erros, com o número da linha na planilha.
+
+Colunas reconhecidas (cabeçalho sem diferenciar maiúsculas e acentos):
+matricula, disciplina, ano, semestre, sm1, sm2, av, avs. Outras colunas, como
+o nome do aluno, são ignoradas. Quando a planilha é de uma única turma, a
+disciplina pode ser informada na chamada em vez de nas colunas. Células vazias
+deixam a nota pendente; vírgula é aceita como separador decimal.
+
+Uso pela linha de comando, por exemplo em jobs noturnos:
+
+    python -m registro_notas_alunos.backend.notas.importacao notas.csv
+    python -m registro_notas_alunos.backend.notas.importacao turma.xlsx \\
+        --disciplina "RAD em Python" --ano 2025 --semestre 1 --erros erros.csv
+
+Arquivos .xlsx exigem o pacote opcional openpyxl.
+"""
+
+import argparse
+import csv
+import logging
+import sys
+import unicodedata
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.backend.notas.model import Notas
+from registro_notas_alunos.backend.notas.service import NotasService
+
+logger = logging.getLogger(__name__)
+
+COLUNAS_NOTAS = ("sm1", "sm2", "av", "avs")
+COLUNAS_DISCIPLINA = ("disciplina", "ano", "semestre")
+
+_SQL_RESOLVER_MATRICULAS = """
+    SELECT v.matricula, v.disciplina, v.ano, v.semestre, m.id
+    FROM (VALUES %s) AS v (matricula, disciplina, ano, semestre)
+    JOIN aluno a ON a.matricula = v.matricula
+    JOIN disciplina d ON d.nome = v.disciplina AND d.ano = v.ano AND d.semestre = v.semestre
+    JOIN matricula m ON m.id_aluno = a.id AND m.id_disciplina = d.id
+"""
+
+# (matrícula do aluno, nome da disciplina, ano, semestre)
+ChaveMatricula = Tuple[str, str, int, int]
+
+
+@dataclass
+class ErroImportacao:
+    """
+    Linha da planilha que não foi gravada
+    """
+
+    linha: int
+    mensagem: str
+
+
+@dataclass
+class ResultadoImportacao:
+    """
+    Resumo de uma importação
+    """
+
+    total: int = 0
+    gravadas: int = 0
+    erros: List[ErroImportacao] = field(default_factory=list)
+    # True se a importação apenas validou a planilha, sem gravar
+    simulacao: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """Indica se todas as linhas foram aceitas"""
+        return not self.erros
+
+
+@dataclass
+class _LinhaValida:
+    """Linha convertida, aguardando a resolução da matrícula"""
+
+    linha: int
+    chave: ChaveMatricula
+    notas: Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]
+
+
+def _normalizar_cabecalho(nome) -> str:
+    """Cabeçalho em minúsculas, sem acentos e sem espaços nas pontas"""
+    texto = unicodedata.normalize("NFKD", str(nome or "").strip().lower())
+    return "".join(c for c in texto if not unicodedata.combining(c))
+
+
+def _texto(valor) -> str:
+    """Converte o valor de uma célula em texto; números inteiros perdem o .0"""
+    if valor is None:
+        return ""
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor))
+    return str(valor).strip()
+
+
+def converter_nota(valor) -> Optional[float]:
+    """
+    Converte o valor de uma célula em nota
+
+    Args:
+        valor: Texto (aceita vírgula decimal), número ou vazio
+
+    Returns:
+        Nota ou None se a célula estiver vazia
+
+    Raises:
+        ValueError: Se o valor não for numérico
+    """
+    if valor is None or isinstance(valor, (int, float)):
+        return None if valor is None else float(valor)
+    texto = str(valor).strip()
+    if not texto:
+        return None
+    try:
+        return float(texto.replace(",", "."))
+    except ValueError:
+        raise ValueError(f"Valor inválido: {texto!r}")
+
+
+def ler_csv(caminho: Path) -> Iterator[Tuple[int, Dict[str, object]]]:
+    """
+    Lê as linhas de um arquivo CSV separado por vírgula ou ponto e vírgula
+
+    Args:
+        caminho: Arquivo CSV (UTF-8, com ou sem BOM)
+
+    Yields:
+        (número da linha no arquivo, valores por coluna normalizada)
+    """
+    with open(caminho, newline="", encoding="utf-8-sig") as arquivo:
+        amostra = arquivo.read(4096)
+        arquivo.seek(0)
+        try:
+            dialeto = csv.Sniffer().sniff(amostra, delimiters=",;\t")
+        except csv.Error:
+            dialeto = csv.excel
+
+        leitor = csv.reader(arquivo, dialeto)
+        cabecalho = [_normalizar_cabecalho(nome) for nome in next(leitor, [])]
+        for valores in leitor:
+            if any(valor.strip() for valor in valores):
+                yield leitor.line_num, dict(zip(cabecalho, valores))
+
+
+def ler_xlsx(caminho: Path) -> Iterator[Tuple[int, Dict[str, object]]]:
+    """
+    Lê as linhas da primeira planilha de um arquivo XLSX
+
+    Args:
+        caminho: Arquivo XLSX
+
+    Yields:
+        (número da linha na planilha, valores por coluna normalizada)
+
+    Raises:
+        ImportError: Se o pacote openpyxl não estiver instalado
+    """
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("Instale o pacote openpyxl para importar arquivos .xlsx")
+
+    pasta = openpyxl.load_workbook(caminho, read_only=True, data_only=True)
+    try:
+        linhas = pasta.worksheets[0].iter_rows(values_only=True)
+        cabecalho = [_normalizar_cabecalho(nome) for nome in next(linhas, ())]
+        for numero, valores in enumerate(linhas, start=2):
+            if any(valor not in (None, "") for valor in valores):
+                yield numero, dict(zip(cabecalho, valores))
+    finally:
+        pasta.close()
+
+
+def ler_planilha(caminho: Path) -> Iterator[Tuple[int, Dict[str, object]]]:
+    """
+    Lê um arquivo .csv ou .xlsx conforme a extensão
+
+    Args:
+        caminho: Arquivo da planilha
+
+    Yields:
+        (número da linha, valores por coluna normalizada)
+
+    Raises:
+        ValueError: Se a extensão não for suportada
+    """
+    extensao = Path(caminho).suffix.lower()
+    if extensao == ".csv":
+        return ler_csv(caminho)
+    if extensao in (".xlsx", ".xlsm"):
+        return ler_xlsx(caminho)
+    raise ValueError(f"Formato não suportado: {extensao or caminho} (use .csv ou .xlsx)")
+
+
+class ImportadorNotas:
+    """
+    Importa notas em lote a partir de planilhas
+    """
+
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None):
+        """
+        Inicializa o importador
+
+        Args:
+            db_connection: Conexão com banco de dados (opcional)
+        """
+        self.db = db_connection or DatabaseConnection()
+        self.notas_service = NotasService(self.db)
+
+    def importar(
+        self,
+        caminho: Path,
+        disciplina: Optional[str] = None,
+        ano: Optional[int] = None,
+        semestre: Optional[int] = None,
+        simular: bool = False,
+    ) -> ResultadoImportacao:
+        """
+        Importa as notas de um arquivo .csv ou .xlsx
+
+        Args:
+            caminho: Arquivo da planilha
+            disciplina: Nome da disciplina de todas as linhas (opcional)
+            ano: Ano da disciplina de todas as linhas (opcional)
+            semestre: Semestre da disciplina de todas as linhas (opcional)
+            simular: Apenas valida e resolve as matrículas, sem gravar
+
+        Returns:
+            ResultadoImportacao com a contagem e os erros por linha
+        """
+        return self.importar_linhas(
+            ler_planilha(caminho), disciplina, ano, semestre, simular=simular
+        )
+
+    def importar_linhas(
+        self,
+        linhas,
+        disciplina: Optional[str] = None,
+        ano: Optional[int] = None,
+        semestre: Optional[int] = None,
+        simular: bool = False,
+    ) -> ResultadoImportacao:
+        """
+        Importa linhas já lidas de uma planilha
+
+        Args:
+            linhas: Iterável de (número da linha, valores por coluna normalizada)
+            disciplina: Nome da disciplina de todas as linhas (opcional)
+            ano: Ano da disciplina de todas as linhas (opcional)
+            semestre: Semestre da disciplina de todas as linhas (opcional)
+            simular: Apenas valida e resolve as matrículas, sem gravar
+
+        Returns:
+            ResultadoImportacao com a contagem e os erros por linha
+        """
+        padrao = {"disciplina": disciplina, "ano": ano, "semestre": semestre}
+        resultado = ResultadoImportacao(simulacao=simular)
+        validas: List[_LinhaValida] = []
+
+        for numero, valores in linhas:
+            resultado.total += 1
+            try:
+                validas.append(self._converter(numero, valores, padrao))
+            except ValueError as e:
+                resultado.erros.append(ErroImportacao(numero, str(e)))
+
+        with self.db.transaction():
+            matriculas = self._resolver_matriculas({linha.chave for linha in validas})
+
+            lote: List[Notas] = []
+            linha_por_matricula: Dict[int, int] = {}
+            for linha in validas:
+                id_matricula = matriculas.get(linha.chave)
+                if id_matricula is None:
+                    codigo, nome, ano_disc, semestre_disc = linha.chave
+                    resultado.erros.append(
+                        ErroImportacao(
+                            linha.linha,
+                            f"Aluno {codigo} não está matriculado em "
+                            f"{nome} ({ano_disc}/{semestre_disc})",
+                        )
+                    )
+                    continue
+                if id_matricula in linha_por_matricula:
+                    resultado.erros.append(
+                        ErroImportacao(
+                            linha.linha,
+                            f"Matrícula repetida; já informada na linha "
+                            f"{linha_por_matricula[id_matricula]}",
+                        )
+                    )
+                    continue
+
+                sm1, sm2, av, avs = linha.notas
+                linha_por_matricula[id_matricula] = linha.linha
+                lote.append(
+                    Notas(id=None, id_matricula=id_matricula, sm1=sm1, sm2=sm2, av=av, avs=avs)
+                )
+
+            if not simular:
+                self.notas_service.gravar_em_lote(lote)
+            resultado.gravadas = len(lote)
+
+        resultado.erros.sort(key=lambda erro: erro.linha)
+        logger.info(
+            f"Importação de notas: {resultado.gravadas} de {resultado.total} linhas "
+            f"{'válidas' if simular else 'gravadas'}, {len(resultado.erros)} com erro"
+        )
+        return resultado
+
+    def _converter(self, numero: int, valores: Dict[str, object], padrao: dict) -> _LinhaValida:
+        """
+        Converte e valida uma linha da planilha
+
+        Raises:
+            ValueError: Com a mensagem do erro da linha
+        """
+        codigo = _texto(valores.get("matricula"))
+        if not codigo:
+            raise ValueError("Matrícula do aluno não informada")
+
+        disciplina = {}
+        for coluna in COLUNAS_DISCIPLINA:
+            valor = _texto(valores.get(coluna)) or padrao[coluna]
+            if valor in (None, ""):
+                raise ValueError(f"Coluna {coluna} não informada")
+            disciplina[coluna] = valor
+        try:
+            ano, semestre = int(disciplina["ano"]), int(disciplina["semestre"])
+        except ValueError:
+            raise ValueError("Ano e semestre devem ser números inteiros")
+
+        notas = []
+        for coluna in COLUNAS_NOTAS:
+            try:
+                notas.append(converter_nota(valores.get(coluna)))
+            except ValueError as e:
+                raise ValueError(f"{coluna.upper()}: {e}")
+
+        # Mesmas faixas aceitas pelo modelo Notas
+        Notas(id=None, id_matricula=1, sm1=notas[0], sm2=notas[1], av=notas[2], avs=notas[3])
+
+        return _LinhaValida(
+            numero, (codigo, str(disciplina["disciplina"]).strip(), ano, semestre), tuple(notas)
+        )
+
+    def _resolver_matriculas(self, chaves) -> Dict[ChaveMatricula, int]:
+        """
+        Resolve (matrícula do aluno, disciplina, ano, semestre) em matricula.id
+
+        Args:
+            chaves: Chaves distintas da planilha
+
+        Returns:
+            ID da matrícula por chave; chaves sem matrícula ficam de fora
+        """
+        template = "(%s::varchar, %s::varchar, %s::integer, %s::integer)"
+        result = self.db.execute_values(
+            _SQL_RESOLVER_MATRICULAS, list(chaves), template=template, fetch=True
+        )
+        return {tuple(row[:4]): row[4] for row in result}
+
+
+def gravar_erros(resultado: ResultadoImportacao, caminho: Path) -> None:
+    """
+    Grava o relatório de erros em CSV (colunas linha e mensagem)
+
+    Args:
+        resultado: Resultado da importação
+        caminho: Arquivo de saída
+    """
+    with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(["linha", "mensagem"])
+        for erro in resultado.erros:
+            escritor.writerow([erro.linha, erro.mensagem])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ponto de entrada da linha de comando
+
+    Returns:
+        0 se todas as linhas foram aceitas, 2 se alguma linha tem erro e 1 se a
+        importação falhou
+    """
+    parser = argparse.ArgumentParser(description="Importa notas de planilhas CSV ou XLSX")
+    parser.add_argument("arquivo", type=Path, help="planilha .csv ou .xlsx")
+    parser.add_argument("--disciplina", help="nome da disciplina de todas as linhas")
+    parser.add_argument("--ano", type=int, help="ano da disciplina de todas as linhas")
+    parser.add_argument("--semestre", type=int, help="semestre da disciplina de todas as linhas")
+    parser.add_argument("--simular", action="store_true", help="apenas valida, sem gravar")
+    parser.add_argument("--erros", type=Path, help="grava o relatório de erros neste CSV")
+    args = parser.parse_args(argv)
+
+    try:
+        resultado = ImportadorNotas().importar(
+            args.arquivo, args.disciplina, args.ano, args.semestre, simular=args.simular
+        )
+    except Exception as e:
+        print(f"Erro na importação: {e}", file=sys.stderr)
+        return 1
+
+    acao = "válidas" if resultado.simulacao else "gravadas"
+    print(f"{resultado.gravadas} de {resultado.total} linhas {acao}")
+    for erro in resultado.erros:
+        print(f"Linha {erro.linha}: {erro.mensagem}", file=sys.stderr)
+    if args.erros:
+        gravar_erros(resultado, args.erros)
+
+    return 0 if resultado.ok else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,8 +5,10 @@ Modelo de dados para Notas
 from dataclasses import dataclass
 from typing import Optional
 
+from registro_notas_alunos.backend.notas.calculo import PENDENTE, calcular_nota_final
 
-@dataclass
+
+@dataclass(slots=True)
 class Notas:
     """
     Representa as notas de um aluno em uma disciplina
@@ -18,8 +20,8 @@ class Notas:
         sm2: Nota da Suplementar 2 (0.0 a 1.0)
         av: Nota da Avaliação (0.0 a 10.0)
         avs: Nota da Avaliação Substitutiva (0.0 a 10.0)
-        nf: Nota Final calculada
-        situacao: Situação do aluno (Aprovado/Reprovado/Em Avaliação)
+        nf: Nota Final calculada (None enquanto pendente)
+        situacao: Situação do aluno (APROVADO/REPROVADO/PENDENTE)
     """
 
     id: Optional[int]
@@ -28,8 +30,8 @@ class Notas:
     sm2: Optional[float] = 0.0
     av: Optional[float] = 0.0
     avs: Optional[float] = 0.0
-    nf: float = 0.0
-    situacao: str = "Em Avaliação"
+    nf: Optional[float] = None
+    situacao: str = PENDENTE
 
     def __post_init__(self):
         """Validações após inicialização"""
@@ -38,6 +40,33 @@ class Notas:
 
         self._validar_notas()
 
+    @classmethod
+    def de_linha(cls, linha: tuple) -> "Notas":
+        """
+        Cria Notas a partir de uma linha lida do banco, sem validar
+
+        Os dados gravados já passaram pelas validações na escrita, e nf e
+        situacao vêm do gatilho da migração 0004.
+
+        Args:
+            linha: Tupla (id, id_matricula, sm1, sm2, av, avs, nf, situacao)
+
+        Returns:
+            Notas com os valores da linha
+        """
+        notas = object.__new__(cls)
+        (
+            notas.id,
+            notas.id_matricula,
+            notas.sm1,
+            notas.sm2,
+            notas.av,
+            notas.avs,
+            notas.nf,
+            notas.situacao,
+        ) = linha
+        return notas
+
     def _validar_notas(self):
         """Valida se as notas estão dentro dos limites permitidos"""
         if self.sm1 is not None and not (0.0 <= self.sm1 <= 1.0):
@@ -52,27 +81,15 @@ class Notas:
         if self.avs is not None and not (0.0 <= self.avs <= 10.0):
             raise ValueError("AVS deve estar entre 0.0 e 10.0")
 
-    def calcular_nota_final(self) -> float:
+    def calcular_nota_final(self) -> Optional[float]:
         """
-        Calcula a nota final baseada nas regras do sistema
+        Calcula a nota final e a situação com a regra gravada pelo banco
+
+        O banco recalcula nf e situacao em toda escrita (migração 0004); este
+        cálculo antecipa o mesmo resultado no objeto.
 
         Returns:
-            float: Nota final calculada
+            Nota final calculada ou None se SM1, SM2 ou AV estiverem pendentes
         """
-        # Usa AVS se for maior que AV, tratando None como 0
-        av_valor = self.av if self.av is not None else 0.0
-        avs_valor = self.avs if self.avs is not None else 0.0
-        nota_av = max(av_valor, avs_valor)
-
-        # Calcula pontos extras (máximo 2 pontos), tratando None como 0
-        sm1_valor = self.sm1 if self.sm1 is not None else 0.0
-        sm2_valor = self.sm2 if self.sm2 is not None else 0.0
-        pontos_extras = min(sm1_valor, 1.0) + min(sm2_valor, 1.0)
-
-        # Nota final é a soma da nota AV com os pontos extras
-        self.nf = nota_av + pontos_extras
-
-        # Atualiza situação
-        self.situacao = "Aprovado" if self.nf >= 6.0 else "Reprovado"
-
+        self.nf, self.situacao = calcular_nota_final(self.sm1, self.sm2, self.av, self.avs)
         return self.nf
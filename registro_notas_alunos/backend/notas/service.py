@@ -2,12 +2,137 @@
 Serviço para operações com Notas
 """
 
-from typing import List, Optional, Tuple
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from registro_notas_alunos.backend.disciplina.model import Disciplina
 from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.backend.lib.paginacao import Pagina, condicao_apos, consultar_pagina
+from registro_notas_alunos.backend.notas.calculo import SITUACOES, calcular_nota_final
+from registro_notas_alunos.backend.notas.frame import NotasFrame
 from registro_notas_alunos.backend.notas.model import Notas
-from registro_notas_alunos.backend.notas.vo import AlunoNotaApuradoVO
+from registro_notas_alunos.backend.notas.vo import (
+    AlunoNotaApuradoVO,
+    EstatisticasNotasVO,
+    FiltroNotasVO,
+    RelatorioEstatisticasVO,
+)
+
+# Colunas de notas na ordem esperada por Notas.de_linha
+_COLUNAS_NOTAS = "id, id_matricula, sm1, sm2, av, avs, nf, situacao"
+
+# Notas dos alunos de uma disciplina (listar_por_disciplina)
+_SQL_NOTAS_POR_DISCIPLINA = """
+    SELECT a.nome, a.matricula, n.sm1, n.sm2, n.av, n.avs, n.nf, n.situacao
+    FROM notas n
+    JOIN matricula m ON n.id_matricula = m.id
+    JOIN aluno a ON m.id_aluno = a.id
+"""
+
+# Notas de um aluno em cada disciplina (listar_por_aluno)
+_SQL_NOTAS_POR_ALUNO = """
+    SELECT d.nome, d.ano, d.semestre, n.sm1, n.sm2, n.av, n.avs, n.nf, n.situacao
+    FROM notas n
+    JOIN matricula m ON n.id_matricula = m.id
+    JOIN disciplina d ON m.id_disciplina = d.id
+"""
+
+# Junções das notas apuradas, compartilhadas pela consulta e pela contagem
+_SQL_ORIGEM_NOTAS_APURADAS = """
+    FROM notas n
+    JOIN matricula m ON n.id_matricula = m.id
+    JOIN aluno a ON m.id_aluno = a.id
+    JOIN disciplina d ON m.id_disciplina = d.id
+"""
+
+# Consulta base das notas apuradas (sem ORDER BY), com as colunas esperadas por
+# NotasService._montar_notas_apuradas
+_SQL_NOTAS_APURADAS = f"""
+    SELECT
+        n.id,
+        a.nome as nome_aluno,
+        d.id as disciplina_id,
+        d.nome as disciplina_nome,
+        d.ano as disciplina_ano,
+        d.semestre as disciplina_semestre,
+        n.sm1,
+        n.sm2,
+        n.av,
+        n.avs,
+        n.nf,
+        n.situacao
+    {_SQL_ORIGEM_NOTAS_APURADAS}
+"""
+
+# Colunas das exportações: as notas apuradas com a matrícula do aluno, na ordem
+# de COLUNAS_EXPORTACAO
+_SQL_NOTAS_EXPORTACAO = f"""
+    SELECT
+        a.matricula,
+        a.nome,
+        d.nome,
+        d.ano,
+        d.semestre,
+        n.sm1,
+        n.sm2,
+        n.av,
+        n.avs,
+        n.nf,
+        n.situacao
+    {_SQL_ORIGEM_NOTAS_APURADAS}
+"""
+
+COLUNAS_EXPORTACAO = (
+    "matricula",
+    "aluno",
+    "disciplina",
+    "ano",
+    "semestre",
+    "sm1",
+    "sm2",
+    "av",
+    "avs",
+    "nf",
+    "situacao",
+)
+
+# Colunas aceitas por consultar_notas_apuradas(ordenacao=...) e as expressões
+# SQL correspondentes. n.id é sempre acrescentado ao final para que a ordem
+# seja total e a paginação por deslocamento, estável.
+ORDENACOES_NOTAS_APURADAS = {
+    "id": (),
+    "aluno": ("a.nome", "d.nome"),
+    "disciplina": ("d.nome", "a.nome"),
+    "periodo": ("d.ano", "d.semestre", "a.nome"),
+    "sm1": ("n.sm1",),
+    "sm2": ("n.sm2",),
+    "av": ("n.av",),
+    "avs": ("n.avs",),
+    "nota_final": ("n.nf",),
+    "situacao": ("n.situacao",),
+}
+
+# Valor de cada expressão de ORDENACOES_NOTAS_APURADAS em um AlunoNotaApuradoVO,
+# usado para continuar a consulta a partir de um registro (apos=...)
+_VALORES_ORDENACAO = {
+    "n.id": lambda vo: vo.id_nota,
+    "a.nome": lambda vo: vo.nome_aluno,
+    "d.nome": lambda vo: vo.disciplina.nome,
+    "d.ano": lambda vo: vo.disciplina.ano,
+    "d.semestre": lambda vo: vo.disciplina.semestre,
+    "n.sm1": lambda vo: vo.sm1,
+    "n.sm2": lambda vo: vo.sm2,
+    "n.av": lambda vo: vo.av,
+    "n.avs": lambda vo: vo.avs,
+    # O VO traz 0.0 no lugar da NF nula, que o banco grava apenas nas pendentes
+    "n.nf": lambda vo: None if vo.is_pendente() else vo.nota_final,
+    "n.situacao": lambda vo: vo.situacao,
+}
+
+# Notas são REAL: o valor lido (ex.: 6.7) só é igual ao gravado na precisão da coluna
+_MARCADORES_ORDENACAO = {
+    coluna: "%s::real" for coluna in ("n.sm1", "n.sm2", "n.av", "n.avs", "n.nf")
+}
 
 
 class NotasJaExistemException(Exception):
@@ -48,17 +173,16 @@ class NotasService:
         if notas.id is not None:
             raise ValueError("Notas para criação não devem ter ID")
 
-        # Verifica se já existem notas para esta matrícula
-        if self.buscar_por_matricula(notas.id_matricula):
-            raise NotasJaExistemException("Notas já existem para esta matrícula")
-
         try:
             # Calcula nota final antes de salvar
             notas.calcular_nota_final()
 
+            # ON CONFLICT usa o índice único de id_matricula: sem linha
+            # retornada, já existem notas para a matrícula
             query = """
                 INSERT INTO notas (id_matricula, sm1, sm2, av, avs, nf, situacao)
                 VALUES (%s, %s, %s, %s, %s, %s, %s)
+                ON CONFLICT DO NOTHING
                 RETURNING id
             """
             params = (
@@ -73,7 +197,7 @@ class NotasService:
             result = self.db.execute_query(query, params)
 
             if not result:
-                raise Exception("Erro ao criar registro de notas")
+                raise NotasJaExistemException("Notas já existem para esta matrícula")
 
             return result[0][0]
         except Exception as e:
@@ -82,6 +206,79 @@ class NotasService:
                 raise NotasJaExistemException("Notas já existem")
             raise e
 
+    def criar_em_lote(self, notas_list: List[Notas]) -> List[int]:
+        """
+        Cria vários registros de notas com um único comando INSERT em lote
+
+        Args:
+            notas_list: Notas a serem criadas (sem ID)
+
+        Returns:
+            Lista com os IDs criados, na mesma ordem das notas recebidas
+
+        Raises:
+            ValueError: Se algum registro já tiver ID
+            NotasJaExistemException: Se já existem notas para alguma matrícula
+        """
+        if any(notas.id is not None for notas in notas_list):
+            raise ValueError("Notas para criação não devem ter ID")
+
+        for notas in notas_list:
+            notas.calcular_nota_final()
+
+        try:
+            query = """
+                INSERT INTO notas (id_matricula, sm1, sm2, av, avs, nf, situacao)
+                VALUES %s
+                RETURNING id_matricula, id
+            """
+            params_list = [
+                (n.id_matricula, n.sm1, n.sm2, n.av, n.avs, n.nf, n.situacao) for n in notas_list
+            ]
+            result = self.db.execute_values(query, params_list, fetch=True)
+        except Exception as e:
+            # Captura erros de constraint do banco
+            if "duplicate key" in str(e) or "unique constraint" in str(e):
+                raise NotasJaExistemException("Notas já existem")
+            raise e
+
+        # RETURNING não garante a ordem dos VALUES
+        ids = dict(result)
+        return [ids[notas.id_matricula] for notas in notas_list]
+
+    def atualizar_em_lote(self, notas_list: List[Notas]) -> int:
+        """
+        Atualiza vários registros de notas com um único comando UPDATE em lote
+
+        Args:
+            notas_list: Notas com ID a serem atualizadas
+
+        Returns:
+            int: Número de registros atualizados
+
+        Raises:
+            ValueError: Se algum registro não tiver ID válido
+        """
+        if any(notas.id is None or notas.id <= 0 for notas in notas_list):
+            raise ValueError("Notas devem ter ID válido para atualização")
+
+        for notas in notas_list:
+            notas.calcular_nota_final()
+
+        query = """
+            UPDATE notas AS n
+            SET sm1 = v.sm1, sm2 = v.sm2, av = v.av, avs = v.avs,
+                nf = v.nf, situacao = v.situacao
+            FROM (VALUES %s) AS v (id, sm1, sm2, av, avs, nf, situacao)
+            WHERE n.id = v.id
+            RETURNING n.id
+        """
+        # Casts explícitos para que valores None não sejam inferidos como texto
+        template = "(%s::integer, %s::real, %s::real, %s::real, %s::real, %s::real, %s::varchar)"
+        params_list = [(n.id, n.sm1, n.sm2, n.av, n.avs, n.nf, n.situacao) for n in notas_list]
+        result = self.db.execute_values(query, params_list, template=template, fetch=True)
+        return len(result)
+
     def buscar_por_id(self, id: int) -> Optional[Notas]:
         """
         Busca um registro de notas pelo ID
@@ -95,23 +292,13 @@ class NotasService:
         if id <= 0:
             raise ValueError("ID deve ser maior que zero")
 
-        query = "SELECT * FROM notas WHERE id = %s"
+        query = f"SELECT {_COLUNAS_NOTAS} FROM notas WHERE id = %s"
         result = self.db.execute_query(query, (id,))
 
         if not result:
             return None
 
-        row = result[0]
-        return Notas(
-            id=row[0],
-            id_matricula=row[1],
-            sm1=row[2],
-            sm2=row[3],
-            av=row[4],
-            avs=row[5],
-            nf=row[6],
-            situacao=row[7],
-        )
+        return Notas.de_linha(result[0])
 
     def buscar_por_matricula(self, id_matricula: int) -> Optional[Notas]:
         """
@@ -126,23 +313,13 @@ class NotasService:
         if id_matricula <= 0:
             raise ValueError("ID da matrícula deve ser maior que zero")
 
-        query = "SELECT * FROM notas WHERE id_matricula = %s"
+        query = f"SELECT {_COLUNAS_NOTAS} FROM notas WHERE id_matricula = %s"
         result = self.db.execute_query(query, (id_matricula,))
 
         if not result:
             return None
 
-        row = result[0]
-        return Notas(
-            id=row[0],
-            id_matricula=row[1],
-            sm1=row[2],
-            sm2=row[3],
-            av=row[4],
-            avs=row[5],
-            nf=row[6],
-            situacao=row[7],
-        )
+        return Notas.de_linha(result[0])
 
     def atualizar(self, notas: Notas) -> None:
         """
@@ -158,18 +335,16 @@ class NotasService:
         if notas.id is None or notas.id <= 0:
             raise ValueError("Notas devem ter ID válido para atualização")
 
-        # Verifica se registro existe
-        if not self.buscar_por_id(notas.id):
-            raise Exception("Notas não encontradas")
-
         try:
             # Calcula nota final antes de atualizar
             notas.calcular_nota_final()
 
+            # RETURNING indica se o registro existia, sem consulta prévia
             query = """
                 UPDATE notas
                 SET sm1 = %s, sm2 = %s, av = %s, avs = %s, nf = %s, situacao = %s
                 WHERE id = %s
+                RETURNING id
             """
             params = (
                 notas.sm1,
@@ -180,28 +355,97 @@ class NotasService:
                 notas.situacao,
                 notas.id,
             )
-            self.db.execute_query(query, params)
+            result = self.db.execute_query(query, params)
         except Exception as e:
             # Captura erros de constraint do banco
             if "duplicate key" in str(e) or "unique constraint" in str(e):
                 raise Exception("Notas já existem")
             raise e
 
+        if not result:
+            raise Exception("Notas não encontradas")
+
     def atualizar_por_matricula(self, notas: Notas) -> None:
         """
         Atualiza notas usando ID da matrícula
 
+        Cria o registro se ainda não existirem notas para a matrícula, com um
+        único comando INSERT ... ON CONFLICT DO UPDATE. O ID do registro
+        gravado é atribuído a notas.id.
+
         Args:
             notas: Dados das notas com id_matricula
         """
-        notas_existentes = self.buscar_por_matricula(notas.id_matricula)
-        if not notas_existentes:
-            # Se não existem notas, cria um novo registro
-            self.criar(notas)
-        else:
-            # Se existem, atualiza o registro existente
-            notas.id = notas_existentes.id
-            self.atualizar(notas)
+        # Calcula nota final antes de salvar
+        notas.calcular_nota_final()
+
+        query = """
+            INSERT INTO notas (id_matricula, sm1, sm2, av, avs, nf, situacao)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (id_matricula) DO UPDATE
+            SET sm1 = EXCLUDED.sm1, sm2 = EXCLUDED.sm2, av = EXCLUDED.av, avs = EXCLUDED.avs,
+                nf = EXCLUDED.nf, situacao = EXCLUDED.situacao
+            RETURNING id
+        """
+        params = (
+            notas.id_matricula,
+            notas.sm1,
+            notas.sm2,
+            notas.av,
+            notas.avs,
+            notas.nf,
+            notas.situacao,
+        )
+        result = self.db.execute_query(query, params)
+
+        if not result:
+            raise Exception("Erro ao salvar notas")
+
+        notas.id = result[0][0]
+
+    def gravar_em_lote(self, notas_list: List[Notas]) -> List[int]:
+        """
+        Cria ou atualiza as notas de várias matrículas em um único comando em lote
+
+        Versão em lote de atualizar_por_matricula (INSERT ... ON CONFLICT DO
+        UPDATE). Cada matrícula deve aparecer uma única vez. O ID gravado é
+        atribuído a cada notas.id.
+
+        Args:
+            notas_list: Notas com id_matricula
+
+        Returns:
+            Lista com os IDs gravados, na mesma ordem das notas recebidas
+
+        Raises:
+            ValueError: Se uma matrícula aparecer mais de uma vez
+        """
+        matriculas = [notas.id_matricula for notas in notas_list]
+        if len(set(matriculas)) != len(matriculas):
+            raise ValueError("Cada matrícula deve aparecer uma única vez no lote")
+
+        for notas in notas_list:
+            notas.calcular_nota_final()
+
+        query = """
+            INSERT INTO notas (id_matricula, sm1, sm2, av, avs, nf, situacao)
+            VALUES %s
+            ON CONFLICT (id_matricula) DO UPDATE
+            SET sm1 = EXCLUDED.sm1, sm2 = EXCLUDED.sm2, av = EXCLUDED.av, avs = EXCLUDED.avs,
+                nf = EXCLUDED.nf, situacao = EXCLUDED.situacao
+            RETURNING id_matricula, id
+        """
+        template = "(%s::integer, %s::real, %s::real, %s::real, %s::real, %s::real, %s::varchar)"
+        params_list = [
+            (n.id_matricula, n.sm1, n.sm2, n.av, n.avs, n.nf, n.situacao) for n in notas_list
+        ]
+        result = self.db.execute_values(query, params_list, template=template, fetch=True)
+
+        # RETURNING não garante a ordem dos VALUES
+        ids = dict(result)
+        for notas in notas_list:
+            notas.id = ids[notas.id_matricula]
+        return [notas.id for notas in notas_list]
 
     def listar_por_disciplina(
         self, id_disciplina: int
@@ -218,17 +462,43 @@ class NotasService:
         if id_disciplina <= 0:
             raise ValueError("ID da disciplina deve ser maior que zero")
 
-        query = """
-            SELECT a.nome, a.matricula, n.sm1, n.sm2, n.av, n.avs, n.nf, n.situacao
-            FROM notas n
-            JOIN matricula m ON n.id_matricula = m.id
-            JOIN aluno a ON m.id_aluno = a.id
-            WHERE m.id_disciplina = %s
-            ORDER BY a.nome
-        """
+        query = _SQL_NOTAS_POR_DISCIPLINA + "    WHERE m.id_disciplina = %s\n    ORDER BY a.nome\n"
         result = self.db.execute_query(query, (id_disciplina,))
         return result or []
 
+    def listar_por_disciplina_paginado(
+        self, id_disciplina: int, limite: int = 100, token: Optional[str] = None
+    ) -> Pagina[Tuple[str, str, float, float, float, float, float, str]]:
+        """
+        Lista notas dos alunos de uma disciplina em páginas, na ordem de listar_por_disciplina
+
+        Args:
+            id_disciplina: ID da disciplina
+            limite: Quantidade máxima de registros na página
+            token: Pagina.proximo da página anterior; None para a primeira
+
+        Returns:
+            Pagina de tuplas (nome_aluno, matricula_aluno, sm1, sm2, av, avs, nf, situacao)
+
+        Raises:
+            ValueError: Se o ID ou o limite forem inválidos ou o token for inválido
+        """
+        if id_disciplina <= 0:
+            raise ValueError("ID da disciplina deve ser maior que zero")
+
+        return consultar_pagina(
+            self.db,
+            escopo=f"notas:disciplina:{id_disciplina}",
+            select=_SQL_NOTAS_POR_DISCIPLINA,
+            condicoes=["m.id_disciplina = %s"],
+            params=[id_disciplina],
+            # Cada aluno (matrícula única) tem uma nota por disciplina
+            chave=("a.nome", "a.matricula"),
+            posicoes_chave=(0, 1),
+            limite=limite,
+            token=token,
+        )
+
     def listar_por_aluno(
         self, id_aluno: int
     ) -> List[Tuple[str, int, int, float, float, float, float, float, str]]:
@@ -244,47 +514,117 @@ class NotasService:
         if id_aluno <= 0:
             raise ValueError("ID do aluno deve ser maior que zero")
 
-        query = """
-            SELECT d.nome, d.ano, d.semestre, n.sm1, n.sm2, n.av, n.avs, n.nf, n.situacao
-            FROM notas n
-            JOIN matricula m ON n.id_matricula = m.id
-            JOIN disciplina d ON m.id_disciplina = d.id
-            WHERE m.id_aluno = %s
-            ORDER BY d.ano, d.semestre, d.nome
-        """
+        query = (
+            _SQL_NOTAS_POR_ALUNO
+            + "    WHERE m.id_aluno = %s\n    ORDER BY d.ano, d.semestre, d.nome\n"
+        )
         result = self.db.execute_query(query, (id_aluno,))
         return result or []
 
-    def calcular_todas_notas_finais(self) -> int:
+    def listar_por_aluno_paginado(
+        self, id_aluno: int, limite: int = 100, token: Optional[str] = None
+    ) -> Pagina[Tuple[str, int, int, float, float, float, float, float, str]]:
         """
-        Recalcula todas as notas finais do sistema
+        Lista notas de um aluno em páginas, na ordem de listar_por_aluno
+
+        Args:
+            id_aluno: ID do aluno
+            limite: Quantidade máxima de registros na página
+            token: Pagina.proximo da página anterior; None para a primeira
 
         Returns:
-            int: Número de registros atualizados
+            Pagina de tuplas (nome_disciplina, ano, semestre, sm1, sm2, av, avs, nf, situacao)
+
+        Raises:
+            ValueError: Se o ID ou o limite forem inválidos ou o token for inválido
         """
-        # Busca todos os registros de notas
-        query = "SELECT * FROM notas"
-        results = self.db.execute_query(query) or []
+        if id_aluno <= 0:
+            raise ValueError("ID do aluno deve ser maior que zero")
 
-        contador = 0
-        for row in results:
-            notas = Notas(
-                id=row[0],
-                id_matricula=row[1],
-                sm1=row[2],
-                sm2=row[3],
-                av=row[4],
-                avs=row[5],
-                nf=row[6],
-                situacao=row[7],
+        return consultar_pagina(
+            self.db,
+            escopo=f"notas:aluno:{id_aluno}",
+            select=_SQL_NOTAS_POR_ALUNO,
+            condicoes=["m.id_aluno = %s"],
+            params=[id_aluno],
+            # Nome, ano e semestre identificam a disciplina (uq_disciplina_nome_ano_semestre)
+            chave=("d.ano", "d.semestre", "d.nome"),
+            posicoes_chave=(1, 2, 0),
+            limite=limite,
+            token=token,
+        )
+
+    def calcular_todas_notas_finais(
+        self,
+        id_disciplina: Optional[int] = None,
+        ano: Optional[int] = None,
+        semestre: Optional[int] = None,
+    ) -> int:
+        """
+        Recalcula as notas finais no banco com um único comando UPDATE
+
+        Desde a migração 0004 o banco grava nf e situacao em toda escrita; este
+        recálculo corrige registros gravados com o gatilho desabilitado (ex.:
+        cargas em massa) aplicando as funções nota_final e situacao_nota, sem
+        trazer os registros para a aplicação. Apenas os registros cuja NF ou
+        situação diverge são reescritos.
+
+        Args:
+            id_disciplina: Restringe o recálculo a uma disciplina (opcional)
+            ano: Restringe o recálculo ao ano letivo (opcional)
+            semestre: Restringe o recálculo ao semestre (opcional)
+
+        Returns:
+            int: Número de registros atualizados
+        """
+        filtros = []
+        params: List[int] = []
+
+        if id_disciplina is not None:
+            if id_disciplina <= 0:
+                raise ValueError("ID da disciplina deve ser maior que zero")
+            filtros.append("m.id_disciplina = %s")
+            params.append(id_disciplina)
+
+        if ano is not None:
+            filtros.append("d.ano = %s")
+            params.append(ano)
+
+        if semestre is not None:
+            if semestre not in [1, 2]:
+                raise ValueError("Semestre deve ser 1 ou 2")
+            filtros.append("d.semestre = %s")
+            params.append(semestre)
+
+        origem = "notas n"
+        if filtros:
+            # Junções só são necessárias quando há filtro por disciplina/período
+            origem = (
+                "notas n"
+                " JOIN matricula m ON n.id_matricula = m.id"
+                " JOIN disciplina d ON m.id_disciplina = d.id"
+                " WHERE " + " AND ".join(filtros)
             )
 
-            # Recalcula e atualiza
-            notas.calcular_nota_final()
-            self.atualizar(notas)
-            contador += 1
+        query = f"""
+            WITH atualizadas AS (
+                UPDATE notas AS alvo
+                SET nf = calculo.nf, situacao = calculo.situacao
+                FROM (
+                    SELECT id, nf, situacao_nota(nf) AS situacao
+                    FROM (
+                        SELECT n.id, nota_final(n.sm1, n.sm2, n.av, n.avs) AS nf FROM {origem}
+                    ) AS base
+                ) AS calculo
+                WHERE alvo.id = calculo.id
+                  AND (alvo.nf, alvo.situacao) IS DISTINCT FROM (calculo.nf, calculo.situacao)
+                RETURNING 1
+            )
+            SELECT count(*) FROM atualizadas
+        """
+        result = self.db.execute_query(query, tuple(params))
 
-        return contador
+        return result[0][0] if result else 0
 
     def excluir(self, id: int) -> None:
         """
@@ -331,7 +671,7 @@ class NotasService:
         """
         Calcula a nota final e situação do aluno
 
-        Regras:
+        Prévia da regra gravada pelo banco (calculo.calcular_nota_final):
         - SM1 vale até 1 ponto adicional na NF
         - SM2 vale até 1 ponto adicional na NF
         - AV vale até 10 pontos
@@ -345,34 +685,60 @@ class NotasService:
             avs: Nota AVS (pode ser None) - até 10 pontos, substitui AV se maior
 
         Returns:
-            tuple: (nota_final, situacao)
+            tuple: (nota_final, situacao); nota_final é 0.0 enquanto PENDENTE
         """
-        # Só calcula se tiver SM1, SM2 e AV preenchidos
-        if not all([sm1 is not None, sm2 is not None, av is not None]):
-            return 0.0, "PENDENTE"
+        nf, situacao = calcular_nota_final(sm1, sm2, av, avs)
+        return (nf if nf is not None else 0.0), situacao
 
-        # Como já validamos que sm1, sm2, av não são None, podemos fazer assert
-        assert sm1 is not None
-        assert sm2 is not None
-        assert av is not None
+    def _montar_notas_apuradas(self, rows: Iterable[tuple]) -> Iterator[AlunoNotaApuradoVO]:
+        """
+        Monta os AlunoNotaApuradoVO das linhas de _SQL_NOTAS_APURADAS
 
-        # Aplicar limites nas notas
-        sm1_val = min(sm1, 1.0)  # SM1 até 1 ponto
-        sm2_val = min(sm2, 1.0)  # SM2 até 1 ponto
-        av_val = min(av, 10.0)  # AV até 10 pontos
+        Cada disciplina é criada uma única vez por consulta (pelo ID) e o mesmo
+        objeto é compartilhado por todas as notas dela.
 
-        # AVS substitui AV se for maior
-        if avs is not None:
-            avs_val = min(avs, 10.0)  # AVS até 10 pontos
-            prova_val = max(av_val, avs_val)  # AVS substitui AV se maior
-        else:
-            prova_val = av_val
+        Args:
+            rows: Linhas retornadas pelo banco
 
-        # Fórmula: NF = SM1 + SM2 + max(AV, AVS)
-        nf = sm1_val + sm2_val + prova_val
-        situacao = "APROVADO" if nf >= 6.0 else "REPROVADO"
+        Yields:
+            AlunoNotaApuradoVO na ordem das linhas
+        """
+        disciplinas: Dict[int, Disciplina] = {}
+
+        for row in rows:
+            disciplina = disciplinas.get(row[2])
+            if disciplina is None:
+                # id, nome, ano e semestre da disciplina, já validados na gravação
+                disciplina = disciplinas[row[2]] = Disciplina.de_linha(row[2:6])
 
-        return nf, situacao
+            yield self._montar_nota_apurada(row, disciplina)
+
+    @staticmethod
+    def _montar_nota_apurada(row: tuple, disciplina: Disciplina) -> AlunoNotaApuradoVO:
+        """
+        Monta um AlunoNotaApuradoVO a partir de uma linha de _SQL_NOTAS_APURADAS
+
+        Args:
+            row: Linha retornada pelo banco
+            disciplina: Disciplina da linha, compartilhada entre os VOs
+
+        Returns:
+            AlunoNotaApuradoVO com a nota final e a situação gravadas pelo banco
+        """
+        id_nota, nome_aluno, _, _, _, _, sm1, sm2, av, avs, nf, situacao = row
+
+        return AlunoNotaApuradoVO(
+            id_nota=id_nota,
+            nome_aluno=nome_aluno,
+            disciplina=disciplina,
+            sm1=sm1,
+            sm2=sm2,
+            av=av,
+            avs=avs,
+            # NF nula enquanto pendente
+            nota_final=nf if nf is not None else 0.0,
+            situacao=situacao,
+        )
 
     def listar_notas_apuradas(self) -> List[AlunoNotaApuradoVO]:
         """
@@ -381,68 +747,364 @@ class NotasService:
         Returns:
             Lista de AlunoNotaApuradoVO com todas as informações
         """
-        query = """
-            SELECT
-                n.id,
-                a.nome as nome_aluno,
-                d.id as disciplina_id,
-                d.nome as disciplina_nome,
-                d.ano as disciplina_ano,
-                d.semestre as disciplina_semestre,
-                n.sm1,
-                n.sm2,
-                n.av,
-                n.avs
-            FROM notas n
-            JOIN matricula m ON n.id_matricula = m.id
-            JOIN aluno a ON m.id_aluno = a.id
-            JOIN disciplina d ON m.id_disciplina = d.id
-            ORDER BY a.nome, d.nome
-        """
+        query = _SQL_NOTAS_APURADAS + " ORDER BY a.nome, d.nome"
         results = self.db.execute_query(query) or []
 
-        notas_apuradas = []
-        for row in results:
-            (
-                id_nota,
-                nome_aluno,
-                disciplina_id,
-                disciplina_nome,
-                disciplina_ano,
-                disciplina_semestre,
-                sm1,
-                sm2,
-                av,
-                avs,
-            ) = row
-
-            # Criar objeto Disciplina
-            disciplina = Disciplina(
-                id=disciplina_id,
-                nome=disciplina_nome,
-                ano=disciplina_ano,
-                semestre=disciplina_semestre,
+        return list(self._montar_notas_apuradas(results))
+
+    def iterar_notas_apuradas(self, itersize: int = 2000) -> Iterator[AlunoNotaApuradoVO]:
+        """
+        Percorre todas as notas apuradas sob demanda, com cursor no servidor
+
+        Variante de listar_notas_apuradas que não carrega o resultado inteiro
+        em memória: as linhas chegam em lotes de itersize e cada VO é montado
+        somente quando consumido.
+
+        Args:
+            itersize: Quantidade de linhas trazidas do banco por lote
+
+        Yields:
+            AlunoNotaApuradoVO na mesma ordem de listar_notas_apuradas
+        """
+        query = _SQL_NOTAS_APURADAS + " ORDER BY a.nome, d.nome"
+        lotes = self.db.stream_batches(query, batch_size=itersize)
+        yield from self._montar_notas_apuradas(chain.from_iterable(lotes))
+
+    def iterar_lotes_exportacao(
+        self,
+        filtro: Optional[FiltroNotasVO] = None,
+        ordenacao: Optional[str] = None,
+        tamanho_lote: int = 5000,
+    ) -> Iterator[List[tuple]]:
+        """
+        Percorre as notas apuradas filtradas em lotes de tuplas, com cursor no servidor
+
+        Usado pelas exportações: o resultado não é materializado em memória e
+        as linhas não viram VOs. Cada tupla segue COLUNAS_EXPORTACAO, com nf e
+        situação gravadas pelo banco (nf é None enquanto a situação estiver
+        pendente).
+
+        Args:
+            filtro: Filtros por ano, semestre, disciplina e aluno (opcional)
+            ordenacao: Chave de ORDENACOES_NOTAS_APURADAS (opcional, padrão "aluno")
+            tamanho_lote: Quantidade de linhas por lote
+
+        Yields:
+            Listas com até tamanho_lote tuplas
+        """
+        if tamanho_lote <= 0:
+            raise ValueError("Tamanho do lote deve ser maior que zero")
+
+        where, params = self._montar_filtros(filtro)
+        query = _SQL_NOTAS_EXPORTACAO + where + self._montar_ordenacao(ordenacao, False)
+
+        yield from self.db.stream_batches(query, tuple(params), batch_size=tamanho_lote)
+
+    def _montar_filtros(self, filtro: Optional[FiltroNotasVO]) -> Tuple[str, list]:
+        """
+        Converte um FiltroNotasVO na cláusula WHERE de _SQL_NOTAS_APURADAS
+
+        Args:
+            filtro: Filtros da consulta (opcional)
+
+        Returns:
+            tuple: (cláusula WHERE ou string vazia, lista de parâmetros)
+        """
+        if filtro is None:
+            return "", []
+
+        condicoes = []
+        params: list = []
+
+        if filtro.ano is not None:
+            condicoes.append("d.ano = %s")
+            params.append(filtro.ano)
+
+        if filtro.semestre is not None:
+            if filtro.semestre not in [1, 2]:
+                raise ValueError("Semestre deve ser 1 ou 2")
+            condicoes.append("d.semestre = %s")
+            params.append(filtro.semestre)
+
+        if filtro.id_disciplina is not None:
+            if filtro.id_disciplina <= 0:
+                raise ValueError("ID da disciplina deve ser maior que zero")
+            condicoes.append("d.id = %s")
+            params.append(filtro.id_disciplina)
+
+        if filtro.nome_disciplina is not None:
+            condicoes.append("d.nome = %s")
+            params.append(filtro.nome_disciplina.strip())
+
+        if filtro.id_aluno is not None:
+            if filtro.id_aluno <= 0:
+                raise ValueError("ID do aluno deve ser maior que zero")
+            condicoes.append("a.id = %s")
+            params.append(filtro.id_aluno)
+
+        if filtro.situacao is not None:
+            if filtro.situacao not in SITUACOES:
+                raise ValueError(f"Situação deve ser uma de {', '.join(SITUACOES)}")
+            condicoes.append("n.situacao = %s")
+            params.append(filtro.situacao)
+
+        if not condicoes:
+            return "", []
+
+        return " WHERE " + " AND ".join(condicoes), params
+
+    def _montar_ordenacao(self, ordenacao: Optional[str], decrescente: bool) -> str:
+        """
+        Monta a cláusula ORDER BY de _SQL_NOTAS_APURADAS
+
+        Args:
+            ordenacao: Chave de ORDENACOES_NOTAS_APURADAS (opcional, padrão "aluno")
+            decrescente: Se a ordem é decrescente
+
+        Returns:
+            Cláusula ORDER BY terminada por n.id
+
+        Raises:
+            ValueError: Se a ordenação não for suportada
+        """
+        direcao = " DESC" if decrescente else ""
+        termos = self._termos_ordenacao(ordenacao)
+        return " ORDER BY " + ", ".join(termo + direcao for termo in termos)
+
+    def _termos_ordenacao(self, ordenacao: Optional[str]) -> Tuple[str, ...]:
+        """
+        Retorna as expressões SQL de uma ordenação, terminadas por n.id
+
+        Args:
+            ordenacao: Chave de ORDENACOES_NOTAS_APURADAS (opcional, padrão "aluno")
+
+        Returns:
+            Expressões do ORDER BY, sem a direção
+
+        Raises:
+            ValueError: Se a ordenação não for suportada
+        """
+        if ordenacao is None:
+            ordenacao = "aluno"
+        if ordenacao not in ORDENACOES_NOTAS_APURADAS:
+            raise ValueError(f"Ordenação não suportada: {ordenacao}")
+
+        return ORDENACOES_NOTAS_APURADAS[ordenacao] + ("n.id",)
+
+    def consultar_notas_apuradas(
+        self,
+        filtro: Optional[FiltroNotasVO] = None,
+        limite: Optional[int] = None,
+        deslocamento: int = 0,
+        ordenacao: Optional[str] = None,
+        decrescente: bool = False,
+        apos: Optional[AlunoNotaApuradoVO] = None,
+    ) -> List[AlunoNotaApuradoVO]:
+        """
+        Consulta notas apuradas com filtros, ordenação e paginação aplicados no banco
+
+        Com apos, a consulta continua a partir de um registro já entregue
+        (paginação por chave): o custo da página não cresce com a profundidade,
+        ao contrário do OFFSET, que lê e descarta todas as linhas anteriores.
+
+        Args:
+            filtro: Filtros por ano, semestre, disciplina e aluno (opcional)
+            limite: Quantidade máxima de registros retornados (opcional)
+            deslocamento: Quantidade de registros a pular (OFFSET)
+            ordenacao: Chave de ORDENACOES_NOTAS_APURADAS (opcional, padrão: aluno
+                e disciplina)
+            decrescente: Se a ordem é decrescente
+            apos: Último registro da página anterior, na mesma ordenação; as
+                linhas seguintes a ele são retornadas (opcional, exclusivo com
+                deslocamento)
+
+        Returns:
+            Lista de AlunoNotaApuradoVO na ordem solicitada
+
+        Raises:
+            ValueError: Se limite, deslocamento ou ordenação forem inválidos
+        """
+        if limite is not None and limite <= 0:
+            raise ValueError("Limite deve ser maior que zero")
+        if deslocamento < 0:
+            raise ValueError("Deslocamento não pode ser negativo")
+        if apos is not None and deslocamento:
+            raise ValueError("Use deslocamento ou apos, não ambos")
+
+        where, params = self._montar_filtros(filtro)
+        if apos is not None:
+            termos = self._termos_ordenacao(ordenacao)
+            condicao, params_apos = condicao_apos(
+                termos,
+                [_VALORES_ORDENACAO[termo](apos) for termo in termos],
+                decrescente,
+                [_MARCADORES_ORDENACAO.get(termo, "%s") for termo in termos],
             )
+            where += (" AND " if where else " WHERE ") + condicao
+            params.extend(params_apos)
+        query = _SQL_NOTAS_APURADAS + where + self._montar_ordenacao(ordenacao, decrescente)
+
+        if limite is not None:
+            query += " LIMIT %s"
+            params.append(limite)
+        if deslocamento:
+            query += " OFFSET %s"
+            params.append(deslocamento)
 
-            # Calcular nota final usando as regras do service
-            nota_final, situacao = self.calcular_nota_final_e_situacao(sm1, sm2, av, avs)
-
-            # Criar VO
-            nota_apurada = AlunoNotaApuradoVO(
-                id_nota=id_nota,
-                nome_aluno=nome_aluno,
-                disciplina=disciplina,
-                sm1=sm1,
-                sm2=sm2,
-                av=av,
-                avs=avs,
-                nota_final=nota_final,
-                situacao=situacao,
+        results = self.db.execute_query(query, tuple(params)) or []
+
+        return list(self._montar_notas_apuradas(results))
+
+    def frame_notas_apuradas(
+        self,
+        filtro: Optional[FiltroNotasVO] = None,
+        ordenacao: Optional[str] = None,
+        decrescente: bool = False,
+        tamanho_lote: int = 5000,
+    ) -> NotasFrame:
+        """
+        Consulta notas apuradas em formato colunar (NotasFrame)
+
+        Alternativa a consultar_notas_apuradas para conjuntos grandes que serão
+        filtrados, ordenados ou agregados em memória: as linhas chegam do
+        cursor no servidor em lotes e cada lote vira colunas numpy antes do
+        seguinte, sem um VO por linha.
+
+        Args:
+            filtro: Filtros por ano, semestre, disciplina, aluno e situação (opcional)
+            ordenacao: Chave de ORDENACOES_NOTAS_APURADAS (opcional, padrão: aluno
+                e disciplina)
+            decrescente: Se a ordem é decrescente
+            tamanho_lote: Quantidade de linhas trazidas do banco por lote
+
+        Returns:
+            NotasFrame com as notas na ordem solicitada
+        """
+        where, params = self._montar_filtros(filtro)
+        query = _SQL_NOTAS_APURADAS + where + self._montar_ordenacao(ordenacao, decrescente)
+
+        return NotasFrame.de_lotes(
+            self.db.stream_batches(query, tuple(params), batch_size=tamanho_lote)
+        )
+
+    def contar_notas_apuradas(self, filtro: Optional[FiltroNotasVO] = None) -> int:
+        """
+        Conta as notas apuradas que atendem aos filtros
+
+        Args:
+            filtro: Filtros por ano, semestre, disciplina e aluno (opcional)
+
+        Returns:
+            Quantidade de registros de consultar_notas_apuradas sem paginação
+        """
+        where, params = self._montar_filtros(filtro)
+        query = "SELECT count(*)" + _SQL_ORIGEM_NOTAS_APURADAS + where
+        result = self.db.execute_query(query, tuple(params))
+
+        return result[0][0] if result else 0
+
+    def estatisticas(self, filtro: Optional[FiltroNotasVO] = None) -> RelatorioEstatisticasVO:
+        """
+        Calcula as estatísticas das notas no banco, com uma única consulta agregada
+
+        Usa GROUPING SETS para obter, na mesma consulta, os totais gerais, por
+        disciplina e por semestre, contando as situações e agregando as notas
+        finais gravadas pelo banco. Os filtros são os mesmos de
+        consultar_notas_apuradas.
+
+        Args:
+            filtro: Filtros por ano, semestre, disciplina e aluno (opcional)
+
+        Returns:
+            RelatorioEstatisticasVO com os agrupamentos geral, por disciplina e
+            por semestre
+        """
+        where, params = self._montar_filtros(filtro)
+
+        # nivel = GROUPING(id_disciplina, ano): 0 disciplina, 2 semestre, 3 geral
+        query = f"""
+            WITH apuradas AS (
+                SELECT
+                    d.id AS id_disciplina,
+                    d.nome AS nome_disciplina,
+                    d.ano,
+                    d.semestre,
+                    a.id AS id_aluno,
+                    n.situacao,
+                    -- numeric: agrega os valores decimais gravados, não os binários de REAL
+                    n.nf::numeric AS nf
+                FROM notas n
+                JOIN matricula m ON n.id_matricula = m.id
+                JOIN aluno a ON m.id_aluno = a.id
+                JOIN disciplina d ON m.id_disciplina = d.id
+                {where}
             )
+            SELECT
+                GROUPING(id_disciplina, ano) AS nivel,
+                id_disciplina,
+                nome_disciplina,
+                ano,
+                semestre,
+                count(*),
+                count(DISTINCT id_disciplina),
+                count(DISTINCT id_aluno),
+                count(*) FILTER (WHERE situacao = 'APROVADO'),
+                count(*) FILTER (WHERE situacao = 'REPROVADO'),
+                count(*) FILTER (WHERE situacao = 'PENDENTE'),
+                COALESCE(
+                    100.0 * count(*) FILTER (WHERE situacao = 'APROVADO') / NULLIF(count(*), 0), 0
+                )::float8,
+                avg(nf)::float8,
+                min(nf)::float8,
+                max(nf)::float8,
+                stddev_samp(nf)::float8
+            FROM apuradas
+            GROUP BY GROUPING SETS (
+                (),
+                (id_disciplina, nome_disciplina, ano, semestre),
+                (ano, semestre)
+            )
+            ORDER BY nivel DESC, ano, semestre, nome_disciplina
+        """
+        results = self.db.execute_query(query, tuple(params)) or []
 
-            notas_apuradas.append(nota_apurada)
+        relatorio = None
+        por_disciplina = []
+        por_semestre = []
+        for row in results:
+            vo = EstatisticasNotasVO(
+                id_disciplina=row[1],
+                nome_disciplina=row[2],
+                ano=row[3],
+                semestre=row[4],
+                total_registros=row[5],
+                total_disciplinas=row[6],
+                total_alunos=row[7],
+                aprovados=row[8],
+                reprovados=row[9],
+                pendentes=row[10],
+                percentual_aprovacao=row[11],
+                media=row[12],
+                minima=row[13],
+                maxima=row[14],
+                desvio_padrao=row[15],
+            )
+            if row[0] == 0:
+                por_disciplina.append(vo)
+            elif row[0] == 2:
+                por_semestre.append(vo)
+            else:
+                relatorio = vo
+
+        if relatorio is None:
+            # Sem linhas de resultado: estatísticas zeradas
+            relatorio = EstatisticasNotasVO(
+                None, None, None, None, 0, 0, 0, 0, 0, 0, 0.0, None, None, None, None
+            )
 
-        return notas_apuradas
+        return RelatorioEstatisticasVO(
+            geral=relatorio, por_disciplina=por_disciplina, por_semestre=por_semestre
+        )
 
     def listar_com_detalhes(self) -> List[AlunoNotaApuradoVO]:
         """
@@ -2,16 +2,19 @@
 Value Objects para o módulo de Notas
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 from registro_notas_alunos.backend.disciplina.model import Disciplina
 
 
-@dataclass
+@dataclass(slots=True)
 class AlunoNotaApuradoVO:
     """
     Value Object que representa a nota apurada de um aluno em uma disciplina
+
+    Com slots, sem __dict__ por instância: listagens e streaming montam um VO
+    por linha.
     """
 
     id_nota: int
@@ -72,3 +75,63 @@ class AlunoNotaApuradoVO:
         if self.is_pendente():
             return "--"
         return f"{self.nota_final:.2f}".replace(".", ",")
+
+
+@dataclass
+class FiltroNotasVO:
+    """
+    Value Object com os filtros aplicáveis às consultas de notas apuradas
+
+    Campos com valor None não restringem a consulta.
+    """
+
+    ano: Optional[int] = None
+    semestre: Optional[int] = None
+    id_disciplina: Optional[int] = None
+    nome_disciplina: Optional[str] = None
+    id_aluno: Optional[int] = None
+    # APROVADO, REPROVADO ou PENDENTE
+    situacao: Optional[str] = None
+
+
+@dataclass
+class EstatisticasNotasVO:
+    """
+    Value Object com as estatísticas agregadas de um conjunto de notas
+
+    Para o agrupamento por semestre, id_disciplina e nome_disciplina ficam None;
+    no agrupamento geral, ano e semestre também. Média, mínima, máxima e desvio
+    padrão consideram apenas notas apuradas (não pendentes) e são None quando
+    não há nenhuma.
+
+    total_disciplinas e total_alunos contam IDs distintos, não nomes: alunos
+    homônimos contam separadamente, e a mesma disciplina em dois semestres
+    conta duas vezes.
+    """
+
+    id_disciplina: Optional[int]
+    nome_disciplina: Optional[str]
+    ano: Optional[int]
+    semestre: Optional[int]
+    total_registros: int
+    total_disciplinas: int
+    total_alunos: int
+    aprovados: int
+    reprovados: int
+    pendentes: int
+    percentual_aprovacao: float
+    media: Optional[float]
+    minima: Optional[float]
+    maxima: Optional[float]
+    desvio_padrao: Optional[float]
+
+
+@dataclass
+class RelatorioEstatisticasVO:
+    """
+    Value Object com as estatísticas gerais, por disciplina e por semestre
+    """
+
+    geral: EstatisticasNotasVO
+    por_disciplina: List[EstatisticasNotasVO] = field(default_factory=list)
+    por_semestre: List[EstatisticasNotasVO] = field(default_factory=list)
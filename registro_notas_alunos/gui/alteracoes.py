@@ -0,0 +1,109 @@
+"""
+Entrega das notificações de alteração às telas Tk
+
+O ouvinte de alterações chama seus inscritos na própria thread. ReceptorAlteracoes
+enfileira os eventos das tabelas de interesse de uma tela e, com after(), os
+entrega na thread da interface, agrupados por tabela.
+
+    self.alteracoes = ReceptorAlteracoes(
+        self.window, self.aplicar_alteracao, tabelas=("aluno",)
+    )
+"""
+
+import logging
+import queue
+import tkinter as tk
+from typing import Callable, Iterable, Optional
+
+from registro_notas_alunos.backend.lib.notificacoes import (
+    Alteracao,
+    OuvinteAlteracoes,
+    agrupar,
+    ouvinte_alteracoes,
+)
+
+logger = logging.getLogger(__name__)
+
+# Intervalo entre as verificações da fila; eventos próximos são agrupados
+_INTERVALO_PADRAO_MS = 250
+
+
+class ReceptorAlteracoes:
+    """
+    Repassa à tela, na thread da interface, as alterações de algumas tabelas
+    """
+
+    def __init__(
+        self,
+        widget,
+        ao_alterar: Callable[[Alteracao], None],
+        tabelas: Iterable[str],
+        ouvinte: Optional[OuvinteAlteracoes] = None,
+        intervalo_ms: int = _INTERVALO_PADRAO_MS,
+    ):
+        """
+        Inscreve a tela no ouvinte de alterações
+
+        Se o ouvinte não estiver rodando (DB_NOTIFICACOES=0 ou banco sem os
+        gatilhos), nada é feito e a tela só vê as próprias escritas.
+
+        Args:
+            widget: Janela da tela; recebe os after()
+            ao_alterar: Chamado com cada evento, já agrupado por tabela
+            tabelas: Tabelas de interesse
+            ouvinte: Ouvinte de alterações (opcional, padrão: o compartilhado)
+            intervalo_ms: Intervalo entre as verificações da fila
+        """
+        self.widget = widget
+        self.ao_alterar = ao_alterar
+        self.intervalo_ms = intervalo_ms
+        self._fila: "queue.SimpleQueue[Alteracao]" = queue.SimpleQueue()
+        self._cancelar_inscricao = None
+        self._agendamento = None
+
+        ouvinte = ouvinte or ouvinte_alteracoes
+        if not ouvinte.ativo:
+            return
+
+        self._cancelar_inscricao = ouvinte.inscrever(self._fila.put, tabelas)
+        self.widget.bind("<Destroy>", self._ao_destruir, add="+")
+        self._agendamento = self.widget.after(self.intervalo_ms, self._processar)
+
+    def encerrar(self) -> None:
+        """Cancela a inscrição e para as verificações"""
+        if self._cancelar_inscricao is not None:
+            self._cancelar_inscricao()
+            self._cancelar_inscricao = None
+        if self._agendamento is not None:
+            try:
+                self.widget.after_cancel(self._agendamento)
+            except tk.TclError:
+                pass
+            self._agendamento = None
+
+    def _processar(self) -> None:
+        """Entrega os eventos enfileirados; roda na thread da interface"""
+        self._agendamento = None
+        if self._cancelar_inscricao is None:
+            return
+
+        recebidas = []
+        while True:
+            try:
+                recebidas.append(self._fila.get_nowait())
+            except queue.Empty:
+                break
+
+        for alteracao in agrupar(recebidas):
+            try:
+                self.ao_alterar(alteracao)
+            except Exception as e:
+                logger.exception(f"Erro ao aplicar alteração {alteracao}: {e}")
+
+        if self._cancelar_inscricao is not None:
+            self._agendamento = self.widget.after(self.intervalo_ms, self._processar)
+
+    def _ao_destruir(self, event) -> None:
+        """Cancela a inscrição quando a janela da tela é fechada"""
+        if event.widget is self.widget:
+            self.encerrar()
@@ -0,0 +1,222 @@
+"""
+Campo de busca de alunos: combo preenchido conforme a digitação
+
+Carregar todos os alunos em um Combobox deixa de funcionar com dezenas de
+milhares de cadastros. CampoBuscaAluno é um Combobox editável: uma pausa na
+digitação dispara AlunoService.buscar em segundo plano e a lista passa a ter
+apenas os alunos encontrados (seta para baixo abre a lista). Cada opção mostra
+nome e matrícula, o que distingue alunos com o mesmo nome.
+
+    campo = CampoBuscaAluno(
+        frame,
+        buscar=aluno_service.buscar,
+        tarefas=ExecutorTarefas(janela),
+        ao_selecionar=lambda aluno: ...,
+    )
+    aluno = campo.aluno_selecionado()
+"""
+
+import logging
+from tkinter import ttk
+from typing import Callable, Dict, List, Optional
+
+from registro_notas_alunos.backend.aluno.model import Aluno
+from registro_notas_alunos.gui.tarefas import ExecutorTarefas
+
+logger = logging.getLogger(__name__)
+
+# Teclas que não alteram o texto e não disparam uma nova busca
+_TECLAS_NAVEGACAO = {
+    "Up",
+    "Down",
+    "Left",
+    "Right",
+    "Home",
+    "End",
+    "Prior",
+    "Next",
+    "Return",
+    "KP_Enter",
+    "Escape",
+    "Tab",
+    "ISO_Left_Tab",
+    "Shift_L",
+    "Shift_R",
+    "Control_L",
+    "Control_R",
+    "Alt_L",
+    "Alt_R",
+}
+
+
+def rotulo_aluno(aluno: Aluno) -> str:
+    """Texto exibido para um aluno no campo de busca"""
+    return f"{aluno.nome} ({aluno.matricula})"
+
+
+class CampoBuscaAluno(ttk.Combobox):
+    """
+    Combobox editável que busca os alunos no banco durante a digitação
+    """
+
+    def __init__(
+        self,
+        master,
+        buscar: Callable[[str, int], List[Aluno]],
+        tarefas: ExecutorTarefas,
+        ao_selecionar: Optional[Callable[[Optional[Aluno]], None]] = None,
+        opcao_todos: Optional[str] = None,
+        limite: int = 20,
+        minimo_caracteres: int = 2,
+        atraso_ms: int = 250,
+        **kwargs,
+    ):
+        """
+        Cria o campo
+
+        Args:
+            master: Widget pai
+            buscar: Recebe (termo, limite) e retorna os alunos; roda fora da
+                thread da interface
+            tarefas: Executor de tarefas da janela
+            ao_selecionar: Recebe o aluno escolhido na lista, ou None quando a
+                escolha é desfeita (texto alterado ou opcao_todos) (opcional)
+            opcao_todos: Opção fixa no topo da lista que representa nenhum
+                aluno, ex.: "Todos" em filtros (opcional)
+            limite: Quantidade máxima de alunos na lista
+            minimo_caracteres: Tamanho mínimo do termo para buscar
+            atraso_ms: Pausa na digitação antes de buscar
+            **kwargs: Opções do ttk.Combobox (width etc.)
+        """
+        super().__init__(master, **kwargs)
+        self.buscar = buscar
+        self.tarefas = tarefas
+        self.ao_selecionar = ao_selecionar
+        self.opcao_todos = opcao_todos
+        self.limite = limite
+        self.minimo_caracteres = minimo_caracteres
+        self.atraso_ms = atraso_ms
+
+        # Tarefa própria do campo; outra busca pendente do mesmo campo é descartada
+        self._chave_tarefa = ("busca_aluno", str(self))
+        self._opcoes: Dict[str, Aluno] = {}
+        self._selecionado: Optional[Aluno] = None
+        self._agendamento = None
+
+        self._atualizar_lista()
+        if opcao_todos is not None:
+            self.set(opcao_todos)
+
+        self.bind("<KeyRelease>", self._ao_digitar)
+        self.bind("<Return>", self._ao_confirmar)
+        self.bind("<KP_Enter>", self._ao_confirmar)
+        self.bind("<<ComboboxSelected>>", self._ao_escolher)
+        self.bind("<Destroy>", self._ao_destruir, add="+")
+
+    def aluno_selecionado(self) -> Optional[Aluno]:
+        """
+        Retorna o aluno escolhido, ou None se nenhum aluno foi escolhido
+        """
+        return self._selecionado
+
+    def selecionar(self, aluno: Optional[Aluno]) -> None:
+        """
+        Exibe um aluno como escolhido, sem chamar ao_selecionar
+
+        Args:
+            aluno: Aluno a exibir; None limpa o campo
+        """
+        self._cancelar_busca()
+        if aluno is None:
+            self.limpar()
+            return
+
+        rotulo = rotulo_aluno(aluno)
+        self._opcoes = {rotulo: aluno}
+        self._atualizar_lista()
+        self._selecionado = aluno
+        self.set(rotulo)
+
+    def limpar(self) -> None:
+        """Desfaz a escolha e volta o texto ao estado inicial"""
+        self._cancelar_busca()
+        self._opcoes = {}
+        self._selecionado = None
+        self._atualizar_lista()
+        self.set(self.opcao_todos if self.opcao_todos is not None else "")
+
+    def _atualizar_lista(self) -> None:
+        """Coloca as opções encontradas (e a opção fixa) na lista do combo"""
+        valores = list(self._opcoes)
+        if self.opcao_todos is not None:
+            valores.insert(0, self.opcao_todos)
+        self["values"] = valores
+
+    def _cancelar_busca(self) -> None:
+        """Descarta a busca agendada ou em andamento"""
+        if self._agendamento is not None:
+            self.after_cancel(self._agendamento)
+            self._agendamento = None
+        self.tarefas.cancelar(self._chave_tarefa)
+
+    def _ao_digitar(self, event) -> None:
+        """Agenda a busca para quando a digitação fizer uma pausa"""
+        if event.keysym in _TECLAS_NAVEGACAO:
+            return
+
+        if self._selecionado is not None and self.get() != rotulo_aluno(self._selecionado):
+            self._escolher(None)
+
+        if self._agendamento is not None:
+            self.after_cancel(self._agendamento)
+        self._agendamento = self.after(self.atraso_ms, self._iniciar_busca)
+
+    def _iniciar_busca(self) -> None:
+        """Envia a busca do texto atual para o executor de tarefas"""
+        self._agendamento = None
+        termo = self.get().strip()
+
+        if len(termo) < self.minimo_caracteres or termo == self.opcao_todos:
+            self.tarefas.cancelar(self._chave_tarefa)
+            self._opcoes = {}
+            self._atualizar_lista()
+            return
+
+        self.tarefas.executar(
+            self._chave_tarefa,
+            self.buscar,
+            termo,
+            self.limite,
+            ao_concluir=self._preencher,
+            ao_falhar=lambda e: logger.error(f"Erro ao buscar alunos: {e}", exc_info=e),
+        )
+
+    def _preencher(self, alunos: List[Aluno]) -> None:
+        """Substitui as opções da lista pelos alunos encontrados"""
+        self._opcoes = {rotulo_aluno(aluno): aluno for aluno in alunos}
+        self._atualizar_lista()
+
+    def _ao_confirmar(self, event) -> None:
+        """Enter escolhe a opção digitada por completo ou a única encontrada"""
+        texto = self.get()
+        if texto in self._opcoes or texto == self.opcao_todos:
+            self._ao_escolher(event)
+        elif len(self._opcoes) == 1:
+            self.set(next(iter(self._opcoes)))
+            self._ao_escolher(event)
+
+    def _ao_escolher(self, event) -> None:
+        """Registra a opção escolhida na lista"""
+        self._escolher(self._opcoes.get(self.get()))
+
+    def _escolher(self, aluno: Optional[Aluno]) -> None:
+        """Guarda a escolha e avisa a tela"""
+        self._selecionado = aluno
+        if self.ao_selecionar:
+            self.ao_selecionar(aluno)
+
+    def _ao_destruir(self, event) -> None:
+        """Cancela a busca agendada quando o campo é destruído"""
+        if event.widget is self and self._agendamento is not None:
+            self.after_cancel(self._agendamento)
+            self._agendamento = None
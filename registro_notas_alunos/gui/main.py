@@ -46,32 +46,65 @@ class MainApp:
         self.wait_for_database_connection()
 
     def wait_for_database_connection(self):
-        """Aguarda conexão com banco em loop - não permite usar sem banco"""
+        """
+        Aguarda conexão com banco em loop - não permite usar sem banco
+
+        O esquema não é alterado pela interface: se houver migrações pendentes,
+        o usuário é orientado a pedir a execução de "migrar".
+        """
         while True:
             try:
                 from registro_notas_alunos.backend.lib.database import (
                     DatabaseConnection,
                 )
+                from registro_notas_alunos.backend.lib.migrations import Migrador
+                from registro_notas_alunos.backend.lib.notificacoes import (
+                    ouvinte_alteracoes,
+                )
 
                 db = DatabaseConnection()
-                with db.get_connection() as conn:
+                with db.connection() as conn:
                     with conn.cursor() as cursor:
                         cursor.execute("SELECT 1")
                 logger.info("Conexão com banco de dados estabelecida com sucesso")
-                return True
+
+                migrador = Migrador(db)
+                versao_atual = migrador.versao_atual()
+                versao_requerida = migrador.versao_mais_recente()
             except Exception as e:
                 logger.error(f"Erro na conexão com banco: {e}")
-                # Mostrar mensagem e aguardar
-                result = messagebox.askretrycancel(
-                    "Erro de Conexão com Banco",
+                titulo = "Erro de Conexão com Banco"
+                mensagem = (
                     f"Não foi possível conectar ao banco de dados:\n{str(e)}\n\n"
-                    "O sistema não pode funcionar sem banco de dados.\n\n"
-                    "Clique 'Repetir' para tentar novamente ou 'Cancelar' para sair.",
+                    "O sistema não pode funcionar sem banco de dados."
+                )
+            else:
+                if versao_atual >= versao_requerida:
+                    # Escuta as alterações feitas por outros clientes
+                    ouvinte_alteracoes.iniciar()
+                    return True
+
+                logger.error(
+                    f"Esquema do banco na versão {versao_atual:04d}; "
+                    f"o sistema requer a versão {versao_requerida:04d}"
                 )
-                if not result:
-                    logger.info("Usuário cancelou conexão - encerrando aplicação")
-                    self.root.destroy()
-                    sys.exit(0)
+                titulo = "Banco de Dados Desatualizado"
+                mensagem = (
+                    f"O banco de dados está na versão {versao_atual:04d} e esta versão "
+                    f"do sistema requer a {versao_requerida:04d}.\n\n"
+                    "Peça ao administrador do banco para executar as migrações:\n"
+                    "    poetry run migrar"
+                )
+
+            # Mostrar mensagem e aguardar
+            result = messagebox.askretrycancel(
+                titulo,
+                f"{mensagem}\n\nClique 'Repetir' para tentar novamente ou 'Cancelar' para sair.",
+            )
+            if not result:
+                logger.info("Usuário cancelou conexão - encerrando aplicação")
+                self.root.destroy()
+                sys.exit(0)
 
     def check_backend_connection(self):
         """Verifica se é possível conectar ao banco de dados"""
@@ -79,7 +112,7 @@ class MainApp:
             from registro_notas_alunos.backend.lib.database import DatabaseConnection
 
             db = DatabaseConnection()
-            with db.get_connection() as conn:
+            with db.connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute("SELECT 1")
             return True
@@ -193,6 +226,9 @@ class MainApp:
         """Sai da aplicação"""
         if messagebox.askyesno("Sair", "Deseja realmente sair do sistema?"):
             logger.info("Usuário encerrou a aplicação")
+            from registro_notas_alunos.backend.lib.notificacoes import ouvinte_alteracoes
+
+            ouvinte_alteracoes.parar()
             self.root.quit()
 
     def run(self):
@@ -0,0 +1,184 @@
+"""
+Linhas de um Treeview indexadas pela chave do registro
+
+Cada linha usa como iid a chave do registro (em geral o ID), de forma que uma
+escrita altera, inclui ou remove apenas a linha afetada, sem consultar a tabela
+inteira de novo. A recarga completa (carregar) compara o resultado com as linhas
+atuais e só toca nas que mudaram.
+
+    self.linhas = ModeloLinhas(
+        self.tree,
+        chave=lambda aluno: aluno.id,
+        formatar=lambda aluno: (aluno.id, aluno.nome, aluno.matricula),
+        ordem=lambda aluno: (aluno.nome.casefold(), aluno.matricula),
+    )
+    self.linhas.carregar(aluno_service.listar_todos())
+    self.linhas.inserir(Aluno(id=novo_id, nome=nome, matricula=matricula))
+"""
+
+import bisect
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+
+class ModeloLinhas:
+    """
+    Mantém as linhas de um Treeview sincronizadas com uma lista de registros
+    """
+
+    def __init__(
+        self,
+        tree,
+        chave: Callable[[Any], Hashable],
+        formatar: Callable[[Any], tuple],
+        ordem: Optional[Callable[[Any], Any]] = None,
+    ):
+        """
+        Inicializa o modelo
+
+        Args:
+            tree: Treeview exibido
+            chave: Retorna o identificador único de um registro
+            formatar: Converte um registro nos valores das colunas
+            ordem: Chave de ordenação usada para posicionar linhas incluídas ou
+                alteradas (opcional; sem ela, inclusões vão para o fim)
+        """
+        self.tree = tree
+        self.chave = chave
+        self.formatar = formatar
+        self.ordem = ordem
+        self._registros: Dict[str, Any] = {}
+        self._iids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self._iids)
+
+    def __contains__(self, chave: Hashable) -> bool:
+        return str(chave) in self._registros
+
+    def registro(self, chave: Hashable) -> Optional[Any]:
+        """
+        Retorna o registro exibido com a chave informada
+
+        Args:
+            chave: Chave do registro
+
+        Returns:
+            Registro ou None se não estiver na tabela
+        """
+        return self._registros.get(str(chave))
+
+    def carregar(self, registros: List[Any]) -> None:
+        """
+        Substitui o conteúdo da tabela, alterando apenas as linhas diferentes
+
+        Linhas ausentes em registros são removidas, as novas são incluídas, as
+        alteradas têm os valores trocados e a ordem final é a de registros.
+
+        Args:
+            registros: Registros na ordem de exibição
+        """
+        novos = {str(self.chave(registro)): registro for registro in registros}
+
+        removidos = [iid for iid in self._iids if iid not in novos]
+        if removidos:
+            self.tree.delete(*removidos)
+        atuais = [iid for iid in self._iids if iid in novos]
+
+        for posicao, (iid, registro) in enumerate(novos.items()):
+            anterior = self._registros.get(iid)
+            if anterior is None:
+                self.tree.insert("", posicao, iid=iid, values=self.formatar(registro))
+                atuais.insert(posicao, iid)
+                continue
+
+            if anterior != registro:
+                self.tree.item(iid, values=self.formatar(registro))
+            if atuais[posicao] != iid:
+                self.tree.move(iid, "", posicao)
+                atuais.remove(iid)
+                atuais.insert(posicao, iid)
+
+        self._registros = novos
+        self._iids = atuais
+
+    def inserir(self, registro: Any) -> None:
+        """
+        Inclui a linha de um registro na posição da ordenação
+
+        Args:
+            registro: Registro incluído; se a chave já existir, a linha é atualizada
+        """
+        iid = str(self.chave(registro))
+        if iid in self._registros:
+            self.atualizar(registro)
+            return
+
+        posicao = self._posicao(registro)
+        self._registros[iid] = registro
+        self._iids.insert(posicao, iid)
+        self.tree.insert("", posicao, iid=iid, values=self.formatar(registro))
+
+    def atualizar(self, registro: Any) -> None:
+        """
+        Troca os valores da linha de um registro e a reposiciona se a ordem mudou
+
+        Args:
+            registro: Registro alterado; se a chave não existir, a linha é incluída
+        """
+        iid = str(self.chave(registro))
+        if iid not in self._registros:
+            self.inserir(registro)
+            return
+
+        self._registros[iid] = registro
+        self.tree.item(iid, values=self.formatar(registro))
+
+        if self.ordem is not None:
+            self._iids.remove(iid)
+            posicao = self._posicao(registro)
+            self._iids.insert(posicao, iid)
+            self.tree.move(iid, "", posicao)
+
+    def remover(self, chave: Hashable) -> None:
+        """
+        Remove a linha de um registro, se existir
+
+        Args:
+            chave: Chave do registro removido
+        """
+        iid = str(chave)
+        if self._registros.pop(iid, None) is None:
+            return
+
+        self._iids.remove(iid)
+        self.tree.delete(iid)
+
+    def reconciliar(self, chaves: Iterable[Hashable], registros: List[Any]) -> None:
+        """
+        Aplica a situação atual de algumas chaves, lida de novo do banco
+
+        Registros encontrados são alterados ou incluídos; chaves sem registro
+        correspondente foram excluídas e têm a linha removida.
+
+        Args:
+            chaves: Chaves consultadas
+            registros: Registros encontrados para essas chaves
+        """
+        encontradas = set()
+        for registro in registros:
+            iid = str(self.chave(registro))
+            encontradas.add(iid)
+            if self._registros.get(iid) != registro:
+                self.atualizar(registro)
+
+        for chave in chaves:
+            if str(chave) not in encontradas:
+                self.remover(chave)
+
+    def _posicao(self, registro: Any) -> int:
+        """Posição de registro em _iids segundo a ordenação"""
+        if self.ordem is None:
+            return len(self._iids)
+        return bisect.bisect_right(
+            self._iids, self.ordem(registro), key=lambda iid: self.ordem(self._registros[iid])
+        )
@@ -1,9 +1,14 @@
 import logging
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox, ttk
 
 from registro_notas_alunos.backend import AlunoService
+from registro_notas_alunos.backend.aluno.model import Aluno
 from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.gui.alteracoes import ReceptorAlteracoes
+from registro_notas_alunos.gui.modelo_linhas import ModeloLinhas
+from registro_notas_alunos.gui.tarefas import ExecutorTarefas
 from registro_notas_alunos.gui.screens.exceptions import (
     DatabaseConnectionError,
     DataNotFoundError,
@@ -28,6 +33,8 @@ class GerenciarAlunosScreen:
         self.window.title("Cadastro de Alunos")
         self.window.geometry("900x600")
         self.window.resizable(True, True)
+        self.tarefas = ExecutorTarefas(self.window)
+        self.alteracoes = ReceptorAlteracoes(self.window, self.aplicar_alteracao, ("aluno",))
 
         # Centralizar janela
         self.center_window()
@@ -36,7 +43,7 @@ class GerenciarAlunosScreen:
         self.create_widgets()
 
         # Carregar dados iniciais
-        self.refresh_table()
+        self.refresh_table(recarregar=False)
 
     def center_window(self):
         """Centraliza a janela na tela"""
@@ -122,6 +129,14 @@ class GerenciarAlunosScreen:
         # Bind para seleção
         self.tree.bind("<<TreeviewSelect>>", self.on_select)
 
+        # Linhas indexadas pelo ID, na mesma ordem de listar_todos
+        self.linhas = ModeloLinhas(
+            self.tree,
+            chave=lambda aluno: aluno.id,
+            formatar=lambda aluno: (aluno.id, aluno.nome, aluno.matricula),
+            ordem=lambda aluno: (aluno.nome.casefold(), aluno.matricula),
+        )
+
         # Botão fechar
         ttk.Button(main_frame, text="Fechar", command=self.window.destroy).grid(
             row=3, column=0, columnspan=3, pady=15
@@ -135,25 +150,44 @@ class GerenciarAlunosScreen:
         table_frame.columnconfigure(0, weight=1)
         table_frame.rowconfigure(0, weight=1)
 
-    def refresh_table(self):
-        """Atualiza a tabela com os dados dos alunos"""
-        try:
-            # Limpar tabela
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+    def refresh_table(self, recarregar=True):
+        """
+        Recarrega a tabela inteira com os dados dos alunos, buscados em segundo plano
+
+        Args:
+            recarregar: Ignora a lista em cache; False ao abrir a tela
+        """
+        self.tarefas.executar(
+            "tabela",
+            self.aluno_service.listar_todos,
+            recarregar,
+            ao_concluir=self.preencher_tabela,
+            ao_falhar=self.erro_tabela,
+        )
 
-            # Buscar alunos
-            alunos = self.aluno_service.listar_todos()
+    def preencher_tabela(self, alunos):
+        """Substitui as linhas da tabela pelos alunos informados"""
+        self.linhas.carregar(alunos)
 
-            # Inserir na tabela
-            for aluno in alunos:
-                self.tree.insert("", tk.END, values=(aluno.id, aluno.nome, aluno.matricula))
+        logger.info(f"Tabela de alunos atualizada - {len(alunos)} registros")
 
-            logger.info(f"Tabela de alunos atualizada - {len(alunos)} registros")
+    def erro_tabela(self, e):
+        """Exibe o erro da busca da tabela"""
+        logger.error(f"Erro ao atualizar tabela de alunos: {e}")
+        messagebox.showerror("Erro", f"Erro ao carregar alunos:\n{str(e)}")
 
-        except Exception as e:
-            logger.error(f"Erro ao atualizar tabela de alunos: {e}")
-            messagebox.showerror("Erro", f"Erro ao carregar alunos:\n{str(e)}")
+    def aplicar_alteracao(self, alteracao):
+        """Atualiza as linhas de alunos alterados por outro cliente"""
+        if alteracao.completa:
+            self.refresh_table(recarregar=False)
+            return
+
+        self.tarefas.executar(
+            ("alteracao", alteracao.ids),
+            self.aluno_service.buscar_por_ids,
+            list(alteracao.ids),
+            ao_concluir=partial(self.linhas.reconciliar, alteracao.ids),
+        )
 
     def on_select(self, event):
         """Evento de seleção na tabela"""
@@ -172,7 +206,10 @@ class GerenciarAlunosScreen:
             self.selected_aluno = values[0]
 
     def incluir_aluno(self):
-        """Inclui um novo aluno"""
+        """Inclui um novo aluno; a gravação roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
         try:
             nome = self.nome_entry.get().strip()
             matricula = self.matricula_entry.get().strip()
@@ -180,29 +217,32 @@ class GerenciarAlunosScreen:
             if not nome or not matricula:
                 raise ValidationError("Preencha todos os campos!")
 
-            self.aluno_service.criar(nome=nome, matricula=matricula)
-            self.refresh_table()
-            self.limpar_campos()
-            logger.info(f"Aluno incluído: {nome} - {matricula}")
-            messagebox.showinfo("Sucesso", "Aluno incluído com sucesso!")
+            self.tarefas.executar(
+                "gravacao",
+                self.aluno_service.criar,
+                nome=nome,
+                matricula=matricula,
+                ao_concluir=lambda novo_id: self.aluno_incluido(
+                    Aluno(id=novo_id, nome=nome, matricula=matricula)
+                ),
+                ao_falhar=lambda e: self.tratar_erro_gravacao(e, "incluir aluno"),
+            )
 
-        except ValidationError as e:
-            logger.warning(f"Erro de validação: {e}")
-            messagebox.showerror("Erro de Validação", str(e))
-        except DatabaseConnectionError as e:
-            logger.error(f"Erro de conexão: {e}")
-            messagebox.showerror("Erro de Conexão", "Erro ao conectar com o banco de dados")
         except Exception as e:
-            logger.error(f"Erro ao incluir aluno: {e}")
-            error_msg = str(e)
+            self.tratar_erro_gravacao(e, "incluir aluno")
 
-            if "já existe" in error_msg:
-                messagebox.showerror("Erro", "Este aluno já existe!")
-            else:
-                messagebox.showerror("Erro", "Erro inesperado. Entre em contato com o Suporte")
+    def aluno_incluido(self, aluno):
+        """Insere a linha do aluno gravado"""
+        self.linhas.inserir(aluno)
+        self.limpar_campos()
+        logger.info(f"Aluno incluído: {aluno.nome} - {aluno.matricula}")
+        messagebox.showinfo("Sucesso", "Aluno incluído com sucesso!")
 
     def alterar_aluno(self):
-        """Altera o aluno selecionado"""
+        """Altera o aluno selecionado; a gravação roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
         try:
             if not self.selected_aluno:
                 raise SelectionError("Selecione um aluno na tabela!")
@@ -213,28 +253,83 @@ class GerenciarAlunosScreen:
             if not nome or not matricula:
                 raise ValidationError("Preencha todos os campos!")
 
-            self.aluno_service.atualizar(
-                id=int(self.selected_aluno), nome=nome, matricula=matricula
+            aluno = Aluno(id=int(self.selected_aluno), nome=nome, matricula=matricula)
+            self.tarefas.executar(
+                "gravacao",
+                self.aluno_service.atualizar,
+                id=aluno.id,
+                nome=nome,
+                matricula=matricula,
+                ao_concluir=lambda _: self.aluno_alterado(aluno),
+                ao_falhar=lambda e: self.tratar_erro_gravacao(e, "alterar aluno"),
             )
-            self.refresh_table()
-            self.limpar_campos()
-            logger.info(f"Aluno alterado ID {self.selected_aluno}: {nome} - {matricula}")
-            messagebox.showinfo("Sucesso", "Aluno alterado com sucesso!")
 
-        except SelectionError as e:
+        except Exception as e:
+            self.tratar_erro_gravacao(e, "alterar aluno")
+
+    def aluno_alterado(self, aluno):
+        """Troca a linha do aluno alterado"""
+        self.linhas.atualizar(aluno)
+        self.limpar_campos()
+        logger.info(f"Aluno alterado ID {aluno.id}: {aluno.nome} - {aluno.matricula}")
+        messagebox.showinfo("Sucesso", "Aluno alterado com sucesso!")
+
+    def excluir_aluno(self):
+        """Exclui o aluno selecionado; a exclusão roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
+        if not self.selected_aluno:
+            messagebox.showerror("Erro", "Selecione um aluno na tabela!")
+            return
+
+        nome = self.nome_entry.get().strip()
+
+        if messagebox.askyesno(
+            "Confirmar Exclusão", f"Tem certeza que deseja excluir o aluno:\n{nome}?"
+        ):
+            id_aluno = int(self.selected_aluno)
+            self.tarefas.executar(
+                "gravacao",
+                self.aluno_service.deletar,
+                id_aluno,
+                ao_concluir=lambda _: self.aluno_excluido(id_aluno, nome),
+                ao_falhar=self.erro_exclusao,
+            )
+
+    def aluno_excluido(self, id_aluno, nome):
+        """Remove a linha do aluno excluído"""
+        self.linhas.remover(id_aluno)
+        self.limpar_campos()
+        logger.info(f"Aluno excluído ID {id_aluno}: {nome}")
+
+    def erro_exclusao(self, e):
+        """Exibe o erro da exclusão de um aluno"""
+        logger.error(f"Erro ao excluir aluno: {e}")
+        messagebox.showerror("Erro", "Erro ao salvar, entre em contato com o Suporte")
+
+    def tratar_erro_gravacao(self, e, acao):
+        """
+        Exibe o erro da inclusão ou alteração de um aluno
+
+        Args:
+            e: Exceção lançada na validação ou pela gravação em segundo plano
+            acao: Descrição da gravação, usada no log; ex.: "incluir aluno"
+        """
+        if isinstance(e, SelectionError):
             logger.warning(f"Erro de seleção: {e}")
             messagebox.showerror("Erro de Seleção", str(e))
-        except ValidationError as e:
+        elif isinstance(e, ValidationError):
             logger.warning(f"Erro de validação: {e}")
             messagebox.showerror("Erro de Validação", str(e))
-        except DataNotFoundError as e:
+        elif isinstance(e, DataNotFoundError):
             logger.warning(f"Dados não encontrados: {e}")
             messagebox.showerror("Erro", "Aluno não encontrado!")
-        except DatabaseConnectionError as e:
+        elif isinstance(e, DatabaseConnectionError):
             logger.error(f"Erro de conexão: {e}")
             messagebox.showerror("Erro de Conexão", "Erro ao conectar com o banco de dados")
-        except Exception as e:
-            logger.error(f"Erro ao alterar aluno: {e}")
+        else:
+            logger.error(f"Erro ao {acao}: {e}")
             error_msg = str(e)
 
             if "já existe" in error_msg:
@@ -244,27 +339,6 @@ class GerenciarAlunosScreen:
             else:
                 messagebox.showerror("Erro", "Erro inesperado. Entre em contato com o Suporte")
 
-    def excluir_aluno(self):
-        """Exclui o aluno selecionado"""
-        if not self.selected_aluno:
-            messagebox.showerror("Erro", "Selecione um aluno na tabela!")
-            return
-
-        nome = self.nome_entry.get().strip()
-
-        if messagebox.askyesno(
-            "Confirmar Exclusão", f"Tem certeza que deseja excluir o aluno:\n{nome}?"
-        ):
-            try:
-                self.aluno_service.deletar(int(self.selected_aluno))
-                self.refresh_table()
-                self.limpar_campos()
-                logger.info(f"Aluno excluído ID {self.selected_aluno}: {nome}")
-
-            except Exception as e:
-                logger.error(f"Erro ao excluir aluno: {e}")
-                messagebox.showerror("Erro", "Erro ao salvar, entre em contato com o Suporte")
-
     def limpar_campos(self):
         """Limpa os campos do formulário"""
         self.nome_entry.delete(0, tk.END)
@@ -1,9 +1,15 @@
+import dataclasses
 import logging
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox, ttk
 
 from registro_notas_alunos.backend import DisciplinaService
+from registro_notas_alunos.backend.disciplina.model import Disciplina
 from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.gui.alteracoes import ReceptorAlteracoes
+from registro_notas_alunos.gui.modelo_linhas import ModeloLinhas
+from registro_notas_alunos.gui.tarefas import ExecutorTarefas
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +28,12 @@ class GerenciarDisciplinasScreen:
         self.window.title("Cadastro de Disciplinas")
         self.window.geometry("950x600")
         self.window.resizable(True, True)
+        self.tarefas = ExecutorTarefas(self.window)
+        self.alteracoes = ReceptorAlteracoes(self.window, self.aplicar_alteracao, ("disciplina",))
 
         self.center_window()
         self.create_widgets()
-        self.refresh_table()
+        self.refresh_table(recarregar=False)
 
     def center_window(self):
         """Centraliza a janela na tela"""
@@ -104,6 +112,14 @@ class GerenciarDisciplinasScreen:
 
         self.tree.bind("<<TreeviewSelect>>", self.on_select)
 
+        # Linhas indexadas pelo ID, na mesma ordem de listar_todas
+        self.linhas = ModeloLinhas(
+            self.tree,
+            chave=lambda disc: disc.id,
+            formatar=lambda disc: (disc.id, disc.nome, disc.ano, disc.semestre),
+            ordem=lambda disc: disc.nome.casefold(),
+        )
+
         # Botão fechar
         ttk.Button(main_frame, text="Fechar", command=self.window.destroy).grid(
             row=3, column=0, columnspan=4, pady=15
@@ -117,22 +133,44 @@ class GerenciarDisciplinasScreen:
         table_frame.columnconfigure(0, weight=1)
         table_frame.rowconfigure(0, weight=1)
 
-    def refresh_table(self):
-        """Atualiza a tabela"""
-        try:
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+    def refresh_table(self, recarregar=True):
+        """
+        Recarrega a tabela inteira, buscando as disciplinas em segundo plano
+
+        Args:
+            recarregar: Ignora a lista em cache; False ao abrir a tela
+        """
+        self.tarefas.executar(
+            "tabela",
+            self.disciplina_service.listar_todas,
+            recarregar,
+            ao_concluir=self.preencher_tabela,
+            ao_falhar=self.erro_tabela,
+        )
 
-            disciplinas = self.disciplina_service.listar_todas()
+    def preencher_tabela(self, disciplinas):
+        """Substitui as linhas da tabela pelas disciplinas informadas"""
+        self.linhas.carregar(disciplinas)
 
-            for disc in disciplinas:
-                self.tree.insert("", tk.END, values=(disc.id, disc.nome, disc.ano, disc.semestre))
+        logger.info(f"Tabela disciplinas atualizada - {len(disciplinas)} registros")
 
-            logger.info(f"Tabela disciplinas atualizada - {len(disciplinas)} registros")
+    def erro_tabela(self, e):
+        """Exibe o erro da busca da tabela"""
+        logger.error(f"Erro ao atualizar tabela disciplinas: {e}")
+        messagebox.showerror("Erro", f"Erro ao carregar disciplinas:\n{str(e)}")
 
-        except Exception as e:
-            logger.error(f"Erro ao atualizar tabela disciplinas: {e}")
-            messagebox.showerror("Erro", f"Erro ao carregar disciplinas:\n{str(e)}")
+    def aplicar_alteracao(self, alteracao):
+        """Atualiza as linhas de disciplinas alteradas por outro cliente"""
+        if alteracao.completa:
+            self.refresh_table(recarregar=False)
+            return
+
+        self.tarefas.executar(
+            ("alteracao", alteracao.ids),
+            self.disciplina_service.buscar_por_ids,
+            list(alteracao.ids),
+            ao_concluir=partial(self.linhas.reconciliar, alteracao.ids),
+        )
 
     def on_select(self, event):
         """Evento seleção"""
@@ -150,7 +188,10 @@ class GerenciarDisciplinasScreen:
             self.selected_disciplina = values[0]
 
     def incluir_disciplina(self):
-        """Inclui disciplina"""
+        """Inclui disciplina; a gravação roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
         nome = self.nome_entry.get().strip()
         ano = self.ano_entry.get().strip()
         semestre = self.semestre_combo.get()
@@ -160,25 +201,36 @@ class GerenciarDisciplinasScreen:
             return
 
         try:
-            ano = int(ano)
-            semestre = int(semestre)
-
-            self.disciplina_service.criar(nome=nome, ano=ano, semestre=semestre)
-            self.refresh_table()
-            self.limpar_campos()
-            logger.info(f"Disciplina incluída: {nome} - {ano}/{semestre}")
-
+            disciplina = Disciplina(id=None, nome=nome, ano=int(ano), semestre=int(semestre))
         except Exception as e:
-            logger.error(f"Erro ao incluir disciplina: {e}")
-            error_msg = str(e)
+            self.erro_gravacao(e, "incluir disciplina")
+            return
 
-            if "já existe" in error_msg:
-                messagebox.showerror("Erro", "Esta disciplina já existe!")
-            else:
-                messagebox.showerror("Erro", "Erro ao salvar, entre em contato com o Suporte")
+        self.tarefas.executar(
+            "gravacao",
+            self.disciplina_service.criar,
+            nome=disciplina.nome,
+            ano=disciplina.ano,
+            semestre=disciplina.semestre,
+            ao_concluir=lambda novo_id: self.disciplina_incluida(
+                dataclasses.replace(disciplina, id=novo_id)
+            ),
+            ao_falhar=lambda e: self.erro_gravacao(e, "incluir disciplina"),
+        )
+
+    def disciplina_incluida(self, disciplina):
+        """Insere a linha da disciplina gravada"""
+        self.linhas.inserir(disciplina)
+        self.limpar_campos()
+        logger.info(
+            f"Disciplina incluída: {disciplina.nome} - {disciplina.ano}/{disciplina.semestre}"
+        )
 
     def alterar_disciplina(self):
-        """Altera disciplina selecionada"""
+        """Altera disciplina selecionada; a gravação roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
         if not self.selected_disciplina or not isinstance(self.selected_disciplina, int):
             messagebox.showerror("Erro", "Selecione uma disciplina!")
             return
@@ -192,32 +244,35 @@ class GerenciarDisciplinasScreen:
             return
 
         try:
-            ano = int(ano)
-            semestre = int(semestre)
-
-            self.disciplina_service.atualizar(
-                id=int(self.selected_disciplina),
-                nome=nome,
-                ano=ano,
-                semestre=semestre,
+            disciplina = Disciplina(
+                id=self.selected_disciplina, nome=nome, ano=int(ano), semestre=int(semestre)
             )
-            self.refresh_table()
-            self.limpar_campos()
-            logger.info(f"Disciplina alterada ID {self.selected_disciplina}")
-
         except Exception as e:
-            logger.error(f"Erro ao alterar disciplina: {e}")
-            error_msg = str(e)
+            self.erro_gravacao(e, "alterar disciplina")
+            return
 
-            if "já existe" in error_msg:
-                messagebox.showerror("Erro", "Esta disciplina já existe!")
-            elif "não encontrada" in error_msg:
-                messagebox.showerror("Erro", "Disciplina não encontrada!")
-            else:
-                messagebox.showerror("Erro", "Erro ao salvar, entre em contato com o Suporte")
+        self.tarefas.executar(
+            "gravacao",
+            self.disciplina_service.atualizar,
+            id=disciplina.id,
+            nome=disciplina.nome,
+            ano=disciplina.ano,
+            semestre=disciplina.semestre,
+            ao_concluir=lambda _: self.disciplina_alterada(disciplina),
+            ao_falhar=lambda e: self.erro_gravacao(e, "alterar disciplina"),
+        )
+
+    def disciplina_alterada(self, disciplina):
+        """Troca a linha da disciplina alterada"""
+        self.linhas.atualizar(disciplina)
+        self.limpar_campos()
+        logger.info(f"Disciplina alterada ID {disciplina.id}")
 
     def excluir_disciplina(self):
-        """Exclui disciplina"""
+        """Exclui disciplina; a exclusão roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
         if not self.selected_disciplina or not isinstance(self.selected_disciplina, int):
             messagebox.showerror("Erro", "Selecione uma disciplina!")
             return
@@ -225,16 +280,39 @@ class GerenciarDisciplinasScreen:
         nome = self.nome_entry.get().strip()
 
         if messagebox.askyesno("Confirmar", f"Excluir disciplina:\n{nome}?"):
-            try:
-                self.disciplina_service.deletar(self.selected_disciplina)
-                messagebox.showinfo("Sucesso", "Disciplina excluída!")
-                self.refresh_table()
-                self.limpar_campos()
-                logger.info(f"Disciplina excluída ID {self.selected_disciplina}")
-
-            except Exception as e:
-                logger.error(f"Erro ao excluir disciplina: {e}")
-                messagebox.showerror("Erro", "Erro ao salvar, entre em contato com o Suporte")
+            id_disciplina = self.selected_disciplina
+            self.tarefas.executar(
+                "gravacao",
+                self.disciplina_service.deletar,
+                id_disciplina,
+                ao_concluir=lambda _: self.disciplina_excluida(id_disciplina),
+                ao_falhar=lambda e: self.erro_gravacao(e, "excluir disciplina"),
+            )
+
+    def disciplina_excluida(self, id_disciplina):
+        """Remove a linha da disciplina excluída"""
+        messagebox.showinfo("Sucesso", "Disciplina excluída!")
+        self.linhas.remover(id_disciplina)
+        self.limpar_campos()
+        logger.info(f"Disciplina excluída ID {id_disciplina}")
+
+    def erro_gravacao(self, e, acao):
+        """
+        Exibe o erro de uma gravação de disciplina
+
+        Args:
+            e: Exceção lançada na conversão dos campos ou pela gravação em segundo plano
+            acao: Descrição da gravação, usada no log; ex.: "incluir disciplina"
+        """
+        logger.error(f"Erro ao {acao}: {e}")
+        error_msg = str(e)
+
+        if "já existe" in error_msg:
+            messagebox.showerror("Erro", "Esta disciplina já existe!")
+        elif "não encontrada" in error_msg:
+            messagebox.showerror("Erro", "Disciplina não encontrada!")
+        else:
+            messagebox.showerror("Erro", "Erro ao salvar, entre em contato com o Suporte")
 
     def limpar_campos(self):
         """Limpa campos"""
@@ -1,13 +1,16 @@
 import logging
 import tkinter as tk
+from functools import partial
 from tkinter import messagebox, ttk
 
-from registro_notas_alunos.backend import (AlunoService, DisciplinaService,
-                                           MatriculaService)
+from registro_notas_alunos.backend import AlunoService, DisciplinaService, MatriculaService
 from registro_notas_alunos.backend.lib.database import DatabaseConnection
 from registro_notas_alunos.backend.matricula.model import Matricula
-from registro_notas_alunos.backend.matricula.service import \
-    MatriculaJaExisteException
+from registro_notas_alunos.backend.matricula.service import MatriculaJaExisteException
+from registro_notas_alunos.gui.alteracoes import ReceptorAlteracoes
+from registro_notas_alunos.gui.busca_aluno import CampoBuscaAluno
+from registro_notas_alunos.gui.modelo_linhas import ModeloLinhas
+from registro_notas_alunos.gui.tarefas import ExecutorTarefas
 
 logger = logging.getLogger(__name__)
 
@@ -26,12 +29,16 @@ class GerenciarMatriculasScreen:
         """Cria a janela de gerenciamento de matrículas"""
         self.window = tk.Toplevel(self.parent)
         self.window.title("Cadastro de Matrículas")
-        self.window.geometry("1000x650")
+        self.window.geometry("1000x690")
         self.window.resizable(True, True)
+        self.tarefas = ExecutorTarefas(self.window)
+        self.alteracoes = ReceptorAlteracoes(
+            self.window, self.aplicar_alteracao, ("matricula", "aluno", "disciplina")
+        )
 
         self.center_window()
         self.create_widgets()
-        self.load_combos()
+        self.load_combos(recarregar=False)
         self.refresh_table()
 
     def center_window(self):
@@ -58,7 +65,9 @@ class GerenciarMatriculasScreen:
 
         # Aluno
         ttk.Label(form_frame, text="Aluno:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.aluno_combo = ttk.Combobox(form_frame, width=40, state="readonly")
+        self.aluno_combo = CampoBuscaAluno(
+            form_frame, buscar=self.aluno_service.buscar, tarefas=self.tarefas, width=40
+        )
         self.aluno_combo.grid(row=0, column=1, pady=5, padx=(10, 0))
 
         # Disciplina
@@ -66,14 +75,20 @@ class GerenciarMatriculasScreen:
         self.disciplina_combo = ttk.Combobox(form_frame, width=40, state="readonly")
         self.disciplina_combo.grid(row=1, column=1, pady=5, padx=(10, 0))
 
+        # Turma de origem para copiar as matrículas para a disciplina acima
+        ttk.Label(form_frame, text="Copiar de:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        self.origem_combo = ttk.Combobox(form_frame, width=40, state="readonly")
+        self.origem_combo.grid(row=2, column=1, pady=5, padx=(10, 0))
+
         # Botões
         button_frame = ttk.Frame(form_frame)
-        button_frame.grid(row=2, column=0, columnspan=2, pady=15)
+        button_frame.grid(row=3, column=0, columnspan=2, pady=15)
 
         buttons = [
             ("Incluir", self.incluir_matricula),
+            ("Copiar Turma", self.copiar_matriculas),
             ("Excluir", self.excluir_matricula),
-            ("Atualizar", self.refresh_table),
+            ("Atualizar", self.atualizar),
             ("Limpar", self.limpar_campos),
         ]
 
@@ -111,6 +126,14 @@ class GerenciarMatriculasScreen:
 
         self.tree.bind("<<TreeviewSelect>>", self.on_select)
 
+        # Linhas (id, aluno, matrícula, disciplina) na mesma ordem de listar_todas
+        self.linhas = ModeloLinhas(
+            self.tree,
+            chave=lambda mat: mat[0],
+            formatar=tuple,
+            ordem=lambda mat: (mat[3].casefold(), mat[1].casefold()),
+        )
+
         # Botão fechar
         ttk.Button(main_frame, text="Fechar", command=self.window.destroy).grid(
             row=3, column=0, columnspan=3, pady=15
@@ -124,41 +147,79 @@ class GerenciarMatriculasScreen:
         table_frame.columnconfigure(0, weight=1)
         table_frame.rowconfigure(0, weight=1)
 
-    def load_combos(self):
-        """Carrega dados nos comboboxes"""
-        try:
-            # Carregar alunos
-            alunos = self.aluno_service.listar_todos()
-            self.alunos_dict = {f"{aluno.nome} ({aluno.matricula})": aluno.id for aluno in alunos}
-            self.aluno_combo["values"] = list(self.alunos_dict.keys())
-
-            # Carregar disciplinas
-            disciplinas = self.disciplina_service.listar_todas()
-            self.disciplinas_dict = {
-                f"{disc.nome} ({disc.ano}/{disc.semestre})": disc.id for disc in disciplinas
-            }
-            self.disciplina_combo["values"] = list(self.disciplinas_dict.keys())
+    def load_combos(self, recarregar=True):
+        """
+        Carrega as disciplinas no combobox em segundo plano; alunos são buscados ao digitar
+
+        Args:
+            recarregar: Ignora a lista em cache; False ao abrir a tela
+        """
+        self.tarefas.executar(
+            "combos",
+            self.disciplina_service.listar_todas,
+            recarregar,
+            ao_concluir=self.preencher_combos,
+            ao_falhar=self.erro_combos,
+        )
 
-        except Exception as e:
-            logger.error(f"Erro ao carregar combos: {e}")
-            messagebox.showerror("Erro", f"Erro ao carregar dados:\n{str(e)}")
+    def preencher_combos(self, disciplinas):
+        """Preenche o combobox de disciplinas"""
+        self.disciplinas_dict = {
+            f"{disc.nome} ({disc.ano}/{disc.semestre})": disc.id for disc in disciplinas
+        }
+        self.disciplinas_por_id = {disc.id: disc for disc in disciplinas}
+        self.disciplina_combo["values"] = list(self.disciplinas_dict.keys())
+        self.origem_combo["values"] = list(self.disciplinas_dict.keys())
+
+    def erro_combos(self, e):
+        """Exibe o erro da carga dos comboboxes"""
+        logger.error(f"Erro ao carregar combos: {e}")
+        messagebox.showerror("Erro", f"Erro ao carregar dados:\n{str(e)}")
+
+    def atualizar(self):
+        """Busca de novo no banco as disciplinas dos comboboxes e as matrículas"""
+        self.load_combos()
+        self.refresh_table()
 
     def refresh_table(self):
-        """Atualiza a tabela"""
-        try:
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+        """Recarrega a tabela inteira, buscando as matrículas em segundo plano"""
+        self.tarefas.executar(
+            "tabela",
+            self.matricula_service.listar_todas,
+            ao_concluir=self.preencher_tabela,
+            ao_falhar=self.erro_tabela,
+        )
 
-            matriculas = self.matricula_service.listar_todas()
+    def preencher_tabela(self, matriculas):
+        """Substitui as linhas da tabela pelas matrículas informadas"""
+        self.linhas.carregar(matriculas)
 
-            for mat in matriculas:
-                self.tree.insert("", tk.END, values=mat)
+        logger.info(f"Tabela matrículas atualizada - {len(matriculas)} registros")
 
-            logger.info(f"Tabela matrículas atualizada - {len(matriculas)} registros")
+    def erro_tabela(self, e):
+        """Exibe o erro da busca da tabela"""
+        logger.error(f"Erro ao atualizar tabela matrículas: {e}")
+        messagebox.showerror("Erro", f"Erro ao carregar matrículas:\n{str(e)}")
 
-        except Exception as e:
-            logger.error(f"Erro ao atualizar tabela matrículas: {e}")
-            messagebox.showerror("Erro", f"Erro ao carregar matrículas:\n{str(e)}")
+    def aplicar_alteracao(self, alteracao):
+        """Atualiza as matrículas e os comboboxes alterados por outro cliente"""
+        if alteracao.tabela != "matricula":
+            # Nomes de alunos e disciplinas aparecem nos comboboxes e nas linhas
+            self.load_combos(recarregar=False)
+            if alteracao.operacao != "INSERT":
+                self.refresh_table()
+            return
+
+        if alteracao.completa:
+            self.refresh_table()
+            return
+
+        self.tarefas.executar(
+            ("alteracao", alteracao.ids),
+            self.matricula_service.listar_por_ids,
+            list(alteracao.ids),
+            ao_concluir=partial(self.linhas.reconciliar, alteracao.ids),
+        )
 
     def on_select(self, event):
         """Evento seleção"""
@@ -169,16 +230,19 @@ class GerenciarMatriculasScreen:
             self.selected_matricula = values[0]
 
     def incluir_matricula(self):
-        """Inclui matrícula"""
-        aluno_sel = self.aluno_combo.get()
+        """Inclui matrícula; a gravação roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
+        aluno = self.aluno_combo.aluno_selecionado()
         disciplina_sel = self.disciplina_combo.get()
 
-        if not aluno_sel or not disciplina_sel:
+        if not aluno or not disciplina_sel:
             messagebox.showerror("Erro", "Selecione aluno e disciplina!")
             return
 
         try:
-            id_aluno = self.alunos_dict[aluno_sel]
+            id_aluno = aluno.id
             id_disciplina = self.disciplinas_dict[disciplina_sel]
 
             if not id_aluno or not id_disciplina:
@@ -186,39 +250,115 @@ class GerenciarMatriculasScreen:
                 return
 
             matricula = Matricula(id=None, id_aluno=id_aluno, id_disciplina=id_disciplina)
-            self.matricula_service.criar(matricula)
-            self.refresh_table()
-            self.limpar_campos(manter_aluno=True)
-            logger.info(f"Matrícula incluída: aluno {id_aluno} -> disciplina {id_disciplina}")
+            disciplina = self.disciplinas_por_id[id_disciplina]
+        except Exception as e:
+            self.erro_inclusao(e)
+            return
+
+        self.tarefas.executar(
+            "gravacao",
+            self.matricula_service.criar,
+            matricula,
+            ao_concluir=lambda novo_id: self.matricula_incluida(novo_id, aluno, disciplina),
+            ao_falhar=self.erro_inclusao,
+        )
+
+    def matricula_incluida(self, novo_id, aluno, disciplina):
+        """Insere a linha da matrícula gravada"""
+        # A linha é montada com os dados já carregados nos comboboxes
+        self.linhas.inserir((novo_id, aluno.nome, aluno.matricula, disciplina.nome))
+        self.limpar_campos(manter_aluno=True)
+        logger.info(f"Matrícula incluída: aluno {aluno.id} -> disciplina {disciplina.id}")
 
-        except MatriculaJaExisteException as e:
+    def erro_inclusao(self, e):
+        """Exibe o erro da inclusão de uma matrícula"""
+        if isinstance(e, MatriculaJaExisteException):
             logger.info(f"Tentativa de incluir matrícula duplicada: {e}")
             messagebox.showinfo("Informação", "O aluno já está matriculado!")
-        except Exception as e:
+        else:
             logger.error(f"Erro ao incluir matrícula: {e}")
             messagebox.showerror("Erro", "Erro ao salvar, entre em contato com o Suporte")
 
+    def copiar_matriculas(self):
+        """Matricula na disciplina selecionada todos os alunos da disciplina de origem"""
+        origem_sel = self.origem_combo.get()
+        destino_sel = self.disciplina_combo.get()
+
+        if not origem_sel or not destino_sel:
+            messagebox.showerror("Erro", "Selecione a disciplina e a turma de origem!")
+            return
+        if origem_sel == destino_sel:
+            messagebox.showerror("Erro", "A turma de origem deve ser outra disciplina!")
+            return
+        if not messagebox.askyesno(
+            "Confirmar", f"Matricular em {destino_sel} todos os alunos de {origem_sel}?"
+        ):
+            return
+
+        # Um único comando no banco, executado em segundo plano
+        self.tarefas.executar(
+            "copiar",
+            self.matricula_service.copiar_matriculas,
+            self.disciplinas_dict[origem_sel],
+            self.disciplinas_dict[destino_sel],
+            ao_concluir=self.matriculas_copiadas,
+            ao_falhar=self.erro_copia,
+        )
+
+    def matriculas_copiadas(self, resultados):
+        """Recarrega a tabela e resume o resultado de copiar_matriculas"""
+        criadas = sum(1 for resultado in resultados if resultado.criada)
+        existentes = len(resultados) - criadas
+        if criadas:
+            self.refresh_table()
+        self.origem_combo.set("")
+
+        logger.info(f"Matrículas copiadas: {criadas} criadas, {existentes} já existentes")
+        messagebox.showinfo(
+            "Sucesso",
+            f"{criadas} matrícula(s) criada(s); {existentes} aluno(s) já matriculado(s).",
+        )
+
+    def erro_copia(self, e):
+        """Exibe o erro da cópia de matrículas"""
+        logger.error(f"Erro ao copiar matrículas: {e}")
+        messagebox.showerror("Erro", "Erro ao salvar, entre em contato com o Suporte")
+
     def excluir_matricula(self):
-        """Exclui matrícula"""
+        """Exclui matrícula; a exclusão roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
         if not self.selected_matricula:
             messagebox.showerror("Erro", "Selecione uma matrícula!")
             return
 
         if messagebox.askyesno("Confirmar", "Excluir matrícula selecionada?"):
-            try:
-                self.matricula_service.deletar(int(self.selected_matricula))
-                self.refresh_table()
-                self.limpar_campos()
-                logger.info(f"Matrícula excluída ID {self.selected_matricula}")
-
-            except Exception as e:
-                logger.error(f"Erro ao excluir matrícula: {e}")
-                messagebox.showerror("Erro", "Erro ao salvar, entre em contato com o Suporte")
+            id_matricula = int(self.selected_matricula)
+            self.tarefas.executar(
+                "gravacao",
+                self.matricula_service.deletar,
+                id_matricula,
+                ao_concluir=lambda _: self.matricula_excluida(id_matricula),
+                ao_falhar=self.erro_exclusao,
+            )
+
+    def matricula_excluida(self, id_matricula):
+        """Remove a linha da matrícula excluída"""
+        self.linhas.remover(id_matricula)
+        self.limpar_campos()
+        logger.info(f"Matrícula excluída ID {id_matricula}")
+
+    def erro_exclusao(self, e):
+        """Exibe o erro da exclusão de uma matrícula"""
+        logger.error(f"Erro ao excluir matrícula: {e}")
+        messagebox.showerror("Erro", "Erro ao salvar, entre em contato com o Suporte")
 
     def limpar_campos(self, manter_aluno=False):
         """Limpa campos"""
         if not manter_aluno:
-            self.aluno_combo.set("")
+            self.aluno_combo.limpar()
         self.disciplina_combo.set("")
+        self.origem_combo.set("")
         self.selected_matricula = None
         self.tree.selection_remove(self.tree.selection())
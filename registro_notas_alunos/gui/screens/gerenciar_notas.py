@@ -1,17 +1,23 @@
+import dataclasses
 import logging
 import tkinter as tk
-from tkinter import messagebox, ttk
+from tkinter import filedialog, messagebox, ttk
 
 from registro_notas_alunos.backend import AlunoService, MatriculaService, NotasService
 from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.backend.notas.importacao import ImportadorNotas
 from registro_notas_alunos.backend.notas.model import Notas
 from registro_notas_alunos.backend.notas.service import NotasJaExistemException
+from registro_notas_alunos.gui.alteracoes import ReceptorAlteracoes
+from registro_notas_alunos.gui.busca_aluno import CampoBuscaAluno
 from registro_notas_alunos.gui.screens.exceptions import (
     DatabaseConnectionError,
     DataNotFoundError,
     SelectionError,
     ValidationError,
 )
+from registro_notas_alunos.gui.tabela_virtual import ColunaTabela, TabelaVirtual
+from registro_notas_alunos.gui.tarefas import ExecutorTarefas
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +27,7 @@ class GerenciarNotasScreen:
         self.parent = parent
         try:
             self.db = DatabaseConnection()
+            self.aluno_service = AlunoService(self.db)
             self.notas_service = NotasService(self.db)
             self.matricula_service = MatriculaService(self.db)
         except Exception as e:
@@ -36,10 +43,13 @@ class GerenciarNotasScreen:
         self.window.title("Gerenciar Notas")
         self.window.geometry("1100x700")
         self.window.resizable(True, True)
+        self.tarefas = ExecutorTarefas(self.window)
+        self.alteracoes = ReceptorAlteracoes(
+            self.window, self.aplicar_alteracao, ("notas", "aluno", "disciplina")
+        )
 
         self.center_window()
         self.create_widgets()
-        self.load_alunos()
         self.refresh_table()
 
         # Configurar estado inicial dos botões após criar toda a interface
@@ -69,9 +79,14 @@ class GerenciarNotasScreen:
 
         # Linha 1 - Seleção de Aluno, Semestre e Disciplina
         ttk.Label(form_frame, text="Aluno:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.aluno_combo = ttk.Combobox(form_frame, width=25, state="readonly")
+        self.aluno_combo = CampoBuscaAluno(
+            form_frame,
+            buscar=self.aluno_service.buscar,
+            tarefas=self.tarefas,
+            ao_selecionar=self.on_aluno_selected,
+            width=25,
+        )
         self.aluno_combo.grid(row=0, column=1, pady=5, padx=(10, 20))
-        self.aluno_combo.bind("<<ComboboxSelected>>", self.on_aluno_selected)
 
         ttk.Label(form_frame, text="Semestre:").grid(row=0, column=2, sticky=tk.W, pady=5)
         self.semestre_combo = ttk.Combobox(form_frame, width=15, state="disabled")
@@ -136,56 +151,48 @@ class GerenciarNotasScreen:
         ttk.Button(button_frame, text="Limpar", command=self.limpar_campos).grid(
             row=0, column=5, padx=5
         )
+        ttk.Button(button_frame, text="Importar Planilha", command=self.importar_planilha).grid(
+            row=0, column=6, padx=5
+        )
 
         # Tabela
         table_frame = ttk.LabelFrame(main_frame, text="Lista de Notas", padding="10")
         table_frame.grid(row=2, column=0, columnspan=4, sticky="nsew", pady=(0, 15))
 
-        columns = (
-            "ID",
-            "Aluno",
-            "Disciplina",
-            "Ano/Sem",
-            "SM1",
-            "SM2",
-            "AV",
-            "AVS",
-            "NF",
-            "Situação",
+        # Tabela virtual: apenas as linhas visíveis são buscadas e desenhadas
+        self.tabela = TabelaVirtual(
+            table_frame,
+            colunas=[
+                ColunaTabela("ID", 50, tk.CENTER, ordenacao="id"),
+                ColunaTabela("Aluno", 140, tk.W, ordenacao="aluno"),
+                ColunaTabela("Disciplina", 140, tk.W, ordenacao="disciplina"),
+                ColunaTabela("Ano/Sem", 70, tk.CENTER, ordenacao="periodo"),
+                ColunaTabela("SM1", 60, tk.CENTER, ordenacao="sm1"),
+                ColunaTabela("SM2", 60, tk.CENTER, ordenacao="sm2"),
+                ColunaTabela("AV", 60, tk.CENTER, ordenacao="av"),
+                ColunaTabela("AVS", 60, tk.CENTER, ordenacao="avs"),
+                ColunaTabela("NF", 60, tk.CENTER, ordenacao="nota_final"),
+                ColunaTabela("Situação", 100, tk.CENTER, ordenacao="situacao"),
+            ],
+            buscar_pagina=lambda limite, deslocamento, ordenacao, decrescente: (
+                self.notas_service.consultar_notas_apuradas(
+                    None, limite, deslocamento, ordenacao, decrescente
+                )
+            ),
+            buscar_apos=lambda limite, ultimo, ordenacao, decrescente: (
+                self.notas_service.consultar_notas_apuradas(
+                    None, limite, ordenacao=ordenacao, decrescente=decrescente, apos=ultimo
+                )
+            ),
+            contar=self.notas_service.contar_notas_apuradas,
+            formatar=self.formatar_linha,
+            chave=lambda nota_vo: nota_vo.id_nota,
+            tarefas=self.tarefas,
+            ao_selecionar=self.on_select,
+            ao_falhar=self.erro_tabela,
+            height=12,
         )
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=12)
-
-        # Configurar colunas
-        self.tree.heading("ID", text="ID")
-        self.tree.heading("Aluno", text="Aluno")
-        self.tree.heading("Disciplina", text="Disciplina")
-        self.tree.heading("Ano/Sem", text="Ano/Sem")
-        self.tree.heading("SM1", text="SM1")
-        self.tree.heading("SM2", text="SM2")
-        self.tree.heading("AV", text="AV")
-        self.tree.heading("AVS", text="AVS")
-        self.tree.heading("NF", text="NF")
-        self.tree.heading("Situação", text="Situação")
-
-        self.tree.column("ID", width=50, anchor=tk.CENTER)
-        self.tree.column("Aluno", width=140, anchor=tk.W)
-        self.tree.column("Disciplina", width=140, anchor=tk.W)
-        self.tree.column("Ano/Sem", width=70, anchor=tk.CENTER)
-        self.tree.column("SM1", width=60, anchor=tk.CENTER)
-        self.tree.column("SM2", width=60, anchor=tk.CENTER)
-        self.tree.column("AV", width=60, anchor=tk.CENTER)
-        self.tree.column("AVS", width=60, anchor=tk.CENTER)
-        self.tree.column("NF", width=60, anchor=tk.CENTER)
-        self.tree.column("Situação", width=100, anchor=tk.CENTER)
-
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
-
-        self.tree.bind("<<TreeviewSelect>>", self.on_select)
+        self.tabela.grid(row=0, column=0, sticky="nsew")
 
         # Bind para cálculo automático
         for entry in [self.sm1_entry, self.sm2_entry, self.av_entry, self.avs_entry]:
@@ -204,53 +211,64 @@ class GerenciarNotasScreen:
         table_frame.columnconfigure(0, weight=1)
         table_frame.rowconfigure(0, weight=1)
 
-    def load_alunos(self):
-        """Carrega apenas os alunos no primeiro combo"""
-        try:
-            aluno_service = AlunoService(self.db)
-            alunos = aluno_service.listar_todos()
-
-            if not alunos:
-                raise DataNotFoundError("Nenhum aluno cadastrado no sistema")
-
-            self.alunos_dict = {aluno.nome: aluno.id for aluno in alunos}
-            self.aluno_combo["values"] = list(self.alunos_dict.keys())
+    def tratar_erro_carga(self, e, acao):
+        """
+        Exibe o erro de uma carga de dados feita em segundo plano
 
-        except DataNotFoundError as e:
+        Args:
+            e: Exceção lançada pela carga ou pelo preenchimento da tela
+            acao: Descrição da carga, usada no log
+        """
+        if isinstance(e, SelectionError):
+            # Não mostrar mensagem para erros de seleção triviais
+            logger.warning(f"Erro de seleção: {e}")
+        elif isinstance(e, DataNotFoundError):
             logger.warning(f"Dados não encontrados: {e}")
             messagebox.showwarning("Aviso", str(e))
-        except DatabaseConnectionError as e:
+        elif isinstance(e, DatabaseConnectionError):
             logger.error(f"Erro de conexão: {e}")
             messagebox.showerror("Erro de Conexão", "Erro ao conectar com o banco de dados")
-        except Exception as e:
-            logger.exception(f"Erro inesperado ao carregar alunos: {e}")
+        else:
+            logger.error(f"Erro inesperado ao {acao}: {e}", exc_info=e)
             messagebox.showerror("Erro", "Erro inesperado. Entre em contato com o Suporte")
 
-    def on_aluno_selected(self, event):
-        """Carrega semestres disponíveis para o aluno selecionado"""
+    def on_aluno_selected(self, aluno):
+        """Carrega semestres disponíveis para o aluno escolhido no campo de busca"""
         try:
-            aluno_nome = self.aluno_combo.get()
-            if not aluno_nome:
+            # Limpar campos dependentes primeiro
+            self.limpar_dependentes_aluno()
+
+            if aluno is None:
                 raise SelectionError("Nenhum aluno selecionado")
 
-            id_aluno = self.alunos_dict.get(aluno_nome)
-            if not id_aluno:
-                raise SelectionError("Aluno selecionado não encontrado")
+            # Buscar semestres onde o aluno tem matrícula; trocar de aluno outra vez
+            # descarta esta busca se ela ainda estiver pendente
+            self.tarefas.executar(
+                "selecao",
+                self.matricula_service.listar_por_aluno,
+                aluno.id,
+                ao_concluir=self.preencher_semestres,
+                ao_falhar=lambda e: self.tratar_erro_carga(e, "carregar semestres"),
+            )
 
-            # Limpar campos dependentes primeiro
-            self.semestre_combo.set("")
-            self.semestre_combo["state"] = "disabled"
-            self.disciplina_combo.set("")
-            self.disciplina_combo["state"] = "disabled"
-            self.disable_note_fields()
+        except Exception as e:
+            self.tratar_erro_carga(e, "carregar semestres")
 
-            # Limpar matrícula atual se existir
-            if hasattr(self, "current_id_matricula"):
-                delattr(self, "current_id_matricula")
+    def limpar_dependentes_aluno(self):
+        """Limpa semestre, disciplina, notas e a matrícula atual"""
+        self.semestre_combo.set("")
+        self.semestre_combo["state"] = "disabled"
+        self.disciplina_combo.set("")
+        self.disciplina_combo["state"] = "disabled"
+        self.disable_note_fields()
 
-            # Buscar semestres onde o aluno tem matrícula
-            matriculas_aluno = self.matricula_service.listar_por_aluno(id_aluno)
+        # Limpar matrícula atual se existir
+        if hasattr(self, "current_id_matricula"):
+            delattr(self, "current_id_matricula")
 
+    def preencher_semestres(self, matriculas_aluno):
+        """Habilita o combo de semestres com as matrículas do aluno selecionado"""
+        try:
             if not matriculas_aluno:
                 raise DataNotFoundError("Aluno não possui matrículas em disciplinas")
 
@@ -276,18 +294,8 @@ class GerenciarNotasScreen:
             # Atualizar estado dos botões
             self.update_button_states()
 
-        except SelectionError as e:
-            logger.warning(f"Erro de seleção: {e}")
-            # Não mostrar mensagem para erros de seleção triviais
-        except DataNotFoundError as e:
-            logger.warning(f"Dados não encontrados: {e}")
-            messagebox.showwarning("Aviso", str(e))
-        except DatabaseConnectionError as e:
-            logger.error(f"Erro de conexão: {e}")
-            messagebox.showerror("Erro de Conexão", "Erro ao conectar com o banco de dados")
         except Exception as e:
-            logger.exception(f"Erro inesperado ao carregar semestres: {e}")
-            messagebox.showerror("Erro", "Erro inesperado. Entre em contato com o Suporte")
+            self.tratar_erro_carga(e, "carregar semestres")
 
     def on_semestre_selected(self, event):
         """Carrega disciplinas disponíveis para o semestre selecionado"""
@@ -353,12 +361,24 @@ class GerenciarNotasScreen:
             if not self.current_id_matricula:
                 raise DataNotFoundError("Matrícula não encontrada para disciplina selecionada")
 
+            # Verificar em segundo plano se já existem notas para esta matrícula
+            self.tarefas.executar(
+                "selecao",
+                self.notas_service.buscar_por_matricula,
+                self.current_id_matricula,
+                ao_concluir=self.preencher_notas,
+                ao_falhar=lambda e: self.tratar_erro_carga(e, "carregar dados da disciplina"),
+            )
+
+        except Exception as e:
+            self.tratar_erro_carga(e, "carregar dados da disciplina")
+
+    def preencher_notas(self, notas_existentes):
+        """Habilita os campos de notas e os preenche com as notas já lançadas, se houver"""
+        try:
             # Habilitar campos de notas
             self.enable_note_fields()
 
-            # Verificar se já existem notas para esta matrícula
-            notas_existentes = self.notas_service.buscar_por_matricula(self.current_id_matricula)
-
             if notas_existentes:
                 # Preencher campos com notas existentes
                 self.sm1_entry.delete(0, tk.END)
@@ -385,18 +405,8 @@ class GerenciarNotasScreen:
             # Atualizar estado dos botões
             self.update_button_states()
 
-        except SelectionError as e:
-            logger.warning(f"Erro de seleção: {e}")
-            # Não mostrar mensagem para erros de seleção triviais
-        except DataNotFoundError as e:
-            logger.warning(f"Dados não encontrados: {e}")
-            messagebox.showwarning("Aviso", str(e))
-        except DatabaseConnectionError as e:
-            logger.error(f"Erro de conexão: {e}")
-            messagebox.showerror("Erro de Conexão", "Erro ao conectar com o banco de dados")
         except Exception as e:
-            logger.exception(f"Erro inesperado ao carregar dados da disciplina: {e}")
-            messagebox.showerror("Erro", "Erro inesperado. Entre em contato com o Suporte")
+            self.tratar_erro_carga(e, "carregar dados da disciplina")
 
     def enable_note_fields(self):
         """Habilita campos de entrada de notas"""
@@ -423,47 +433,56 @@ class GerenciarNotasScreen:
         self.situacao_label.config(text="--", foreground="black")
 
     def refresh_table(self):
-        """Atualiza a tabela"""
-        try:
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            notas_apuradas = self.notas_service.listar_com_detalhes()
-
-            for nota_vo in notas_apuradas:
-                # Formatear a situação com símbolos para destacar visualmente
-                situacao_display = nota_vo.situacao
-                if nota_vo.situacao == "APROVADO":
-                    situacao_display = "✓ APROVADO"
-                elif nota_vo.situacao == "REPROVADO":
-                    situacao_display = "✗ REPROVADO"
-                elif nota_vo.situacao == "PENDENTE":
-                    situacao_display = "⏳ PENDENTE"
-
-                self.tree.insert(
-                    "",
-                    tk.END,
-                    values=(
-                        nota_vo.id_nota,  # ID da nota para operações
-                        nota_vo.nome_aluno,
-                        nota_vo.disciplina.nome,
-                        f"{nota_vo.disciplina.ano}/{nota_vo.disciplina.semestre}",
-                        nota_vo.get_sm1_display(),
-                        nota_vo.get_sm2_display(),
-                        nota_vo.get_av_display(),
-                        nota_vo.get_avs_display(),
-                        nota_vo.get_nota_final_display(),
-                        situacao_display,
-                    ),
-                )
-
-            logger.info(f"Tabela notas atualizada - {len(notas_apuradas)} registros")
+        """Recarrega a tabela inteira; as páginas visíveis são buscadas em segundo plano"""
+        self.tabela.recarregar()
+
+    def aplicar_alteracao(self, alteracao):
+        """Atualiza a tabela com alterações feitas por outro cliente"""
+        if alteracao.tabela == "notas":
+            # Alterações de notas fora das páginas em memória não mudam a tela
+            afeta_tabela = (
+                alteracao.completa
+                or alteracao.operacao != "UPDATE"
+                or any(self.tabela.registro(id) is not None for id in alteracao.ids)
+            )
+        else:
+            # Inclusões de alunos e disciplinas não mudam as notas existentes
+            afeta_tabela = alteracao.operacao != "INSERT"
+
+        if afeta_tabela:
+            self.tabela.renovar()
+
+    def formatar_linha(self, nota_vo):
+        """Converte uma nota apurada nos valores das colunas da tabela"""
+        # Formatear a situação com símbolos para destacar visualmente
+        situacao_display = nota_vo.situacao
+        if nota_vo.situacao == "APROVADO":
+            situacao_display = "✓ APROVADO"
+        elif nota_vo.situacao == "REPROVADO":
+            situacao_display = "✗ REPROVADO"
+        elif nota_vo.situacao == "PENDENTE":
+            situacao_display = "⏳ PENDENTE"
+
+        return (
+            nota_vo.id_nota,  # ID da nota para operações
+            nota_vo.nome_aluno,
+            nota_vo.disciplina.nome,
+            f"{nota_vo.disciplina.ano}/{nota_vo.disciplina.semestre}",
+            nota_vo.get_sm1_display(),
+            nota_vo.get_sm2_display(),
+            nota_vo.get_av_display(),
+            nota_vo.get_avs_display(),
+            nota_vo.get_nota_final_display(),
+            situacao_display,
+        )
 
-        except DatabaseConnectionError as e:
+    def erro_tabela(self, e):
+        """Exibe o erro da atualização da tabela"""
+        if isinstance(e, DatabaseConnectionError):
             logger.error(f"Erro de conexão ao atualizar tabela: {e}")
             messagebox.showerror("Erro de Conexão", "Erro ao conectar com o banco de dados")
-        except Exception as e:
-            logger.exception(f"Erro inesperado ao atualizar tabela notas: {e}")
+        else:
+            logger.error(f"Erro inesperado ao atualizar tabela notas: {e}", exc_info=e)
             messagebox.showerror("Erro", "Erro inesperado. Entre em contato com o Suporte")
 
     def validar_notas(self, sm1, sm2, av, avs, mostrar_mensagem=True):
@@ -566,39 +585,77 @@ class GerenciarNotasScreen:
             self.nf_label.config(text="--", foreground="gray")
             self.situacao_label.config(text="--", foreground="gray")
 
-    def on_select(self, event):
+    def on_select(self, nota_vo):
         """Evento seleção da tabela - carrega dados nos combos"""
-        selection = self.tree.selection()
-        if selection:
-            item = self.tree.item(selection[0])
-            values = item["values"]
+        id_nota = nota_vo.id_nota
+        nome_disciplina = nota_vo.disciplina.nome
+        ano_semestre = f"{nota_vo.disciplina.ano}/{nota_vo.disciplina.semestre}"
+
+        self.limpar_dependentes_aluno()
+
+        # Aluno, matrículas e notas buscados em uma única tarefa; clicar em outra
+        # linha descarta o resultado desta se ainda estiver pendente
+        self.tarefas.executar(
+            "selecao",
+            self.carregar_selecao,
+            id_nota,
+            ao_concluir=lambda dados: self.aplicar_selecao(
+                dados, ano_semestre, nome_disciplina, id_nota
+            ),
+            ao_falhar=lambda e: self.tratar_erro_carga(e, "carregar nota selecionada"),
+        )
 
-            # Nova estrutura: (id_nota, nome_aluno, nome_disciplina, ano_semestre,
-            #                 sm1, sm2, av, avs, nf, situacao)
-            nome_aluno = values[1]
-            nome_disciplina = values[2]
-            ano_semestre = values[3]  # formato "2024/1"
+    def carregar_selecao(self, id_nota):
+        """
+        Busca as notas da linha selecionada, o aluno e as matrículas dele
 
-            # Selecionar aluno
-            self.aluno_combo.set(nome_aluno)
-            self.on_aluno_selected(None)  # Carregar semestres
+        Roda fora da thread da interface. A linha da tabela traz apenas o nome
+        do aluno, que pode se repetir; o aluno vem da matrícula das notas.
 
-            # Selecionar semestre
-            self.semestre_combo.set(ano_semestre)
-            self.on_semestre_selected(None)  # Carregar disciplinas
+        Args:
+            id_nota: ID das notas da linha
 
-            # Selecionar disciplina
-            self.disciplina_combo.set(nome_disciplina)
-            self.on_disciplina_selected(None)  # Carregar notas
+        Returns:
+            Tupla (aluno, matrículas do aluno, notas)
 
-            # O ID da nota já foi definido no on_disciplina_selected
-            self.selected_nota = values[0]  # id_nota
+        Raises:
+            DataNotFoundError: Se as notas foram excluídas por outro cliente
+        """
+        notas = self.notas_service.buscar_por_id(id_nota)
+        matricula = notas and self.matricula_service.buscar_por_id(notas.id_matricula)
+        aluno = matricula and self.aluno_service.buscar_por_id(matricula.id_aluno)
+        if not aluno:
+            raise DataNotFoundError("Notas selecionadas não encontradas")
 
-            # Atualizar estado dos botões
-            self.update_button_states()
+        return aluno, self.matricula_service.listar_por_aluno(aluno.id), notas
+
+    def aplicar_selecao(self, dados, ano_semestre, nome_disciplina, id_nota):
+        """Preenche combos e notas com o resultado de carregar_selecao"""
+        aluno, matriculas_aluno, notas = dados
+
+        # Selecionar aluno e carregar semestres
+        self.aluno_combo.selecionar(aluno)
+        self.preencher_semestres(matriculas_aluno)
+
+        # Selecionar semestre
+        self.semestre_combo.set(ano_semestre)
+        self.on_semestre_selected(None)  # Carregar disciplinas
+
+        # Selecionar disciplina e preencher as notas
+        self.disciplina_combo.set(nome_disciplina)
+        self.current_id_matricula = self.disciplinas_dict.get(nome_disciplina)
+        self.preencher_notas(notas)
+
+        self.selected_nota = id_nota
+
+        # Atualizar estado dos botões
+        self.update_button_states()
 
     def incluir_nota(self):
-        """Inclui nova nota"""
+        """Inclui nova nota; a gravação roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
         try:
             # Validar se há seleção completa
             if not hasattr(self, "current_id_matricula") or not self.current_id_matricula:
@@ -606,16 +663,9 @@ class GerenciarNotasScreen:
 
             # Limpar seleção para garantir que é uma inclusão nova
             self.selected_nota = None
-            self.tree.selection_remove(self.tree.selection())
+            self.tabela.limpar_selecao()
 
-            # Converter e validar valores
-            try:
-                sm1 = self.convert_decimal_input(self.sm1_entry.get() or "0")
-                sm2 = self.convert_decimal_input(self.sm2_entry.get() or "0")
-                av = self.convert_decimal_input(self.av_entry.get() or "0")
-                avs = self.convert_decimal_input(self.avs_entry.get() or "0")
-            except (ValueError, TypeError):
-                raise ValidationError("Valores inválidos digitados!")
+            sm1, sm2, av, avs = self.ler_campos_notas()
 
             # Validar notas antes de salvar
             if not self.validar_notas(sm1, sm2, av, avs):
@@ -624,46 +674,40 @@ class GerenciarNotasScreen:
             notas = Notas(
                 id=None, id_matricula=self.current_id_matricula, sm1=sm1, sm2=sm2, av=av, avs=avs
             )
-            self.notas_service.criar(notas)
-            self.refresh_table()
-            self.limpar_campos_notas()
+            self.tarefas.executar(
+                "gravacao",
+                self.notas_service.criar,
+                notas,
+                ao_concluir=lambda _: self.nota_incluida(notas),
+                ao_falhar=lambda e: self.tratar_erro_gravacao(e, "incluir nota"),
+            )
 
-            # Atualizar estado dos botões
-            self.update_button_states()
+        except Exception as e:
+            self.tratar_erro_gravacao(e, "incluir nota")
 
-            logger.info(f"Nota incluída para matrícula {self.current_id_matricula}")
-            messagebox.showinfo("Sucesso", "Nota incluída com sucesso!")
+    def nota_incluida(self, notas):
+        """Atualiza a tela depois que a inclusão foi gravada"""
+        self.tabela.registro_incluido()
+        self.limpar_campos_notas()
 
-        except SelectionError as e:
-            logger.warning(f"Erro de seleção: {e}")
-            messagebox.showerror("Erro de Seleção", str(e))
-        except ValidationError as e:
-            logger.warning(f"Erro de validação: {e}")
-            messagebox.showerror("Erro de Validação", str(e))
-        except NotasJaExistemException as e:
-            logger.info(f"Tentativa de incluir nota existente: {e}")
-            messagebox.showinfo("Informação", "Nota já existe para esta matrícula!")
-        except DatabaseConnectionError as e:
-            logger.error(f"Erro de conexão ao incluir nota: {e}")
-            messagebox.showerror("Erro de Conexão", "Erro ao conectar com o banco de dados")
-        except Exception as e:
-            logger.exception(f"Erro inesperado ao incluir nota: {e}")
-            messagebox.showerror("Erro", "Erro inesperado. Entre em contato com o Suporte")
+        # Atualizar estado dos botões
+        self.update_button_states()
+
+        logger.info(f"Nota incluída para matrícula {notas.id_matricula}")
+        messagebox.showinfo("Sucesso", "Nota incluída com sucesso!")
 
     def alterar_nota(self):
-        """Altera nota selecionada"""
+        """Altera nota selecionada; a gravação roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
         try:
             if not self.selected_nota:
                 raise SelectionError("Selecione uma nota na tabela!")
+            if not getattr(self, "current_id_matricula", None):
+                raise SelectionError("Selecione aluno, semestre e disciplina!")
 
-            # Converter e validar valores
-            try:
-                sm1 = self.convert_decimal_input(self.sm1_entry.get() or "0")
-                sm2 = self.convert_decimal_input(self.sm2_entry.get() or "0")
-                av = self.convert_decimal_input(self.av_entry.get() or "0")
-                avs = self.convert_decimal_input(self.avs_entry.get() or "0")
-            except (ValueError, TypeError):
-                raise ValidationError("Valores inválidos digitados!")
+            sm1, sm2, av, avs = self.ler_campos_notas()
 
             # Validar notas antes de salvar
             if not self.validar_notas(sm1, sm2, av, avs):
@@ -671,45 +715,54 @@ class GerenciarNotasScreen:
 
             notas = Notas(
                 id=int(self.selected_nota),
-                id_matricula=0,
+                id_matricula=self.current_id_matricula,
                 sm1=sm1,
                 sm2=sm2,
                 av=av,
                 avs=avs,
             )
-            self.notas_service.atualizar(notas)
-            self.refresh_table()
-            self.limpar_campos_notas()
+            self.tarefas.executar(
+                "gravacao",
+                self.notas_service.atualizar,
+                notas,
+                ao_concluir=lambda _: self.nota_alterada(notas),
+                ao_falhar=lambda e: self.tratar_erro_gravacao(e, "alterar nota"),
+            )
 
-            # Atualizar estado dos botões
-            self.update_button_states()
+        except Exception as e:
+            self.tratar_erro_gravacao(e, "alterar nota")
+
+    def nota_alterada(self, notas):
+        """Troca só a linha alterada, recalculando a nota como o relatório faz"""
+        nota_vo = self.tabela.registro(notas.id)
+        if nota_vo is not None:
+            nf, situacao = self.notas_service.calcular_nota_final_e_situacao(
+                notas.sm1, notas.sm2, notas.av, notas.avs
+            )
+            self.tabela.atualizar_registro(
+                dataclasses.replace(
+                    nota_vo,
+                    sm1=notas.sm1,
+                    sm2=notas.sm2,
+                    av=notas.av,
+                    avs=notas.avs,
+                    nota_final=nf,
+                    situacao=situacao,
+                )
+            )
+        self.limpar_campos_notas()
 
-            logger.info(f"Nota alterada ID {self.selected_nota}")
-            messagebox.showinfo("Sucesso", "Nota alterada com sucesso!")
+        # Atualizar estado dos botões
+        self.update_button_states()
 
-        except SelectionError as e:
-            logger.warning(f"Erro de seleção: {e}")
-            messagebox.showerror("Erro de Seleção", str(e))
-        except ValidationError as e:
-            logger.warning(f"Erro de validação: {e}")
-            messagebox.showerror("Erro de Validação", str(e))
-        except DataNotFoundError as e:
-            logger.warning(f"Nota não encontrada: {e}")
-            messagebox.showerror("Erro", "Nota não encontrada!")
-        except DatabaseConnectionError as e:
-            logger.error(f"Erro de conexão ao alterar nota: {e}")
-            messagebox.showerror("Erro de Conexão", "Erro ao conectar com o banco de dados")
-        except Exception as e:
-            error_msg = str(e)
-            if "não encontrada" in error_msg:
-                logger.warning(f"Nota não encontrada: {e}")
-                messagebox.showerror("Erro", "Nota não encontrada!")
-            else:
-                logger.exception(f"Erro inesperado ao alterar nota: {e}")
-                messagebox.showerror("Erro", "Erro inesperado. Entre em contato com o Suporte")
+        logger.info(f"Nota alterada ID {notas.id}")
+        messagebox.showinfo("Sucesso", "Nota alterada com sucesso!")
 
     def excluir_nota(self):
-        """Exclui nota selecionada"""
+        """Exclui nota selecionada; a exclusão roda em segundo plano"""
+        if self.tarefas.pendente("gravacao"):
+            return
+
         try:
             if not self.selected_nota:
                 raise SelectionError("Selecione uma nota na tabela!")
@@ -717,32 +770,121 @@ class GerenciarNotasScreen:
             if not messagebox.askyesno("Confirmar", "Excluir nota selecionada?"):
                 return
 
-            self.notas_service.deletar(int(self.selected_nota))
-            self.refresh_table()
-            self.limpar_campos()
+            id_nota = int(self.selected_nota)
+            self.tarefas.executar(
+                "gravacao",
+                self.notas_service.deletar,
+                id_nota,
+                ao_concluir=lambda _: self.nota_excluida(id_nota),
+                ao_falhar=lambda e: self.tratar_erro_gravacao(e, "excluir nota"),
+            )
 
-            # Atualizar estado dos botões
-            self.update_button_states()
+        except Exception as e:
+            self.tratar_erro_gravacao(e, "excluir nota")
 
-            logger.info(f"Nota excluída ID {self.selected_nota}")
-            messagebox.showinfo("Sucesso", "Nota excluída com sucesso!")
+    def nota_excluida(self, id_nota):
+        """Remove a linha da nota excluída e limpa a seleção"""
+        self.tabela.remover_registro(id_nota)
+        self.limpar_campos()
 
-        except SelectionError as e:
+        # Atualizar estado dos botões
+        self.update_button_states()
+
+        logger.info(f"Nota excluída ID {id_nota}")
+        messagebox.showinfo("Sucesso", "Nota excluída com sucesso!")
+
+    def ler_campos_notas(self):
+        """
+        Converte os campos de notas; campos vazios valem zero
+
+        Returns:
+            Tupla (sm1, sm2, av, avs)
+
+        Raises:
+            ValidationError: Se algum campo não for um número
+        """
+        try:
+            return tuple(
+                self.convert_decimal_input(campo.get() or "0")
+                for campo in (self.sm1_entry, self.sm2_entry, self.av_entry, self.avs_entry)
+            )
+        except (ValueError, TypeError):
+            raise ValidationError("Valores inválidos digitados!")
+
+    def tratar_erro_gravacao(self, e, acao):
+        """
+        Exibe o erro de uma gravação de notas
+
+        Args:
+            e: Exceção lançada na validação ou pela gravação em segundo plano
+            acao: Descrição da gravação, usada no log; ex.: "incluir nota"
+        """
+        if isinstance(e, SelectionError):
             logger.warning(f"Erro de seleção: {e}")
             messagebox.showerror("Erro de Seleção", str(e))
-        except DataNotFoundError as e:
+        elif isinstance(e, ValidationError):
+            logger.warning(f"Erro de validação: {e}")
+            messagebox.showerror("Erro de Validação", str(e))
+        elif isinstance(e, NotasJaExistemException):
+            logger.info(f"Tentativa de incluir nota existente: {e}")
+            messagebox.showinfo("Informação", "Nota já existe para esta matrícula!")
+        elif isinstance(e, DataNotFoundError) or "não encontrada" in str(e):
             logger.warning(f"Nota não encontrada: {e}")
             messagebox.showerror("Erro", "Nota não encontrada!")
-        except DatabaseConnectionError as e:
-            logger.error(f"Erro de conexão ao excluir nota: {e}")
+        elif isinstance(e, DatabaseConnectionError):
+            logger.error(f"Erro de conexão ao {acao}: {e}")
             messagebox.showerror("Erro de Conexão", "Erro ao conectar com o banco de dados")
-        except Exception as e:
-            logger.exception(f"Erro inesperado ao excluir nota: {e}")
+        else:
+            logger.error(f"Erro inesperado ao {acao}: {e}", exc_info=e)
+            messagebox.showerror("Erro", "Erro inesperado. Entre em contato com o Suporte")
+
+    def importar_planilha(self):
+        """Importa as notas de uma planilha CSV ou XLSX em segundo plano"""
+        caminho = filedialog.askopenfilename(
+            parent=self.window,
+            title="Importar notas",
+            filetypes=[("Planilhas", "*.csv *.xlsx"), ("Todos os arquivos", "*.*")],
+        )
+        if not caminho:
+            return
+
+        self.tarefas.executar(
+            "importacao",
+            ImportadorNotas(self.db).importar,
+            caminho,
+            ao_concluir=self.concluir_importacao,
+            ao_falhar=self.erro_importacao,
+        )
+
+    def concluir_importacao(self, resultado):
+        """Exibe o resumo da importação e recarrega a tabela"""
+        logger.info(f"Importação: {resultado.gravadas} de {resultado.total} linhas gravadas")
+        if resultado.gravadas:
+            self.refresh_table()
+
+        resumo = f"{resultado.gravadas} de {resultado.total} linhas gravadas."
+        if resultado.ok:
+            messagebox.showinfo("Importação", resumo, parent=self.window)
+            return
+
+        # Exibe apenas as primeiras linhas com erro; a linha de comando gera o relatório completo
+        erros = "\n".join(f"Linha {e.linha}: {e.mensagem}" for e in resultado.erros[:15])
+        if len(resultado.erros) > 15:
+            erros += f"\n... e mais {len(resultado.erros) - 15} linhas com erro"
+        messagebox.showwarning("Importação", f"{resumo}\n\n{erros}", parent=self.window)
+
+    def erro_importacao(self, e):
+        """Exibe o erro de uma importação que não gravou nenhuma linha"""
+        if isinstance(e, (ValueError, ImportError, OSError)):
+            logger.warning(f"Planilha não importada: {e}")
+            messagebox.showerror("Erro na Importação", str(e), parent=self.window)
+        else:
+            logger.error(f"Erro inesperado ao importar planilha: {e}", exc_info=e)
             messagebox.showerror("Erro", "Erro inesperado. Entre em contato com o Suporte")
 
     def limpar_campos(self):
         """Limpa todos os campos"""
-        self.aluno_combo.set("")
+        self.aluno_combo.limpar()
         self.semestre_combo.set("")
         self.semestre_combo["state"] = "disabled"
         self.disciplina_combo.set("")
@@ -751,7 +893,7 @@ class GerenciarNotasScreen:
         self.selected_nota = None
         if hasattr(self, "current_id_matricula"):
             delattr(self, "current_id_matricula")
-        self.tree.selection_remove(self.tree.selection())
+        self.tabela.limpar_selecao()
 
         # Atualizar estado dos botões
         self.update_button_states()
@@ -795,10 +937,10 @@ class GerenciarNotasScreen:
     def update_button_states(self):
         """Atualiza o estado dos botões com base na seleção"""
         # Verificar se a interface foi completamente criada
-        if not hasattr(self, "tree") or not hasattr(self, "btn_incluir"):
+        if not hasattr(self, "tabela") or not hasattr(self, "btn_incluir"):
             return
 
-        has_selection = bool(self.tree.selection())
+        has_selection = self.tabela.selecionada is not None
         has_complete_selection = hasattr(self, "current_id_matricula") and self.current_id_matricula
 
         if has_selection:
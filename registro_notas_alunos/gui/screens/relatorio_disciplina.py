@@ -1,10 +1,21 @@
 import logging
 import tkinter as tk
-from tkinter import messagebox, ttk
-
-from registro_notas_alunos.backend import (AlunoService, DisciplinaService,
-                                           MatriculaService, NotasService)
+from tkinter import filedialog, messagebox, ttk
+
+from registro_notas_alunos.backend import (
+    AlunoService,
+    DisciplinaService,
+    MatriculaService,
+    NotasService,
+)
 from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.backend.notas.calculo import SITUACOES
+from registro_notas_alunos.backend.notas.exportacao import ExportadorNotas
+from registro_notas_alunos.backend.notas.vo import FiltroNotasVO
+from registro_notas_alunos.gui.alteracoes import ReceptorAlteracoes
+from registro_notas_alunos.gui.busca_aluno import CampoBuscaAluno
+from registro_notas_alunos.gui.tabela_virtual import ColunaTabela, TabelaVirtual
+from registro_notas_alunos.gui.tarefas import ExecutorTarefas
 
 logger = logging.getLogger(__name__)
 
@@ -17,6 +28,8 @@ class RelatorioDisciplinaScreen:
         self.matricula_service = MatriculaService(self.db)
         self.notas_service = NotasService(self.db)
         self.aluno_service = AlunoService(self.db)
+        self.disciplinas_dict = {}
+        self.filtro = FiltroNotasVO()
         self.create_window()
 
     def create_window(self):
@@ -25,10 +38,14 @@ class RelatorioDisciplinaScreen:
         self.window.title("Relatório de Disciplinas")
         self.window.geometry("1200x700")
         self.window.resizable(True, True)
+        self.tarefas = ExecutorTarefas(self.window)
+        self.alteracoes = ReceptorAlteracoes(
+            self.window, self.aplicar_alteracao, ("notas", "aluno", "disciplina")
+        )
 
         self.center_window()
         self.create_widgets()
-        self.carregar_filtros()
+        self.carregar_filtros(recarregar=False)
         self.gerar_relatorio()
 
     def center_window(self):
@@ -72,9 +89,23 @@ class RelatorioDisciplinaScreen:
 
         # Aluno
         ttk.Label(filter_frame, text="Aluno:").grid(row=1, column=0, sticky=tk.W, pady=5)
-        self.aluno_combo = ttk.Combobox(filter_frame, width=25, state="readonly")
+        self.aluno_combo = CampoBuscaAluno(
+            filter_frame,
+            buscar=self.aluno_service.buscar,
+            tarefas=self.tarefas,
+            opcao_todos="Todos",
+            width=25,
+        )
         self.aluno_combo.grid(row=1, column=1, columnspan=2, pady=5, padx=(10, 0))
 
+        # Situação (gravada pelo banco, filtrada pelo índice de notas.situacao)
+        ttk.Label(filter_frame, text="Situação:").grid(row=1, column=4, sticky=tk.W, pady=5)
+        self.situacao_combo = ttk.Combobox(
+            filter_frame, width=12, state="readonly", values=["Todas", *SITUACOES]
+        )
+        self.situacao_combo.grid(row=1, column=5, sticky=tk.W, pady=5, padx=(10, 20))
+        self.situacao_combo.set("Todas")
+
         # Botões
         button_frame = ttk.Frame(filter_frame)
         button_frame.grid(row=2, column=0, columnspan=6, pady=15)
@@ -120,49 +151,39 @@ class RelatorioDisciplinaScreen:
         )
         table_frame.grid(row=3, column=0, columnspan=4, sticky="nsew", pady=(0, 15))
 
-        columns = (
-            "Aluno",
-            "Matrícula",
-            "Disciplina",
-            "Ano/Sem",
-            "SM1",
-            "SM2",
-            "AV",
-            "AVS",
-            "NF",
-            "Situação",
+        # Tabela virtual: apenas as linhas visíveis são buscadas e desenhadas
+        self.tabela = TabelaVirtual(
+            table_frame,
+            colunas=[
+                ColunaTabela("Aluno", 150, tk.W, ordenacao="aluno"),
+                ColunaTabela("Matrícula", 100, tk.CENTER, ordenacao="id"),
+                ColunaTabela("Disciplina", 140, tk.W, ordenacao="disciplina"),
+                ColunaTabela("Ano/Sem", 80, tk.CENTER, ordenacao="periodo"),
+                ColunaTabela("SM1", 60, tk.CENTER, ordenacao="sm1"),
+                ColunaTabela("SM2", 60, tk.CENTER, ordenacao="sm2"),
+                ColunaTabela("AV", 60, tk.CENTER, ordenacao="av"),
+                ColunaTabela("AVS", 60, tk.CENTER, ordenacao="avs"),
+                ColunaTabela("NF", 70, tk.CENTER, ordenacao="nota_final"),
+                ColunaTabela("Situação", 100, tk.CENTER, ordenacao="situacao"),
+            ],
+            buscar_pagina=lambda limite, deslocamento, ordenacao, decrescente: (
+                self.notas_service.consultar_notas_apuradas(
+                    self.filtro, limite, deslocamento, ordenacao, decrescente
+                )
+            ),
+            buscar_apos=lambda limite, ultimo, ordenacao, decrescente: (
+                self.notas_service.consultar_notas_apuradas(
+                    self.filtro, limite, ordenacao=ordenacao, decrescente=decrescente, apos=ultimo
+                )
+            ),
+            contar=lambda: self.notas_service.contar_notas_apuradas(self.filtro),
+            formatar=self.formatar_linha,
+            chave=lambda nota_vo: nota_vo.id_nota,
+            tarefas=self.tarefas,
+            ao_falhar=self.erro_relatorio,
+            height=15,
         )
-        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings", height=15)
-
-        # Configurar colunas
-        self.tree.heading("Aluno", text="Aluno")
-        self.tree.heading("Matrícula", text="Matrícula")
-        self.tree.heading("Disciplina", text="Disciplina")
-        self.tree.heading("Ano/Sem", text="Ano/Sem")
-        self.tree.heading("SM1", text="SM1")
-        self.tree.heading("SM2", text="SM2")
-        self.tree.heading("AV", text="AV")
-        self.tree.heading("AVS", text="AVS")
-        self.tree.heading("NF", text="NF")
-        self.tree.heading("Situação", text="Situação")
-
-        self.tree.column("Aluno", width=150, anchor=tk.W)
-        self.tree.column("Matrícula", width=100, anchor=tk.CENTER)
-        self.tree.column("Disciplina", width=140, anchor=tk.W)
-        self.tree.column("Ano/Sem", width=80, anchor=tk.CENTER)
-        self.tree.column("SM1", width=60, anchor=tk.CENTER)
-        self.tree.column("SM2", width=60, anchor=tk.CENTER)
-        self.tree.column("AV", width=60, anchor=tk.CENTER)
-        self.tree.column("AVS", width=60, anchor=tk.CENTER)
-        self.tree.column("NF", width=70, anchor=tk.CENTER)
-        self.tree.column("Situação", width=100, anchor=tk.CENTER)
-
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        self.tree.configure(yscrollcommand=scrollbar.set)
-
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        scrollbar.grid(row=0, column=1, sticky="ns")
+        self.tabela.grid(row=0, column=0, sticky="nsew")
 
         # Botão fechar
         ttk.Button(main_frame, text="Fechar", command=self.window.destroy).grid(
@@ -177,15 +198,24 @@ class RelatorioDisciplinaScreen:
         table_frame.columnconfigure(0, weight=1)
         table_frame.rowconfigure(0, weight=1)
 
-    def carregar_filtros(self):
-        """Carrega os dados dos filtros"""
-        try:
-            # Carregar disciplinas
-            disciplinas = self.disciplina_service.listar_todas()
-
-            # Carregar alunos
-            alunos = self.aluno_service.listar_todos()
+    def carregar_filtros(self, recarregar=True):
+        """
+        Carrega os dados dos filtros em segundo plano
+
+        Args:
+            recarregar: Ignora a lista em cache; False ao abrir a tela
+        """
+        self.tarefas.executar(
+            "filtros",
+            self.disciplina_service.listar_todas,
+            recarregar,
+            ao_concluir=self.preencher_filtros,
+            ao_falhar=self.erro_filtros,
+        )
 
+    def preencher_filtros(self, disciplinas):
+        """Preenche os combos de filtro com as disciplinas; alunos são buscados ao digitar"""
+        try:
             # Extrair anos e semestres únicos
             anos = sorted(set(disc.ano for disc in disciplinas))
             semestres = sorted(set(disc.semestre for disc in disciplinas))
@@ -198,107 +228,85 @@ class RelatorioDisciplinaScreen:
             self.disciplinas_dict = {f"{disc.nome}": disc.id for disc in disciplinas}
             self.disciplina_combo["values"] = ["Todas"] + list(self.disciplinas_dict.keys())
 
-            # Alunos
-            self.alunos_dict = {aluno.nome: aluno.id for aluno in alunos}
-            self.aluno_combo["values"] = ["Todos"] + list(self.alunos_dict.keys())
-
             # Valores padrão
             self.ano_combo.set("Todos")
             self.semestre_combo.set("Todos")
             self.disciplina_combo.set("Todas")
-            self.aluno_combo.set("Todos")
 
         except Exception as e:
-            logger.error(f"Erro ao carregar filtros: {e}")
-            messagebox.showerror("Erro", f"Erro ao carregar filtros:\n{str(e)}")
+            self.erro_filtros(e)
+
+    def erro_filtros(self, e):
+        """Exibe o erro da carga dos filtros"""
+        logger.error(f"Erro ao carregar filtros: {e}")
+        messagebox.showerror("Erro", f"Erro ao carregar filtros:\n{str(e)}")
 
     def gerar_relatorio(self):
-        """Gera o relatório com base nos filtros"""
+        """Gera o relatório com base nos filtros, consultando o banco em segundo plano"""
         try:
-            # Limpar tabela
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Obter filtros
-            ano_filtro = self.ano_combo.get()
-            semestre_filtro = self.semestre_combo.get()
-            disciplina_filtro = self.disciplina_combo.get()
-            aluno_filtro = self.aluno_combo.get()
-
-            # Buscar todas as notas com detalhes
-            notas_apuradas = self.notas_service.listar_com_detalhes()
-
-            # Aplicar filtros
-            registros_filtrados = []
-            for nota_vo in notas_apuradas:
-                # Filtro de ano
-                if ano_filtro != "Todos" and nota_vo.disciplina.ano != int(ano_filtro):
-                    continue
-
-                # Filtro de semestre
-                if semestre_filtro != "Todos" and nota_vo.disciplina.semestre != int(
-                    semestre_filtro
-                ):
-                    continue
-
-                # Filtro de disciplina
-                if disciplina_filtro != "Todas" and nota_vo.disciplina.nome != disciplina_filtro:
-                    continue
-
-                # Filtro de aluno
-                if aluno_filtro != "Todos" and nota_vo.nome_aluno != aluno_filtro:
-                    continue
-
-                registros_filtrados.append(nota_vo)
-
-            # Estatísticas gerais
-            total_registros = len(registros_filtrados)
-            disciplinas_unicas = set()
-            alunos_unicos = set()
-            aprovados = 0
-            reprovados = 0
-
-            # Processar registros e adicionar à tabela
-            for nota_vo in registros_filtrados:
-                disciplinas_unicas.add(nota_vo.disciplina.nome)
-                alunos_unicos.add(nota_vo.nome_aluno)
-
-                if nota_vo.situacao == "APROVADO":
-                    aprovados += 1
-                elif nota_vo.situacao == "REPROVADO":
-                    reprovados += 1
-
-                # Formatear situação com símbolo
-                situacao_display = nota_vo.situacao
-                if nota_vo.situacao == "APROVADO":
-                    situacao_display = "✓ APROVADO"
-                elif nota_vo.situacao == "REPROVADO":
-                    situacao_display = "✗ REPROVADO"
-                elif nota_vo.situacao == "PENDENTE":
-                    situacao_display = "⏳ PENDENTE"
-
-                # Adicionar linha na tabela
-                self.tree.insert(
-                    "",
-                    tk.END,
-                    values=(
-                        nota_vo.nome_aluno,
-                        nota_vo.id_nota,  # Usando id_nota como proxy para matrícula
-                        nota_vo.disciplina.nome,
-                        f"{nota_vo.disciplina.ano}/{nota_vo.disciplina.semestre}",
-                        nota_vo.get_sm1_display(),
-                        nota_vo.get_sm2_display(),
-                        nota_vo.get_av_display(),
-                        nota_vo.get_avs_display(),
-                        nota_vo.get_nota_final_display(),
-                        situacao_display,
-                    ),
-                )
+            # Filtros lidos dos combos aqui, na thread da interface
+            self.filtro = self.obter_filtro()
+        except Exception as e:
+            self.erro_relatorio(e)
+            return
+
+        # A tabela busca apenas as páginas visíveis com o novo filtro
+        self.tabela.recarregar()
+        self.atualizar_estatisticas()
+
+    def atualizar_estatisticas(self):
+        """Calcula as estatísticas do filtro atual em segundo plano"""
+        # Estatísticas calculadas no banco com os mesmos filtros; um novo relatório
+        # descarta o resultado de um pedido anterior ainda pendente
+        self.tarefas.executar(
+            "estatisticas",
+            self.notas_service.estatisticas,
+            self.filtro,
+            ao_concluir=self.exibir_estatisticas,
+            ao_falhar=self.erro_relatorio,
+        )
+
+    def aplicar_alteracao(self, alteracao):
+        """Atualiza o relatório com alterações feitas por outro cliente"""
+        # Inclusões de alunos e disciplinas não mudam as notas existentes
+        if alteracao.tabela != "notas" and alteracao.operacao == "INSERT":
+            return
+
+        self.tabela.renovar()
+        self.atualizar_estatisticas()
+
+    def formatar_linha(self, nota_vo):
+        """Converte uma nota apurada nos valores das colunas da tabela"""
+        # Formatear situação com símbolo
+        situacao_display = nota_vo.situacao
+        if nota_vo.situacao == "APROVADO":
+            situacao_display = "✓ APROVADO"
+        elif nota_vo.situacao == "REPROVADO":
+            situacao_display = "✗ REPROVADO"
+        elif nota_vo.situacao == "PENDENTE":
+            situacao_display = "⏳ PENDENTE"
+
+        return (
+            nota_vo.nome_aluno,
+            nota_vo.id_nota,  # Usando id_nota como proxy para matrícula
+            nota_vo.disciplina.nome,
+            f"{nota_vo.disciplina.ano}/{nota_vo.disciplina.semestre}",
+            nota_vo.get_sm1_display(),
+            nota_vo.get_sm2_display(),
+            nota_vo.get_av_display(),
+            nota_vo.get_avs_display(),
+            nota_vo.get_nota_final_display(),
+            situacao_display,
+        )
 
-            # Calcular estatísticas
-            total_disciplinas = len(disciplinas_unicas)
-            total_alunos = len(alunos_unicos)
-            perc_aprovacao = (aprovados / total_registros * 100) if total_registros > 0 else 0
+    def exibir_estatisticas(self, relatorio):
+        """Atualiza o resumo estatístico com o resultado de NotasService.estatisticas"""
+        try:
+            estatisticas = relatorio.geral
+            total_registros = estatisticas.total_registros
+            total_disciplinas = estatisticas.total_disciplinas
+            total_alunos = estatisticas.total_alunos
+            perc_aprovacao = estatisticas.percentual_aprovacao
 
             # Atualizar estatísticas
             self.total_registros_label.config(text=f"Total de Registros: {total_registros}")
@@ -311,48 +319,71 @@ class RelatorioDisciplinaScreen:
             )
 
         except Exception as e:
-            logger.error(f"Erro ao gerar relatório: {e}")
-            messagebox.showerror("Erro", f"Erro ao gerar relatório:\n{str(e)}")
+            self.erro_relatorio(e)
+
+    def erro_relatorio(self, e):
+        """Exibe o erro da geração do relatório"""
+        logger.error(f"Erro ao gerar relatório: {e}")
+        messagebox.showerror("Erro", f"Erro ao gerar relatório:\n{str(e)}")
+
+    def obter_filtro(self) -> FiltroNotasVO:
+        """Monta o filtro da consulta a partir dos combos da tela"""
+        ano_filtro = self.ano_combo.get()
+        semestre_filtro = self.semestre_combo.get()
+        disciplina_filtro = self.disciplina_combo.get()
+        aluno_filtro = self.aluno_combo.aluno_selecionado()
+        situacao_filtro = self.situacao_combo.get()
+
+        return FiltroNotasVO(
+            ano=int(ano_filtro) if ano_filtro not in ("", "Todos") else None,
+            semestre=int(semestre_filtro) if semestre_filtro not in ("", "Todos") else None,
+            nome_disciplina=disciplina_filtro if disciplina_filtro not in ("", "Todas") else None,
+            id_aluno=aluno_filtro.id if aluno_filtro else None,
+            situacao=situacao_filtro if situacao_filtro not in ("", "Todas") else None,
+        )
 
     def limpar_filtros(self):
         """Limpa todos os filtros"""
         self.ano_combo.set("Todos")
         self.semestre_combo.set("Todos")
         self.disciplina_combo.set("Todas")
-        self.aluno_combo.set("Todos")
+        self.aluno_combo.limpar()
+        self.situacao_combo.set("Todas")
         self.gerar_relatorio()
 
     def exportar_dados(self):
-        """Exporta os dados para um formato legível"""
-        try:
-            dados = []
-            for child in self.tree.get_children():
-                values = self.tree.item(child)["values"]
-                dados.append(values)
-
-            if not dados:
-                messagebox.showwarning("Aviso", "Nenhum dado para exportar!")
-                return
-
-            # Por enquanto, apenas mostra resumo
-            resumo = "RELATÓRIO DE DISCIPLINAS\n"
-            resumo += "=" * 50 + "\n\n"
-            resumo += "Filtros aplicados:\n"
-            resumo += f"Ano: {self.ano_combo.get()}\n"
-            resumo += f"Semestre: {self.semestre_combo.get()}\n"
-            resumo += f"Disciplina: {self.disciplina_combo.get()}\n"
-            resumo += f"Aluno: {self.aluno_combo.get()}\n\n"
-
-            resumo += "Estatísticas:\n"
-            resumo += f"{self.total_registros_label.cget('text')}\n"
-            resumo += f"{self.total_disciplinas_label.cget('text')}\n"
-            resumo += f"{self.total_alunos_label.cget('text')}\n"
-            resumo += f"{self.aprovacao_geral_label.cget('text')}\n\n"
-
-            resumo += f"Total de registros no relatório: {len(dados)}\n"
-
-            messagebox.showinfo("Exportação", resumo)
+        """Exporta as notas do relatório atual direto do banco, em segundo plano"""
+        total = self.tabela.total or 0
+        if not total:
+            messagebox.showwarning("Aviso", "Nenhum dado para exportar!")
+            return
+
+        destino = filedialog.asksaveasfilename(
+            parent=self.window,
+            title="Exportar notas",
+            defaultextension=".csv",
+            filetypes=[
+                ("CSV", "*.csv"),
+                ("JSON Lines", "*.jsonl"),
+                ("Parquet", "*.parquet"),
+            ],
+        )
+        if not destino:
+            return
+
+        # Usa o filtro do relatório exibido, não o dos combos ainda não aplicados
+        self.tarefas.executar(
+            "exportacao",
+            ExportadorNotas(self.db).exportar,
+            destino,
+            self.filtro,
+            ao_concluir=lambda linhas: messagebox.showinfo(
+                "Exportação", f"{linhas} registros exportados para\n{destino}", parent=self.window
+            ),
+            ao_falhar=self.erro_exportacao,
+        )
 
-        except Exception as e:
-            logger.error(f"Erro ao exportar dados: {e}")
-            messagebox.showerror("Erro", f"Erro ao exportar dados:\n{str(e)}")
+    def erro_exportacao(self, e):
+        """Exibe o erro da exportação"""
+        logger.error(f"Erro ao exportar dados: {e}")
+        messagebox.showerror("Erro", f"Erro ao exportar dados:\n{str(e)}")
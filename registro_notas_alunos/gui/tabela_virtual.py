@@ -0,0 +1,503 @@
+"""
+Tabela virtual: Treeview que exibe apenas as linhas visíveis
+
+O Treeview fica lento com dezenas de milhares de itens. TabelaVirtual mantém no
+widget somente as linhas que cabem na tela; a barra de rolagem representa o
+total de registros e as páginas são buscadas sob demanda, em segundo plano,
+com a paginação e a ordenação da camada de serviço. Clicar no cabeçalho de uma
+coluna ordenável refaz a consulta com a nova ordem, sem recontar os registros.
+
+Na rolagem para baixo, a página seguinte continua a partir do último registro
+da página anterior (buscar_apos, paginação por chave), com custo independente
+da profundidade. LIMIT/OFFSET fica para os saltos da barra de rolagem e para a
+rolagem para cima a partir de uma página fora da memória.
+
+    tabela = TabelaVirtual(
+        frame,
+        colunas=[ColunaTabela("ID", 50, ordenacao="id"), ...],
+        buscar_pagina=lambda limite, deslocamento, ordenacao, decrescente: ...,
+        buscar_apos=lambda limite, ultimo, ordenacao, decrescente: ...,
+        contar=notas_service.contar_notas_apuradas,
+        formatar=lambda nota: (nota.id_nota, ...),
+        chave=lambda nota: nota.id_nota,
+        tarefas=ExecutorTarefas(janela),
+    )
+"""
+
+import logging
+import tkinter as tk
+from collections import OrderedDict
+from dataclasses import dataclass
+from tkinter import ttk
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from registro_notas_alunos.gui.tarefas import ExecutorTarefas
+
+logger = logging.getLogger(__name__)
+
+# Páginas mantidas em memória; as menos usadas são descartadas
+_PAGINAS_EM_CACHE = 20
+
+# Medidas usadas até que a primeira linha seja desenhada
+_ALTURA_LINHA_PADRAO = 20
+_ALTURA_CABECALHO_PADRAO = 25
+
+
+@dataclass
+class ColunaTabela:
+    """
+    Coluna de uma TabelaVirtual
+    """
+
+    titulo: str
+    largura: int = 100
+    alinhamento: str = tk.W
+    # Chave de ordenação repassada a buscar_pagina; None se não for ordenável
+    ordenacao: Optional[str] = None
+
+
+class TabelaVirtual(ttk.Frame):
+    """
+    Treeview paginado que desenha apenas a janela visível de linhas
+    """
+
+    def __init__(
+        self,
+        master,
+        colunas: List[ColunaTabela],
+        buscar_pagina: Callable[[int, int, Optional[str], bool], List[Any]],
+        contar: Callable[[], int],
+        formatar: Callable[[Any], tuple],
+        chave: Callable[[Any], Hashable],
+        tarefas: ExecutorTarefas,
+        ao_selecionar: Optional[Callable[[Any], None]] = None,
+        ao_falhar: Optional[Callable[[Exception], None]] = None,
+        buscar_apos: Optional[Callable[[int, Any, Optional[str], bool], List[Any]]] = None,
+        tamanho_pagina: int = 100,
+        ordenacao: Optional[str] = None,
+        height: int = 12,
+    ):
+        """
+        Cria a tabela
+
+        Args:
+            master: Widget pai
+            colunas: Colunas exibidas
+            buscar_pagina: Recebe (limite, deslocamento, ordenacao, decrescente) e
+                retorna os registros; roda fora da thread da interface
+            contar: Retorna o total de registros; roda fora da thread da interface
+            formatar: Converte um registro nos valores das colunas
+            chave: Retorna o identificador único de um registro
+            tarefas: Executor das consultas da tela
+            ao_selecionar: Chamado com o registro quando o usuário seleciona uma linha
+            ao_falhar: Chamado com a exceção de uma consulta (opcional)
+            buscar_apos: Recebe (limite, último registro da página anterior,
+                ordenacao, decrescente) e retorna os registros seguintes; roda
+                fora da thread da interface (opcional, sem ela toda página usa
+                buscar_pagina)
+            tamanho_pagina: Registros buscados por consulta
+            ordenacao: Ordenação inicial (opcional)
+            height: Linhas visíveis iniciais
+        """
+        super().__init__(master)
+        self.colunas = colunas
+        self.buscar_pagina = buscar_pagina
+        self.contar = contar
+        self.formatar = formatar
+        self.chave = chave
+        self.tarefas = tarefas
+        self.ao_selecionar = ao_selecionar
+        self.ao_falhar = ao_falhar
+        self.buscar_apos = buscar_apos
+        self.tamanho_pagina = tamanho_pagina
+        self.ordenacao = ordenacao
+        self.decrescente = False
+
+        self.total: Optional[int] = None
+        self.inicio = 0
+        self.visiveis = height
+        self.selecionada: Optional[Hashable] = None
+        self._paginas: "OrderedDict[int, List[Any]]" = OrderedDict()
+        # Último registro de cada página como veio do banco, ponto de partida da
+        # página seguinte; atualizar_registro não o altera
+        self._ultimos: Dict[int, Any] = {}
+        self._desenhadas: Dict[str, Any] = {}
+        self._versao = 0
+        self._tarefa_pagina = f"pagina-{id(self)}"
+        self._tarefa_total = f"total-{id(self)}"
+
+        titulos = [coluna.titulo for coluna in colunas]
+        self.tree = ttk.Treeview(
+            self, columns=titulos, show="headings", height=height, selectmode="browse"
+        )
+        for coluna in colunas:
+            self.tree.heading(
+                coluna.titulo,
+                text=coluna.titulo,
+                command=lambda c=coluna: self.ordenar_por(c),
+            )
+            self.tree.column(coluna.titulo, width=coluna.largura, anchor=coluna.alinhamento)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._rolar)
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.tree.bind("<<TreeviewSelect>>", self._ao_selecionar_linha)
+        self.tree.bind("<Configure>", self._ao_redimensionar)
+        self.tree.bind("<MouseWheel>", self._ao_rolar_mouse)
+        self.tree.bind("<Button-4>", lambda e: self._rolar("scroll", -3, "units"))
+        self.tree.bind("<Button-5>", lambda e: self._rolar("scroll", 3, "units"))
+        self.tree.bind("<Up>", lambda e: self._mover_selecao(-1))
+        self.tree.bind("<Down>", lambda e: self._mover_selecao(1))
+        self.tree.bind("<Prior>", lambda e: self._rolar("scroll", -1, "pages"))
+        self.tree.bind("<Next>", lambda e: self._rolar("scroll", 1, "pages"))
+
+    def recarregar(self, recontar: bool = True) -> None:
+        """
+        Descarta as páginas em memória e volta ao início da tabela
+
+        Args:
+            recontar: Busca o total de novo; False mantém o total conhecido
+                (ex.: só a ordenação mudou)
+        """
+        self._versao += 1
+        self._paginas.clear()
+        self._ultimos.clear()
+        self.inicio = 0
+        if recontar or self.total is None:
+            self.total = None
+            self.tarefas.executar(
+                self._tarefa_total,
+                self.contar,
+                ao_concluir=lambda total, versao=self._versao: self._definir_total(total, versao),
+                ao_falhar=self._falhar,
+            )
+        self._desenhar()
+
+    def renovar(self) -> None:
+        """
+        Busca de novo o total e as linhas visíveis, mantendo a posição
+
+        Usado quando outro cliente altera os dados: as linhas atuais continuam
+        na tela até a resposta, e as páginas fora da janela são descartadas.
+        """
+        self._versao += 1
+        primeira = self.inicio // self.tamanho_pagina
+        ultima = (self.inicio + max(self.visiveis, 1) - 1) // self.tamanho_pagina
+        for pagina in [numero for numero in self._paginas if not primeira <= numero <= ultima]:
+            self._descartar(pagina)
+
+        self.tarefas.executar(
+            self._tarefa_total,
+            self.contar,
+            ao_concluir=lambda total, versao=self._versao: self._definir_total(total, versao),
+            ao_falhar=self._falhar,
+        )
+        self._buscar(primeira, ultima)
+
+    def ordenar_por(self, coluna: ColunaTabela) -> None:
+        """
+        Ordena a tabela pela coluna; a segunda chamada inverte a direção
+
+        Args:
+            coluna: Coluna clicada; ignorada se não for ordenável
+        """
+        if coluna.ordenacao is None:
+            return
+
+        if self.ordenacao == coluna.ordenacao:
+            self.decrescente = not self.decrescente
+        else:
+            self.ordenacao = coluna.ordenacao
+            self.decrescente = False
+
+        for outra in self.colunas:
+            texto = outra.titulo
+            if outra is coluna:
+                texto += " ▼" if self.decrescente else " ▲"
+            self.tree.heading(outra.titulo, text=texto)
+
+        # A ordem não muda a quantidade de registros
+        self.recarregar(recontar=False)
+
+    def limpar_selecao(self) -> None:
+        """Remove a seleção da tabela"""
+        self.selecionada = None
+        self.tree.selection_remove(self.tree.selection())
+
+    def registro(self, chave: Hashable) -> Optional[Any]:
+        """
+        Retorna o registro com a chave informada, se estiver em memória
+
+        Args:
+            chave: Chave do registro
+
+        Returns:
+            Registro ou None se sua página não estiver carregada
+        """
+        localizacao = self._localizar(chave)
+        if localizacao is None:
+            return None
+        pagina, posicao = localizacao
+        return self._paginas[pagina][posicao]
+
+    def atualizar_registro(self, registro: Any) -> None:
+        """
+        Troca um registro alterado na memória e na linha exibida, sem consultar o banco
+
+        A linha permanece na posição atual até a próxima recarga, mesmo que a
+        alteração mude sua posição na ordenação.
+
+        Args:
+            registro: Registro alterado
+        """
+        chave = self.chave(registro)
+        localizacao = self._localizar(chave)
+        if localizacao is None:
+            return
+        pagina, posicao = localizacao
+        self._paginas[pagina][posicao] = registro
+
+        iid = str(chave)
+        if iid in self._desenhadas:
+            self._desenhadas[iid] = registro
+            self.tree.item(iid, values=self.formatar(registro))
+
+    def remover_registro(self, chave: Hashable) -> None:
+        """
+        Remove um registro excluído da memória e da tela
+
+        As linhas seguintes sobem uma posição; as páginas posteriores, agora
+        deslocadas, são descartadas e só voltam a ser buscadas se ficarem visíveis.
+
+        Args:
+            chave: Chave do registro excluído
+        """
+        if self.selecionada == chave:
+            self.selecionada = None
+
+        localizacao = self._localizar(chave)
+        if self.total is not None:
+            self.total = max(self.total - 1, 0)
+        if localizacao is None:
+            self._desenhar()
+            return
+
+        pagina, posicao = localizacao
+        del self._paginas[pagina][posicao]
+        for posterior in [numero for numero in self._paginas if numero > pagina]:
+            self._descartar(posterior)
+        self._desenhar()
+
+    def registro_incluido(self) -> None:
+        """
+        Avisa a tabela que um registro foi incluído
+
+        A posição do novo registro depende da ordenação feita no banco; as páginas
+        em memória são descartadas e apenas a janela visível é buscada de novo,
+        sem recontar a tabela.
+        """
+        self._versao += 1
+        self._paginas.clear()
+        self._ultimos.clear()
+        if self.total is not None:
+            self.total += 1
+        self._desenhar()
+
+    def _descartar(self, pagina: int) -> None:
+        """Remove uma página da memória"""
+        self._paginas.pop(pagina, None)
+        self._ultimos.pop(pagina, None)
+
+    def _localizar(self, chave: Hashable) -> Optional[tuple]:
+        """Retorna (página, posição) do registro em memória"""
+        for pagina, registros in self._paginas.items():
+            for posicao, registro in enumerate(registros):
+                if self.chave(registro) == chave:
+                    return pagina, posicao
+        return None
+
+    def _definir_total(self, total: int, versao: int) -> None:
+        """Recebe o resultado de contar()"""
+        if versao != self._versao:
+            return
+        self.total = total
+        self._desenhar()
+
+    def _falhar(self, erro: Exception) -> None:
+        """Repassa o erro de uma consulta à tela"""
+        if self.ao_falhar is not None:
+            self.ao_falhar(erro)
+        else:
+            logger.error(f"Erro ao carregar tabela: {erro}", exc_info=erro)
+
+    def _limite(self) -> int:
+        """Total conhecido de linhas, ou uma estimativa enquanto a contagem não chega"""
+        if self.total is not None:
+            return self.total
+        carregadas = sum(len(pagina) for pagina in self._paginas.values())
+        return max(carregadas, self.inicio + self.visiveis)
+
+    def _desenhar(self) -> None:
+        """Substitui as linhas do Treeview pela janela visível e busca o que faltar"""
+        self.inicio = max(0, min(self.inicio, self._limite() - self.visiveis))
+        fim = min(self.inicio + self.visiveis, self._limite())
+
+        registros = []
+        faltantes = []
+        for indice in range(self.inicio, fim):
+            pagina, posicao = divmod(indice, self.tamanho_pagina)
+            linhas = self._paginas.get(pagina)
+            # Página ausente, ou encurtada por remover_registro
+            if linhas is None or posicao >= len(linhas):
+                if pagina not in faltantes:
+                    faltantes.append(pagina)
+                continue
+            self._paginas.move_to_end(pagina)
+            registros.append(linhas[posicao])
+
+        self.tree.delete(*self.tree.get_children())
+        self._desenhadas = {}
+        for registro in registros:
+            iid = str(self.chave(registro))
+            self._desenhadas[iid] = registro
+            self.tree.insert("", tk.END, iid=iid, values=self.formatar(registro))
+
+        # Mantém a seleção ao rolar; o evento gerado é ignorado em _ao_selecionar_linha
+        iid_selecionado = str(self.selecionada)
+        if self.selecionada is not None and iid_selecionado in self._desenhadas:
+            self.tree.selection_set(iid_selecionado)
+
+        limite = self._limite()
+        if limite:
+            self.scrollbar.set(self.inicio / limite, fim / limite)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+        if faltantes:
+            self._buscar(faltantes[0], faltantes[-1])
+
+    def _buscar(self, primeira: int, ultima: int) -> None:
+        """
+        Busca em uma consulta as páginas de primeira a ultima
+
+        Se a página anterior está completa em memória, a busca continua a
+        partir do último registro dela (buscar_apos); senão usa o deslocamento.
+        """
+        versao = self._versao
+        limite = (ultima - primeira + 1) * self.tamanho_pagina
+
+        anterior = self._paginas.get(primeira - 1)
+        ultimo = self._ultimos.get(primeira - 1)
+        if (
+            self.buscar_apos is not None
+            and ultimo is not None
+            and anterior is not None
+            # Página encurtada por remover_registro: as posições já não batem
+            and len(anterior) == self.tamanho_pagina
+        ):
+            funcao, posicao = self.buscar_apos, ultimo
+        else:
+            funcao, posicao = self.buscar_pagina, primeira * self.tamanho_pagina
+
+        # Rolar de novo substitui esta busca se ela ainda estiver pendente
+        self.tarefas.executar(
+            self._tarefa_pagina,
+            funcao,
+            limite,
+            posicao,
+            self.ordenacao,
+            self.decrescente,
+            ao_concluir=lambda registros: self._receber(registros, primeira, limite, versao),
+            ao_falhar=self._falhar,
+        )
+
+    def _receber(self, registros: List[Any], primeira: int, limite: int, versao: int) -> None:
+        """Guarda as páginas recebidas e redesenha"""
+        if versao != self._versao:
+            return
+
+        for numero in range(limite // self.tamanho_pagina):
+            inicio = numero * self.tamanho_pagina
+            pagina = registros[inicio : inicio + self.tamanho_pagina]
+            self._paginas[primeira + numero] = pagina
+            self._ultimos[primeira + numero] = pagina[-1] if pagina else None
+        while len(self._paginas) > _PAGINAS_EM_CACHE:
+            descartada, _ = self._paginas.popitem(last=False)
+            self._ultimos.pop(descartada, None)
+
+        # Resultado incompleto: a tabela termina aqui, mesmo antes da contagem
+        if len(registros) < limite:
+            self.total = primeira * self.tamanho_pagina + len(registros)
+
+        self._desenhar()
+
+    def _rolar(self, acao: str, quantidade, unidade: Optional[str] = None) -> str:
+        """Trata os comandos da barra de rolagem ("moveto" e "scroll")"""
+        if acao == "moveto":
+            self.inicio = int(float(quantidade) * self._limite())
+        elif acao == "scroll":
+            passo = self.visiveis if unidade == "pages" else 1
+            self.inicio += int(quantidade) * passo
+        self._desenhar()
+        return "break"
+
+    def _ao_rolar_mouse(self, event) -> str:
+        """Roda do mouse no Windows e no macOS"""
+        passos = -3 if event.delta > 0 else 3
+        return self._rolar("scroll", passos, "units")
+
+    def _mover_selecao(self, direcao: int) -> Optional[str]:
+        """Nas bordas da janela visível, as setas rolam a tabela"""
+        itens = self.tree.get_children()
+        foco = self.tree.focus()
+        if not itens or foco not in itens:
+            return None
+
+        posicao = itens.index(foco)
+        if 0 <= posicao + direcao < len(itens):
+            # Dentro da janela: comportamento padrão do Treeview
+            return None
+
+        self._rolar("scroll", direcao, "units")
+        itens = self.tree.get_children()
+        if itens:
+            destino = itens[-1] if direcao > 0 else itens[0]
+            self.tree.focus(destino)
+            self.tree.selection_set(destino)
+        return "break"
+
+    def _ao_redimensionar(self, event) -> None:
+        """Recalcula quantas linhas cabem na área do Treeview"""
+        itens = self.tree.get_children()
+        caixa = self.tree.bbox(itens[0]) if itens else None
+        if caixa:
+            _, topo, _, altura_linha = caixa
+        else:
+            topo, altura_linha = _ALTURA_CABECALHO_PADRAO, _ALTURA_LINHA_PADRAO
+
+        visiveis = max(1, (event.height - topo) // max(altura_linha, 1))
+        if visiveis != self.visiveis:
+            self.visiveis = visiveis
+            self._desenhar()
+
+    def _ao_selecionar_linha(self, event) -> None:
+        """Avisa a tela quando o usuário seleciona outra linha"""
+        selecao = self.tree.selection()
+        if not selecao:
+            return
+
+        registro = self._desenhadas.get(selecao[0])
+        if registro is None:
+            return
+
+        chave = self.chave(registro)
+        if chave == self.selecionada:
+            return
+
+        self.selecionada = chave
+        if self.ao_selecionar is not None:
+            self.ao_selecionar(registro)
@@ -0,0 +1,216 @@
+"""
+Execução de chamadas de serviço fora da thread da interface
+
+O Tkinter não é thread-safe: widgets só podem ser alterados pela thread do
+mainloop. ExecutorTarefas envia as chamadas de serviço para um pool de threads
+limitado e, com after(), verifica na thread da interface quais terminaram,
+entregando o resultado aos callbacks das telas. Cada tarefa tem uma chave; uma
+nova tarefa com a mesma chave substitui a anterior, cujo resultado é descartado.
+
+    self.tarefas = ExecutorTarefas(self.window)
+    self.tarefas.executar(
+        "tabela",
+        self.aluno_service.listar_todos,
+        ao_concluir=self.preencher_tabela,
+        ao_falhar=self.tratar_erro,
+    )
+"""
+
+import logging
+import os
+import threading
+import tkinter as tk
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Intervalo entre as verificações das tarefas pendentes
+_INTERVALO_PADRAO_MS = 30
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _pool_compartilhado() -> ThreadPoolExecutor:
+    """
+    Retorna o pool de threads compartilhado por todas as telas
+
+    O tamanho vem de GUI_MAX_WORKERS (padrão 4) e deve ficar abaixo de
+    DB_MAX_CONNECTIONS, pois cada tarefa em execução ocupa uma conexão.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            valor = os.getenv("GUI_MAX_WORKERS")
+            _pool = ThreadPoolExecutor(
+                max_workers=int(valor) if valor else 4, thread_name_prefix="gui-tarefa"
+            )
+        return _pool
+
+
+class ExecutorTarefas:
+    """
+    Executa chamadas de serviço em segundo plano e entrega o resultado ao Tk
+    """
+
+    def __init__(
+        self,
+        widget,
+        pool: Optional[Executor] = None,
+        intervalo_ms: int = _INTERVALO_PADRAO_MS,
+        ao_mudar_estado: Optional[Callable[[bool], None]] = None,
+    ):
+        """
+        Inicializa o executor de uma tela
+
+        Args:
+            widget: Janela da tela; recebe o cursor de ocupado e os after()
+            pool: Executor das chamadas (opcional, padrão: pool compartilhado)
+            intervalo_ms: Intervalo entre as verificações das tarefas pendentes
+            ao_mudar_estado: Chamado com True/False quando a tela fica ocupada ou livre
+        """
+        self.widget = widget
+        self.pool = pool or _pool_compartilhado()
+        self.intervalo_ms = intervalo_ms
+        self.ao_mudar_estado = ao_mudar_estado
+        self._pendentes: Dict[Hashable, Tuple[Future, Optional[Callable], Optional[Callable]]] = {}
+        self._agendamento = None
+        self._encerrado = False
+        self.widget.bind("<Destroy>", self._ao_destruir, add="+")
+
+    @property
+    def ocupado(self) -> bool:
+        """Indica se há tarefas aguardando resultado"""
+        return bool(self._pendentes)
+
+    def pendente(self, chave: Hashable) -> bool:
+        """
+        Indica se a tarefa da chave ainda aguarda resultado
+
+        Gravações consultam este estado para ignorar um segundo clique: executar
+        com a mesma chave descartaria o resultado da gravação já enviada.
+
+        Args:
+            chave: Chave da tarefa
+        """
+        return chave in self._pendentes
+
+    def executar(
+        self,
+        chave: Hashable,
+        funcao: Callable,
+        *args,
+        ao_concluir: Optional[Callable[[Any], None]] = None,
+        ao_falhar: Optional[Callable[[Exception], None]] = None,
+        **kwargs,
+    ) -> Optional[Future]:
+        """
+        Envia uma chamada para o pool de threads
+
+        Se já houver uma tarefa pendente com a mesma chave, ela é cancelada
+        (ou, se já estiver rodando, seu resultado é descartado). Os callbacks
+        são chamados na thread da interface.
+
+        Args:
+            chave: Identifica a tarefa; ex.: "tabela", "selecao"
+            funcao: Chamada executada no pool; não deve acessar widgets
+            *args: Argumentos posicionais da chamada
+            ao_concluir: Recebe o retorno da chamada (opcional)
+            ao_falhar: Recebe a exceção lançada pela chamada (opcional)
+            **kwargs: Argumentos nomeados da chamada
+
+        Returns:
+            Future da chamada, ou None se a tela já foi fechada
+        """
+        if self._encerrado:
+            return None
+
+        estava_ocupado = self.ocupado
+        self.cancelar(chave)
+        future = self.pool.submit(funcao, *args, **kwargs)
+        self._pendentes[chave] = (future, ao_concluir, ao_falhar)
+
+        if not estava_ocupado:
+            self._mudar_estado(True)
+        if self._agendamento is None:
+            self._agendamento = self.widget.after(self.intervalo_ms, self._coletar)
+        return future
+
+    def cancelar(self, chave: Optional[Hashable] = None) -> None:
+        """
+        Descarta a tarefa pendente da chave, ou todas se chave for None
+
+        Args:
+            chave: Chave da tarefa (opcional)
+        """
+        chaves = list(self._pendentes) if chave is None else [chave]
+        for item in chaves:
+            pendente = self._pendentes.pop(item, None)
+            if pendente is not None:
+                pendente[0].cancel()
+
+    def encerrar(self) -> None:
+        """Descarta as tarefas pendentes e para as verificações"""
+        self._encerrado = True
+        self.cancelar()
+        if self._agendamento is not None:
+            try:
+                self.widget.after_cancel(self._agendamento)
+            except tk.TclError:
+                pass
+            self._agendamento = None
+
+    def _coletar(self) -> None:
+        """Entrega os resultados das tarefas concluídas; roda na thread da interface"""
+        self._agendamento = None
+        if self._encerrado:
+            return
+
+        concluidas = [chave for chave, (future, _, _) in self._pendentes.items() if future.done()]
+        for chave in concluidas:
+            # Um callback anterior pode ter substituído ou cancelado a tarefa
+            pendente = self._pendentes.get(chave)
+            if pendente is None or not pendente[0].done():
+                continue
+            del self._pendentes[chave]
+            self._entregar(*pendente)
+
+        # Callbacks podem ter encerrado a tela ou agendado nova verificação
+        if self._encerrado or self._agendamento is not None:
+            return
+        if self._pendentes:
+            self._agendamento = self.widget.after(self.intervalo_ms, self._coletar)
+        else:
+            self._mudar_estado(False)
+
+    def _entregar(self, future: Future, ao_concluir, ao_falhar) -> None:
+        """Chama o callback correspondente ao resultado da tarefa"""
+        if future.cancelled():
+            return
+
+        erro = future.exception()
+        try:
+            if erro is not None:
+                if ao_falhar is None:
+                    logger.error(f"Erro em tarefa de segundo plano: {erro}", exc_info=erro)
+                else:
+                    ao_falhar(erro)
+            elif ao_concluir is not None:
+                ao_concluir(future.result())
+        except Exception as e:
+            logger.exception(f"Erro ao aplicar resultado de tarefa: {e}")
+
+    def _mudar_estado(self, ocupado: bool) -> None:
+        """Mostra ou remove o cursor de ocupado e avisa a tela"""
+        try:
+            self.widget.winfo_toplevel().configure(cursor="watch" if ocupado else "")
+        except tk.TclError:
+            return
+        if self.ao_mudar_estado is not None:
+            self.ao_mudar_estado(ocupado)
+
+    def _ao_destruir(self, event) -> None:
+        """Encerra o executor quando a janela da tela é fechada"""
+        if event.widget is self.widget:
+            self.encerrar()
@@ -0,0 +1,13 @@
+-- Índices para as consultas mais frequentes dos serviços
+
+-- MatriculaService.listar_por_disciplina e junções por disciplina
+CREATE INDEX IF NOT EXISTS idx_matricula_id_disciplina ON matricula (id_disciplina);
+
+-- NotasService.buscar_por_matricula
+CREATE INDEX IF NOT EXISTS idx_notas_id_matricula ON notas (id_matricula);
+
+-- DisciplinaService.listar_por_periodo (WHERE ano, semestre ORDER BY nome)
+CREATE INDEX IF NOT EXISTS idx_disciplina_ano_semestre ON disciplina (ano, semestre, nome);
+
+-- DisciplinaService.buscar_por_nome_ano_semestre
+CREATE INDEX IF NOT EXISTS idx_disciplina_nome_ano_semestre ON disciplina (nome, ano, semestre);
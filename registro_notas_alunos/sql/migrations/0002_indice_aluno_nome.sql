@@ -0,0 +1,4 @@
+-- Primeira página das notas apuradas em ordem de aluno (tabelas virtuais da
+-- interface): permite ler aluno já ordenado e parar após LIMIT linhas, em vez
+-- de ordenar todas as notas
+CREATE INDEX IF NOT EXISTS idx_aluno_nome ON aluno (nome);
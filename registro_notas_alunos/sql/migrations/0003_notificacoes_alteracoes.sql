@@ -0,0 +1,69 @@
+-- Eventos de alteração para invalidar caches e atualizar telas de outros clientes
+--
+-- Cada comando INSERT/UPDATE/DELETE em aluno, disciplina, matricula e notas
+-- publica um único NOTIFY no canal registro_notas_alteracoes, entregue apenas
+-- após o commit, com o payload JSON:
+--
+--     {"tabela": "aluno", "operacao": "UPDATE", "ids": [3, 7]}
+--
+-- Acima de 500 linhas os IDs são omitidos ("ids": null) e o ouvinte recarrega
+-- a tabela inteira; isso também mantém o payload abaixo do limite de 8000 bytes.
+
+CREATE OR REPLACE FUNCTION notificar_alteracao() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    ids integer[];
+BEGIN
+    -- As tabelas de transição só existem para as operações que as declaram
+    IF TG_OP = 'DELETE' THEN
+        SELECT array_agg(id) INTO ids FROM (SELECT id FROM linhas_antigas LIMIT 501) AS t;
+    ELSE
+        SELECT array_agg(id) INTO ids FROM (SELECT id FROM linhas_novas LIMIT 501) AS t;
+    END IF;
+
+    IF ids IS NULL THEN
+        RETURN NULL;
+    END IF;
+    IF cardinality(ids) > 500 THEN
+        ids := NULL;
+    END IF;
+
+    PERFORM pg_notify(
+        'registro_notas_alteracoes',
+        json_build_object('tabela', TG_TABLE_NAME, 'operacao', TG_OP, 'ids', ids)::text
+    );
+    RETURN NULL;
+END;
+$$;
+
+-- Tabelas de transição exigem um gatilho por operação
+DO $$
+DECLARE
+    tabela text;
+BEGIN
+    FOREACH tabela IN ARRAY ARRAY['aluno', 'disciplina', 'matricula', 'notas'] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_notificar_insert ON %1$I', tabela);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_notificar_update ON %1$I', tabela);
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%1$s_notificar_delete ON %1$I', tabela);
+
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_notificar_insert AFTER INSERT ON %1$I '
+            'REFERENCING NEW TABLE AS linhas_novas '
+            'FOR EACH STATEMENT EXECUTE FUNCTION notificar_alteracao()',
+            tabela
+        );
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_notificar_update AFTER UPDATE ON %1$I '
+            'REFERENCING NEW TABLE AS linhas_novas '
+            'FOR EACH STATEMENT EXECUTE FUNCTION notificar_alteracao()',
+            tabela
+        );
+        EXECUTE format(
+            'CREATE TRIGGER trg_%1$s_notificar_delete AFTER DELETE ON %1$I '
+            'REFERENCING OLD TABLE AS linhas_antigas '
+            'FOR EACH STATEMENT EXECUTE FUNCTION notificar_alteracao()',
+            tabela
+        );
+    END LOOP;
+END;
+$$;
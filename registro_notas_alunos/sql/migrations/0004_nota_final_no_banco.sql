@@ -0,0 +1,68 @@
+-- Nota final e situação calculadas pelo banco
+--
+-- Regra única, antes duplicada no modelo Notas ("Aprovado"/"Reprovado") e em
+-- NotasService ("APROVADO"/"REPROVADO"/"PENDENTE"):
+--
+--     NF = min(SM1, 1) + min(SM2, 1) + min(max(AV, AVS), 10)
+--     PENDENTE sem SM1, SM2 ou AV (NF nula); APROVADO com NF >= 6; senão REPROVADO
+--
+-- A soma é feita em numeric para somar os valores decimais gravados (ex.: 2.7)
+-- e não a representação binária de REAL. Um gatilho BEFORE INSERT/UPDATE grava
+-- nf e situacao em toda escrita, ignorando os valores enviados pelos clientes,
+-- de forma que as duas colunas sempre correspondem às notas e podem ser
+-- filtradas, ordenadas e agregadas diretamente.
+
+CREATE OR REPLACE FUNCTION nota_final(sm1 real, sm2 real, av real, avs real) RETURNS real
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE
+        WHEN sm1 IS NULL OR sm2 IS NULL OR av IS NULL THEN NULL
+        ELSE (
+            LEAST(sm1::numeric, 1)
+            + LEAST(sm2::numeric, 1)
+            + LEAST(GREATEST(av::numeric, COALESCE(avs::numeric, 0)), 10)
+        )::real
+    END
+$$;
+
+CREATE OR REPLACE FUNCTION situacao_nota(nf real) RETURNS varchar
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE
+        WHEN nf IS NULL THEN 'PENDENTE'
+        WHEN nf >= 6 THEN 'APROVADO'
+        ELSE 'REPROVADO'
+    END
+$$;
+
+CREATE OR REPLACE FUNCTION calcular_nota_final() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.nf := nota_final(NEW.sm1, NEW.sm2, NEW.av, NEW.avs);
+    NEW.situacao := situacao_nota(NEW.nf);
+    RETURN NEW;
+END;
+$$;
+
+-- Registros gravados com as regras anteriores
+UPDATE notas
+SET nf = nota_final(sm1, sm2, av, avs),
+    situacao = situacao_nota(nota_final(sm1, sm2, av, avs))
+WHERE (nf, situacao) IS DISTINCT FROM (
+    nota_final(sm1, sm2, av, avs), situacao_nota(nota_final(sm1, sm2, av, avs))
+);
+
+ALTER TABLE notas ALTER COLUMN nf DROP DEFAULT;
+ALTER TABLE notas ALTER COLUMN situacao SET DEFAULT 'PENDENTE';
+ALTER TABLE notas ALTER COLUMN situacao SET NOT NULL;
+ALTER TABLE notas DROP CONSTRAINT IF EXISTS ck_notas_situacao;
+ALTER TABLE notas ADD CONSTRAINT ck_notas_situacao
+    CHECK (situacao IN ('APROVADO', 'REPROVADO', 'PENDENTE'));
+
+DROP TRIGGER IF EXISTS trg_notas_calcular_nota_final ON notas;
+CREATE TRIGGER trg_notas_calcular_nota_final
+    BEFORE INSERT OR UPDATE ON notas
+    FOR EACH ROW EXECUTE FUNCTION calcular_nota_final();
+
+-- Filtros e contagens por situação (NotasService.consultar_notas_apuradas e
+-- estatisticas); nf atende a ordenação por nota final
+CREATE INDEX IF NOT EXISTS idx_notas_situacao ON notas (situacao);
+CREATE INDEX IF NOT EXISTS idx_notas_nf ON notas (nf);
@@ -0,0 +1,43 @@
+-- Busca de alunos por parte do nome ou da matrícula (AlunoService.buscar)
+--
+-- normalizar_busca remove acentos e passa para minúsculas, de forma que
+-- "joão" encontra "João" e "JOAO". translate é usado no lugar da extensão
+-- unaccent, que nem sempre está instalada e cuja função não é IMMUTABLE (não
+-- pode ser usada em índices nem em colunas geradas).
+--
+-- O nome normalizado fica gravado em nome_busca: translate com caracteres
+-- acentuados é caro, e calculá-lo a cada linha lida deixava a busca por trecho
+-- lenta sem índice de trigramas.
+--
+-- Com a extensão pg_trgm (incluída na imagem oficial do PostgreSQL), um índice
+-- GIN de trigramas atende a busca por trecho do nome (LIKE '%termo%') e a busca
+-- tolerante a erros de digitação (operador <%). Sem a extensão, a busca se
+-- limita a trechos exatos; o índice de prefixo atende os termos no início do
+-- nome.
+
+CREATE OR REPLACE FUNCTION normalizar_busca(texto text) RETURNS text
+LANGUAGE sql IMMUTABLE STRICT PARALLEL SAFE AS $$
+    SELECT lower(translate(
+        texto,
+        'ÁÀÂÃÄÅáàâãäåÉÈÊËéèêëÍÌÎÏíìîïÓÒÔÕÖóòôõöÚÙÛÜúùûüÇçÑñÝýÿ',
+        'AAAAAAaaaaaaEEEEeeeeIIIIiiiiOOOOOoooooUUUUuuuuCcNnYyy'
+    ))
+$$;
+
+ALTER TABLE aluno ADD COLUMN IF NOT EXISTS nome_busca text
+    GENERATED ALWAYS AS (normalizar_busca(nome)) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_aluno_nome_busca_prefixo
+    ON aluno (nome_busca text_pattern_ops);
+CREATE INDEX IF NOT EXISTS idx_aluno_matricula_prefixo
+    ON aluno (matricula text_pattern_ops);
+
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        EXECUTE 'CREATE INDEX IF NOT EXISTS idx_aluno_nome_busca_trgm '
+            'ON aluno USING gin (nome_busca gin_trgm_ops)';
+    END IF;
+END
+$$;
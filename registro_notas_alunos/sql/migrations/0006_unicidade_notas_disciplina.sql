@@ -0,0 +1,46 @@
+-- Unicidade de notas por matrícula e de disciplina por nome e período
+--
+-- Requisito de dados: cada matrícula tem no máximo uma linha em notas e não há
+-- duas disciplinas com o mesmo nome, ano e semestre. Os serviços dependem
+-- dessas regras (INSERT ... ON CONFLICT (id_matricula) em NotasService e
+-- paginação por (nome, ano, semestre) em DisciplinaService). Bancos com
+-- registros duplicados não são alterados: a migração para com a quantidade de
+-- duplicatas e a consulta que as lista, para que sejam corrigidas antes de
+-- executar migrar novamente.
+
+DO $$
+DECLARE
+    duplicadas integer;
+BEGIN
+    SELECT count(*) INTO duplicadas
+    FROM (
+        SELECT id_matricula FROM notas
+        WHERE id_matricula IS NOT NULL
+        GROUP BY id_matricula HAVING count(*) > 1
+    ) AS d;
+    IF duplicadas > 0 THEN
+        RAISE EXCEPTION 'Migração 0006: % matrícula(s) com mais de uma linha em notas', duplicadas
+            USING HINT = 'Liste com SELECT id_matricula, count(*) FROM notas '
+                'GROUP BY id_matricula HAVING count(*) > 1 e mantenha uma linha por matrícula';
+    END IF;
+
+    SELECT count(*) INTO duplicadas
+    FROM (
+        SELECT nome, ano, semestre FROM disciplina
+        GROUP BY nome, ano, semestre HAVING count(*) > 1
+    ) AS d;
+    IF duplicadas > 0 THEN
+        RAISE EXCEPTION 'Migração 0006: % disciplina(s) repetida(s) no mesmo ano e semestre', duplicadas
+            USING HINT = 'Liste com SELECT nome, ano, semestre, count(*) FROM disciplina '
+                'GROUP BY nome, ano, semestre HAVING count(*) > 1 e una as repetidas';
+    END IF;
+END
+$$;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_notas_id_matricula ON notas (id_matricula);
+CREATE UNIQUE INDEX IF NOT EXISTS uq_disciplina_nome_ano_semestre
+    ON disciplina (nome, ano, semestre);
+
+-- Os índices únicos atendem as mesmas consultas que os índices comuns da 0001
+DROP INDEX IF EXISTS idx_notas_id_matricula;
+DROP INDEX IF EXISTS idx_disciplina_nome_ano_semestre;
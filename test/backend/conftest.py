@@ -13,11 +13,20 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 from registro_notas_alunos.backend.aluno.model import Aluno
 from registro_notas_alunos.backend.disciplina.model import Disciplina
+from registro_notas_alunos.backend.lib.cache import cache_leitura
 from registro_notas_alunos.backend.lib.database import DatabaseConnection
 from registro_notas_alunos.backend.matricula.model import Matricula
 from registro_notas_alunos.backend.notas.model import Notas
 
 
+@pytest.fixture(autouse=True)
+def limpar_cache_leitura():
+    """Isola os testes do cache de leitura compartilhado pelos serviços"""
+    cache_leitura.limpar()
+    yield
+    cache_leitura.limpar()
+
+
 @pytest.fixture
 def mock_db():
     """Mock da conexão com banco de dados"""
@@ -33,39 +33,34 @@ class TestAlunoService:
     def test_criar_sucesso(self):
         """Testa criação de aluno com sucesso"""
         mock_db = Mock()
-        mock_db.execute_query.side_effect = [
-            [],  # buscar_por_matricula (não existe)
-            [(1,)],  # INSERT RETURNING id
-        ]
+        mock_db.execute_query.return_value = [(1,)]  # INSERT RETURNING id
 
         service = AlunoService(mock_db)
         id_criado = service.criar(nome="João Silva", matricula="2024001")
 
         assert id_criado == 1
-        assert mock_db.execute_query.call_count == 2
+        assert mock_db.execute_query.call_count == 1
+        assert "ON CONFLICT DO NOTHING" in mock_db.execute_query.call_args[0][0]
 
     def test_criar_matricula_duplicada(self):
         """Testa criação com matrícula duplicada"""
         mock_db = Mock()
-        # buscar_por_matricula retorna aluno existente
-        mock_db.execute_query.return_value = [(1, "Outro Aluno", "2024001")]
+        # INSERT ... ON CONFLICT DO NOTHING não retorna linha
+        mock_db.execute_query.return_value = []
 
         service = AlunoService(mock_db)
 
         with pytest.raises(Exception, match="Aluno já existe"):
             service.criar(nome="João Silva", matricula="2024001")
 
-    def test_criar_sem_resultado(self):
-        """Testa criação que falha sem retornar resultado"""
+    def test_criar_violacao_constraint(self):
+        """Testa criação quando o banco acusa chave duplicada"""
         mock_db = Mock()
-        mock_db.execute_query.side_effect = [
-            [],  # buscar_por_matricula (não existe)
-            [],  # INSERT falha
-        ]
+        mock_db.execute_query.side_effect = Exception("duplicate key value violates")
 
         service = AlunoService(mock_db)
 
-        with pytest.raises(Exception, match="Erro ao criar aluno"):
+        with pytest.raises(Exception, match="Aluno já existe"):
             service.criar(nome="João Silva", matricula="2024001")
 
     def test_buscar_por_id_encontrado(self):
@@ -136,6 +131,24 @@ class TestAlunoService:
         with pytest.raises(ValueError, match="Matrícula é obrigatória"):
             service.buscar_por_matricula("   ")
 
+    def test_buscar_por_ids(self):
+        """Testa a busca de vários alunos em uma consulta"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(1, "João Silva", "2024001")]
+
+        service = AlunoService(mock_db)
+        alunos = service.buscar_por_ids((1, 2))
+
+        assert [aluno.id for aluno in alunos] == [1]
+        assert mock_db.execute_query.call_args[0][1] == ([1, 2],)
+
+    def test_buscar_por_ids_vazio(self):
+        """Testa que a lista vazia não consulta o banco"""
+        mock_db = Mock()
+
+        assert AlunoService(mock_db).buscar_por_ids([]) == []
+        mock_db.execute_query.assert_not_called()
+
     def test_listar_todos_com_resultados(self):
         """Testa listagem de todos os alunos com resultados"""
         mock_db = Mock()
@@ -151,6 +164,63 @@ class TestAlunoService:
         assert alunos[0].nome == "João Silva"
         assert alunos[1].nome == "Maria Santos"
 
+    def test_listar_todos_paginado(self):
+        """Testa a página de alunos montada sem passar pelo cache"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(1, "Ana", "01"), (2, "Bia", "02")]
+
+        service = AlunoService(mock_db)
+        pagina = service.listar_todos_paginado(limite=1)
+
+        assert [aluno.nome for aluno in pagina.itens] == ["Ana"]
+        assert pagina.proximo is not None
+        query, params = mock_db.execute_query.call_args[0]
+        assert query.endswith("ORDER BY nome, matricula LIMIT %s")
+        assert params == (2,)
+
+    def test_buscar_sem_trigramas(self):
+        """Testa a busca por trecho sem a extensão pg_trgm, com curingas escapados"""
+        mock_db = Mock()
+        mock_db.execute_query.side_effect = [
+            [(False,)],  # pg_trgm não instalada
+            [(1, "João Silva", "2024001")],
+        ]
+
+        service = AlunoService(mock_db)
+        result = service.buscar("  jo%o  ", limite=5)
+
+        assert [aluno.nome for aluno in result] == ["João Silva"]
+        query, params = mock_db.execute_query.call_args[0]
+        assert "nome_busca LIKE" in query
+        assert "<%" not in query
+        assert params == ("jo\\%o",) * 5 + (5,)
+
+    def test_buscar_com_trigramas(self):
+        """Testa que a busca tolerante a erros só é usada com pg_trgm, verificada uma vez"""
+        mock_db = Mock()
+        mock_db.execute_query.side_effect = [[(True,)], [], []]
+
+        service = AlunoService(mock_db)
+        service.buscar("Joao Slva")
+        service.buscar("Maria")
+
+        assert mock_db.execute_query.call_count == 3
+        query, params = mock_db.execute_query.call_args[0]
+        assert "normalizar_busca(%s) <%% nome_busca" in query
+        assert "word_similarity" in query
+        assert params[-1] == 20
+
+    def test_buscar_termo_vazio(self):
+        """Testa que termo em branco não consulta o banco"""
+        mock_db = Mock()
+        service = AlunoService(mock_db)
+
+        assert service.buscar("   ") == []
+        mock_db.execute_query.assert_not_called()
+
+        with pytest.raises(ValueError, match="Limite"):
+            service.buscar("Ana", limite=0)
+
     def test_listar_todos_sem_resultados(self):
         """Testa listagem quando não há alunos"""
         mock_db = Mock()
@@ -161,6 +231,43 @@ class TestAlunoService:
 
         assert alunos == []
 
+    def test_listar_todos_compartilha_cache(self):
+        """Testa que instâncias diferentes do serviço reaproveitam a lista"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(1, "João Silva", "2024001")]
+
+        AlunoService(mock_db).listar_todos()
+        alunos = AlunoService(mock_db).listar_todos()
+
+        assert alunos[0].nome == "João Silva"
+        assert mock_db.execute_query.call_count == 1
+
+    def test_listar_todos_recarregar(self):
+        """Testa a releitura forçada da lista"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(1, "João Silva", "2024001")]
+        service = AlunoService(mock_db)
+
+        service.listar_todos()
+        service.listar_todos(recarregar=True)
+
+        assert mock_db.execute_query.call_count == 2
+
+    def test_criar_invalida_cache(self):
+        """Testa que a inclusão descarta a lista em cache"""
+        mock_db = Mock()
+        mock_db.execute_query.side_effect = [
+            [(1, "João Silva", "2024001")],  # listar_todos
+            [(2,)],  # insert
+            [(1, "João Silva", "2024001"), (2, "Maria Santos", "2024002")],  # listar_todos
+        ]
+        service = AlunoService(mock_db)
+
+        service.listar_todos()
+        service.criar(nome="Maria Santos", matricula="2024002")
+
+        assert len(service.listar_todos()) == 2
+
     def test_atualizar_sucesso(self):
         """Testa atualização de aluno com sucesso"""
         mock_db = Mock()
@@ -0,0 +1,169 @@
+"""
+Testes unitários para o cache de leitura compartilhado
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.lib import cache as modulo_cache
+from registro_notas_alunos.backend.lib.cache import CacheLeitura
+from registro_notas_alunos.backend.lib.database import DatabaseConnection
+
+
+class Relogio:
+    """Substitui time.monotonic para controlar a validade das entradas"""
+
+    def __init__(self):
+        self.agora = 1000.0
+
+    def __call__(self):
+        return self.agora
+
+
+@pytest.fixture
+def relogio(monkeypatch):
+    """Relógio controlado pelo teste"""
+    relogio = Relogio()
+    monkeypatch.setattr(modulo_cache.time, "monotonic", relogio)
+    return relogio
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """DatabaseConnection com pool falso, para abrir transaction()"""
+    monkeypatch.setattr(DatabaseConnection, "_pool", MagicMock())
+    return object.__new__(DatabaseConnection)
+
+
+class TestCacheLeitura:
+    """Testes para CacheLeitura"""
+
+    def test_segunda_leitura_usa_cache(self, relogio):
+        """Testa que a consulta só roda na primeira leitura"""
+        cache = CacheLeitura(ttl_s=60, max_itens=10)
+        chamadas = []
+
+        def carregar():
+            chamadas.append(1)
+            return ["João"]
+
+        assert cache.obter(("aluno", "listar"), carregar) == ["João"]
+        assert cache.obter(("aluno", "listar"), carregar) == ["João"]
+        assert len(chamadas) == 1
+        assert (cache.acertos, cache.falhas) == (1, 1)
+
+    def test_entrada_vencida_e_consultada_de_novo(self, relogio):
+        """Testa a expiração pela validade"""
+        cache = CacheLeitura(ttl_s=60, max_itens=10)
+        valores = iter([1, 2])
+
+        assert cache.obter(("aluno",), lambda: next(valores)) == 1
+        relogio.agora += 61
+        assert cache.obter(("aluno",), lambda: next(valores)) == 2
+
+    def test_descarta_menos_usada(self, relogio):
+        """Testa o limite de entradas"""
+        cache = CacheLeitura(ttl_s=60, max_itens=2)
+        cache.obter(("a",), lambda: 1)
+        cache.obter(("b",), lambda: 2)
+        cache.obter(("a",), lambda: 1)
+        cache.obter(("c",), lambda: 3)
+
+        assert len(cache) == 2
+        assert cache.obter(("a",), lambda: "nova") == 1
+        assert cache.obter(("b",), lambda: "nova") == "nova"
+
+    def test_invalidar_grupo(self, relogio):
+        """Testa que invalidar descarta apenas o grupo informado"""
+        cache = CacheLeitura(ttl_s=60, max_itens=10)
+        cache.obter(("aluno", "listar"), lambda: 1)
+        cache.obter(("disciplina", "listar"), lambda: 2)
+
+        cache.invalidar("aluno")
+
+        assert cache.obter(("aluno", "listar"), lambda: "nova") == "nova"
+        assert cache.obter(("disciplina", "listar"), lambda: "nova") == 2
+
+    def test_leitura_concorrente_com_escrita_nao_e_guardada(self, relogio):
+        """Testa que uma leitura iniciada antes da invalidação não fica no cache"""
+        cache = CacheLeitura(ttl_s=60, max_itens=10)
+
+        def carregar_durante_escrita():
+            cache.invalidar("aluno")
+            return "antiga"
+
+        assert cache.obter(("aluno",), carregar_durante_escrita) == "antiga"
+        assert cache.obter(("aluno",), lambda: "nova") == "nova"
+
+    def test_recarregar_ignora_cache(self, relogio):
+        """Testa a releitura forçada"""
+        cache = CacheLeitura(ttl_s=60, max_itens=10)
+        cache.obter(("aluno",), lambda: 1)
+
+        assert cache.obter(("aluno",), lambda: 2, recarregar=True) == 2
+        assert cache.obter(("aluno",), lambda: 3) == 2
+
+    def test_ttl_zero_desliga(self):
+        """Testa que validade zero não guarda nada"""
+        cache = CacheLeitura(ttl_s=0, max_itens=10)
+        valores = iter([1, 2])
+
+        assert cache.obter(("aluno",), lambda: next(valores)) == 1
+        assert cache.obter(("aluno",), lambda: next(valores)) == 2
+        assert len(cache) == 0
+
+    def test_configuracao_por_ambiente(self, monkeypatch):
+        """Testa CACHE_TTL_SECONDS e CACHE_MAX_ITENS"""
+        monkeypatch.setenv("CACHE_TTL_SECONDS", "5")
+        monkeypatch.setenv("CACHE_MAX_ITENS", "3")
+
+        cache = CacheLeitura()
+
+        assert cache.ttl_s == 5.0
+        assert cache.max_itens == 3
+
+
+class TestCacheLeituraEmTransacao:
+    """Testes para CacheLeitura dentro de DatabaseConnection.transaction()"""
+
+    def test_leitura_em_transacao_nao_usa_nem_guarda(self, relogio, db):
+        """Testa que linhas não confirmadas não entram no cache"""
+        cache = CacheLeitura(ttl_s=60, max_itens=10)
+        cache.obter(("aluno",), lambda: "confirmada")
+
+        with db.transaction():
+            assert cache.obter(("disciplina",), lambda: "nao confirmada") == "nao confirmada"
+            assert cache.obter(("aluno",), lambda: "da transacao") == "da transacao"
+
+        assert cache.obter(("disciplina",), lambda: "nova") == "nova"
+        assert cache.obter(("aluno",), lambda: "nova") == "confirmada"
+
+    def test_invalidar_repete_apos_commit(self, relogio, db):
+        """Testa que uma leitura guardada por outra thread antes do commit é descartada"""
+        cache = CacheLeitura(ttl_s=60, max_itens=10)
+
+        with db.transaction():
+            cache.invalidar("aluno")
+            # Leitura de outra thread, que ainda não enxerga a escrita
+            cache._itens[("aluno",)] = (relogio.agora + 60, "antiga")
+
+        assert cache.obter(("aluno",), lambda: "nova") == "nova"
+
+    def test_invalidar_nao_repete_apos_rollback(self, relogio, db):
+        """Testa que o descarte registrado é abandonado no rollback"""
+        cache = CacheLeitura(ttl_s=60, max_itens=10)
+
+        with pytest.raises(ValueError):
+            with db.transaction():
+                cache.invalidar("aluno")
+                raise ValueError("erro de negócio")
+        cache.obter(("aluno",), lambda: "guardada")
+
+        assert db._local.ao_confirmar == []
+        assert cache.obter(("aluno",), lambda: "nova") == "guardada"
@@ -0,0 +1,31 @@
+"""
+Testes unitários para o cálculo da nota final
+"""
+
+import os
+import sys
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.notas.calculo import calcular_nota_final
+
+
+class TestCalcularNotaFinal:
+    """Testes para calcular_nota_final"""
+
+    def test_aprovado(self):
+        """Testa limites e substituição da AV pela AVS"""
+        assert calcular_nota_final(1.5, 0.5, 3.0, 12.0) == (11.5, "APROVADO")
+
+    def test_reprovado(self):
+        """Testa AVS menor que a AV, que é mantida"""
+        assert calcular_nota_final(0.5, 0.5, 4.0, 2.0) == (5.0, "REPROVADO")
+
+    def test_pendente(self):
+        """Testa matrícula sem AV"""
+        assert calcular_nota_final(1.0, 1.0, None, 9.0) == (None, "PENDENTE")
+
+    def test_arredonda_como_o_banco(self):
+        """Testa que 0.1 + 0.2 + 5.7 aprova, como a soma em numeric do banco"""
+        assert calcular_nota_final(0.1, 0.2, 5.7, None) == (6.0, "APROVADO")
@@ -0,0 +1,218 @@
+"""
+Testes unitários para DatabaseConnection
+"""
+
+import os
+import sys
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.lib.database import DatabaseConnection
+
+
+@pytest.fixture
+def pool_mock(monkeypatch):
+    """Pool de conexões falso que entrega uma conexão nova a cada getconn"""
+    conexoes = []
+
+    def getconn():
+        conn = MagicMock()
+        conexoes.append(conn)
+        return conn
+
+    fake_pool = MagicMock()
+    fake_pool.getconn.side_effect = getconn
+    fake_pool.conexoes = conexoes
+    monkeypatch.setattr(DatabaseConnection, "_pool", fake_pool)
+    return fake_pool
+
+
+@pytest.fixture
+def db(pool_mock):
+    """Instância de DatabaseConnection sem inicializar o pool real"""
+    return object.__new__(DatabaseConnection)
+
+
+def cursor_de(conn):
+    """Retorna o cursor usado dentro do bloco with conn.cursor()"""
+    return conn.cursor.return_value.__enter__.return_value
+
+
+class TestDatabaseConnection:
+    """Testes para DatabaseConnection"""
+
+    def test_execute_query_select_faz_commit_e_libera(self, db, pool_mock):
+        """Testa que uma query avulsa usa sua própria conexão e a devolve ao pool"""
+        db_conn = MagicMock()
+        pool_mock.getconn.side_effect = None
+        pool_mock.getconn.return_value = db_conn
+        cursor_de(db_conn).fetchall.return_value = [(1,)]
+
+        result = db.execute_query("SELECT 1")
+
+        assert result == [(1,)]
+        db_conn.commit.assert_called_once()
+        pool_mock.putconn.assert_called_once_with(db_conn)
+
+    def test_execute_query_erro_faz_rollback(self, db, pool_mock):
+        """Testa rollback e liberação da conexão em caso de erro"""
+        db_conn = MagicMock()
+        pool_mock.getconn.side_effect = None
+        pool_mock.getconn.return_value = db_conn
+        cursor_de(db_conn).execute.side_effect = Exception("falhou")
+
+        with pytest.raises(Exception, match="falhou"):
+            db.execute_query("UPDATE aluno SET nome = %s", ("X",))
+
+        db_conn.rollback.assert_called_once()
+        db_conn.commit.assert_not_called()
+        pool_mock.putconn.assert_called_once_with(db_conn)
+
+    def test_execute_query_sem_linhas_retorna_none(self, db, pool_mock):
+        """Testa que comandos sem resultado (UPDATE sem RETURNING) retornam None"""
+        db_conn = MagicMock()
+        pool_mock.getconn.side_effect = None
+        pool_mock.getconn.return_value = db_conn
+        cursor_de(db_conn).description = None
+        cursor_de(db_conn).rowcount = 1
+
+        assert db.execute_query("UPDATE aluno SET nome = %s", ("X",)) is None
+        cursor_de(db_conn).fetchall.assert_not_called()
+
+    def test_transaction_compartilha_conexao_e_commita_uma_vez(self, db, pool_mock):
+        """Testa que as queries da transação usam uma única conexão"""
+        with db.transaction() as conn:
+            db.execute_query("UPDATE aluno SET nome = %s", ("A",))
+            db.execute_query("UPDATE aluno SET nome = %s", ("B",))
+
+        assert pool_mock.getconn.call_count == 1
+        assert cursor_de(conn).execute.call_count == 2
+        conn.commit.assert_called_once()
+        pool_mock.putconn.assert_called_once_with(conn)
+
+    def test_transaction_rollback_em_erro(self, db, pool_mock):
+        """Testa rollback da transação quando o bloco lança exceção"""
+        with pytest.raises(ValueError):
+            with db.transaction() as conn:
+                db.execute_query("DELETE FROM aluno")
+                raise ValueError("erro de negócio")
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        pool_mock.putconn.assert_called_once_with(conn)
+        assert db._current_connection() is None
+
+    def test_transaction_aninhada_reaproveita_externa(self, db, pool_mock):
+        """Testa que transações aninhadas usam a conexão da externa"""
+        with db.transaction() as externa:
+            with db.transaction() as interna:
+                assert interna is externa
+
+        assert pool_mock.getconn.call_count == 1
+        externa.commit.assert_called_once()
+
+    def test_transaction_isolada_por_thread(self, db, pool_mock):
+        """Testa que outra thread não enxerga a transação da thread atual"""
+        vista_pela_thread = []
+
+        with db.transaction():
+            thread = threading.Thread(
+                target=lambda: vista_pela_thread.append(db._current_connection())
+            )
+            thread.start()
+            thread.join()
+
+        assert vista_pela_thread == [None]
+
+    def test_execute_values_envia_lote_e_retorna_returning(self, db, pool_mock, monkeypatch):
+        """Testa que execute_values repassa todas as linhas em uma chamada"""
+        chamadas = []
+
+        def fake_execute_values(cur, query, params_list, **kwargs):
+            chamadas.append((query, params_list, kwargs))
+            return [(1,), (2,)]
+
+        monkeypatch.setattr(
+            "registro_notas_alunos.backend.lib.database.extras.execute_values",
+            fake_execute_values,
+        )
+
+        result = db.execute_values(
+            "INSERT INTO aluno (nome, matricula) VALUES %s RETURNING id",
+            [("A", "1"), ("B", "2")],
+            fetch=True,
+        )
+
+        assert result == [(1,), (2,)]
+        assert len(chamadas) == 1
+        assert chamadas[0][1] == [("A", "1"), ("B", "2")]
+        assert pool_mock.getconn.call_count == 1
+
+    def test_execute_values_lista_vazia_nao_acessa_banco(self, db, pool_mock):
+        """Testa que lotes vazios não obtêm conexão do pool"""
+        assert db.execute_values("INSERT INTO aluno VALUES %s", [], fetch=True) == []
+        pool_mock.getconn.assert_not_called()
+
+    def test_stream_batches_usa_cursor_nomeado(self, db, pool_mock):
+        """Testa que o streaming usa cursor server-side e entrega lotes sob demanda"""
+        db_conn = MagicMock()
+        pool_mock.getconn.side_effect = None
+        pool_mock.getconn.return_value = db_conn
+        cursor_de(db_conn).fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+        lotes = db.stream_batches("SELECT id FROM notas", batch_size=2)
+        pool_mock.getconn.assert_not_called()
+
+        assert list(lotes) == [[(1,), (2,)], [(3,)]]
+        assert db_conn.cursor.call_args.kwargs["name"].startswith("stream_")
+        assert cursor_de(db_conn).itersize == 2
+        pool_mock.putconn.assert_called_once_with(db_conn)
+
+    def test_stream_query_fechado_antes_do_fim_libera_conexao(self, db, pool_mock):
+        """Testa que interromper o consumo devolve a conexão ao pool"""
+        db_conn = MagicMock()
+        pool_mock.getconn.side_effect = None
+        pool_mock.getconn.return_value = db_conn
+        cursor_de(db_conn).fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+
+        linhas = db.stream_query("SELECT id FROM notas", itersize=2)
+        assert next(linhas) == (1,)
+        linhas.close()
+
+        pool_mock.putconn.assert_called_once_with(db_conn)
+
+    def test_ao_confirmar_roda_apos_commit(self, db, pool_mock):
+        """Testa que as funções registradas rodam uma vez, depois do commit"""
+        chamadas = []
+
+        with db.transaction() as conn:
+            with db.transaction():
+                db.ao_confirmar(lambda: chamadas.append(conn.commit.called))
+            assert chamadas == []
+
+        assert chamadas == [True]
+        assert not DatabaseConnection.em_transacao()
+
+    def test_ao_confirmar_descartado_no_rollback(self, db, pool_mock):
+        """Testa que as funções registradas não rodam após rollback"""
+        chamadas = []
+
+        with pytest.raises(ValueError):
+            with db.transaction():
+                db.ao_confirmar(lambda: chamadas.append(1))
+                raise ValueError("erro de negócio")
+
+        assert chamadas == []
+
+    def test_ao_confirmar_fora_de_transacao_roda_na_hora(self, db):
+        """Testa que sem transação aberta a função roda imediatamente"""
+        chamadas = []
+
+        db.ao_confirmar(lambda: chamadas.append(1))
+
+        assert chamadas == [1]
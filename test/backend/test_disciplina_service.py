@@ -33,51 +33,37 @@ class TestDisciplinaService:
     def test_criar_sucesso(self):
         """Testa criação de disciplina com sucesso"""
         mock_db = Mock()
-        mock_db.execute_query.side_effect = [
-            [],  # buscar_por_nome_ano_semestre retorna vazio (não existe)
-            [(1,)],  # insert retorna ID criado
-        ]
+        mock_db.execute_query.return_value = [(1,)]  # insert retorna ID criado
 
         service = DisciplinaService(mock_db)
         id_criado = service.criar(nome="Matemática", ano=2024, semestre=1)
 
         assert id_criado == 1
-        assert mock_db.execute_query.call_count == 2
-        # Primeira chamada: buscar_por_nome_ano_semestre
-        buscar_call = mock_db.execute_query.call_args_list[0]
-        assert (
-            "SELECT id, nome, ano, semestre FROM disciplina "
-            "WHERE nome = %s AND ano = %s AND semestre = %s"
-        ) in buscar_call[0][0]
-        assert buscar_call[0][1] == ("Matemática", 2024, 1)
-        # Segunda chamada: insert
-        insert_call = mock_db.execute_query.call_args_list[1]
+        # Uma única chamada: insert com ON CONFLICT, sem consulta prévia
+        assert mock_db.execute_query.call_count == 1
+        insert_call = mock_db.execute_query.call_args_list[0]
         assert "INSERT INTO disciplina" in insert_call[0][0]
+        assert "ON CONFLICT DO NOTHING" in insert_call[0][0]
         assert insert_call[0][1] == ("Matemática", 2024, 1)
 
     def test_criar_disciplina_ja_existe(self):
         """Testa criação de disciplina que já existe"""
         mock_db = Mock()
-        mock_db.execute_query.return_value = [
-            (1, "Matemática", 2024, 1)
-        ]  # disciplina já existe
+        mock_db.execute_query.return_value = []  # ON CONFLICT DO NOTHING não retorna linha
 
         service = DisciplinaService(mock_db)
 
         with pytest.raises(Exception, match="Disciplina já existe"):
             service.criar(nome="Matemática", ano=2024, semestre=1)
 
-    def test_criar_sem_resultado(self):
-        """Testa criação que falha sem retornar resultado"""
+    def test_criar_violacao_constraint(self):
+        """Testa criação quando o banco acusa chave duplicada"""
         mock_db = Mock()
-        mock_db.execute_query.side_effect = [
-            [],  # buscar_por_nome_ano_semestre retorna vazio
-            [],  # insert não retorna resultado
-        ]
+        mock_db.execute_query.side_effect = Exception("duplicate key value violates")
 
         service = DisciplinaService(mock_db)
 
-        with pytest.raises(Exception, match="Erro ao criar disciplina"):
+        with pytest.raises(Exception, match="Disciplina já existe"):
             service.criar(nome="Matemática", ano=2024, semestre=1)
 
     def test_buscar_por_nome_ano_semestre_encontrado(self):
@@ -175,6 +161,22 @@ class TestDisciplinaService:
 
         assert disciplinas == []
 
+    def test_atualizar_invalida_cache(self):
+        """Testa que a alteração descarta a lista em cache"""
+        mock_db = Mock()
+        mock_db.execute_query.side_effect = [
+            [(1, "Matemática", 2024, 1)],  # listar_todas
+            [(1, "Matemática", 2024, 1)],  # buscar_por_id
+            None,  # update
+            [(1, "Cálculo", 2024, 1)],  # listar_todas
+        ]
+        service = DisciplinaService(mock_db)
+
+        service.listar_todas()
+        service.atualizar(id=1, nome="Cálculo", ano=2024, semestre=1)
+
+        assert service.listar_todas()[0].nome == "Cálculo"
+
     def test_listar_por_periodo_com_resultados(self):
         """Testa listagem por período com resultados"""
         mock_db = Mock()
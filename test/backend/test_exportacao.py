@@ -0,0 +1,136 @@
+"""
+Testes unitários para a exportação das notas apuradas
+"""
+
+import csv
+import json
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.notas.exportacao import (
+    ExportadorNotas,
+    formato_do_arquivo,
+    main,
+)
+from registro_notas_alunos.backend.notas.vo import FiltroNotasVO
+
+# Linhas de _SQL_NOTAS_EXPORTACAO, em dois lotes
+LOTES = [
+    [
+        ("2025001", "Ana", "RAD", 2025, 1, 1.0, 0.5, 7.0, None, 8.5, "APROVADO"),
+        ("2025002", "Bruno", "RAD", 2025, 1, 0.5, None, 3.0, None, None, "PENDENTE"),
+    ],
+    [("2025003", "Carla", "RAD", 2025, 1, 0.0, 0.0, 4.0, 5.5, 5.5, "REPROVADO")],
+]
+
+
+@pytest.fixture
+def mock_db():
+    """DatabaseConnection falso com o streaming das linhas de LOTES"""
+    mock_db = Mock()
+    mock_db.stream_batches.return_value = iter(LOTES)
+    return mock_db
+
+
+class TestExportadorNotas:
+    """Testes para ExportadorNotas"""
+
+    def test_exportar_csv(self, mock_db, tmp_path):
+        """Testa o CSV com cabeçalho, nota final gravada e pendência"""
+        destino = tmp_path / "notas.csv"
+
+        total = ExportadorNotas(mock_db).exportar(destino)
+
+        assert total == 3
+        with open(destino, newline="", encoding="utf-8") as arquivo:
+            linhas = list(csv.DictReader(arquivo))
+        assert linhas[0]["nf"] == "8.5"
+        assert linhas[0]["situacao"] == "APROVADO"
+        assert linhas[1]["nf"] == ""
+        assert linhas[1]["situacao"] == "PENDENTE"
+        assert linhas[2]["nf"] == "5.5"
+        assert not list(tmp_path.glob(".*.tmp"))
+
+    def test_exportar_jsonl_com_filtro(self, mock_db, tmp_path):
+        """Testa o JSON Lines e o repasse dos filtros ao banco"""
+        destino = tmp_path / "notas.jsonl"
+
+        ExportadorNotas(mock_db).exportar(
+            destino, FiltroNotasVO(ano=2025, semestre=1), tamanho_lote=2
+        )
+
+        registros = [
+            json.loads(linha) for linha in destino.read_text(encoding="utf-8").split("\n")[:-1]
+        ]
+        assert registros[2]["aluno"] == "Carla"
+        assert registros[1]["nf"] is None
+        query, params = mock_db.stream_batches.call_args[0]
+        assert "d.ano = %s AND d.semestre = %s" in query
+        assert params == (2025, 1)
+        assert mock_db.stream_batches.call_args.kwargs["batch_size"] == 2
+
+    def test_exportar_parquet(self, mock_db, tmp_path):
+        """Testa o Parquet, com um row group por lote"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        destino = tmp_path / "notas.parquet"
+
+        ExportadorNotas(mock_db).exportar(destino)
+
+        arquivo = pq.ParquetFile(destino)
+        assert arquivo.metadata.num_rows == 3
+        assert arquivo.metadata.num_row_groups == 2
+        assert arquivo.read().column("nf").to_pylist() == [8.5, None, 5.5]
+
+    def test_parquet_sem_pyarrow(self, mock_db, tmp_path, monkeypatch):
+        """Testa a mensagem sem o pacote opcional e que o destino não é criado"""
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        destino = tmp_path / "notas.parquet"
+
+        with pytest.raises(ImportError, match="pyarrow"):
+            ExportadorNotas(mock_db).exportar(destino)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_falha_preserva_destino(self, mock_db, tmp_path):
+        """Testa que uma exportação interrompida não substitui o arquivo anterior"""
+        mock_db.stream_batches.return_value = self._falha_no_segundo_lote()
+        destino = tmp_path / "notas.csv"
+        destino.write_text("anterior", encoding="utf-8")
+
+        with pytest.raises(RuntimeError):
+            ExportadorNotas(mock_db).exportar(destino)
+
+        assert destino.read_text(encoding="utf-8") == "anterior"
+        assert list(tmp_path.iterdir()) == [destino]
+
+    @staticmethod
+    def _falha_no_segundo_lote():
+        yield LOTES[0]
+        raise RuntimeError("conexão perdida")
+
+    @pytest.mark.parametrize(
+        "nome,formato", [("a.csv", "csv"), ("a.JSONL", "jsonl"), ("a.parquet", "parquet")]
+    )
+    def test_formato_do_arquivo(self, nome, formato):
+        """Testa a dedução do formato pela extensão"""
+        assert formato_do_arquivo(nome) == formato
+
+    def test_formato_nao_suportado(self):
+        """Testa extensão desconhecida"""
+        with pytest.raises(ValueError, match="Formato não suportado"):
+            formato_do_arquivo("notas.xls")
+
+    def test_main_formato_invalido(self, tmp_path, capsys, monkeypatch):
+        """Testa o código de saída de uma exportação que falhou"""
+        monkeypatch.setattr(
+            "registro_notas_alunos.backend.notas.exportacao.DatabaseConnection", Mock
+        )
+
+        assert main([str(tmp_path / "notas.txt")]) == 1
+        assert "Erro na exportação" in capsys.readouterr().err
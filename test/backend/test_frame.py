@@ -0,0 +1,130 @@
+"""
+Testes unitários para o resultado colunar das notas apuradas
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.notas.frame import NotasFrame
+from registro_notas_alunos.backend.notas.service import NotasService
+from registro_notas_alunos.backend.notas.vo import FiltroNotasVO
+
+# Linhas de _SQL_NOTAS_APURADAS, em dois lotes
+LOTES = [
+    [
+        (1, "Bruno", 1, "Matemática", 2024, 1, 1.0, 1.0, 5.0, None, 7.0, "APROVADO"),
+        (2, "Ana", 2, "Física", 2024, 1, 0.5, None, 5.0, None, None, "PENDENTE"),
+    ],
+    [
+        (3, "Ana", 1, "Matemática", 2024, 1, 0.5, 0.5, 3.0, 4.0, 5.0, "REPROVADO"),
+        (4, "Carla", 1, "Matemática", 2024, 1, 1.0, 1.0, 8.0, None, 10.0, "APROVADO"),
+    ],
+]
+
+
+@pytest.fixture
+def frame():
+    """Frame montado a partir de LOTES"""
+    return NotasFrame.de_lotes(LOTES)
+
+
+class TestNotasFrame:
+    """Testes para NotasFrame"""
+
+    def test_colunas(self, frame):
+        """Testa a conversão dos lotes em colunas, com NaN nas notas nulas"""
+        assert len(frame) == 4
+        assert frame.id_nota.tolist() == [1, 2, 3, 4]
+        assert frame.nulos("sm2").tolist() == [False, True, False, False]
+        assert frame.nulos("nf").tolist() == [False, True, False, False]
+        assert frame.nome_aluno[1] is frame.nome_aluno[2]
+        assert sorted(frame.disciplinas) == [1, 2]
+
+    def test_linha_como_vo(self, frame):
+        """Testa a visão de uma linha como AlunoNotaApuradoVO"""
+        pendente = frame[1]
+
+        assert pendente.nome_aluno == "Ana"
+        assert pendente.sm2 is None
+        assert pendente.nota_final == 0.0
+        assert pendente.is_pendente()
+        assert pendente.disciplina.nome == "Física"
+        assert frame[0].disciplina is frame[-1].disciplina
+        with pytest.raises(IndexError):
+            frame[4]
+
+    def test_iteracao(self, frame):
+        """Testa que iterar percorre todas as linhas na ordem"""
+        assert [vo.id_nota for vo in frame] == [1, 2, 3, 4]
+
+    def test_filtrar(self, frame):
+        """Testa filtro por máscara e por situação"""
+        aprovados = frame.filtrar(frame.mascara_situacao("APROVADO"))
+        assert aprovados.id_nota.tolist() == [1, 4]
+
+        assert frame.filtrar(frame.nf >= 6).id_nota.tolist() == [1, 4]
+
+        with pytest.raises(ValueError, match="uma posição por linha"):
+            frame.filtrar(np.array([True]))
+        with pytest.raises(ValueError, match="Situação"):
+            frame.mascara_situacao("Aprovado")
+
+    def test_ordenar(self, frame):
+        """Testa ordenação estável por várias colunas, com nulos no fim"""
+        assert frame.ordenar("nome_aluno", "nf").id_nota.tolist() == [3, 2, 1, 4]
+        assert frame.ordenar("nf").id_nota.tolist() == [3, 1, 4, 2]
+        assert frame.ordenar("nf", decrescente=True).id_nota.tolist() == [4, 1, 3, 2]
+        assert frame.ordenar("id_disciplina", decrescente=True).id_nota.tolist() == [2, 1, 3, 4]
+
+        with pytest.raises(ValueError, match="Coluna desconhecida"):
+            frame.ordenar("matricula")
+
+    def test_agrupar_e_agregar(self, frame):
+        """Testa agrupamento por disciplina e por situação e as agregações"""
+        por_disciplina = frame.agrupar("id_disciplina")
+
+        assert list(por_disciplina) == [1, 2]
+        assert por_disciplina[1].id_nota.tolist() == [1, 3, 4]
+        assert por_disciplina[1].media_nf() == pytest.approx(22.0 / 3)
+        assert por_disciplina[2].media_nf() is None
+        assert list(frame.agrupar("situacao")) == ["APROVADO", "REPROVADO", "PENDENTE"]
+        assert frame.contar_situacoes() == {"APROVADO": 2, "REPROVADO": 1, "PENDENTE": 1}
+
+    def test_vazio(self):
+        """Testa o frame sem linhas"""
+        frame = NotasFrame.de_lotes([[]])
+
+        assert len(frame) == 0
+        assert list(frame) == []
+        assert frame.media_nf() is None
+        assert frame.contar_situacoes() == {"APROVADO": 0, "REPROVADO": 0, "PENDENTE": 0}
+        assert len(NotasFrame.vazio().ordenar("nf")) == 0
+
+
+class TestFrameNotasApuradas:
+    """Testes para NotasService.frame_notas_apuradas"""
+
+    def test_consulta_em_lotes_com_filtros(self):
+        """Testa que o frame é montado do streaming com filtros e ordenação do banco"""
+        mock_db = Mock()
+        mock_db.stream_batches.return_value = iter(LOTES)
+
+        service = NotasService(mock_db)
+        frame = service.frame_notas_apuradas(
+            FiltroNotasVO(ano=2024), ordenacao="nota_final", tamanho_lote=2
+        )
+
+        assert len(frame) == 4
+        query, params = mock_db.stream_batches.call_args[0]
+        assert "WHERE d.ano = %s" in query
+        assert "ORDER BY n.nf, n.id" in query
+        assert params == (2024,)
+        assert mock_db.stream_batches.call_args.kwargs["batch_size"] == 2
+        mock_db.execute_query.assert_not_called()
@@ -0,0 +1,188 @@
+"""
+Testes unitários para a importação de notas em lote
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.notas.importacao import (
+    ImportadorNotas,
+    converter_nota,
+    gravar_erros,
+    ler_planilha,
+    main,
+)
+
+
+def db_com_matriculas(matriculas):
+    """
+    DatabaseConnection falso
+
+    matriculas mapeia (matrícula do aluno, disciplina, ano, semestre) ao ID da
+    matrícula; a resolução devolve apenas as chaves conhecidas e a gravação
+    devolve IDs de notas iguais a 100 + id_matricula.
+    """
+
+    def execute_values(query, params_list, template=None, page_size=1000, fetch=False):
+        if "FROM (VALUES" in query:
+            return [(*chave, matriculas[chave]) for chave in params_list if chave in matriculas]
+        return [(params[0], 100 + params[0]) for params in params_list]
+
+    mock_db = MagicMock()
+    mock_db.execute_values.side_effect = execute_values
+    return mock_db
+
+
+def gravadas(mock_db):
+    """Parâmetros enviados ao INSERT das notas"""
+    for chamada in mock_db.execute_values.call_args_list:
+        if "INSERT INTO notas" in chamada[0][0]:
+            return chamada[0][1]
+    return []
+
+
+@pytest.fixture
+def planilha(tmp_path):
+    """CSV com ponto e vírgula, vírgula decimal e cabeçalho acentuado"""
+    caminho = tmp_path / "notas.csv"
+    caminho.write_text(
+        "Matrícula;Nome;Disciplina;Ano;Semestre;SM1;SM2;AV;AVS\n"
+        "2023001;Ana;RAD;2025;1;1,0;0,5;7;\n"
+        "2023002;Bruno;RAD;2025;1;0.5;0.5;3;6\n"
+        "\n"
+        "2023003;Carla;RAD;2025;1;2;0;5;\n"
+        "2023004;Davi;RAD;2025;1;0;0;5;\n"
+        "2023001;Ana;RAD;2025;1;0;0;9;\n",
+        encoding="utf-8",
+    )
+    return caminho
+
+
+MATRICULAS = {
+    ("2023001", "RAD", 2025, 1): 11,
+    ("2023002", "RAD", 2025, 1): 12,
+    ("2023003", "RAD", 2025, 1): 13,
+}
+
+
+class TestLeitura:
+    """Testes para a leitura das planilhas"""
+
+    def test_ler_csv(self, planilha):
+        """Testa cabeçalho normalizado, separador detectado e linhas vazias ignoradas"""
+        linhas = list(ler_planilha(planilha))
+
+        assert [numero for numero, _ in linhas] == [2, 3, 5, 6, 7]
+        assert linhas[0][1]["matricula"] == "2023001"
+        assert linhas[0][1]["sm1"] == "1,0"
+
+    def test_formato_nao_suportado(self, tmp_path):
+        """Testa extensão desconhecida"""
+        with pytest.raises(ValueError, match="Formato não suportado"):
+            ler_planilha(tmp_path / "notas.ods")
+
+    @pytest.mark.parametrize(
+        "valor,esperado", [("7,5", 7.5), ("8", 8.0), ("", None), (None, None), (6, 6.0)]
+    )
+    def test_converter_nota(self, valor, esperado):
+        """Testa vírgula decimal e células vazias"""
+        assert converter_nota(valor) == esperado
+
+    def test_converter_nota_invalida(self):
+        """Testa valor não numérico"""
+        with pytest.raises(ValueError, match="Valor inválido"):
+            converter_nota("dez")
+
+
+class TestImportadorNotas:
+    """Testes para ImportadorNotas"""
+
+    def test_importar_com_erros_por_linha(self, planilha):
+        """Testa que as linhas válidas são gravadas e as inválidas relatadas"""
+        mock_db = db_com_matriculas(MATRICULAS)
+
+        resultado = ImportadorNotas(mock_db).importar(planilha)
+
+        assert resultado.total == 5
+        assert resultado.gravadas == 2
+        assert not resultado.ok
+        assert [(erro.linha, erro.mensagem) for erro in resultado.erros] == [
+            (5, "SM1 deve estar entre 0.0 e 1.0"),
+            (6, "Aluno 2023004 não está matriculado em RAD (2025/1)"),
+            (7, "Matrícula repetida; já informada na linha 2"),
+        ]
+        assert gravadas(mock_db) == [
+            (11, 1.0, 0.5, 7.0, None, 8.5, "APROVADO"),
+            (12, 0.5, 0.5, 3.0, 6.0, 7.0, "APROVADO"),
+        ]
+
+    def test_resolve_matriculas_em_uma_consulta(self, planilha):
+        """Testa que as matrículas são resolvidas em lote, dentro da transação"""
+        mock_db = db_com_matriculas(MATRICULAS)
+
+        ImportadorNotas(mock_db).importar(planilha)
+
+        consultas = [c for c in mock_db.execute_values.call_args_list if "FROM (VALUES" in c[0][0]]
+        assert len(consultas) == 1
+        assert len(consultas[0][0][1]) == 3
+        mock_db.transaction.assert_called_once()
+
+    def test_disciplina_informada_na_chamada(self, tmp_path):
+        """Testa planilha de uma turma, sem as colunas da disciplina"""
+        caminho = tmp_path / "turma.csv"
+        caminho.write_text("matricula,av\n2023001,8\n", encoding="utf-8")
+        mock_db = db_com_matriculas(MATRICULAS)
+
+        resultado = ImportadorNotas(mock_db).importar(caminho, "RAD", 2025, 1)
+
+        assert resultado.ok
+        assert gravadas(mock_db)[0][:4] == (11, None, None, 8.0)
+
+    def test_coluna_da_disciplina_ausente(self, tmp_path):
+        """Testa linha sem disciplina nem valor padrão"""
+        caminho = tmp_path / "turma.csv"
+        caminho.write_text("matricula,av\n2023001,8\n", encoding="utf-8")
+
+        resultado = ImportadorNotas(db_com_matriculas(MATRICULAS)).importar(caminho)
+
+        assert resultado.erros[0].mensagem == "Coluna disciplina não informada"
+
+    def test_simular_nao_grava(self, planilha):
+        """Testa a validação sem gravação"""
+        mock_db = db_com_matriculas(MATRICULAS)
+
+        resultado = ImportadorNotas(mock_db).importar(planilha, simular=True)
+
+        assert resultado.simulacao
+        assert resultado.gravadas == 2
+        assert gravadas(mock_db) == []
+
+
+class TestLinhaDeComando:
+    """Testes para a linha de comando e o relatório de erros"""
+
+    def test_gravar_erros(self, planilha, tmp_path):
+        """Testa o CSV do relatório de erros"""
+        resultado = ImportadorNotas(db_com_matriculas(MATRICULAS)).importar(planilha)
+        saida = tmp_path / "erros.csv"
+
+        gravar_erros(resultado, saida)
+
+        linhas = saida.read_text(encoding="utf-8").splitlines()
+        assert linhas[0] == "linha,mensagem"
+        assert linhas[1] == "5,SM1 deve estar entre 0.0 e 1.0"
+
+    def test_main_arquivo_inexistente(self, tmp_path, capsys, monkeypatch):
+        """Testa o código de saída de uma importação que falhou"""
+        monkeypatch.setattr(
+            "registro_notas_alunos.backend.notas.importacao.DatabaseConnection", MagicMock
+        )
+
+        assert main([str(tmp_path / "faltando.csv")]) == 1
+        assert "Erro na importação" in capsys.readouterr().err
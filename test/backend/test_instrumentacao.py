@@ -0,0 +1,106 @@
+"""
+Testes unitários para a instrumentação de queries
+"""
+
+import logging
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.lib.database import DatabaseConnection
+from registro_notas_alunos.backend.lib.instrumentacao import Instrumentacao, normalizar_sql
+
+
+class TestNormalizarSql:
+    """Testes para o fingerprint de queries"""
+
+    def test_literais_e_placeholders(self):
+        """Testa que parâmetros diferentes geram o mesmo fingerprint"""
+        assert normalizar_sql("SELECT * FROM aluno WHERE id = 10") == normalizar_sql(
+            "SELECT *\n  FROM aluno\n  WHERE id = %s"
+        )
+        assert normalizar_sql("SELECT 1 FROM t WHERE nome = 'O''Brien'") == (
+            "SELECT ? FROM t WHERE nome = ?"
+        )
+
+    def test_listas_de_valores(self):
+        """Testa que listas VALUES de tamanhos diferentes são agrupadas"""
+        assert normalizar_sql("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s)") == (
+            "INSERT INTO t (a, b) VALUES (?)"
+        )
+        assert normalizar_sql("SELECT * FROM t WHERE id IN (1, 2, 3)") == (
+            "SELECT * FROM t WHERE id IN (?)"
+        )
+
+
+class TestInstrumentacao:
+    """Testes para o coletor de estatísticas"""
+
+    def test_snapshot_agrega_por_fingerprint(self):
+        """Testa a agregação de execuções da mesma query"""
+        coletor = Instrumentacao(limite_lento_ms=0)
+        coletor.registrar("SELECT * FROM aluno WHERE id = %s", 0.002, linhas=1)
+        coletor.registrar("SELECT * FROM aluno WHERE id = 5", 0.004, linhas=1, espera_pool_s=0.001)
+        coletor.registrar("DELETE FROM aluno", 0.001, erro=True)
+
+        snapshot = coletor.snapshot()
+
+        assert [e.fingerprint for e in snapshot] == [
+            "SELECT * FROM aluno WHERE id = ?",
+            "DELETE FROM aluno",
+        ]
+        select = snapshot[0]
+        assert select.execucoes == 2
+        assert select.linhas == 2
+        assert round(select.tempo_medio_ms, 3) == 3.0
+        assert round(select.tempo_maximo_ms, 3) == 4.0
+        assert round(select.espera_pool_ms, 3) == 1.0
+        assert snapshot[1].erros == 1
+
+        coletor.resetar()
+        assert coletor.snapshot() == []
+
+    def test_query_lenta_registrada_no_log(self, caplog):
+        """Testa que queries acima do limite são registradas no log"""
+        coletor = Instrumentacao(limite_lento_ms=100)
+
+        with caplog.at_level(logging.WARNING):
+            coletor.registrar("SELECT pg_sleep(1)", 0.5)
+            coletor.registrar("SELECT 1", 0.01)
+
+        assert coletor.snapshot()[0].lentas == 1
+        assert len(caplog.records) == 1
+        assert "Query lenta (500.0 ms" in caplog.records[0].getMessage()
+
+    def test_capturar_conta_queries_da_thread(self):
+        """Testa a captura das queries executadas dentro de um bloco"""
+        coletor = Instrumentacao(limite_lento_ms=0)
+
+        with coletor.capturar() as captura:
+            for id_aluno in range(3):
+                coletor.registrar(f"SELECT * FROM notas WHERE id_matricula = {id_aluno}", 0.001)
+        coletor.registrar("SELECT 1", 0.001)
+
+        assert captura.total == 3
+        assert captura.por_fingerprint().most_common(1)[0][1] == 3
+
+    def test_execute_query_registra_espera_e_linhas(self, monkeypatch):
+        """Testa a integração com DatabaseConnection.execute_query"""
+        coletor = Instrumentacao(limite_lento_ms=0)
+        db_conn = MagicMock()
+        db_conn.cursor.return_value.__enter__.return_value.fetchall.return_value = [(1,), (2,)]
+        fake_pool = MagicMock()
+        fake_pool.getconn.return_value = db_conn
+        monkeypatch.setattr(DatabaseConnection, "_pool", fake_pool)
+        monkeypatch.setattr(DatabaseConnection, "instrumentacao", coletor)
+        db = object.__new__(DatabaseConnection)
+
+        with coletor.capturar() as captura:
+            db.execute_query("SELECT id FROM aluno WHERE nome = %s", ("A",))
+
+        assert captura.total == 1
+        assert captura.registros[0].linhas == 2
+        assert captura.registros[0].fingerprint == "SELECT id FROM aluno WHERE nome = ?"
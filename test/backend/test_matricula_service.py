@@ -12,7 +12,10 @@ import pytest
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
 
 from registro_notas_alunos.backend.matricula.model import Matricula
-from registro_notas_alunos.backend.matricula.service import MatriculaService
+from registro_notas_alunos.backend.matricula.service import (
+    MatriculaJaExisteException,
+    MatriculaService,
+)
 
 
 class TestMatriculaService:
@@ -34,28 +37,27 @@ class TestMatriculaService:
     def test_criar_sucesso(self):
         """Testa criação de matrícula com sucesso"""
         mock_db = Mock()
-        mock_db.execute_query.side_effect = [
-            [],  # buscar_por_aluno_disciplina (não existe)
-            [(1,)],  # INSERT RETURNING id
-        ]
+        mock_db.execute_query.return_value = [(1,)]  # INSERT RETURNING id
 
         service = MatriculaService(mock_db)
         matricula = Matricula(id=None, id_aluno=1, id_disciplina=1)
         id_criado = service.criar(matricula)
 
         assert id_criado == 1
-        assert mock_db.execute_query.call_count == 2
+        assert mock_db.execute_query.call_count == 1
 
     def test_criar_matricula_duplicada(self):
         """Testa criação de matrícula que já existe"""
         mock_db = Mock()
-        # buscar_por_aluno_disciplina retorna matrícula existente
-        mock_db.execute_query.return_value = [(1, 1, 1)]
+        # INSERT ... ON CONFLICT DO NOTHING não retorna linha
+        mock_db.execute_query.return_value = []
 
         service = MatriculaService(mock_db)
         matricula = Matricula(id=None, id_aluno=1, id_disciplina=1)
 
-        with pytest.raises(Exception, match="O aluno já está matriculado nesta disciplina"):
+        with pytest.raises(
+            MatriculaJaExisteException, match="O aluno já está matriculado nesta disciplina"
+        ):
             service.criar(matricula)
 
     def test_criar_matricula_com_id(self):
@@ -135,6 +137,19 @@ class TestMatriculaService:
         assert matriculas[0][1] == "João Silva"  # Nome do aluno
         assert matriculas[1][1] == "Maria Santos"
 
+    def test_listar_por_ids(self):
+        """Testa a listagem das matrículas informadas"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(3, "João Silva", "2024001", "Matemática")]
+
+        service = MatriculaService(mock_db)
+        matriculas = service.listar_por_ids([3])
+
+        assert matriculas == [(3, "João Silva", "2024001", "Matemática")]
+        query, params = mock_db.execute_query.call_args[0]
+        assert "ANY" in query
+        assert params == ([3],)
+
     def test_listar_todas_sem_resultados(self):
         """Testa listagem quando não há matrículas"""
         mock_db = Mock()
@@ -164,6 +179,25 @@ class TestMatriculaService:
         with pytest.raises(ValueError, match="ID do aluno deve ser maior que zero"):
             service.listar_por_aluno(0)
 
+    def test_listar_por_aluno_paginado(self):
+        """Testa a continuação da listagem por aluno a partir do token"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(1, "Matemática", 2024, 1)]
+        service = MatriculaService(mock_db)
+
+        primeira = service.listar_por_aluno_paginado(3, limite=1)
+        assert primeira.proximo is None
+
+        mock_db.execute_query.return_value = [(1, "Física", 2024, 1), (2, "Química", 2024, 2)]
+        primeira = service.listar_por_aluno_paginado(3, limite=1)
+        service.listar_por_aluno_paginado(3, limite=1, token=primeira.proximo)
+
+        query, params = mock_db.execute_query.call_args[0]
+        assert "(d.ano, d.semestre, d.nome, m.id) > (%s, %s, %s, %s)" in query
+        assert params == (3, 2024, 1, "Física", 1, 2)
+        with pytest.raises(ValueError, match="Token de paginação inválido"):
+            service.listar_por_aluno_paginado(4, token=primeira.proximo)
+
     def test_listar_por_disciplina_com_resultados(self):
         """Testa listagem por disciplina com resultados"""
         mock_db = Mock()
@@ -227,3 +261,108 @@ class TestMatriculaService:
         service.excluir_por_aluno_disciplina(1, 1)
 
         assert mock_db.execute_query.call_count == 3
+
+    def test_criar_em_lote_sucesso(self):
+        """Testa criação de várias matrículas em um único comando"""
+        mock_db = Mock()
+        mock_db.execute_values.return_value = [(1, 1, 10), (2, 1, 11)]
+
+        service = MatriculaService(mock_db)
+        ids = service.criar_em_lote(
+            [
+                Matricula(id=None, id_aluno=1, id_disciplina=1),
+                Matricula(id=None, id_aluno=2, id_disciplina=1),
+            ]
+        )
+
+        assert ids == [10, 11]
+        mock_db.execute_values.assert_called_once()
+        assert mock_db.execute_values.call_args[0][1] == [(1, 1), (2, 1)]
+        mock_db.execute_query.assert_not_called()
+
+    def test_criar_em_lote_ids_fora_de_ordem(self):
+        """Testa que os IDs seguem a ordem das matrículas mesmo com várias páginas"""
+        mock_db = Mock()
+        # Mais linhas que uma página de execute_values, devolvidas invertidas
+        mock_db.execute_values.return_value = [(i, 7, i * 10) for i in range(1500, 0, -1)]
+        matriculas = [Matricula(id=None, id_aluno=i, id_disciplina=7) for i in range(1, 1501)]
+
+        service = MatriculaService(mock_db)
+        ids = service.criar_em_lote(matriculas)
+
+        assert ids == [i * 10 for i in range(1, 1501)]
+        assert "RETURNING id_aluno, id_disciplina, id" in mock_db.execute_values.call_args[0][0]
+
+    def test_criar_em_lote_duplicada(self):
+        """Testa criação em lote com matrícula já existente"""
+        mock_db = Mock()
+        mock_db.execute_values.side_effect = Exception("duplicate key value violates")
+
+        service = MatriculaService(mock_db)
+
+        with pytest.raises(MatriculaJaExisteException):
+            service.criar_em_lote([Matricula(id=None, id_aluno=1, id_disciplina=1)])
+
+    def test_matricular_em_lote(self):
+        """Testa matrícula em lote com aluno novo, já matriculado e inexistente"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [
+            (3, 10, None, True, True),
+            (1, None, 7, True, True),
+            (99, None, None, False, True),
+        ]
+
+        service = MatriculaService(mock_db)
+        resultados = service.matricular_em_lote(5, [3, 1, 3, 99])
+
+        assert [(r.id_aluno, r.situacao, r.id_matricula) for r in resultados] == [
+            (3, "CRIADA", 10),
+            (1, "JA_EXISTENTE", 7),
+            (99, "ALUNO_NAO_ENCONTRADO", None),
+        ]
+        assert mock_db.execute_query.call_count == 1
+        query, params = mock_db.execute_query.call_args[0]
+        assert "ON CONFLICT (id_aluno, id_disciplina) DO NOTHING" in query
+        assert params == ([3, 1, 99], 5, 5, 5)
+
+    def test_matricular_em_lote_validacoes(self):
+        """Testa lista vazia, IDs inválidos e disciplina inexistente"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(1, None, None, True, False)]
+        service = MatriculaService(mock_db)
+
+        assert service.matricular_em_lote(5, []) == []
+        with pytest.raises(ValueError, match="ID deve ser maior que zero"):
+            service.matricular_em_lote(5, [1, 0])
+        mock_db.execute_query.assert_not_called()
+
+        with pytest.raises(ValueError, match="Disciplina não encontrada"):
+            service.matricular_em_lote(5, [1])
+
+    def test_copiar_matriculas(self):
+        """Testa cópia das matrículas de uma disciplina para outra"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(1, 20, None, True, True)]
+
+        service = MatriculaService(mock_db)
+        resultados = service.copiar_matriculas(2, 5)
+
+        assert resultados[0].criada
+        query, params = mock_db.execute_query.call_args[0]
+        assert "WHERE m.id_disciplina = %s" in query
+        assert params == (2, 5, 5, 5)
+
+        with pytest.raises(ValueError, match="diferentes"):
+            service.copiar_matriculas(5, 5)
+
+    def test_iterar_todas_usa_streaming(self):
+        """Testa que iterar_todas delega ao cursor server-side"""
+        mock_db = Mock()
+        mock_db.stream_query.return_value = iter([(1, "João Silva", "2024001", "Matemática")])
+
+        service = MatriculaService(mock_db)
+        matriculas = list(service.iterar_todas(itersize=500))
+
+        assert matriculas == [(1, "João Silva", "2024001", "Matemática")]
+        assert mock_db.stream_query.call_args.kwargs["itersize"] == 500
+        mock_db.execute_query.assert_not_called()
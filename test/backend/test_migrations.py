@@ -0,0 +1,114 @@
+"""
+Testes unitários para o Migrador
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.lib.migrations import (
+    DIRETORIO_MIGRACOES,
+    Migrador,
+    _indices_do_plano,
+)
+
+
+def db_com_transacao(versoes_aplicadas):
+    """DatabaseConnection falso cuja transação entrega um cursor simulado"""
+    mock_db = MagicMock()
+    conn = MagicMock()
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.fetchall.return_value = [(versao,) for versao in versoes_aplicadas]
+    mock_db.transaction.return_value.__enter__.return_value = conn
+    return mock_db, cursor
+
+
+@pytest.fixture
+def diretorio(tmp_path):
+    """Diretório com duas migrações e um arquivo ignorado"""
+    (tmp_path / "0002_segunda.sql").write_text("CREATE INDEX b ON t (b);")
+    (tmp_path / "0001_primeira.sql").write_text("CREATE INDEX a ON t (a);")
+    (tmp_path / "leia-me.txt").write_text("ignorado")
+    return tmp_path
+
+
+class TestMigrador:
+    """Testes para Migrador"""
+
+    def test_listar_disponiveis_ordenadas(self, diretorio):
+        """Testa a leitura dos arquivos em ordem de versão"""
+        migracoes = Migrador(Mock(), diretorio).listar_disponiveis()
+
+        assert [(m.versao, m.nome) for m in migracoes] == [(1, "primeira"), (2, "segunda")]
+
+    def test_listar_disponiveis_versao_duplicada(self, diretorio):
+        """Testa que versões repetidas são rejeitadas"""
+        (diretorio / "0002_outra.sql").write_text("SELECT 1;")
+
+        with pytest.raises(ValueError, match="Versão de migração duplicada: 2"):
+            Migrador(Mock(), diretorio).listar_disponiveis()
+
+    def test_aplicar_somente_pendentes_com_lock(self, diretorio):
+        """Testa que apenas as migrações não registradas são executadas"""
+        mock_db, cursor = db_com_transacao([1])
+
+        executadas = Migrador(mock_db, diretorio).aplicar()
+
+        assert [m.versao for m in executadas] == [2]
+        comandos = [c.args for c in cursor.execute.call_args_list]
+        assert "pg_advisory_xact_lock" in comandos[0][0]
+        assert ("CREATE INDEX b ON t (b);",) in comandos
+        assert ("CREATE INDEX a ON t (a);",) not in comandos
+        assert comandos[-1][1] == (2, "segunda")
+
+    def test_aplicar_sem_pendentes(self, diretorio):
+        """Testa que nada é executado quando tudo já foi aplicado"""
+        mock_db, _ = db_com_transacao([1, 2])
+
+        assert Migrador(mock_db, diretorio).aplicar() == []
+
+    def test_versao_atual_somente_leitura(self, diretorio):
+        """Testa a comparação de versões sem criar schema_migrations"""
+        mock_db = Mock()
+        mock_db.execute_query.side_effect = [[(True,)], [(1,)]]
+        migrador = Migrador(mock_db, diretorio)
+
+        assert migrador.versao_atual() == 1
+        assert migrador.versao_mais_recente() == 2
+        consultas = [c.args[0] for c in mock_db.execute_query.call_args_list]
+        assert not any("CREATE" in consulta for consulta in consultas)
+
+    def test_versao_atual_sem_tabela_de_controle(self, diretorio):
+        """Testa que um banco nunca migrado está na versão 0"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(False,)]
+
+        assert Migrador(mock_db, diretorio).versao_atual() == 0
+        assert mock_db.execute_query.call_count == 1
+
+    def test_migracoes_do_projeto_sao_validas(self):
+        """Testa que os arquivos do projeto seguem o padrão de nomes"""
+        migracoes = Migrador(Mock(), DIRETORIO_MIGRACOES).listar_disponiveis()
+
+        assert migracoes[0].versao == 1
+        unicidade = next(m for m in migracoes if m.nome == "unicidade_notas_disciplina")
+        assert "uq_notas_id_matricula" in unicidade.sql()
+        assert "RAISE EXCEPTION" in unicidade.sql()
+        assert "UNIQUE" not in migracoes[0].sql()
+
+    def test_indices_do_plano_percorre_subplanos(self):
+        """Testa a extração dos índices de um plano aninhado"""
+        plano = {
+            "Node Type": "Nested Loop",
+            "Plans": [
+                {"Node Type": "Index Scan", "Index Name": "idx_a"},
+                {"Node Type": "Seq Scan", "Plans": [{"Index Name": "idx_b"}]},
+            ],
+        }
+
+        assert _indices_do_plano(plano) == ["idx_a", "idx_b"]
@@ -62,6 +62,13 @@ class TestAlunoModel:
         with pytest.raises(ValueError, match="Matrícula do aluno é obrigatória"):
             Aluno(id=1, nome="João Silva", matricula="   ")
 
+    def test_aluno_de_linha_sem_normalizar(self):
+        """Testa a criação a partir de uma linha do banco, sem validação"""
+        aluno = Aluno.de_linha((7, " Ana ", "2025001"))
+
+        assert (aluno.id, aluno.nome, aluno.matricula) == (7, " Ana ", "2025001")
+        assert not hasattr(aluno, "__dict__")
+
 
 class TestDisciplinaModel:
     """Testes para o modelo Disciplina"""
@@ -110,6 +117,12 @@ class TestDisciplinaModel:
         with pytest.raises(ValueError, match="Semestre deve ser 1 ou 2"):
             Disciplina(id=1, nome="Matemática", ano=2024, semestre=3)
 
+    def test_disciplina_de_linha(self):
+        """Testa a criação a partir de uma linha do banco"""
+        disciplina = Disciplina.de_linha((3, "RAD", 2025, 1))
+
+        assert disciplina == Disciplina(id=3, nome="RAD", ano=2025, semestre=1)
+
 
 class TestMatriculaModel:
     """Testes para o modelo Matricula"""
@@ -140,6 +153,12 @@ class TestMatriculaModel:
         with pytest.raises(ValueError, match="ID da disciplina deve ser maior que zero"):
             Matricula(id=1, id_aluno=1, id_disciplina=0)
 
+    def test_matricula_de_linha_sem_validar(self):
+        """Testa que a linha do banco não passa pelas validações dos IDs"""
+        matricula = Matricula.de_linha((1, 0, 4))
+
+        assert (matricula.id, matricula.id_aluno, matricula.id_disciplina) == (1, 0, 4)
+
 
 class TestNotasModel:
     """Testes para o modelo Notas"""
@@ -180,14 +199,21 @@ class TestNotasModel:
         notas = Notas(id=1, id_matricula=1, sm1=0.8, sm2=0.7, av=5.0, avs=4.0)
 
         notas.calcular_nota_final()
-        assert notas.situacao == "Aprovado"  # 5.0 + 1.5 = 6.5 >= 6.0
+        assert notas.situacao == "APROVADO"  # 5.0 + 1.5 = 6.5 >= 6.0
 
     def test_notas_situacao_reprovado(self):
         """Testa situação reprovado (NF < 6.0)"""
         notas = Notas(id=1, id_matricula=1, sm1=0.2, sm2=0.3, av=4.0, avs=3.0)
 
         notas.calcular_nota_final()
-        assert notas.situacao == "Reprovado"  # 4.0 + 0.5 = 4.5 < 6.0
+        assert notas.situacao == "REPROVADO"  # 4.0 + 0.5 = 4.5 < 6.0
+
+    def test_notas_situacao_pendente(self):
+        """Testa situação pendente sem a nota da AV"""
+        notas = Notas(id=1, id_matricula=1, sm1=0.2, sm2=0.3, av=None, avs=8.0)
+
+        assert notas.calcular_nota_final() is None
+        assert notas.situacao == "PENDENTE"
 
     def test_notas_id_matricula_invalido(self):
         """Testa validação de ID da matrícula inválido"""
@@ -213,3 +239,10 @@ class TestNotasModel:
         """Testa validação de AVS inválida"""
         with pytest.raises(ValueError, match="AVS deve estar entre 0.0 e 10.0"):
             Notas(id=1, id_matricula=1, sm1=0.8, sm2=0.7, av=9.0, avs=-2.0)
+
+    def test_notas_de_linha(self):
+        """Testa a criação a partir de uma linha do banco, com nf e situação gravadas"""
+        notas = Notas.de_linha((5, 2, 1.0, 0.5, None, None, None, "PENDENTE"))
+
+        assert notas == Notas(id=5, id_matricula=2, sm1=1.0, sm2=0.5, av=None, avs=None)
+        assert not hasattr(notas, "__dict__")
@@ -0,0 +1,495 @@
+"""
+Testes unitários para NotasService
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.disciplina.model import Disciplina
+from registro_notas_alunos.backend.notas.model import Notas
+from registro_notas_alunos.backend.notas.service import NotasJaExistemException, NotasService
+from registro_notas_alunos.backend.notas.vo import AlunoNotaApuradoVO, FiltroNotasVO
+
+
+class TestNotasService:
+    """Testes para NotasService"""
+
+    def test_criar_em_lote_sucesso(self):
+        """Testa criação de várias notas em um único comando"""
+        mock_db = Mock()
+        mock_db.execute_values.return_value = [(1, 1), (2, 2)]
+
+        service = NotasService(mock_db)
+        ids = service.criar_em_lote(
+            [
+                Notas(id=None, id_matricula=1, sm1=1.0, sm2=1.0, av=5.0, avs=None),
+                Notas(id=None, id_matricula=2, sm1=0.5, sm2=0.5, av=3.0, avs=None),
+            ]
+        )
+
+        assert ids == [1, 2]
+        params_list = mock_db.execute_values.call_args[0][1]
+        assert params_list[0] == (1, 1.0, 1.0, 5.0, None, 7.0, "APROVADO")
+        assert params_list[1][6] == "REPROVADO"
+
+    def test_criar_em_lote_ids_fora_de_ordem(self):
+        """Testa que os IDs seguem a ordem das notas mesmo com várias páginas"""
+        mock_db = Mock()
+        # Mais linhas que uma página de execute_values, devolvidas invertidas
+        mock_db.execute_values.return_value = [(i, i * 10) for i in range(1500, 0, -1)]
+        notas_list = [Notas(id=None, id_matricula=i) for i in range(1, 1501)]
+
+        service = NotasService(mock_db)
+        ids = service.criar_em_lote(notas_list)
+
+        assert ids == [i * 10 for i in range(1, 1501)]
+        assert "RETURNING id_matricula, id" in mock_db.execute_values.call_args[0][0]
+
+    def test_criar_em_lote_com_id(self):
+        """Testa criação em lote com ID preenchido (deve falhar)"""
+        service = NotasService(Mock())
+
+        with pytest.raises(ValueError, match="Notas para criação não devem ter ID"):
+            service.criar_em_lote([Notas(id=1, id_matricula=1)])
+
+    def test_criar_em_lote_duplicada(self):
+        """Testa criação em lote para matrícula que já possui notas"""
+        mock_db = Mock()
+        mock_db.execute_values.side_effect = Exception("duplicate key value violates")
+
+        service = NotasService(mock_db)
+
+        with pytest.raises(NotasJaExistemException):
+            service.criar_em_lote([Notas(id=None, id_matricula=1)])
+
+    def test_atualizar_em_lote_sucesso(self):
+        """Testa atualização de várias notas em um único comando"""
+        mock_db = Mock()
+        mock_db.execute_values.return_value = [(1,), (2,)]
+
+        service = NotasService(mock_db)
+        atualizados = service.atualizar_em_lote(
+            [Notas(id=1, id_matricula=1, av=8.0), Notas(id=2, id_matricula=2, av=2.0)]
+        )
+
+        assert atualizados == 2
+        mock_db.execute_values.assert_called_once()
+        assert mock_db.execute_values.call_args.kwargs["fetch"] is True
+
+    def test_atualizar_em_lote_sem_id(self):
+        """Testa atualização em lote sem ID (deve falhar)"""
+        service = NotasService(Mock())
+
+        with pytest.raises(ValueError, match="Notas devem ter ID válido"):
+            service.atualizar_em_lote([Notas(id=None, id_matricula=1)])
+
+    def test_gravar_em_lote_upsert(self):
+        """Testa gravação em lote com ON CONFLICT e IDs fora de ordem"""
+        mock_db = Mock()
+        mock_db.execute_values.return_value = [(2, 20), (1, 10)]
+        notas_list = [
+            Notas(id=None, id_matricula=1, sm1=1.0, sm2=1.0, av=5.0, avs=None),
+            Notas(id=None, id_matricula=2, av=2.0),
+        ]
+
+        service = NotasService(mock_db)
+        ids = service.gravar_em_lote(notas_list)
+
+        assert ids == [10, 20]
+        assert [notas.id for notas in notas_list] == [10, 20]
+        query, params_list = mock_db.execute_values.call_args[0]
+        assert "ON CONFLICT (id_matricula) DO UPDATE" in query
+        assert params_list[0] == (1, 1.0, 1.0, 5.0, None, 7.0, "APROVADO")
+
+    def test_gravar_em_lote_matricula_repetida(self):
+        """Testa lote com a mesma matrícula duas vezes (deve falhar)"""
+        service = NotasService(Mock())
+
+        with pytest.raises(ValueError, match="uma única vez"):
+            service.gravar_em_lote([Notas(id=None, id_matricula=1), Notas(id=None, id_matricula=1)])
+
+    def test_iterar_notas_apuradas_monta_vos_sob_demanda(self):
+        """Testa que as notas apuradas são montadas lote a lote a partir do streaming"""
+        mock_db = Mock()
+        mock_db.stream_batches.return_value = iter(
+            [
+                [
+                    (
+                        1,
+                        "João Silva",
+                        1,
+                        "Matemática",
+                        2024,
+                        1,
+                        1.0,
+                        1.0,
+                        5.0,
+                        None,
+                        7.0,
+                        "APROVADO",
+                    ),
+                    (
+                        2,
+                        "Maria Santos",
+                        1,
+                        "Matemática",
+                        2024,
+                        1,
+                        0.5,
+                        None,
+                        5.0,
+                        None,
+                        None,
+                        "PENDENTE",
+                    ),
+                ]
+            ]
+        )
+
+        service = NotasService(mock_db)
+        notas = service.iterar_notas_apuradas(itersize=100)
+
+        primeira = next(notas)
+        assert primeira.nome_aluno == "João Silva"
+        assert primeira.nota_final == 7.0
+        assert primeira.situacao == "APROVADO"
+        pendente = next(notas)
+        assert pendente.situacao == "PENDENTE"
+        assert pendente.nota_final == 0.0
+        assert mock_db.stream_batches.call_args.kwargs["batch_size"] == 100
+        mock_db.execute_query.assert_not_called()
+
+    def test_iterar_lotes_exportacao(self):
+        """Testa os lotes de tuplas repassados do banco com os filtros aplicados"""
+        lote = [("2025001", "Ana", "RAD", 2025, 1, 0.3, 0.3, 7.0, None, 7.6, "APROVADO")]
+        mock_db = Mock()
+        mock_db.stream_batches.return_value = iter([lote])
+
+        service = NotasService(mock_db)
+        lotes = list(service.iterar_lotes_exportacao(FiltroNotasVO(ano=2025), tamanho_lote=10))
+
+        assert lotes == [lote]
+        assert "n.situacao" in mock_db.stream_batches.call_args[0][0]
+        query, params = mock_db.stream_batches.call_args[0]
+        assert "a.matricula" in query and "WHERE d.ano = %s" in query
+        assert params == (2025,)
+
+    def test_listar_notas_apuradas(self):
+        """Testa listagem completa das notas apuradas"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [
+            (1, "João Silva", 1, "Matemática", 2024, 1, 0.5, 0.5, 4.0, None, 5.0, "REPROVADO"),
+        ]
+
+        service = NotasService(mock_db)
+        notas = service.listar_notas_apuradas()
+
+        assert len(notas) == 1
+        assert notas[0].disciplina.nome == "Matemática"
+        assert notas[0].situacao == "REPROVADO"
+
+    def test_listar_notas_apuradas_compartilha_disciplina(self):
+        """Testa que notas da mesma disciplina compartilham um único objeto Disciplina"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [
+            (1, "Ana", 1, "Matemática", 2024, 1, 1.0, 1.0, 5.0, None, 7.0, "APROVADO"),
+            (2, "Bruno", 2, "Física", 2024, 1, 1.0, 1.0, 5.0, None, 7.0, "APROVADO"),
+            (3, "Carla", 1, "Matemática", 2024, 1, 0.5, 0.5, 4.0, None, 5.0, "REPROVADO"),
+        ]
+
+        service = NotasService(mock_db)
+        notas = service.listar_notas_apuradas()
+
+        assert notas[0].disciplina is notas[2].disciplina
+        assert notas[1].disciplina.nome == "Física"
+
+    def test_calcular_todas_notas_finais_um_comando(self):
+        """Testa que o recálculo é feito com um único comando no banco"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(42,)]
+
+        service = NotasService(mock_db)
+        atualizados = service.calcular_todas_notas_finais()
+
+        assert atualizados == 42
+        assert mock_db.execute_query.call_count == 1
+        query, params = mock_db.execute_query.call_args[0]
+        assert "UPDATE notas" in query
+        assert "JOIN disciplina" not in query
+        assert params == ()
+
+    def test_calcular_todas_notas_finais_com_filtros(self):
+        """Testa recálculo restrito a disciplina e período"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(3,)]
+
+        service = NotasService(mock_db)
+        atualizados = service.calcular_todas_notas_finais(id_disciplina=7, ano=2025, semestre=1)
+
+        assert atualizados == 3
+        query, params = mock_db.execute_query.call_args[0]
+        assert "m.id_disciplina = %s" in query
+        assert params == (7, 2025, 1)
+
+    def test_calcular_todas_notas_finais_semestre_invalido(self):
+        """Testa recálculo com semestre inválido"""
+        service = NotasService(Mock())
+
+        with pytest.raises(ValueError, match="Semestre deve ser 1 ou 2"):
+            service.calcular_todas_notas_finais(semestre=3)
+
+    def test_consultar_notas_apuradas_filtros_no_banco(self):
+        """Testa que os filtros viram cláusula WHERE parametrizada"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [
+            (1, "João Silva", 3, "Matemática", 2024, 2, 1.0, 1.0, 5.0, None, 7.0, "APROVADO"),
+        ]
+
+        service = NotasService(mock_db)
+        notas = service.consultar_notas_apuradas(
+            FiltroNotasVO(ano=2024, semestre=2, nome_disciplina=" Matemática ", id_aluno=5)
+        )
+
+        assert len(notas) == 1
+        assert notas[0].disciplina.id == 3
+        query, params = mock_db.execute_query.call_args[0]
+        assert "d.ano = %s AND d.semestre = %s AND d.nome = %s AND a.id = %s" in query
+        assert params == (2024, 2, "Matemática", 5)
+
+    def test_consultar_notas_apuradas_por_situacao(self):
+        """Testa o filtro pela situação gravada no banco"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = []
+
+        service = NotasService(mock_db)
+        service.consultar_notas_apuradas(FiltroNotasVO(situacao="REPROVADO"))
+
+        query, params = mock_db.execute_query.call_args[0]
+        assert "WHERE n.situacao = %s" in query
+        assert params == ("REPROVADO",)
+
+    def test_consultar_notas_apuradas_situacao_invalida(self):
+        """Testa situação desconhecida no filtro"""
+        service = NotasService(Mock())
+
+        with pytest.raises(ValueError, match="Situação"):
+            service.consultar_notas_apuradas(FiltroNotasVO(situacao="Aprovado"))
+
+    def test_consultar_notas_apuradas_paginada(self):
+        """Testa limite e deslocamento aplicados na consulta"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = []
+
+        service = NotasService(mock_db)
+        assert service.consultar_notas_apuradas(limite=50, deslocamento=100) == []
+
+        query, params = mock_db.execute_query.call_args[0]
+        assert "WHERE" not in query
+        assert query.endswith("LIMIT %s OFFSET %s")
+        assert params == (50, 100)
+
+    def test_consultar_notas_apuradas_ordenacao(self):
+        """Testa a ordenação por coluna aplicada no banco, desempatada pelo ID"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = []
+
+        service = NotasService(mock_db)
+        service.consultar_notas_apuradas(limite=10, ordenacao="periodo", decrescente=True)
+
+        query, params = mock_db.execute_query.call_args[0]
+        assert "ORDER BY d.ano DESC, d.semestre DESC, a.nome DESC, n.id DESC LIMIT %s" in query
+        assert params == (10,)
+
+        service.consultar_notas_apuradas()
+        query, _ = mock_db.execute_query.call_args[0]
+        assert query.endswith("ORDER BY a.nome, d.nome, n.id")
+
+    def test_consultar_notas_apuradas_apos_registro(self):
+        """Testa a continuação a partir do último registro, sem OFFSET"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = []
+        ultimo = AlunoNotaApuradoVO(
+            id_nota=9,
+            nome_aluno="Ana",
+            disciplina=Disciplina(id=3, nome="Matemática", ano=2024, semestre=2),
+            sm1=1.0,
+            sm2=None,
+            av=None,
+            avs=None,
+            nota_final=0.0,
+            situacao="PENDENTE",
+        )
+
+        service = NotasService(mock_db)
+        service.consultar_notas_apuradas(
+            FiltroNotasVO(ano=2024), limite=100, ordenacao="nota_final", apos=ultimo
+        )
+
+        query, params = mock_db.execute_query.call_args[0]
+        # NF pendente é NULL no banco: na ordem crescente, só outras pendentes vêm depois
+        assert "WHERE d.ano = %s AND n.nf IS NULL AND ((n.nf IS NULL AND" in query
+        assert "OFFSET" not in query
+        assert query.endswith("ORDER BY n.nf, n.id LIMIT %s")
+        assert params == (2024, 9, 100)
+
+    def test_consultar_notas_apuradas_apos_compara_notas_como_real(self):
+        """Testa que as notas do registro são comparadas na precisão da coluna REAL"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = []
+        ultimo = AlunoNotaApuradoVO(
+            id_nota=9,
+            nome_aluno="Ana",
+            disciplina=Disciplina(id=3, nome="Matemática", ano=2024, semestre=2),
+            sm1=1.0,
+            sm2=1.0,
+            av=6.7,
+            avs=None,
+            nota_final=8.7,
+            situacao="APROVADO",
+        )
+
+        service = NotasService(mock_db)
+        service.consultar_notas_apuradas(ordenacao="av", decrescente=True, apos=ultimo)
+
+        query, params = mock_db.execute_query.call_args[0]
+        assert "WHERE n.av <= %s::real AND" in query
+        assert params == (6.7, 6.7, 6.7, 9)
+
+    def test_consultar_notas_apuradas_apos_com_deslocamento(self):
+        """Testa que apos e deslocamento não são aceitos juntos"""
+        service = NotasService(Mock())
+
+        with pytest.raises(ValueError, match="deslocamento ou apos"):
+            service.consultar_notas_apuradas(deslocamento=100, apos=Mock())
+
+    def test_consultar_notas_apuradas_ordenacao_invalida(self):
+        """Testa que apenas colunas conhecidas são aceitas na ordenação"""
+        service = NotasService(Mock())
+
+        with pytest.raises(ValueError, match="Ordenação não suportada"):
+            service.consultar_notas_apuradas(ordenacao="a.nome; DROP TABLE notas")
+
+    def test_contar_notas_apuradas(self):
+        """Testa a contagem com os mesmos filtros da consulta"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(42,)]
+
+        service = NotasService(mock_db)
+
+        assert service.contar_notas_apuradas(FiltroNotasVO(ano=2024)) == 42
+        query, params = mock_db.execute_query.call_args[0]
+        assert query.startswith("SELECT count(*)")
+        assert "d.ano = %s" in query
+        assert params == (2024,)
+
+    def test_consultar_notas_apuradas_limite_invalido(self):
+        """Testa consulta com limite inválido"""
+        service = NotasService(Mock())
+
+        with pytest.raises(ValueError, match="Limite deve ser maior que zero"):
+            service.consultar_notas_apuradas(limite=0)
+
+    def test_estatisticas_uma_consulta_agregada(self):
+        """Testa que as estatísticas vêm de uma única consulta com GROUPING SETS"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [
+            (3, None, None, None, None, 4, 2, 3, 2, 1, 1, 50.0, 6.5, 4.0, 9.0, 2.5),
+            (2, None, None, 2024, 1, 4, 2, 3, 2, 1, 1, 50.0, 6.5, 4.0, 9.0, 2.5),
+            (0, 1, "Matemática", 2024, 1, 3, 1, 3, 2, 1, 0, 66.7, 6.5, 4.0, 9.0, 2.5),
+            (0, 2, "Física", 2024, 1, 1, 1, 1, 0, 0, 1, 0.0, None, None, None, None),
+        ]
+
+        service = NotasService(mock_db)
+        relatorio = service.estatisticas(FiltroNotasVO(ano=2024))
+
+        assert mock_db.execute_query.call_count == 1
+        query, params = mock_db.execute_query.call_args[0]
+        assert "GROUPING SETS" in query
+        assert params == (2024,)
+        assert relatorio.geral.total_registros == 4
+        assert relatorio.geral.total_alunos == 3
+        assert relatorio.geral.percentual_aprovacao == 50.0
+        assert [vo.nome_disciplina for vo in relatorio.por_disciplina] == ["Matemática", "Física"]
+        assert relatorio.por_disciplina[1].media is None
+        assert relatorio.por_semestre[0].semestre == 1
+
+    def test_estatisticas_contam_ids_distintos(self):
+        """Testa que alunos e disciplinas são contados pelo ID, não pelo nome"""
+        mock_db = Mock()
+        # Dois alunos "João Silva" e "Matemática" em 2024/1 e 2024/2
+        mock_db.execute_query.return_value = [
+            (3, None, None, None, None, 3, 2, 2, 2, 1, 0, 66.7, 6.0, 5.0, 7.0, 1.0),
+        ]
+
+        relatorio = NotasService(mock_db).estatisticas()
+
+        query = mock_db.execute_query.call_args[0][0]
+        assert "count(DISTINCT id_disciplina)" in query
+        assert "count(DISTINCT id_aluno)" in query
+        assert "DISTINCT nome" not in query
+        assert (relatorio.geral.total_disciplinas, relatorio.geral.total_alunos) == (2, 2)
+
+    def test_estatisticas_sem_registros(self):
+        """Testa estatísticas zeradas quando a consulta não retorna linhas"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = []
+
+        relatorio = NotasService(mock_db).estatisticas()
+
+        assert relatorio.geral.total_registros == 0
+        assert relatorio.geral.percentual_aprovacao == 0.0
+        assert relatorio.por_disciplina == []
+
+    def test_criar_um_comando(self):
+        """Testa criação de notas com INSERT ... ON CONFLICT, sem consulta prévia"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(5,)]
+
+        service = NotasService(mock_db)
+        id_criado = service.criar(Notas(id=None, id_matricula=1, sm1=1.0, sm2=1.0, av=5.0))
+
+        assert id_criado == 5
+        assert mock_db.execute_query.call_count == 1
+        assert "ON CONFLICT DO NOTHING" in mock_db.execute_query.call_args[0][0]
+
+    def test_criar_notas_ja_existem(self):
+        """Testa criação para matrícula que já possui notas"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = []
+
+        service = NotasService(mock_db)
+
+        with pytest.raises(NotasJaExistemException, match="Notas já existem para esta matrícula"):
+            service.criar(Notas(id=None, id_matricula=1))
+
+    def test_atualizar_nao_encontrada(self):
+        """Testa atualização de registro inexistente (UPDATE sem linha retornada)"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = []
+
+        service = NotasService(mock_db)
+
+        with pytest.raises(Exception, match="Notas não encontradas"):
+            service.atualizar(Notas(id=99, id_matricula=1))
+        assert mock_db.execute_query.call_count == 1
+
+    def test_atualizar_por_matricula_upsert(self):
+        """Testa que atualizar_por_matricula grava com um único upsert"""
+        mock_db = Mock()
+        mock_db.execute_query.return_value = [(8,)]
+
+        service = NotasService(mock_db)
+        notas = Notas(id=None, id_matricula=3, sm1=1.0, sm2=1.0, av=4.0)
+        service.atualizar_por_matricula(notas)
+
+        assert notas.id == 8
+        assert mock_db.execute_query.call_count == 1
+        query, params = mock_db.execute_query.call_args[0]
+        assert "ON CONFLICT (id_matricula) DO UPDATE" in query
+        assert params == (3, 1.0, 1.0, 4.0, 0.0, 6.0, "APROVADO")
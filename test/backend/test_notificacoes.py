@@ -0,0 +1,136 @@
+"""
+Testes unitários para as notificações de alteração (LISTEN/NOTIFY)
+"""
+
+import os
+import sys
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.lib.cache import cache_leitura
+from registro_notas_alunos.backend.lib.notificacoes import (
+    Alteracao,
+    OuvinteAlteracoes,
+    agrupar,
+    interpretar_payload,
+    ouvinte_alteracoes,
+)
+
+
+class TestInterpretarPayload:
+    """Testes para interpretar_payload"""
+
+    def test_payload_com_ids(self):
+        """Testa o payload publicado pelos gatilhos"""
+        alteracao = interpretar_payload(
+            '{"tabela" : "aluno", "operacao" : "UPDATE", "ids" : [1,2]}'
+        )
+
+        assert alteracao == Alteracao("aluno", "UPDATE", (1, 2))
+        assert not alteracao.completa
+
+    def test_payload_sem_ids(self):
+        """Testa o payload de comandos com muitas linhas"""
+        alteracao = interpretar_payload('{"tabela": "notas", "operacao": "DELETE", "ids": null}')
+
+        assert alteracao.completa
+
+    @pytest.mark.parametrize("payload", ["", "texto", '{"tabela": "aluno"}', '{"ids": 3}'])
+    def test_payload_invalido(self, payload):
+        """Testa que payloads inválidos são ignorados"""
+        assert interpretar_payload(payload) is None
+
+
+class TestAgrupar:
+    """Testes para agrupar"""
+
+    def test_une_ids_por_tabela(self):
+        """Testa a união dos IDs e a ordem das tabelas"""
+        agrupadas = agrupar(
+            [
+                Alteracao("notas", "UPDATE", (1, 2)),
+                Alteracao("aluno", "INSERT", (5,)),
+                Alteracao("notas", "UPDATE", (2, 3)),
+            ]
+        )
+
+        assert agrupadas == [
+            Alteracao("notas", "UPDATE", (1, 2, 3)),
+            Alteracao("aluno", "INSERT", (5,)),
+        ]
+
+    def test_operacoes_diferentes(self):
+        """Testa o agrupamento de operações diferentes"""
+        agrupadas = agrupar(
+            [Alteracao("aluno", "INSERT", (1,)), Alteracao("aluno", "DELETE", (2,))]
+        )
+
+        assert agrupadas == [Alteracao("aluno", "MULTIPLA", (1, 2))]
+
+    def test_evento_completo_prevalece(self):
+        """Testa que um evento sem IDs torna o grupo completo"""
+        agrupadas = agrupar([Alteracao("aluno", "UPDATE", (1,)), Alteracao("aluno", "UPDATE")])
+
+        assert agrupadas[0].completa
+
+
+class TestOuvinteAlteracoes:
+    """Testes para OuvinteAlteracoes"""
+
+    def test_despachar_filtra_tabelas(self):
+        """Testa que cada inscrito recebe apenas as tabelas de interesse"""
+        ouvinte = OuvinteAlteracoes()
+        alunos, todas = [], []
+        ouvinte.inscrever(alunos.append, tabelas=("aluno",))
+        ouvinte.inscrever(todas.append)
+
+        ouvinte.despachar(Alteracao("aluno", "UPDATE", (1,)))
+        ouvinte.despachar(Alteracao("notas", "UPDATE", (2,)))
+
+        assert [a.tabela for a in alunos] == ["aluno"]
+        assert [a.tabela for a in todas] == ["aluno", "notas"]
+
+    def test_erro_em_inscrito_nao_interrompe_os_demais(self):
+        """Testa o isolamento dos callbacks"""
+        ouvinte = OuvinteAlteracoes()
+        recebidas = []
+
+        def falha(alteracao):
+            raise RuntimeError("falha")
+
+        ouvinte.inscrever(falha)
+        ouvinte.inscrever(recebidas.append)
+        ouvinte.despachar(Alteracao("aluno", "UPDATE", (1,)))
+
+        assert len(recebidas) == 1
+
+    def test_cancelar_inscricao(self):
+        """Testa a função retornada por inscrever"""
+        ouvinte = OuvinteAlteracoes()
+        recebidas = []
+        cancelar = ouvinte.inscrever(recebidas.append)
+
+        cancelar()
+        cancelar()
+        ouvinte.despachar(Alteracao("aluno", "UPDATE", (1,)))
+
+        assert recebidas == []
+
+    def test_iniciar_desligado(self, monkeypatch):
+        """Testa DB_NOTIFICACOES=0"""
+        monkeypatch.setenv("DB_NOTIFICACOES", "0")
+        ouvinte = OuvinteAlteracoes(conectar=pytest.fail)
+
+        assert ouvinte.iniciar() is False
+        assert not ouvinte.ativo
+
+    def test_ouvinte_compartilhado_invalida_cache(self):
+        """Testa que alterações de outros clientes descartam as listas em cache"""
+        cache_leitura.obter(("aluno", "listar_todos"), lambda: ["antiga"])
+
+        ouvinte_alteracoes.despachar(Alteracao("aluno", "UPDATE", (1,)))
+
+        assert cache_leitura.obter(("aluno", "listar_todos"), lambda: ["nova"]) == ["nova"]
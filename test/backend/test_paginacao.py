@@ -0,0 +1,137 @@
+"""
+Testes unitários para a paginação por chave
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.lib.paginacao import (
+    LIMITE_MAXIMO,
+    codificar_token,
+    condicao_apos,
+    consultar_pagina,
+    decodificar_token,
+)
+
+
+def _consultar(db, token=None, limite=2):
+    """Consulta paginada de alunos usada nos testes"""
+    return consultar_pagina(
+        db,
+        escopo="aluno",
+        select="SELECT id, nome, matricula FROM aluno",
+        condicoes=["ativo = %s"],
+        params=[True],
+        chave=("nome", "matricula"),
+        posicoes_chave=(1, 2),
+        limite=limite,
+        token=token,
+    )
+
+
+class TestToken:
+    """Testes para codificar_token e decodificar_token"""
+
+    def test_ida_e_volta(self):
+        """Testa que a chave é recuperada do token, inclusive com acentos"""
+        token = codificar_token("aluno", ["João", "2025001", 7])
+
+        assert "=" not in token
+        assert decodificar_token(token, "aluno", 3) == ["João", "2025001", 7]
+
+    @pytest.mark.parametrize("token", ["", "não-é-base64", codificar_token("aluno", ["a"])])
+    def test_token_invalido(self, token):
+        """Testa token corrompido ou com chave de outro tamanho"""
+        with pytest.raises(ValueError, match="Token de paginação inválido"):
+            decodificar_token(token, "aluno", 2)
+
+    def test_token_de_outra_listagem(self):
+        """Testa que o token de uma listagem não é aceito por outra"""
+        token = codificar_token("disciplina", ["RAD", 2025])
+
+        with pytest.raises(ValueError, match="Token de paginação inválido"):
+            decodificar_token(token, "aluno", 2)
+
+
+class TestConsultarPagina:
+    """Testes para consultar_pagina"""
+
+    def test_primeira_pagina_com_seguinte(self):
+        """Testa a linha a mais que indica a página seguinte"""
+        db = Mock()
+        db.execute_query.return_value = [(1, "Ana", "01"), (2, "Bia", "02"), (3, "Caio", "03")]
+
+        pagina = _consultar(db)
+
+        assert pagina.itens == [(1, "Ana", "01"), (2, "Bia", "02")]
+        assert decodificar_token(pagina.proximo, "aluno", 2) == ["Bia", "02"]
+        query, params = db.execute_query.call_args[0]
+        assert query.endswith("WHERE ativo = %s ORDER BY nome, matricula LIMIT %s")
+        assert params == (True, 3)
+
+    def test_pagina_seguinte_continua_apos_a_chave(self):
+        """Testa a comparação de tupla com a chave do token"""
+        db = Mock()
+        db.execute_query.return_value = [(3, "Caio", "03")]
+
+        pagina = _consultar(db, token=codificar_token("aluno", ["Bia", "02"]))
+
+        assert pagina.proximo is None
+        query, params = db.execute_query.call_args[0]
+        assert "WHERE ativo = %s AND (nome, matricula) > (%s, %s) ORDER BY" in query
+        assert params == (True, "Bia", "02", 3)
+
+    @pytest.mark.parametrize("limite", [0, LIMITE_MAXIMO + 1])
+    def test_limite_invalido(self, limite):
+        """Testa limites fora da faixa"""
+        with pytest.raises(ValueError, match="Limite deve estar entre"):
+            _consultar(Mock(), limite=limite)
+
+
+class TestCondicaoApos:
+    """Testes para condicao_apos"""
+
+    def test_crescente(self):
+        """Testa o limite na primeira coluna e as alternativas na ordem das colunas"""
+        condicao, params = condicao_apos(("a.nome", "n.id"), ("Bia", 7))
+
+        assert condicao == (
+            "(a.nome >= %s OR a.nome IS NULL) AND "
+            "(((a.nome > %s OR a.nome IS NULL)) OR (a.nome = %s AND (n.id > %s OR n.id IS NULL)))"
+        )
+        assert params == ["Bia", "Bia", "Bia", 7]
+
+    def test_decrescente_a_partir_de_nulo(self):
+        """Testa que, na ordem decrescente, os valores vêm depois do NULL"""
+        condicao, params = condicao_apos(("n.nf", "n.id"), (None, 7), decrescente=True)
+
+        assert condicao == "((n.nf IS NOT NULL) OR (n.nf IS NULL AND n.id < %s))"
+        assert params == [7]
+
+    def test_crescente_a_partir_de_nulo(self):
+        """Testa que, na ordem crescente, só outros NULLs vêm depois do NULL"""
+        condicao, params = condicao_apos(("n.nf", "n.id"), (None, 7), marcadores=("%s::real", "%s"))
+
+        assert condicao == "n.nf IS NULL AND ((n.nf IS NULL AND (n.id > %s OR n.id IS NULL)))"
+        assert params == [7]
+
+    def test_marcadores(self):
+        """Testa o marcador informado para cada coluna"""
+        condicao, params = condicao_apos(
+            ("n.av", "n.id"), (6.7, 7), decrescente=True, marcadores=("%s::real", "%s")
+        )
+
+        assert condicao.startswith("n.av <= %s::real AND ((n.av < %s::real) OR")
+        assert "(n.av = %s::real AND n.id < %s)" in condicao
+        assert params == [6.7, 6.7, 6.7, 7]
+
+    def test_colunas_e_valores_divergentes(self):
+        """Testa que cada coluna precisa de um valor"""
+        with pytest.raises(ValueError, match="Informe um valor"):
+            condicao_apos(("a.nome", "n.id"), ("Bia",))
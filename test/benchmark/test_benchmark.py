@@ -0,0 +1,103 @@
+"""
+Testes unitários para o gerador de dados e a suíte de benchmark
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from benchmark.gerador import Volumes, _linhas_notas, _par_matricula
+from benchmark.suite import Caso, comparar, medir, montar_casos
+from registro_notas_alunos.backend.lib.cache import cache_leitura
+
+
+class TestGerador:
+    """Testes para o gerador de dados sintéticos"""
+
+    def test_pares_de_matricula_unicos(self):
+        """Testa que todas as matrículas geradas são pares aluno/disciplina distintos"""
+        volumes = Volumes(alunos=7, disciplinas=5, notas=35)
+
+        pares = [_par_matricula(k, volumes) for k in range(volumes.notas)]
+
+        assert len(set(pares)) == 35
+        assert all(1 <= a <= 7 and 1 <= d <= 5 for a, d in pares)
+
+    def test_volumes_notas_acima_do_possivel(self):
+        """Testa que não é possível pedir mais notas que pares aluno/disciplina"""
+        with pytest.raises(ValueError, match="Notas não podem exceder alunos x disciplinas"):
+            Volumes(alunos=2, disciplinas=2, notas=5)
+
+    def test_linhas_notas_deterministicas(self):
+        """Testa que a mesma semente gera as mesmas notas"""
+        volumes = Volumes(alunos=10, disciplinas=10, notas=20)
+
+        assert list(_linhas_notas(volumes, 1)) == list(_linhas_notas(volumes, 1))
+        assert len(list(_linhas_notas(volumes, 1))) == 20
+
+
+class TestSuite:
+    """Testes para a suíte de benchmark"""
+
+    def test_medir_descarta_aquecimento(self):
+        """Testa que o aquecimento não entra nas repetições medidas"""
+        chamadas = []
+        caso = Caso("Servico.listar", lambda: chamadas.append(1) or [1, 2, 3])
+
+        medicao = medir(caso, MagicMock(), repeticoes=3, aquecimento=2)
+
+        assert len(chamadas) == 5
+        assert medicao.repeticoes == 3
+        assert medicao.linhas == 3
+        assert medicao.minimo_ms <= medicao.mediana_ms <= medicao.maximo_ms
+
+    def test_medir_escrita_desfaz_transacao(self):
+        """Testa que casos de escrita são desfeitos ao fim de cada repetição"""
+        db = MagicMock()
+        conn = db.transaction.return_value.__enter__.return_value
+
+        medir(Caso("Servico.criar", lambda: 1, escrita=True), db, repeticoes=2, aquecimento=0)
+
+        assert conn.rollback.call_count == 2
+
+    @pytest.mark.parametrize(
+        "nome", ["AlunoService.listar_todos", "DisciplinaService.listar_todas"]
+    )
+    def test_listagens_com_cache_medem_a_consulta(self, nome):
+        """Testa que cada repetição das listagens em cache consulta o banco"""
+        db = MagicMock()
+        db.execute_query.return_value = []
+        cache_leitura.limpar()
+        with patch("benchmark.suite._Amostra"):
+            casos = {caso.nome: caso for caso in montar_casos(db)}
+
+        medir(casos[nome], db, repeticoes=3, aquecimento=1)
+        assert db.execute_query.call_count == 4
+
+        db.execute_query.reset_mock()
+        medir(casos[f"{nome} (cache)"], db, repeticoes=3, aquecimento=1)
+        assert db.execute_query.call_count == 0
+        cache_leitura.limpar()
+
+    def test_comparar_aponta_regressao(self):
+        """Testa a comparação entre duas execuções pela mediana"""
+        base = {"resultados": {"a": {"mediana_ms": 10.0}, "b": {"mediana_ms": 10.0}}}
+        atual = {
+            "resultados": {
+                "a": {"mediana_ms": 11.0},
+                "b": {"mediana_ms": 15.0},
+                "novo": {"mediana_ms": 1.0},
+            }
+        }
+
+        comparacao = {item["caso"]: item for item in comparar(base, atual, tolerancia=0.2)}
+
+        assert set(comparacao) == {"a", "b"}
+        assert comparacao["a"]["regressao"] is False
+        assert comparacao["b"]["regressao"] is True
+        assert comparacao["b"]["razao"] == 1.5
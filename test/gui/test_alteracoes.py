@@ -0,0 +1,106 @@
+"""
+Testes unitários para a entrega das notificações de alteração às telas
+"""
+
+import os
+import sys
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.lib.notificacoes import Alteracao, OuvinteAlteracoes
+from registro_notas_alunos.gui.alteracoes import ReceptorAlteracoes
+
+
+class JanelaFalsa:
+    """Substitui a janela Tk: guarda os after() para execução manual"""
+
+    def __init__(self):
+        self.agendados = {}
+        self.ao_destruir = None
+        self._proximo = 0
+
+    def after(self, ms, funcao):
+        self._proximo += 1
+        self.agendados[self._proximo] = funcao
+        return self._proximo
+
+    def after_cancel(self, identificador):
+        self.agendados.pop(identificador, None)
+
+    def bind(self, sequencia, funcao, add=None):
+        self.ao_destruir = funcao
+
+    def processar(self):
+        """Executa os after() agendados até o momento"""
+        for identificador in sorted(self.agendados):
+            self.agendados.pop(identificador)()
+
+
+class OuvinteAtivo(OuvinteAlteracoes):
+    """Ouvinte sem conexão, considerado em execução"""
+
+    ativo = True
+
+
+@pytest.fixture
+def janela():
+    """Janela falsa"""
+    return JanelaFalsa()
+
+
+@pytest.fixture
+def ouvinte():
+    """Ouvinte isolado por teste"""
+    return OuvinteAtivo()
+
+
+class TestReceptorAlteracoes:
+    """Testes para ReceptorAlteracoes"""
+
+    def test_entrega_agrupada_na_verificacao(self, janela, ouvinte):
+        """Testa que os eventos são entregues no after(), agrupados por tabela"""
+        recebidas = []
+        ReceptorAlteracoes(janela, recebidas.append, ("aluno",), ouvinte=ouvinte)
+
+        ouvinte.despachar(Alteracao("aluno", "UPDATE", (1,)))
+        ouvinte.despachar(Alteracao("notas", "UPDATE", (7,)))
+        ouvinte.despachar(Alteracao("aluno", "UPDATE", (2,)))
+        assert recebidas == []
+
+        janela.processar()
+
+        assert recebidas == [Alteracao("aluno", "UPDATE", (1, 2))]
+        assert len(janela.agendados) == 1
+
+    def test_fechar_janela_cancela_inscricao(self, janela, ouvinte):
+        """Testa que a tela fechada deixa de receber eventos"""
+        recebidas = []
+        ReceptorAlteracoes(janela, recebidas.append, ("aluno",), ouvinte=ouvinte)
+
+        janela.ao_destruir(type("Evento", (), {"widget": janela})())
+        ouvinte.despachar(Alteracao("aluno", "UPDATE", (1,)))
+
+        assert janela.agendados == {}
+        assert recebidas == []
+
+    def test_erro_na_tela_nao_para_verificacoes(self, janela, ouvinte):
+        """Testa que uma exceção da tela não interrompe as entregas seguintes"""
+
+        def falha(alteracao):
+            raise RuntimeError("falha")
+
+        ReceptorAlteracoes(janela, falha, ("aluno",), ouvinte=ouvinte)
+        ouvinte.despachar(Alteracao("aluno", "UPDATE", (1,)))
+        janela.processar()
+
+        assert len(janela.agendados) == 1
+
+    def test_ouvinte_parado(self, janela):
+        """Testa que nada é agendado sem o ouvinte em execução"""
+        ReceptorAlteracoes(janela, pytest.fail, ("aluno",), ouvinte=OuvinteAlteracoes())
+
+        assert janela.agendados == {}
+        assert janela.ao_destruir is None
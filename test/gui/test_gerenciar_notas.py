@@ -0,0 +1,144 @@
+"""
+Testes unitários para as gravações da tela de notas
+"""
+
+import os
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.disciplina.model import Disciplina
+from registro_notas_alunos.backend.notas.vo import AlunoNotaApuradoVO
+from registro_notas_alunos.gui.screens.exceptions import DatabaseConnectionError
+from registro_notas_alunos.gui.screens.gerenciar_notas import GerenciarNotasScreen
+
+
+class TarefasImediatas:
+    """Substitui o ExecutorTarefas: executa a chamada e o callback na hora"""
+
+    def __init__(self):
+        self.chaves = []
+
+    def pendente(self, chave):
+        return False
+
+    def executar(self, chave, funcao, *args, ao_concluir=None, ao_falhar=None, **kwargs):
+        self.chaves.append(chave)
+        try:
+            resultado = funcao(*args, **kwargs)
+        except Exception as e:
+            ao_falhar(e)
+        else:
+            ao_concluir(resultado)
+
+
+def campo(valor):
+    """Substitui um ttk.Entry com o texto informado"""
+    return Mock(get=Mock(return_value=valor))
+
+
+@pytest.fixture
+def tela():
+    """Tela de notas sem janela Tk, com a nota 3 (matrícula 7) selecionada"""
+    tela = object.__new__(GerenciarNotasScreen)
+    tela.notas_service = Mock()
+    tela.notas_service.calcular_nota_final_e_situacao.return_value = (8.0, "APROVADO")
+    tela.selected_nota = 3
+    tela.current_id_matricula = 7
+    tela.sm1_entry, tela.sm2_entry, tela.av_entry, tela.avs_entry = (
+        campo("1"),
+        campo("1"),
+        campo("6,0"),
+        campo(""),
+    )
+    tela.tarefas = TarefasImediatas()
+    tela.tabela = Mock()
+    tela.tabela.registro.return_value = AlunoNotaApuradoVO(
+        id_nota=3,
+        nome_aluno="Ana",
+        disciplina=Disciplina(id=1, nome="Matemática", ano=2024, semestre=1),
+        sm1=None,
+        sm2=None,
+        av=None,
+        avs=None,
+        nota_final=0.0,
+        situacao="PENDENTE",
+    )
+    tela.limpar_campos = Mock()
+    tela.limpar_campos_notas = Mock()
+    tela.update_button_states = Mock()
+    return tela
+
+
+class TestAlterarNota:
+    """Testes para GerenciarNotasScreen.alterar_nota"""
+
+    def test_alterar_grava_e_atualiza_linha(self, tela):
+        """Testa que a alteração grava com a matrícula selecionada e troca a linha"""
+        with patch("registro_notas_alunos.gui.screens.gerenciar_notas.messagebox") as caixa:
+            tela.alterar_nota()
+
+        caixa.showerror.assert_not_called()
+        assert tela.tarefas.chaves == ["gravacao"]
+        notas = tela.notas_service.atualizar.call_args[0][0]
+        assert (notas.id, notas.id_matricula, notas.av) == (3, 7, 6.0)
+
+        linha = tela.tabela.atualizar_registro.call_args[0][0]
+        assert (linha.av, linha.nota_final, linha.situacao) == (6.0, 8.0, "APROVADO")
+
+    def test_alterar_sem_matricula_selecionada(self, tela):
+        """Testa que sem matrícula a alteração não chega ao serviço"""
+        tela.current_id_matricula = None
+
+        with patch("registro_notas_alunos.gui.screens.gerenciar_notas.messagebox") as caixa:
+            tela.alterar_nota()
+
+        caixa.showerror.assert_called_once()
+        tela.notas_service.atualizar.assert_not_called()
+
+    def test_alterar_ignorado_com_gravacao_pendente(self, tela):
+        """Testa que um segundo clique não reenvia a gravação em andamento"""
+        tela.tarefas.pendente = Mock(return_value=True)
+
+        tela.alterar_nota()
+
+        tela.notas_service.atualizar.assert_not_called()
+
+    def test_erro_da_gravacao_exibido(self, tela):
+        """Testa que a falha da gravação em segundo plano chega ao usuário"""
+        tela.notas_service.atualizar.side_effect = DatabaseConnectionError("sem conexão")
+
+        with patch("registro_notas_alunos.gui.screens.gerenciar_notas.messagebox") as caixa:
+            tela.alterar_nota()
+
+        caixa.showerror.assert_called_once_with(
+            "Erro de Conexão", "Erro ao conectar com o banco de dados"
+        )
+        tela.tabela.atualizar_registro.assert_not_called()
+        tela.limpar_campos_notas.assert_not_called()
+
+
+class TestExcluirNota:
+    """Testes para GerenciarNotasScreen.excluir_nota"""
+
+    def test_excluir_remove_linha(self, tela):
+        """Testa que a exclusão confirmada remove a linha depois de gravada"""
+        with patch("registro_notas_alunos.gui.screens.gerenciar_notas.messagebox") as caixa:
+            caixa.askyesno.return_value = True
+            tela.excluir_nota()
+
+        tela.notas_service.deletar.assert_called_once_with(3)
+        tela.tabela.remover_registro.assert_called_once_with(3)
+        tela.limpar_campos.assert_called_once()
+
+    def test_excluir_cancelado(self, tela):
+        """Testa que nada é enviado quando o usuário não confirma"""
+        with patch("registro_notas_alunos.gui.screens.gerenciar_notas.messagebox") as caixa:
+            caixa.askyesno.return_value = False
+            tela.excluir_nota()
+
+        tela.notas_service.deletar.assert_not_called()
@@ -0,0 +1,157 @@
+"""
+Testes unitários para o modelo de linhas indexadas dos Treeviews
+"""
+
+import os
+import sys
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.backend.aluno.model import Aluno
+from registro_notas_alunos.gui.modelo_linhas import ModeloLinhas
+
+
+class TreeFalso:
+    """Substitui o Treeview: guarda as linhas e conta as operações"""
+
+    def __init__(self):
+        self.linhas = []
+        self.valores = {}
+        self.operacoes = 0
+
+    def insert(self, parent, index, iid, values):
+        self.operacoes += 1
+        self.linhas.insert(index, iid)
+        self.valores[iid] = values
+
+    def item(self, iid, values):
+        self.operacoes += 1
+        self.valores[iid] = values
+
+    def move(self, iid, parent, index):
+        self.operacoes += 1
+        self.linhas.remove(iid)
+        self.linhas.insert(index, iid)
+
+    def delete(self, *iids):
+        self.operacoes += 1
+        for iid in iids:
+            self.linhas.remove(iid)
+            del self.valores[iid]
+
+    def get_children(self):
+        return tuple(self.linhas)
+
+
+@pytest.fixture
+def tree():
+    """Treeview falso"""
+    return TreeFalso()
+
+
+@pytest.fixture
+def modelo(tree):
+    """Modelo de linhas de alunos ordenado por nome"""
+    return ModeloLinhas(
+        tree,
+        chave=lambda aluno: aluno.id,
+        formatar=lambda aluno: (aluno.id, aluno.nome, aluno.matricula),
+        ordem=lambda aluno: aluno.nome,
+    )
+
+
+def alunos(*nomes):
+    """Alunos com IDs sequenciais"""
+    return [Aluno(id=i, nome=nome, matricula=f"{i:03d}") for i, nome in enumerate(nomes, 1)]
+
+
+class TestModeloLinhas:
+    """Testes para ModeloLinhas"""
+
+    def test_carregar(self, modelo, tree):
+        """Testa a carga inicial na ordem recebida"""
+        modelo.carregar(alunos("Ana", "Bruno", "Carla"))
+
+        assert tree.get_children() == ("1", "2", "3")
+        assert tree.valores["2"] == (2, "Bruno", "002")
+        assert len(modelo) == 3
+
+    def test_recarga_sem_mudancas_nao_altera_linhas(self, modelo, tree):
+        """Testa que recarregar os mesmos dados não faz operações no Treeview"""
+        modelo.carregar(alunos("Ana", "Bruno", "Carla"))
+        tree.operacoes = 0
+
+        modelo.carregar(alunos("Ana", "Bruno", "Carla"))
+
+        assert tree.operacoes == 0
+
+    def test_recarga_aplica_apenas_diferencas(self, modelo, tree):
+        """Testa que a recarga remove, inclui, altera e reordena só o necessário"""
+        modelo.carregar(alunos("Ana", "Bruno", "Carla"))
+        tree.operacoes = 0
+
+        novos = [
+            Aluno(id=3, nome="Carla", matricula="003"),
+            Aluno(id=1, nome="Ana Maria", matricula="001"),
+            Aluno(id=4, nome="Daniel", matricula="004"),
+        ]
+        modelo.carregar(novos)
+
+        assert tree.get_children() == ("3", "1", "4")
+        assert tree.valores["1"] == (1, "Ana Maria", "001")
+        assert "2" not in tree.valores
+        # delete, item, move e insert
+        assert tree.operacoes == 4
+
+    def test_inserir_na_posicao_da_ordem(self, modelo, tree):
+        """Testa que a inclusão respeita a ordenação sem recarregar"""
+        modelo.carregar(alunos("Ana", "Carla"))
+        tree.operacoes = 0
+
+        modelo.inserir(Aluno(id=9, nome="Bruno", matricula="009"))
+
+        assert tree.get_children() == ("1", "9", "2")
+        assert tree.operacoes == 1
+
+    def test_atualizar_reposiciona(self, modelo, tree):
+        """Testa que a alteração troca os valores e move a linha"""
+        modelo.carregar(alunos("Ana", "Bruno", "Carla"))
+
+        modelo.atualizar(Aluno(id=1, nome="Zilda", matricula="001"))
+
+        assert tree.get_children() == ("2", "3", "1")
+        assert tree.valores["1"] == (1, "Zilda", "001")
+        assert modelo.registro(1).nome == "Zilda"
+
+    def test_remover(self, modelo, tree):
+        """Testa a remoção de uma linha e de uma chave inexistente"""
+        modelo.carregar(alunos("Ana", "Bruno"))
+
+        modelo.remover(1)
+        modelo.remover(99)
+
+        assert tree.get_children() == ("2",)
+        assert 1 not in modelo
+        assert modelo.registro(1) is None
+
+    def test_reconciliar(self, modelo, tree):
+        """Testa a aplicação das chaves lidas de novo: altera, inclui e remove"""
+        modelo.carregar(alunos("Ana", "Bruno", "Carla"))
+        tree.operacoes = 0
+
+        modelo.reconciliar(
+            [1, 2, 3, 4],
+            [
+                Aluno(id=1, nome="Ana", matricula="001"),
+                Aluno(id=3, nome="Carla Souza", matricula="003"),
+                Aluno(id=4, nome="Beatriz", matricula="004"),
+            ],
+        )
+
+        assert tree.get_children() == ("1", "4", "3")
+        assert tree.valores["3"] == (3, "Carla Souza", "003")
+        # Ana sem mudança: nenhuma operação na sua linha
+        assert tree.operacoes == 4
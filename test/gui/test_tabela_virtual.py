@@ -0,0 +1,103 @@
+"""
+Testes unitários para a escolha da consulta de páginas da tabela virtual
+"""
+
+import os
+import sys
+from collections import OrderedDict
+from unittest.mock import Mock
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.gui.tabela_virtual import TabelaVirtual
+
+
+@pytest.fixture
+def tabela():
+    """Tabela sem widgets, com páginas de 3 registros e a página 0 em memória"""
+    tabela = object.__new__(TabelaVirtual)
+    tabela.buscar_pagina = Mock(name="buscar_pagina")
+    tabela.buscar_apos = Mock(name="buscar_apos")
+    tabela.contar = Mock(name="contar")
+    tabela.tarefas = Mock()
+    tabela.tamanho_pagina = 3
+    tabela.ordenacao = "aluno"
+    tabela.decrescente = False
+    tabela.total = 10
+    tabela.inicio = 0
+    tabela._versao = 0
+    tabela._paginas = OrderedDict({0: ["a", "b", "c"]})
+    tabela._ultimos = {0: "c"}
+    tabela._tarefa_pagina = "pagina"
+    tabela._tarefa_total = "total"
+    tabela._desenhar = Mock()
+    return tabela
+
+
+def consulta(tabela):
+    """Função e argumentos enviados ao executor na última busca"""
+    _, funcao, *args = tabela.tarefas.executar.call_args[0]
+    return funcao, args
+
+
+class TestBuscarPaginas:
+    """Testes para TabelaVirtual._buscar"""
+
+    def test_pagina_seguinte_continua_apos_o_ultimo(self, tabela):
+        """Testa que a rolagem sequencial usa a paginação por chave"""
+        tabela._buscar(1, 1)
+
+        assert consulta(tabela) == (tabela.buscar_apos, [3, "c", "aluno", False])
+
+    def test_salto_usa_deslocamento(self, tabela):
+        """Testa que uma página sem a anterior em memória usa o deslocamento"""
+        tabela._buscar(5, 6)
+
+        assert consulta(tabela) == (tabela.buscar_pagina, [6, 15, "aluno", False])
+
+    def test_pagina_anterior_encurtada_usa_deslocamento(self, tabela):
+        """Testa que após remover um registro a página seguinte volta ao deslocamento"""
+        tabela._paginas[0] = ["a", "b"]
+
+        tabela._buscar(1, 1)
+
+        assert consulta(tabela)[0] is tabela.buscar_pagina
+
+    def test_registro_alterado_nao_muda_o_ponto_de_partida(self, tabela):
+        """Testa que a continuação parte do registro como veio do banco"""
+        tabela._paginas[0][2] = "c alterado"
+
+        tabela._buscar(1, 1)
+
+        assert consulta(tabela)[1][1] == "c"
+
+    def test_receber_guarda_o_ultimo_de_cada_pagina(self, tabela):
+        """Testa que cada página recebida guarda o ponto de partida da seguinte"""
+        tabela._receber(["d", "e", "f", "g"], 1, 6, 0)
+
+        assert tabela._paginas[1] == ["d", "e", "f"]
+        assert tabela._ultimos == {0: "c", 1: "f", 2: "g"}
+        assert tabela.total == 7
+
+
+class TestRecarregar:
+    """Testes para a contagem em TabelaVirtual.recarregar"""
+
+    def test_recarregar_reconta(self, tabela):
+        """Testa que recarregar descarta o total e busca a contagem"""
+        tabela.recarregar()
+
+        assert tabela.total is None
+        assert tabela.tarefas.executar.call_args[0][:2] == ("total", tabela.contar)
+        assert tabela._ultimos == {}
+
+    def test_recarregar_sem_recontar_mantem_total(self, tabela):
+        """Testa que trocar a ordenação não conta os registros de novo"""
+        tabela.recarregar(recontar=False)
+
+        assert tabela.total == 10
+        tabela.tarefas.executar.assert_not_called()
+        assert tabela._paginas == {}
@@ -0,0 +1,206 @@
+"""
+Testes unitários para a execução de tarefas da interface em segundo plano
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+# Adiciona o diretório raiz ao path para imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
+
+from registro_notas_alunos.gui.tarefas import ExecutorTarefas
+
+
+class JanelaFalsa:
+    """Substitui a janela Tk: guarda os after() para execução manual"""
+
+    def __init__(self):
+        self.agendados = {}
+        self.cursor = ""
+        self.ao_destruir = None
+        self._proximo = 0
+
+    def after(self, ms, funcao):
+        self._proximo += 1
+        self.agendados[self._proximo] = funcao
+        return self._proximo
+
+    def after_cancel(self, identificador):
+        self.agendados.pop(identificador, None)
+
+    def bind(self, sequencia, funcao, add=None):
+        self.ao_destruir = funcao
+
+    def winfo_toplevel(self):
+        return self
+
+    def configure(self, cursor=None):
+        self.cursor = cursor
+
+    def processar(self, executor, timeout=2.0):
+        """Executa os after() agendados até não haver tarefas pendentes"""
+        limite = time.monotonic() + timeout
+        while self.agendados:
+            if time.monotonic() > limite:
+                raise TimeoutError("Tarefas não concluídas")
+            identificador = min(self.agendados)
+            self.agendados.pop(identificador)()
+            if executor.ocupado:
+                time.sleep(0.005)
+
+
+@pytest.fixture
+def pool():
+    """Pool de threads isolado por teste"""
+    executor = ThreadPoolExecutor(max_workers=2)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def janela():
+    """Janela falsa"""
+    return JanelaFalsa()
+
+
+class TestExecutorTarefas:
+    """Testes para ExecutorTarefas"""
+
+    def test_entrega_resultado_na_thread_chamadora(self, janela, pool):
+        """Testa que o callback recebe o resultado na thread que processa os after()"""
+        tarefas = ExecutorTarefas(janela, pool=pool)
+        recebidos = []
+
+        tarefas.executar(
+            "tabela",
+            lambda: threading.current_thread().name,
+            ao_concluir=lambda nome: recebidos.append((nome, threading.current_thread().name)),
+        )
+        janela.processar(tarefas)
+
+        assert len(recebidos) == 1
+        thread_tarefa, thread_callback = recebidos[0]
+        assert thread_tarefa != thread_callback
+        assert thread_callback == threading.current_thread().name
+
+    def test_tarefa_substituida_e_descartada(self, janela, pool):
+        """Testa que uma nova tarefa com a mesma chave descarta o resultado da anterior"""
+        tarefas = ExecutorTarefas(janela, pool=pool)
+        liberar = threading.Event()
+        recebidos = []
+
+        def lenta():
+            liberar.wait(1)
+            return "antiga"
+
+        tarefas.executar("selecao", lenta, ao_concluir=recebidos.append)
+        tarefas.executar("selecao", lambda: "nova", ao_concluir=recebidos.append)
+        liberar.set()
+        janela.processar(tarefas)
+
+        assert recebidos == ["nova"]
+
+    def test_chaves_diferentes_sao_independentes(self, janela, pool):
+        """Testa que tarefas de chaves diferentes são todas entregues"""
+        tarefas = ExecutorTarefas(janela, pool=pool)
+        recebidos = []
+
+        tarefas.executar("tabela", lambda: 1, ao_concluir=recebidos.append)
+        tarefas.executar("alunos", lambda: 2, ao_concluir=recebidos.append)
+        janela.processar(tarefas)
+
+        assert sorted(recebidos) == [1, 2]
+
+    def test_pendente_ate_a_entrega(self, janela, pool):
+        """Testa que a tarefa fica pendente até o callback ser chamado"""
+        tarefas = ExecutorTarefas(janela, pool=pool)
+        liberar = threading.Event()
+        pendente_no_callback = []
+
+        tarefas.executar(
+            "gravacao",
+            liberar.wait,
+            1,
+            ao_concluir=lambda _: pendente_no_callback.append(tarefas.pendente("gravacao")),
+        )
+        assert tarefas.pendente("gravacao")
+        assert not tarefas.pendente("tabela")
+
+        liberar.set()
+        janela.processar(tarefas)
+
+        assert pendente_no_callback == [False]
+        assert not tarefas.pendente("gravacao")
+
+    def test_erro_entregue_ao_callback_de_falha(self, janela, pool):
+        """Testa que a exceção da chamada é entregue em ao_falhar"""
+        tarefas = ExecutorTarefas(janela, pool=pool)
+        erros = []
+
+        def falha():
+            raise ValueError("Erro de conexão")
+
+        tarefas.executar("tabela", falha, ao_concluir=pytest.fail, ao_falhar=erros.append)
+        janela.processar(tarefas)
+
+        assert len(erros) == 1
+        assert str(erros[0]) == "Erro de conexão"
+
+    def test_argumentos_repassados(self, janela, pool):
+        """Testa que argumentos posicionais e nomeados chegam à chamada"""
+        tarefas = ExecutorTarefas(janela, pool=pool)
+        recebidos = []
+
+        tarefas.executar("tabela", lambda a, b=0: a + b, 1, b=2, ao_concluir=recebidos.append)
+        janela.processar(tarefas)
+
+        assert recebidos == [3]
+
+    def test_estado_ocupado(self, janela, pool):
+        """Testa o cursor de ocupado e o aviso de mudança de estado"""
+        estados = []
+        tarefas = ExecutorTarefas(janela, pool=pool, ao_mudar_estado=estados.append)
+        liberar = threading.Event()
+
+        tarefas.executar("tabela", liberar.wait, 1)
+        assert tarefas.ocupado
+        assert janela.cursor == "watch"
+
+        liberar.set()
+        janela.processar(tarefas)
+
+        assert not tarefas.ocupado
+        assert janela.cursor == ""
+        assert estados == [True, False]
+
+    def test_encerrar_ao_fechar_janela(self, janela, pool):
+        """Testa que fechar a janela descarta as tarefas e ignora novas chamadas"""
+        tarefas = ExecutorTarefas(janela, pool=pool)
+        recebidos = []
+
+        tarefas.executar("tabela", lambda: 1, ao_concluir=recebidos.append)
+        janela.ao_destruir(type("Evento", (), {"widget": janela})())
+
+        assert janela.agendados == {}
+        assert tarefas.executar("tabela", lambda: 2) is None
+        assert recebidos == []
+
+    def test_callback_pode_agendar_nova_tarefa(self, janela, pool):
+        """Testa que um callback pode encadear outra tarefa"""
+        tarefas = ExecutorTarefas(janela, pool=pool)
+        recebidos = []
+
+        def encadear(valor):
+            recebidos.append(valor)
+            tarefas.executar("selecao", lambda: valor + 1, ao_concluir=recebidos.append)
+
+        tarefas.executar("selecao", lambda: 1, ao_concluir=encadear)
+        janela.processar(tarefas)
+
+        assert recebidos == [1, 2]
+        assert not tarefas.ocupado